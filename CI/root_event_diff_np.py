@@ -1,14 +1,41 @@
 import sys
 import argparse
 import numpy as np
+import awkward as ak
 import uproot
 
 
-parser = argparse.ArgumentParser()
+parser = argparse.ArgumentParser(
+    description="Compare the entries of two trees (given as file.root:tree) event by event"
+)
 parser.add_argument("a")
 parser.add_argument("b")
 parser.add_argument("--event-nr", default="event_nr")
 parser.add_argument("--fail-fast", action="store_true")
+parser.add_argument(
+    "--step-size",
+    type=int,
+    default=100000,
+    help="Approximate number of entries compared at once, bounds the memory usage",
+)
+parser.add_argument(
+    "--max-gap",
+    type=int,
+    default=1000,
+    help="Maximum number of unneeded entries read between two needed ones instead of starting a new read",
+)
+parser.add_argument(
+    "--rtol", type=float, default=0.0, help="Relative tolerance for floating point"
+)
+parser.add_argument(
+    "--atol", type=float, default=0.0, help="Absolute tolerance for floating point"
+)
+parser.add_argument(
+    "--max-print",
+    type=int,
+    default=10,
+    help="Maximum number of mismatching entries to print per branch",
+)
 args = parser.parse_args()
 
 a_data = uproot.open(args.a)
@@ -16,54 +43,105 @@ b_data = uproot.open(args.b)
 event_nr = args.event_nr
 fail_fast = args.fail_fast
 
-a_sort_index = np.argsort(a_data[event_nr].array(library="np"), kind="stable")
-b_sort_index = np.argsort(b_data[event_nr].array(library="np"), kind="stable")
+# Only the event numbers are read in full, everything else is read in chunks
+a_events = a_data[event_nr].array(library="np")
+b_events = b_data[event_nr].array(library="np")
+a_sort_index = np.argsort(a_events, kind="stable")
+b_sort_index = np.argsort(b_events, kind="stable")
+events = a_events[a_sort_index]
 
 np.set_printoptions(linewidth=np.inf)
 
+if len(a_events) != len(b_events) or not np.array_equal(events, b_events[b_sort_index]):
+    print(f"entries per event differ ({len(a_events)} vs {len(b_events)} entries)")
+    sys.exit(1)
 
-def cmp(a, b):
-    if np.isscalar(a):
-        if a != b:
-            return False
-    elif type(a) == np.ndarray:
-        if not np.array_equal(a, b, equal_nan=True):
-            return False
-    else:
-        for aa, bb in zip(a, b):
-            if not cmp(aa, bb):
-                return False
-    return True
+keys = [key for key in a_data.keys() if key != event_nr]
+missing = [key for key in keys if key not in b_data.keys()]
+if missing:
+    print("keys missing in b: " + " ".join(missing))
+    sys.exit(1)
 
 
-failed_events = set()
-failed_keys = set()
-for key in a_data.keys():
-    if key == event_nr:
-        continue
+def chunks():
+    """Ranges of sorted entries of approximately `step_size`, split between events"""
+    start = 0
+    while start < len(events):
+        stop = min(start + args.step_size, len(events))
+        if stop < len(events):
+            # do not split an event across two chunks
+            stop = np.searchsorted(events, events[stop - 1], side="right")
+        yield start, stop
+        start = stop
+
+
+def read(data, sort_index, start, stop):
+    """Read the sorted entries [start, stop) of all keys.
+
+    Only the needed entries are read, in ascending ranges of entries, so that
+    files not sorted by event are not read in full for every chunk.
+    """
+    index = sort_index[start:stop]
+    entries = np.sort(index)
+    breaks = np.flatnonzero(np.diff(entries) > args.max_gap + 1) + 1
+    parts = []
+    for run in np.split(entries, breaks):
+        lo, hi = run[0], run[-1] + 1
+        arrays = data.arrays(keys, entry_start=lo, entry_stop=hi, library="ak")
+        parts.append(arrays[run - lo])
+    arrays = parts[0] if len(parts) == 1 else ak.concatenate(parts)
+    # back from the order of the entries to the order of the events
+    return arrays[np.searchsorted(entries, index)]
 
-    a_vals = a_data[key].array(library="np")
-    a_vals = a_vals[a_sort_index]
 
-    b_vals = b_data[key].array(library="np")
-    b_vals = b_vals[b_sort_index]
+def mismatch(a, b):
+    """Per-entry flag whether two (jagged) arrays differ"""
+    if a.ndim == 1:
+        a = ak.to_numpy(a)
+        b = ak.to_numpy(b)
+        if a.dtype.kind == "f" or b.dtype.kind == "f":
+            return ~np.isclose(a, b, rtol=args.rtol, atol=args.atol, equal_nan=True)
+        return a != b
+
+    na = ak.to_numpy(ak.num(a, axis=1))
+    nb = ak.to_numpy(ak.num(b, axis=1))
+    bad = na != nb
+    ok = ~bad
+    inner = mismatch(ak.flatten(a[ok], axis=1), ak.flatten(b[ok], axis=1))
+    bad[ok] = ak.to_numpy(ak.any(ak.unflatten(inner, na[ok]), axis=1))
+    return bad
+
+
+failed_events = set()
+failed_counts = {key: 0 for key in keys}
+for start, stop in chunks():
+    a_chunk = read(a_data, a_sort_index, start, stop)
+    b_chunk = read(b_data, b_sort_index, start, stop)
+
+    for key in keys:
+        bad = mismatch(a_chunk[key], b_chunk[key])
+        if not np.any(bad):
+            continue
 
-    for event, (a, b) in enumerate(zip(a_vals, b_vals)):
-        if not cmp(a, b):
-            print(f"event {event} failed for {key}")
-            print(f"a {a}")
-            print(f"b {b}")
-            print()
+        for i in np.flatnonzero(bad):
+            if failed_counts[key] < args.max_print:
+                print(f"event {events[start + i]} failed for {key}")
+                print(f"a {a_chunk[key][i]}")
+                print(f"b {b_chunk[key][i]}")
+                print()
 
             if fail_fast:
                 sys.exit(1)
-            failed_events.add(event)
-            failed_keys.add(key)
+            failed_counts[key] += 1
+            failed_events.add(events[start + i])
 
-if failed_events or failed_keys:
+if failed_events:
     print("summary")
     print("failed events: " + " ".join(map(str, sorted(failed_events))))
-    print("failed keys: " + " ".join(failed_keys))
+    print("mismatching entries per key:")
+    for key, count in failed_counts.items():
+        if count > 0:
+            print(f"  {key}: {count}")
     sys.exit(1)
 
 sys.exit(0)
@@ -154,4 +154,24 @@ Acts::InterpolatedBFieldMap<
 solenoidFieldMap(std::pair<double, double> rlim, std::pair<double, double> zlim,
                  std::pair<size_t, size_t> nbins, const SolenoidBField& field);
 
+/// Function which creates a field mapper by sampling grid points from a
+/// field in (r,z), e.g. an analytical solenoid field evaluated in parallel.
+/// The grid is identical to the one of the overload above.
+///
+/// @param rlim pair of r bounds
+/// @param zlim pair of z bounds
+/// @param nbins pair of bin counts
+/// @param evaluate fills the field values (Br,Bz) for all given (r,z)
+///        positions at once
+///
+/// @return A field map instance for use in interpolation.
+Acts::InterpolatedBFieldMap<
+    Acts::detail::Grid<Acts::Vector2, Acts::detail::EquidistantAxis,
+                       Acts::detail::EquidistantAxis>>
+solenoidFieldMap(
+    std::pair<double, double> rlim, std::pair<double, double> zlim,
+    std::pair<size_t, size_t> nbins,
+    const std::function<void(const std::vector<Vector2>& positions,
+                             std::vector<Vector2>& fields)>& evaluate);
+
 }  // namespace Acts
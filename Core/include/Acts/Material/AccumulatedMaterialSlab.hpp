@@ -30,8 +30,18 @@ namespace Acts {
 ///     tracks. Each track contributes equally.
 class AccumulatedMaterialSlab {
  public:
-  // this class does not have a custom default constructor and thus should not
-  // provide any custom default cstors, dstor, or assignment. see ISOCPP C.20.
+  /// Default constructor with empty per-track and total stores.
+  AccumulatedMaterialSlab() = default;
+
+  /// Construct from the total store of previously accumulated tracks.
+  ///
+  /// @param totalAverage Average material properties of the tracks
+  /// @param totalCount Number of tracks contributing to the average
+  /// @param totalVariance Material variance of the tracks
+  ///
+  /// This allows to continue an accumulation, e.g. from a checkpoint.
+  AccumulatedMaterialSlab(const MaterialSlab& totalAverage,
+                          unsigned int totalCount, float totalVariance = 0.0);
 
   /// Add the material to the current per-track store.
   ///
@@ -71,6 +81,16 @@ class AccumulatedMaterialSlab {
   /// unless explicitly requested.
   void trackAverage(bool useEmptyTrack = false);
 
+  /// Add the total store of another accumulation to the total average.
+  ///
+  /// @param other Accumulated material from a different set of tracks
+  ///
+  /// The result is the same as if the tracks of both accumulations had been
+  /// averaged by this one, i.e. each track still contributes equally. This
+  /// allows to accumulate disjoint sets of tracks independently and to merge
+  /// them afterwards. The per-track stores are not affected.
+  void merge(const AccumulatedMaterialSlab& other);
+
   /// Return the average material properties from all accumulated tracks.
   ///
   /// @returns Average material properties and the number of contributing tracks
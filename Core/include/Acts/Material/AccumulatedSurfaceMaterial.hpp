@@ -52,6 +52,17 @@ class AccumulatedSurfaceMaterial {
   AccumulatedSurfaceMaterial(const BinUtility& binUtility,
                              double splitFactor = 0.);
 
+  /// Constructor from previously accumulated material
+  ///
+  /// @param binUtility defines the binning structure on the surface
+  /// @param accumulatedMaterial is the accumulated material per bin
+  /// @param splitFactor is the pre/post splitting directive
+  ///
+  /// @throws std::invalid_argument if the material does not match the binning
+  AccumulatedSurfaceMaterial(const BinUtility& binUtility,
+                             AccumulatedMatrix accumulatedMaterial,
+                             double splitFactor = 0.);
+
   /// Copy Constructor
   ///
   /// @param asma is the source object to be copied
@@ -131,6 +142,13 @@ class AccumulatedSurfaceMaterial {
   /// @param emptyHit indicator if this is an empty assignment
   void trackAverage(const Vector3& gp, bool emptyHit = false);
 
+  /// Merge the material accumulated from a different set of tracks
+  ///
+  /// @param other is the accumulated material of the same surface
+  ///
+  /// @throws std::invalid_argument if the binning does not match
+  void merge(const AccumulatedSurfaceMaterial& other);
+
   /// Total average creates SurfaceMaterial
   std::unique_ptr<const ISurfaceMaterial> totalAverage();
 
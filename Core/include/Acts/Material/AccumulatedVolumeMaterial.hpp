@@ -27,6 +27,12 @@ class AccumulatedVolumeMaterial {
   /// @returns Vacuum properties if no matter has been accumulated yet.
   const Material& average() { return m_average.material(); }
 
+  /// Return the combination of all entries accumulated so far.
+  const MaterialSlab& accumulated() const { return m_average; }
+
+  /// Add the entries accumulated by another object.
+  void merge(const AccumulatedVolumeMaterial& other);
+
  private:
   MaterialSlab m_average;
 };
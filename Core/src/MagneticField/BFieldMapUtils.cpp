@@ -22,6 +22,7 @@
 #include <initializer_list>
 #include <limits>
 #include <set>
+#include <stdexcept>
 #include <tuple>
 
 using Acts::VectorHelpers::perp;
@@ -257,6 +258,21 @@ Acts::solenoidFieldMap(std::pair<double, double> rlim,
                        std::pair<double, double> zlim,
                        std::pair<size_t, size_t> nbins,
                        const SolenoidBField& field) {
+  return solenoidFieldMap(rlim, zlim, nbins,
+                          [&field](const std::vector<Vector2>& positions,
+                                   std::vector<Vector2>& fields) {
+                            field.getField(positions, fields);
+                          });
+}
+
+Acts::InterpolatedBFieldMap<
+    Acts::detail::Grid<Acts::Vector2, Acts::detail::EquidistantAxis,
+                       Acts::detail::EquidistantAxis>>
+Acts::solenoidFieldMap(
+    std::pair<double, double> rlim, std::pair<double, double> zlim,
+    std::pair<size_t, size_t> nbins,
+    const std::function<void(const std::vector<Vector2>& positions,
+                             std::vector<Vector2>& fields)>& evaluate) {
   double rMin = 0, rMax = 0, zMin = 0, zMax = 0;
   std::tie(rMin, rMax) = rlim;
   std::tie(zMin, zMax) = zlim;
@@ -304,8 +320,12 @@ Acts::solenoidFieldMap(std::pair<double, double> rlim,
                          bfield.y());
   };
 
-  // iterate over all bins, set their value to the solenoid value
-  // at their lower left position
+  // collect the lower left positions of all regular bins, their field is
+  // evaluated at once
+  std::vector<Grid_t::index_t> indices;
+  std::vector<Vector2> positions;
+  indices.reserve(nBinsR * nBinsZ);
+  positions.reserve(nBinsR * nBinsZ);
   for (size_t i = 0; i <= nBinsR + 1; i++) {
     for (size_t j = 0; j <= nBinsZ + 1; j++) {
       Grid_t::index_t index({i, j});
@@ -315,13 +335,21 @@ Acts::solenoidFieldMap(std::pair<double, double> rlim,
       } else {
         // regular bin, get lower left boundary
         Grid_t::point_t lowerLeft = grid.lowerLeftBinEdge(index);
-        // do lookup
-        Vector2 B = field.getField(Vector2(lowerLeft[0], lowerLeft[1]));
-        grid.atLocalBins(index) = B;
+        indices.push_back(index);
+        positions.emplace_back(lowerLeft[0], lowerLeft[1]);
       }
     }
   }
 
+  std::vector<Vector2> fields;
+  evaluate(positions, fields);
+  if (fields.size() != positions.size()) {
+    throw std::runtime_error("Field values missing for the solenoid field map");
+  }
+  for (size_t k = 0; k < indices.size(); k++) {
+    grid.atLocalBins(indices[k]) = fields[k];
+  }
+
   // Create the mapper & BField Service
   // create field mapping
   Acts::InterpolatedBFieldMap<Grid_t> map(
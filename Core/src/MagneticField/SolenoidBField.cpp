@@ -22,6 +22,10 @@
 Acts::SolenoidBField::SolenoidBField(Config config) : m_cfg(config) {
   m_dz = m_cfg.length / m_cfg.nCoils;
   m_R2 = m_cfg.radius * m_cfg.radius;
+  m_coilOffsets.reserve(m_cfg.nCoils);
+  for (size_t coil = 0; coil < m_cfg.nCoils; coil++) {
+    m_coilOffsets.push_back(m_dz * (coil + 0.5));
+  }
   // we need to scale so we reproduce the expected B field strength
   // at the center of the solenoid
   Vector2 field = multiCoilField({0, 0}, 1.);  // scale = 1
@@ -57,6 +61,53 @@ Acts::Vector2 Acts::SolenoidBField::getField(const Vector2& position) const {
   return multiCoilField(position, m_scale);
 }
 
+void Acts::SolenoidBField::getField(const std::vector<Vector2>& positions,
+                                    std::vector<Vector2>& fields) const {
+  using boost::math::ellint_1;
+  using boost::math::ellint_2;
+
+  fields.resize(positions.size());
+
+  // per coil quantities of the current position, stored contiguously so the
+  // arithmetic can be vectorised by the compiler
+  const size_t nCoils = m_coilOffsets.size();
+  std::vector<double> z(nCoils);
+  std::vector<double> k_2(nCoils);
+  std::vector<double> ellint1(nCoils);
+  std::vector<double> ellint2(nCoils);
+
+  for (size_t i = 0; i < positions.size(); i++) {
+    const Vector2& pos = positions[i];
+    // the same arithmetic as multiCoilField, so the values are identical
+    double zEnd = pos[1] + m_cfg.length * 0.5;
+    Vector2 resultField(0, 0);
+
+    double r = std::abs(pos[0]);
+    if (r == 0) {
+      for (size_t coil = 0; coil < nCoils; coil++) {
+        resultField +=
+            Vector2(0., B_z_axis(zEnd - m_coilOffsets[coil], m_scale));
+      }
+      fields[i] = resultField;
+      continue;
+    }
+
+    for (size_t coil = 0; coil < nCoils; coil++) {
+      z[coil] = zEnd - m_coilOffsets[coil];
+      k_2[coil] = k2(r, z[coil]);
+    }
+    for (size_t coil = 0; coil < nCoils; coil++) {
+      ellint1[coil] = ellint_1(k_2[coil]);
+      ellint2[coil] = ellint_2(k_2[coil]);
+    }
+    for (size_t coil = 0; coil < nCoils; coil++) {
+      resultField += singleCoilField(Vector2(pos[0], z[coil]), m_scale,
+                                     k_2[coil], ellint1[coil], ellint2[coil]);
+    }
+    fields[i] = resultField;
+  }
+}
+
 Acts::Result<Acts::Vector3> Acts::SolenoidBField::getFieldGradient(
     const Vector3& position, ActsMatrix<3, 3>& /*derivative*/,
     MagneticFieldProvider::Cache& /*cache*/) const {
@@ -67,9 +118,8 @@ Acts::Vector2 Acts::SolenoidBField::multiCoilField(const Vector2& pos,
                                                    double scale) const {
   // iterate over all coils
   Vector2 resultField(0, 0);
-  for (size_t coil = 0; coil < m_cfg.nCoils; coil++) {
-    Vector2 shiftedPos =
-        Vector2(pos[0], pos[1] + m_cfg.length * 0.5 - m_dz * (coil + 0.5));
+  for (double offset : m_coilOffsets) {
+    Vector2 shiftedPos = Vector2(pos[0], pos[1] + m_cfg.length * 0.5 - offset);
     resultField += singleCoilField(shiftedPos, scale);
   }
 
@@ -78,10 +128,6 @@ Acts::Vector2 Acts::SolenoidBField::multiCoilField(const Vector2& pos,
 
 Acts::Vector2 Acts::SolenoidBField::singleCoilField(const Vector2& pos,
                                                     double scale) const {
-  return {B_r(pos, scale), B_z(pos, scale)};
-}
-
-double Acts::SolenoidBField::B_r(const Vector2& pos, double scale) const {
   //              _
   //     2       /  pi / 2          2    2          - 1 / 2
   // E (k )  =   |         ( 1  -  k  sin {theta} )         dtheta
@@ -97,9 +143,28 @@ double Acts::SolenoidBField::B_r(const Vector2& pos, double scale) const {
   double z = pos[1];
 
   if (r == 0) {
-    return 0.;
+    return {0., B_z_axis(z, scale)};
   }
 
+  // both components need the same elliptic integrals, which dominate the
+  // cost of the evaluation
+  double k_2 = k2(r, z);
+  return singleCoilField(pos, scale, k_2, ellint_1(k_2), ellint_2(k_2));
+}
+
+Acts::Vector2 Acts::SolenoidBField::singleCoilField(const Vector2& pos,
+                                                    double scale, double k_2,
+                                                    double ellint1,
+                                                    double ellint2) const {
+  return {B_r(pos, scale, k_2, ellint1, ellint2),
+          B_z(pos, scale, k_2, ellint1, ellint2)};
+}
+
+double Acts::SolenoidBField::B_r(const Vector2& pos, double scale, double k_2,
+                                 double ellint1, double ellint2) const {
+  double r = std::abs(pos[0]);
+  double z = pos[1];
+
   //                            _                             _
   //              mu  I        |  /     2 \                    |
   //                0     kz   |  |2 - k  |    2          2    |
@@ -107,31 +172,19 @@ double Acts::SolenoidBField::B_r(const Vector2& pos, double scale) const {
   //  r            4pi     ___ |  |      2| 2          1       |
   //                    | /  3 |_ \2 - 2k /                   _|
   //                    |/ Rr
-  double k_2 = k2(r, z);
   double k = std::sqrt(k_2);
   double constant =
       scale * k * z / (4 * M_PI * std::sqrt(m_cfg.radius * r * r * r));
 
-  double B = (2. - k_2) / (2. - 2. * k_2) * ellint_2(k_2) - ellint_1(k_2);
+  double B = (2. - k_2) / (2. - 2. * k_2) * ellint2 - ellint1;
 
   // pos[0] is still signed!
   return r / pos[0] * constant * B;
 }
 
-double Acts::SolenoidBField::B_z(const Vector2& pos, double scale) const {
-  //              _
-  //     2       /  pi / 2          2    2          - 1 / 2
-  // E (k )  =   |         ( 1  -  k  sin {theta} )         dtheta
-  //  1         _/  0
-  using boost::math::ellint_1;
-  //              _          ____________________
-  //     2       /  pi / 2| /       2    2
-  // E (k )  =   |        |/ 1  -  k  sin {theta} dtheta
-  //  2         _/  0
-  using boost::math::ellint_2;
-
+double Acts::SolenoidBField::B_z(const Vector2& pos, double scale, double k_2,
+                                 double ellint1, double ellint2) const {
   double r = std::abs(pos[0]);
-  double z = pos[1];
 
   //                         _                                       _
   //             mu  I      |  /         2      \                     |
@@ -139,22 +192,19 @@ double Acts::SolenoidBField::B_z(const Vector2& pos, double scale) const {
   // B (r,z)  =  ----- ---- |  | -------------- | E (k )  +  E (k )   |
   //  z           4pi    __ |  |           2    |  2          1       |
   //                   |/Rr |_ \   2r(1 - k )   /                    _|
-
-  if (r == 0) {
-    double res = scale / 2. * m_R2 / (std::sqrt(m_R2 + z * z) * (m_R2 + z * z));
-    return res;
-  }
-
-  double k_2 = k2(r, z);
   double k = std::sqrt(k_2);
   double constant = scale * k / (4 * M_PI * std::sqrt(m_cfg.radius * r));
-  double B = ((m_cfg.radius + r) * k_2 - 2. * r) / (2. * r * (1. - k_2)) *
-                 ellint_2(k_2) +
-             ellint_1(k_2);
+  double B =
+      ((m_cfg.radius + r) * k_2 - 2. * r) / (2. * r * (1. - k_2)) * ellint2 +
+      ellint1;
 
   return constant * B;
 }
 
+double Acts::SolenoidBField::B_z_axis(double z, double scale) const {
+  return scale / 2. * m_R2 / (std::sqrt(m_R2 + z * z) * (m_R2 + z * z));
+}
+
 double Acts::SolenoidBField::k2(double r, double z) const {
   //  2           4Rr
   // k   =  ---------------
@@ -11,6 +11,13 @@
 #include "Acts/Material/Material.hpp"
 #include "Acts/Material/detail/AverageMaterials.hpp"
 
+Acts::AccumulatedMaterialSlab::AccumulatedMaterialSlab(
+    const MaterialSlab& totalAverage, unsigned int totalCount,
+    float totalVariance)
+    : m_totalAverage(totalAverage),
+      m_totalVariance(totalVariance),
+      m_totalCount(totalCount) {}
+
 void Acts::AccumulatedMaterialSlab::accumulate(MaterialSlab slab,
                                                float pathCorrection) {
   // scale the recorded material to the equivalence contribution along the
@@ -58,6 +65,31 @@ void Acts::AccumulatedMaterialSlab::trackAverage(bool useEmptyTrack) {
   m_trackAverage = MaterialSlab();
 }
 
+void Acts::AccumulatedMaterialSlab::merge(
+    const AccumulatedMaterialSlab& other) {
+  if (other.m_totalCount == 0u) {
+    return;
+  }
+  if (m_totalCount == 0u) {
+    m_totalAverage = other.m_totalAverage;
+    m_totalVariance = other.m_totalVariance;
+    m_totalCount = other.m_totalCount;
+    return;
+  }
+  double totalCount = static_cast<double>(m_totalCount) + other.m_totalCount;
+  double weightThis = m_totalCount / totalCount;
+  double weightOther = other.m_totalCount / totalCount;
+  // average such that each track of both stores contributes equally.
+  MaterialSlab fromThis(m_totalAverage.material(),
+                        weightThis * m_totalAverage.thickness());
+  MaterialSlab fromOther(other.m_totalAverage.material(),
+                         weightOther * other.m_totalAverage.thickness());
+  m_totalAverage = detail::combineSlabs(fromThis, fromOther);
+  m_totalVariance =
+      weightThis * m_totalVariance + weightOther * other.m_totalVariance;
+  m_totalCount += other.m_totalCount;
+}
+
 std::pair<Acts::MaterialSlab, unsigned int>
 Acts::AccumulatedMaterialSlab::totalAverage() const {
   return {m_totalAverage, m_totalCount};
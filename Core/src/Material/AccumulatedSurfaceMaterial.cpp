@@ -11,6 +11,8 @@
 #include "Acts/Material/BinnedSurfaceMaterial.hpp"
 #include "Acts/Material/HomogeneousSurfaceMaterial.hpp"
 
+#include <algorithm>
+#include <stdexcept>
 #include <utility>
 
 // Default Constructor - for homogeneous material
@@ -30,6 +32,22 @@ Acts::AccumulatedSurfaceMaterial::AccumulatedSurfaceMaterial(
   m_accumulatedMaterial = AccumulatedMatrix(bins1, accVec);
 }
 
+// Constructor from previously accumulated material
+Acts::AccumulatedSurfaceMaterial::AccumulatedSurfaceMaterial(
+    const BinUtility& binUtility, AccumulatedMatrix accumulatedMaterial,
+    double splitFactor)
+    : m_binUtility(binUtility),
+      m_splitFactor(splitFactor),
+      m_accumulatedMaterial(std::move(accumulatedMaterial)) {
+  size_t bins0 = m_binUtility.bins(0);
+  if (m_accumulatedMaterial.size() != m_binUtility.bins(1) or
+      std::any_of(m_accumulatedMaterial.begin(), m_accumulatedMaterial.end(),
+                  [&](const auto& accVec) { return accVec.size() != bins0; })) {
+    throw std::invalid_argument(
+        "Accumulated material does not match the binning");
+  }
+}
+
 // Assign a material properties object
 std::array<size_t, 3> Acts::AccumulatedSurfaceMaterial::accumulate(
     const Vector2& lp, const MaterialSlab& mp, double pathCorrection) {
@@ -129,6 +147,25 @@ void Acts::AccumulatedSurfaceMaterial::trackAverage(
   }
 }
 
+// Merge the material accumulated from a different set of tracks
+void Acts::AccumulatedSurfaceMaterial::merge(
+    const AccumulatedSurfaceMaterial& other) {
+  if (other.m_accumulatedMaterial.size() != m_accumulatedMaterial.size()) {
+    throw std::invalid_argument("Cannot merge material with different binning");
+  }
+  for (size_t ib1 = 0; ib1 < m_accumulatedMaterial.size(); ++ib1) {
+    auto& accVec = m_accumulatedMaterial[ib1];
+    const auto& otherVec = other.m_accumulatedMaterial[ib1];
+    if (otherVec.size() != accVec.size()) {
+      throw std::invalid_argument(
+          "Cannot merge material with different binning");
+    }
+    for (size_t ib0 = 0; ib0 < accVec.size(); ++ib0) {
+      accVec[ib0].merge(otherVec[ib0]);
+    }
+  }
+}
+
 /// Total average creates SurfaceMaterial
 std::unique_ptr<const Acts::ISurfaceMaterial>
 Acts::AccumulatedSurfaceMaterial::totalAverage() {
@@ -13,3 +13,8 @@
 void Acts::AccumulatedVolumeMaterial::accumulate(const MaterialSlab& mat) {
   m_average = detail::combineSlabs(m_average, mat);
 }
+
+void Acts::AccumulatedVolumeMaterial::merge(
+    const AccumulatedVolumeMaterial& other) {
+  m_average = detail::combineSlabs(m_average, other.m_average);
+}
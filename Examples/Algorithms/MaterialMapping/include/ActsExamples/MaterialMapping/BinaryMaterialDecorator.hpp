@@ -0,0 +1,88 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include "Acts/Material/IMaterialDecorator.hpp"
+#include "Acts/Utilities/Logger.hpp"
+
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <string>
+
+namespace Acts {
+class Surface;
+class TrackingVolume;
+}  // namespace Acts
+
+namespace ActsExamples {
+
+/// @class BinaryMaterialDecorator
+///
+/// @brief Decorates the geometry with the material maps of a file written by
+/// the BinaryMaterialWriter.
+///
+/// The file is memory mapped and only its index is read up front. The
+/// material of a surface is looked up when the surface is decorated, and the
+/// binned material refers to the material bins in the mapped file instead of
+/// copying them. Processes on one node reading the same file therefore share
+/// its pages.
+class BinaryMaterialDecorator : public Acts::IMaterialDecorator {
+ public:
+  struct Config {
+    /// The name of the input file
+    std::string fileName = "material-maps.bin";
+    /// Remove existing surface material without a replacement in the file
+    bool clearSurfaceMaterial = true;
+    /// Remove existing volume material without a replacement in the file
+    bool clearVolumeMaterial = true;
+  };
+
+  /// Constructor
+  ///
+  /// @param config configuration struct for the reader
+  /// @param level the log level
+  BinaryMaterialDecorator(const Config& config, Acts::Logging::Level level);
+
+  /// Decorate a surface
+  ///
+  /// @param surface the non-cost surface that is decorated
+  void decorate(Acts::Surface& surface) const final;
+
+  /// Decorate a TrackingVolume
+  ///
+  /// @param volume the non-cost volume that is decorated
+  void decorate(Acts::TrackingVolume& volume) const final;
+
+  /// Number of surfaces with material in the file
+  std::size_t nSurfaces() const;
+
+  /// Number of volumes with material in the file
+  std::size_t nVolumes() const;
+
+  /// Get readonly access to the config parameters
+  const Config& config() const { return m_cfg; }
+
+ private:
+  /// Offset of the record of a geometry identifier, 0 if not found
+  std::size_t find(std::uint64_t indexOffset, std::size_t nEntries,
+                   std::uint64_t geometryId) const;
+
+  const Acts::Logger& logger() const { return *m_logger; }
+
+  Config m_cfg;
+
+  std::unique_ptr<const Acts::Logger> m_logger;
+
+  /// The mapped file, shared with the material views
+  std::shared_ptr<const std::byte> m_data;
+  std::size_t m_size = 0;
+};
+
+}  // namespace ActsExamples
@@ -0,0 +1,96 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include "Acts/Material/MaterialSlab.hpp"
+
+#include <cstddef>
+#include <cstdint>
+#include <type_traits>
+
+/// Layout of the binary material map files written by the
+/// BinaryMaterialWriter and read by the BinaryMaterialDecorator.
+///
+/// The file starts with a header, followed by one record per surface or
+/// volume and the two indices, each sorted by geometry identifier. Records
+/// are aligned to 8 bytes, so they can be used in place from a memory mapped
+/// file. The file is written in the byte order of the machine and is only
+/// meant to be read by builds with the same material slab layout.
+namespace ActsExamples::BinaryMaterialFormat {
+
+static_assert(std::is_trivially_copyable_v<Acts::MaterialSlab>,
+              "Material slabs are stored as raw bytes");
+
+constexpr char magic[8] = {'A', 'C', 'T', 'S', 'M', 'A', 'T', '\0'};
+constexpr std::uint32_t version = 1;
+constexpr std::size_t alignment = 8;
+
+struct Header {
+  char magic[8];
+  std::uint32_t version;
+  /// sizeof(Acts::MaterialSlab) of the writer
+  std::uint32_t slabSize;
+  std::uint64_t nSurfaces;
+  std::uint64_t nVolumes;
+  /// file offset of the surface index
+  std::uint64_t surfaceIndex;
+  /// file offset of the volume index
+  std::uint64_t volumeIndex;
+};
+
+struct IndexEntry {
+  std::uint64_t geometryId;
+  /// file offset of the record
+  std::uint64_t offset;
+};
+
+enum class SurfaceType : std::uint32_t { Homogeneous = 0, Binned = 1 };
+
+/// Surface record, followed by `nBinningData` binning records and
+/// `nBins0 * nBins1` material slabs, stored row by row in bin 1
+struct SurfaceRecord {
+  SurfaceType type;
+  std::int32_t mappingType;
+  double splitFactor;
+  std::uint32_t nBins0;
+  std::uint32_t nBins1;
+  std::uint32_t nBinningData;
+  std::uint32_t padding;
+  /// the bin utility transform, column major
+  double transform[16];
+};
+
+/// Binning record, followed by `bins + 1` boundaries for arbitrary binning
+/// and padded to the alignment
+struct BinningRecord {
+  std::uint8_t type;
+  std::uint8_t option;
+  std::uint8_t value;
+  std::uint8_t zdim;
+  std::uint32_t bins;
+  float min;
+  float max;
+};
+
+enum class VolumeType : std::uint32_t { Homogeneous = 0 };
+
+struct VolumeRecord {
+  VolumeType type;
+  std::uint32_t padding;
+  /// the material parameters, see Acts::Material::ParametersVector
+  float parameters[5];
+  float padding2;
+};
+
+/// Size rounded up to the alignment of the records
+constexpr std::size_t aligned(std::size_t size) {
+  return (size + alignment - 1) / alignment * alignment;
+}
+
+}  // namespace ActsExamples::BinaryMaterialFormat
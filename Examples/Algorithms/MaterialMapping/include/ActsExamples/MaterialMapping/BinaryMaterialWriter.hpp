@@ -0,0 +1,74 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include "Acts/Utilities/Logger.hpp"
+#include "ActsExamples/MaterialMapping/IMaterialWriter.hpp"
+
+#include <memory>
+#include <string>
+
+namespace Acts {
+class Layer;
+class TrackingGeometry;
+class TrackingVolume;
+}  // namespace Acts
+
+namespace ActsExamples {
+
+/// @class BinaryMaterialWriter
+///
+/// @brief Writes out the detector material maps in a binary format that
+/// can be memory mapped by the BinaryMaterialDecorator.
+///
+/// Binned and homogeneous surface material and homogeneous volume material
+/// are supported, other material types are skipped with a warning.
+class BinaryMaterialWriter : public IMaterialWriter {
+ public:
+  struct Config {
+    /// Output file name
+    std::string fileName = "material-maps.bin";
+  };
+
+  /// Constructor
+  ///
+  /// @param config The configuration struct of the writer
+  /// @param level The log level
+  BinaryMaterialWriter(const Config& config, Acts::Logging::Level level);
+
+  /// Write out the material map
+  ///
+  /// @param detMaterial is the SurfaceMaterial and VolumeMaterial maps
+  void writeMaterial(const Acts::DetectorMaterialMaps& detMaterial) override;
+
+  /// Write out the material of a decorated geometry
+  ///
+  /// @param tGeometry is the TrackingGeometry
+  void write(const Acts::TrackingGeometry& tGeometry);
+
+  /// Readonly access to the config
+  const Config& config() const { return m_cfg; }
+
+ private:
+  void collectMaterial(const Acts::TrackingVolume& tVolume,
+                       Acts::DetectorMaterialMaps& detMatMap) const;
+
+  void collectMaterial(const Acts::Layer& tLayer,
+                       Acts::DetectorMaterialMaps& detMatMap) const;
+
+  const Acts::Logger& logger() const { return *m_logger; }
+
+  /// The config of the writer
+  Config m_cfg;
+
+  /// The logger instance
+  std::unique_ptr<const Acts::Logger> m_logger{nullptr};
+};
+
+}  // namespace ActsExamples
@@ -0,0 +1,135 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include "Acts/Definitions/Algebra.hpp"
+#include "Acts/Material/BinnedSurfaceMaterial.hpp"
+#include "Acts/Material/ISurfaceMaterial.hpp"
+#include "Acts/Material/MaterialSlab.hpp"
+#include "Acts/Utilities/BinUtility.hpp"
+
+#include <cstddef>
+#include <memory>
+#include <ostream>
+#include <utility>
+#include <vector>
+
+namespace ActsExamples {
+
+/// @class MappedSurfaceMaterial
+///
+/// Binned surface material like Acts::BinnedSurfaceMaterial, but referring
+/// to material bins owned by someone else, e.g. a memory mapped file, instead
+/// of holding a copy.
+class MappedSurfaceMaterial final : public Acts::ISurfaceMaterial {
+ public:
+  /// Constructor
+  ///
+  /// @param binUtility defines the binning structure on the surface
+  /// @param data keeps the memory of the bins alive
+  /// @param slabs the `nBins0 * nBins1` material bins, stored row by row in bin 1
+  /// @param nBins0 the number of bins in dimension 0
+  /// @param nBins1 the number of bins in dimension 1
+  /// @param splitFactor is the pre/post splitting directive
+  /// @param mappingType is the type of surface mapping associated to the surface
+  MappedSurfaceMaterial(
+      Acts::BinUtility binUtility, std::shared_ptr<const void> data,
+      const Acts::MaterialSlab* slabs, std::size_t nBins0, std::size_t nBins1,
+      double splitFactor = 0.,
+      Acts::MappingType mappingType = Acts::MappingType::Default)
+      : Acts::ISurfaceMaterial(splitFactor, mappingType),
+        m_binUtility(std::move(binUtility)),
+        m_data(std::move(data)),
+        m_slabs(slabs),
+        m_nBins0(nBins0),
+        m_nBins1(nBins1) {}
+
+  /// Scale operator, the bins are copied on first use
+  ///
+  /// @param scale is the scale factor for the full material
+  MappedSurfaceMaterial& operator*=(double scale) final {
+    if (m_owned.empty()) {
+      m_owned.assign(m_slabs, m_slabs + m_nBins0 * m_nBins1);
+      m_slabs = nullptr;
+      m_data.reset();
+    }
+    for (auto& slab : m_owned) {
+      slab.scaleThickness(scale);
+    }
+    return *this;
+  }
+
+  /// Copy the bins into a BinnedSurfaceMaterial, e.g. to write them with
+  /// writers that only know the ACTS material types
+  Acts::BinnedSurfaceMaterial toBinned() const {
+    Acts::MaterialSlabMatrix bins(m_nBins1, Acts::MaterialSlabVector(m_nBins0));
+    for (std::size_t bin1 = 0; bin1 < m_nBins1; ++bin1) {
+      for (std::size_t bin0 = 0; bin0 < m_nBins0; ++bin0) {
+        bins[bin1][bin0] = materialSlab(bin0, bin1);
+      }
+    }
+    return Acts::BinnedSurfaceMaterial(m_binUtility, std::move(bins),
+                                       m_splitFactor, m_mappingType);
+  }
+
+  /// Return the BinUtility
+  const Acts::BinUtility& binUtility() const { return m_binUtility; }
+
+  /// The number of bins in dimension 0
+  std::size_t nBins0() const { return m_nBins0; }
+
+  /// The number of bins in dimension 1
+  std::size_t nBins1() const { return m_nBins1; }
+
+  using Acts::ISurfaceMaterial::materialSlab;
+
+  /// @copydoc Acts::ISurfaceMaterial::materialSlab(const Vector2&) const
+  const Acts::MaterialSlab& materialSlab(const Acts::Vector2& lp) const final {
+    std::size_t ibin0 = m_binUtility.bin(lp, 0);
+    std::size_t ibin1 = m_binUtility.max(1) != 0u ? m_binUtility.bin(lp, 1) : 0;
+    return materialSlab(ibin0, ibin1);
+  }
+
+  /// @copydoc Acts::ISurfaceMaterial::materialSlab(const Vector3&) const
+  const Acts::MaterialSlab& materialSlab(const Acts::Vector3& gp) const final {
+    std::size_t ibin0 = m_binUtility.bin(gp, 0);
+    std::size_t ibin1 = m_binUtility.max(1) != 0u ? m_binUtility.bin(gp, 1) : 0;
+    return materialSlab(ibin0, ibin1);
+  }
+
+  /// @copydoc Acts::ISurfaceMaterial::materialSlab(size_t, size_t) const
+  const Acts::MaterialSlab& materialSlab(std::size_t bin0,
+                                         std::size_t bin1) const final {
+    const Acts::MaterialSlab* slabs =
+        m_owned.empty() ? m_slabs : m_owned.data();
+    return slabs[bin1 * m_nBins0 + bin0];
+  }
+
+  /// Output Method for std::ostream
+  std::ostream& toStream(std::ostream& sl) const final {
+    sl << "ActsExamples::MappedSurfaceMaterial : " << std::endl;
+    sl << "   - Number of Material bins [0,1] : " << m_nBins0 << " / "
+       << m_nBins1 << std::endl;
+    sl << "  - BinUtility: " << m_binUtility << std::endl;
+    return sl;
+  }
+
+ private:
+  Acts::BinUtility m_binUtility;
+  /// Keeps the bins alive, unless they are owned
+  std::shared_ptr<const void> m_data;
+  /// Not used once the bins are owned
+  const Acts::MaterialSlab* m_slabs;
+  std::size_t m_nBins0;
+  std::size_t m_nBins1;
+  /// Only filled once the material is scaled
+  std::vector<Acts::MaterialSlab> m_owned;
+};
+
+}  // namespace ActsExamples
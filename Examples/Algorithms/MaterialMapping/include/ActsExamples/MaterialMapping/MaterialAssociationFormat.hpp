@@ -0,0 +1,63 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <cstdint>
+
+/// Layout of the material association index files written by the
+/// MaterialAssociationWriter and read by the MaterialAssociationIndex.
+///
+/// The file starts with a header, followed by one block per event and the
+/// event index, sorted by event number. An event block is the number of
+/// tracks followed by one track record per track, each followed by its
+/// association records. The file is written in the byte order of the machine.
+namespace ActsExamples::MaterialAssociationFormat {
+
+constexpr char magic[8] = {'A', 'C', 'T', 'S', 'A', 'S', 'C', '\0'};
+constexpr std::uint32_t version = 2;
+
+struct Header {
+  char magic[8];
+  std::uint32_t version;
+  std::uint32_t padding;
+  /// hash of the mapping surfaces, see MaterialAssociationIndex::geometryHash
+  std::uint64_t geometryHash;
+  /// hash of the material tracks the association was found for
+  std::uint64_t inputHash;
+  std::uint64_t nEvents;
+  /// file offset of the event index
+  std::uint64_t eventIndex;
+};
+
+struct EventEntry {
+  std::uint64_t eventNumber;
+  /// file offset of the event block
+  std::uint64_t offset;
+};
+
+struct TrackRecord {
+  /// key of the track in the material track collection of the event
+  std::uint64_t trackKey;
+  std::uint32_t nAssociations;
+  std::uint32_t padding;
+};
+
+/// Association of a material interaction with a mapping surface
+struct AssociationRecord {
+  std::uint64_t geometryId;
+  /// index of the material interaction read for the track, -1 for an empty
+  /// hit added by the mapping
+  std::int32_t step;
+  float pathCorrection;
+  /// intersection with the surface
+  float intersection[3];
+  std::uint32_t padding;
+};
+
+}  // namespace ActsExamples::MaterialAssociationFormat
@@ -0,0 +1,82 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include "Acts/Geometry/GeometryContext.hpp"
+#include "Acts/Material/MaterialInteraction.hpp"
+
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <unordered_map>
+
+namespace Acts {
+class TrackingGeometry;
+}  // namespace Acts
+
+namespace ActsExamples {
+
+/// @class MaterialAssociationIndex
+///
+/// @brief Association of recorded material steps with the mapping surfaces,
+/// as written by the MaterialAssociationWriter.
+///
+/// The index is produced once by a surface material mapping and identified
+/// by the hash of the mapping surfaces. Applying it to the same material
+/// tracks in a later mapping onto the same surfaces lets the mapper skip the
+/// navigation, e.g. when only the binning of the surfaces changes.
+class MaterialAssociationIndex {
+ public:
+  using MaterialTrackCollection =
+      std::unordered_map<std::size_t, Acts::RecordedMaterialTrack>;
+
+  /// Constructor
+  ///
+  /// @param fileName the name of the index file, which is memory mapped
+  MaterialAssociationIndex(const std::string& fileName);
+
+  /// Hash of the mapping surfaces the index was produced for
+  std::uint64_t geometryHash() const;
+
+  /// Hash of the material tracks the index was produced for
+  std::uint64_t inputHash() const;
+
+  /// Number of events in the index
+  std::size_t nEvents() const;
+
+  /// Associate the material tracks of an event with the mapping surfaces
+  ///
+  /// @param eventNumber the number of the event
+  /// @param tracks the material tracks of the event as read from the input
+  ///
+  /// @return false if the event is not part of the index
+  ///
+  /// Material steps that were not associated with a surface are removed and
+  /// the empty hits added by the mapping are restored, tracks without any
+  /// associated step are left unchanged.
+  bool apply(std::size_t eventNumber, MaterialTrackCollection& tracks) const;
+
+  /// Hash of the placement, shape and mapping type of the surfaces with
+  /// material and of the volumes with material of a geometry
+  ///
+  /// @param tGeometry the tracking geometry prepared for the mapping
+  /// @param gctx the geometry context
+  static std::uint64_t geometryHash(const Acts::TrackingGeometry& tGeometry,
+                                    const Acts::GeometryContext& gctx);
+
+ private:
+  std::string m_fileName;
+
+  /// The mapped file
+  std::shared_ptr<const std::byte> m_data;
+  std::size_t m_size = 0;
+};
+
+}  // namespace ActsExamples
@@ -0,0 +1,93 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include "Acts/Material/MaterialInteraction.hpp"
+#include "Acts/Utilities/Logger.hpp"
+#include "ActsExamples/Framework/DataHandle.hpp"
+#include "ActsExamples/Framework/ProcessCode.hpp"
+#include "ActsExamples/Framework/WriterT.hpp"
+#include "ActsExamples/MaterialMapping/MaterialAssociationFormat.hpp"
+
+#include <cstddef>
+#include <cstdint>
+#include <fstream>
+#include <mutex>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+namespace ActsExamples {
+struct AlgorithmContext;
+
+/// @class MaterialAssociationWriter
+///
+/// @brief Writes the association of the material steps with the mapping
+/// surfaces found by a surface material mapping, to be read back as a
+/// MaterialAssociationIndex.
+///
+/// The mapped material tracks are compared with the material tracks read for
+/// the mapping to record which material step was associated with which
+/// surface. Events may be written by several threads, the event index is
+/// written when the writer is finalised.
+class MaterialAssociationWriter
+    : public WriterT<std::unordered_map<size_t, Acts::RecordedMaterialTrack>> {
+ public:
+  struct Config {
+    /// The material tracks read for the mapping
+    std::string inputMaterialTracks = "material_tracks";
+    /// The material tracks after the surface material mapping
+    std::string collection = "mapped_material_tracks";
+    /// Output file name
+    std::string fileName = "material-association.idx";
+    /// Hash of the mapping surfaces, see MaterialAssociationIndex
+    std::uint64_t geometryHash = 0;
+    /// Hash of the input material tracks, e.g. of the content of their file
+    std::uint64_t inputHash = 0;
+  };
+
+  /// Constructor
+  ///
+  /// @param config The configuration struct of the writer
+  /// @param level The log level
+  MaterialAssociationWriter(const Config& config,
+                            Acts::Logging::Level level = Acts::Logging::INFO);
+
+  /// Framework finalize method
+  ProcessCode finalize() override;
+
+  /// Readonly access to the config
+  const Config& config() const { return m_cfg; }
+
+ protected:
+  /// Write the association of the material tracks of one event
+  ///
+  /// @param context The algorithm context with per event information
+  /// @param mappedTracks The material tracks after the mapping
+  ProcessCode writeT(
+      const AlgorithmContext& context,
+      const std::unordered_map<size_t, Acts::RecordedMaterialTrack>&
+          mappedTracks) override;
+
+ private:
+  /// The config class
+  Config m_cfg;
+  /// mutex used to protect multi-threaded writes
+  std::mutex m_writeMutex;
+  /// The output file, renamed to the configured name when finalising
+  std::string m_partialFileName;
+  std::ofstream m_outputFile;
+  /// Offset of the event blocks written so far
+  std::vector<MaterialAssociationFormat::EventEntry> m_eventIndex;
+
+  ReadDataHandle<std::unordered_map<size_t, Acts::RecordedMaterialTrack>>
+      m_inputMaterialTracks{this, "InputMaterialTracks"};
+};
+
+}  // namespace ActsExamples
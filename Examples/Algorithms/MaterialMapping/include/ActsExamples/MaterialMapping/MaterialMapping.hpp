@@ -19,6 +19,7 @@
 #include "ActsExamples/Framework/IAlgorithm.hpp"
 #include "ActsExamples/Framework/ProcessCode.hpp"
 #include "ActsExamples/MaterialMapping/IMaterialWriter.hpp"
+#include "ActsExamples/MaterialMapping/MaterialAssociationIndex.hpp"
 
 #include <climits>
 #include <cstddef>
@@ -32,6 +33,8 @@
 #include <utility>
 #include <vector>
 
+#include <tbb/enumerable_thread_specific.h>
+
 namespace ActsExamples {
 class IMaterialWriter;
 struct AlgorithmContext;
@@ -67,8 +70,19 @@ namespace ActsExamples {
 /// However, running it in one single event, puts enormous pressure onto
 /// the I/O structure.
 ///
-/// It therefore saves the mapping state/cache as a private member variable
-/// and is designed to be executed in a single threaded mode.
+/// It therefore saves the mapping state/cache as a private member variable.
+/// Each thread maps its events into a separate copy of the state, and the
+/// copies are merged when the algorithm is finalised. The resulting maps only
+/// differ from single threaded mapping by the rounding of the averages.
+///
+/// The accumulated material can be written to a checkpoint before the maps
+/// are finalised and merged into later mappings. This allows to map disjoint
+/// sets of material tracks in independent jobs and to finalise the maps in
+/// a job that only merges their checkpoints.
+///
+/// The association of the material steps with the surfaces can be read from
+/// a MaterialAssociationIndex produced by an earlier mapping onto the same
+/// surfaces, the surface material mapper then skips the navigation.
 class MaterialMapping : public IAlgorithm {
  public:
   /// @class nested Config class
@@ -98,6 +112,15 @@ class MaterialMapping : public IAlgorithm {
 
     /// The TrackingGeometry to be mapped on
     std::shared_ptr<const Acts::TrackingGeometry> trackingGeometry = nullptr;
+    /// Checkpoints of earlier mappings onto the same geometry, their
+    /// accumulated material is merged in before mapping
+    std::vector<std::string> inputCheckpoints{};
+    /// Write the accumulated material to this checkpoint in `finalize`,
+    /// before the maps are finalised
+    std::string outputCheckpoint{};
+    /// Association of the material steps with the mapping surfaces, only
+    /// supported for surface material mapping
+    std::shared_ptr<const MaterialAssociationIndex> associationIndex = nullptr;
   };
 
   /// Constructor
@@ -117,8 +140,14 @@ class MaterialMapping : public IAlgorithm {
   ActsExamples::ProcessCode execute(
       const AlgorithmContext& context) const override;
 
+  /// Framework finalize method
+  ///
+  /// Merges the material accumulated by the different threads
+  ActsExamples::ProcessCode finalize() override;
+
   /// Return the parameters to optimised the material map for a given surface
-  /// Those parameters are the variance and the number of track for each bin
+  /// Those parameters are the variance and the number of track for each bin,
+  /// they are only complete once the algorithm is finalised
   ///
   /// @param surfaceID the ID of the surface of interest
   std::vector<std::pair<double, int>> scoringParameters(uint64_t surfaceID);
@@ -127,12 +156,22 @@ class MaterialMapping : public IAlgorithm {
   const Config& config() const { return m_cfg; }
 
  private:
+  /// The mapping states of one thread
+  struct ThreadState {
+    Acts::SurfaceMaterialMapper::State surface;
+    Acts::VolumeMaterialMapper::State volume;
+  };
+
+  /// Merge the material accumulated by the threads into the mapping states
+  void mergeThreadStates();
+
   Config m_cfg;  //!< internal config object
   Acts::SurfaceMaterialMapper::State
       m_mappingState;  //!< Material mapping state
   Acts::VolumeMaterialMapper::State
       m_mappingStateVol;  //!< Material mapping state
-                          //
+  /// Material mapping states of the threads, merged when finalising
+  mutable tbb::enumerable_thread_specific<ThreadState> m_threadStates;
 
   ReadDataHandle<std::unordered_map<size_t, Acts::RecordedMaterialTrack>>
       m_inputMaterialTracks{this, "InputMaterialTracks"};
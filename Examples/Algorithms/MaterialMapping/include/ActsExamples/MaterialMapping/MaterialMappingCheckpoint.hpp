@@ -0,0 +1,49 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include "Acts/Material/SurfaceMaterialMapper.hpp"
+#include "Acts/Material/VolumeMaterialMapper.hpp"
+
+#include <string>
+
+/// Checkpoints of the accumulated material of a material mapping.
+///
+/// A checkpoint holds the material accumulated by the surface and volume
+/// material mappers before the maps are finalised. Checkpoints of jobs that
+/// mapped disjoint sets of material tracks onto the same geometry can be
+/// merged and finalised once, which gives the same maps as mapping all tracks
+/// in a single job.
+///
+/// The binning is not stored, it is taken from the mapping states which have
+/// to be created from the same geometry. The file is written in the byte
+/// order of the machine.
+namespace ActsExamples::MaterialMappingCheckpoint {
+
+/// Write the accumulated material of the mapping states to a file
+///
+/// @param fileName is the name of the checkpoint file
+/// @param surfaceState is the surface mapping state, can be nullptr
+/// @param volumeState is the volume mapping state, can be nullptr
+void write(const std::string& fileName,
+           const Acts::SurfaceMaterialMapper::State* surfaceState,
+           const Acts::VolumeMaterialMapper::State* volumeState);
+
+/// Merge the accumulated material of a file into the mapping states
+///
+/// @param fileName is the name of the checkpoint file
+/// @param surfaceState is the surface mapping state, can be nullptr
+/// @param volumeState is the volume mapping state, can be nullptr
+///
+/// @throws std::runtime_error if the file does not match the mapping states
+void merge(const std::string& fileName,
+           Acts::SurfaceMaterialMapper::State* surfaceState,
+           Acts::VolumeMaterialMapper::State* volumeState);
+
+}  // namespace ActsExamples::MaterialMappingCheckpoint
@@ -0,0 +1,228 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#include "ActsExamples/MaterialMapping/BinaryMaterialDecorator.hpp"
+
+#include "Acts/Geometry/TrackingVolume.hpp"
+#include "Acts/Material/HomogeneousSurfaceMaterial.hpp"
+#include "Acts/Material/HomogeneousVolumeMaterial.hpp"
+#include "Acts/Material/ISurfaceMaterial.hpp"
+#include "Acts/Material/Material.hpp"
+#include "Acts/Surfaces/Surface.hpp"
+#include "Acts/Utilities/BinUtility.hpp"
+#include "Acts/Utilities/BinningData.hpp"
+#include "ActsExamples/MaterialMapping/BinaryMaterialFormat.hpp"
+#include "ActsExamples/MaterialMapping/MappedSurfaceMaterial.hpp"
+
+#include <algorithm>
+#include <cstring>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+namespace Format = ActsExamples::BinaryMaterialFormat;
+
+namespace {
+
+/// Pointer to `n` objects of type `T` at `pos`, nullptr if they exceed the
+/// file
+template <typename T>
+const T* recordAt(const std::byte* data, std::size_t size, std::size_t pos,
+                  std::size_t n = 1) {
+  if (pos > size || n > (size - pos) / sizeof(T)) {
+    return nullptr;
+  }
+  return reinterpret_cast<const T*>(data + pos);
+}
+
+}  // namespace
+
+ActsExamples::BinaryMaterialDecorator::BinaryMaterialDecorator(
+    const Config& config, Acts::Logging::Level level)
+    : m_cfg(config),
+      m_logger{Acts::getDefaultLogger("BinaryMaterialDecorator", level)} {
+  int fd = ::open(m_cfg.fileName.c_str(), O_RDONLY);
+  if (fd < 0) {
+    throw std::ios_base::failure("Could not open '" + m_cfg.fileName + "'");
+  }
+  struct stat st {};
+  if (::fstat(fd, &st) != 0 ||
+      static_cast<std::size_t>(st.st_size) < sizeof(Format::Header)) {
+    ::close(fd);
+    throw std::runtime_error("'" + m_cfg.fileName +
+                             "' is not a binary material map");
+  }
+  m_size = st.st_size;
+  void* addr = ::mmap(nullptr, m_size, PROT_READ, MAP_SHARED, fd, 0);
+  // the mapping stays valid after closing the file
+  ::close(fd);
+  if (addr == MAP_FAILED) {
+    throw std::runtime_error("Could not map '" + m_cfg.fileName + "'");
+  }
+  std::size_t size = m_size;
+  m_data = std::shared_ptr<const std::byte>(
+      static_cast<const std::byte*>(addr), [size](const std::byte* p) {
+        ::munmap(const_cast<std::byte*>(p), size);
+      });
+
+  const auto& header = *reinterpret_cast<const Format::Header*>(m_data.get());
+  if (std::memcmp(header.magic, Format::magic, sizeof(header.magic)) != 0) {
+    throw std::runtime_error("'" + m_cfg.fileName +
+                             "' is not a binary material map");
+  }
+  if (header.version != Format::version ||
+      header.slabSize != sizeof(Acts::MaterialSlab)) {
+    throw std::runtime_error("'" + m_cfg.fileName +
+                             "' was written by an incompatible version");
+  }
+  auto inRange = [&](std::uint64_t offset, std::uint64_t n) {
+    return offset % Format::alignment == 0 && offset <= m_size &&
+           n <= (m_size - offset) / sizeof(Format::IndexEntry);
+  };
+  if (!inRange(header.surfaceIndex, header.nSurfaces) ||
+      !inRange(header.volumeIndex, header.nVolumes)) {
+    throw std::runtime_error("'" + m_cfg.fileName + "' is truncated");
+  }
+
+  ACTS_DEBUG("Mapped material of " << header.nSurfaces << " surfaces and "
+                                   << header.nVolumes << " volumes from "
+                                   << m_cfg.fileName);
+}
+
+std::size_t ActsExamples::BinaryMaterialDecorator::nSurfaces() const {
+  return reinterpret_cast<const Format::Header*>(m_data.get())->nSurfaces;
+}
+
+std::size_t ActsExamples::BinaryMaterialDecorator::nVolumes() const {
+  return reinterpret_cast<const Format::Header*>(m_data.get())->nVolumes;
+}
+
+std::size_t ActsExamples::BinaryMaterialDecorator::find(
+    std::uint64_t indexOffset, std::size_t nEntries,
+    std::uint64_t geometryId) const {
+  const auto* begin =
+      reinterpret_cast<const Format::IndexEntry*>(m_data.get() + indexOffset);
+  const auto* end = begin + nEntries;
+  const auto* it = std::lower_bound(
+      begin, end, geometryId,
+      [](const Format::IndexEntry& entry, std::uint64_t value) {
+        return entry.geometryId < value;
+      });
+  if (it == end || it->geometryId != geometryId) {
+    return 0;
+  }
+  return it->offset;
+}
+
+void ActsExamples::BinaryMaterialDecorator::decorate(
+    Acts::Surface& surface) const {
+  ACTS_VERBOSE("Processing surface: " << surface.geometryId());
+  if (m_cfg.clearSurfaceMaterial) {
+    surface.assignSurfaceMaterial(nullptr);
+  }
+
+  const auto& header = *reinterpret_cast<const Format::Header*>(m_data.get());
+  std::size_t offset =
+      find(header.surfaceIndex, header.nSurfaces, surface.geometryId().value());
+  if (offset == 0) {
+    return;
+  }
+
+  const std::byte* data = m_data.get();
+  auto check = [&](const void* object) {
+    if (object == nullptr) {
+      throw std::runtime_error("Material record of surface " +
+                               std::to_string(surface.geometryId().value()) +
+                               " exceeds the file '" + m_cfg.fileName + "'");
+    }
+  };
+
+  const auto* record = recordAt<Format::SurfaceRecord>(data, m_size, offset);
+  check(record);
+  std::size_t pos = offset + Format::aligned(sizeof(Format::SurfaceRecord));
+  auto mappingType = static_cast<Acts::MappingType>(record->mappingType);
+
+  if (record->type == Format::SurfaceType::Homogeneous) {
+    const auto* slab = recordAt<Acts::MaterialSlab>(data, m_size, pos);
+    check(slab);
+    ACTS_VERBOSE("-> Found homogeneous material for surface, assigning");
+    surface.assignSurfaceMaterial(
+        std::make_shared<Acts::HomogeneousSurfaceMaterial>(
+            *slab, record->splitFactor, mappingType));
+    return;
+  }
+
+  Acts::Transform3 transform;
+  std::copy_n(record->transform, 16, transform.matrix().data());
+  Acts::BinUtility binUtility(transform);
+  for (std::uint32_t ib = 0; ib < record->nBinningData; ++ib) {
+    const auto* bRecord = recordAt<Format::BinningRecord>(data, m_size, pos);
+    check(bRecord);
+    pos += sizeof(Format::BinningRecord);
+    auto option = static_cast<Acts::BinningOption>(bRecord->option);
+    auto value = static_cast<Acts::BinningValue>(bRecord->value);
+    if (bRecord->zdim != 0u) {
+      binUtility += Acts::BinUtility(
+          Acts::BinningData(value, bRecord->min, bRecord->max));
+    } else if (bRecord->type == Acts::arbitrary) {
+      std::size_t nBoundaries = bRecord->bins + 1;
+      const auto* boundaries = recordAt<float>(data, m_size, pos, nBoundaries);
+      check(boundaries);
+      pos += nBoundaries * sizeof(float);
+      binUtility += Acts::BinUtility(Acts::BinningData(
+          option, value,
+          std::vector<float>(boundaries, boundaries + nBoundaries)));
+    } else {
+      binUtility += Acts::BinUtility(Acts::BinningData(
+          option, value, bRecord->bins, bRecord->min, bRecord->max));
+    }
+    pos = Format::aligned(pos);
+  }
+
+  const auto* slabs = recordAt<Acts::MaterialSlab>(
+      data, m_size, pos, std::size_t{record->nBins0} * record->nBins1);
+  check(slabs);
+  ACTS_VERBOSE("-> Found binned material for surface, assigning");
+  surface.assignSurfaceMaterial(
+      std::make_shared<ActsExamples::MappedSurfaceMaterial>(
+          std::move(binUtility), m_data, slabs, record->nBins0, record->nBins1,
+          record->splitFactor, mappingType));
+}
+
+void ActsExamples::BinaryMaterialDecorator::decorate(
+    Acts::TrackingVolume& volume) const {
+  ACTS_VERBOSE("Processing volume: " << volume.geometryId());
+  if (m_cfg.clearVolumeMaterial) {
+    volume.assignVolumeMaterial(nullptr);
+  }
+
+  const auto& header = *reinterpret_cast<const Format::Header*>(m_data.get());
+  std::size_t offset =
+      find(header.volumeIndex, header.nVolumes, volume.geometryId().value());
+  if (offset == 0) {
+    return;
+  }
+  const auto* record =
+      recordAt<Format::VolumeRecord>(m_data.get(), m_size, offset);
+  if (record == nullptr) {
+    throw std::runtime_error("Material record of volume " +
+                             std::to_string(volume.geometryId().value()) +
+                             " exceeds the file '" + m_cfg.fileName + "'");
+  }
+  Acts::Material::ParametersVector parameters;
+  std::copy_n(record->parameters, 5, parameters.data());
+  ACTS_VERBOSE("-> Found material for volume, assigning");
+  volume.assignVolumeMaterial(std::make_shared<Acts::HomogeneousVolumeMaterial>(
+      Acts::Material(parameters)));
+}
@@ -0,0 +1,292 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#include "ActsExamples/MaterialMapping/BinaryMaterialWriter.hpp"
+
+#include "Acts/Definitions/Direction.hpp"
+#include "Acts/Geometry/ApproachDescriptor.hpp"
+#include "Acts/Geometry/BoundarySurfaceT.hpp"
+#include "Acts/Geometry/Layer.hpp"
+#include "Acts/Geometry/TrackingGeometry.hpp"
+#include "Acts/Geometry/TrackingVolume.hpp"
+#include "Acts/Material/BinnedSurfaceMaterial.hpp"
+#include "Acts/Material/HomogeneousSurfaceMaterial.hpp"
+#include "Acts/Material/HomogeneousVolumeMaterial.hpp"
+#include "Acts/Surfaces/SurfaceArray.hpp"
+#include "Acts/Utilities/BinUtility.hpp"
+#include "Acts/Utilities/BinningData.hpp"
+#include "ActsExamples/MaterialMapping/BinaryMaterialFormat.hpp"
+#include "ActsExamples/MaterialMapping/MappedSurfaceMaterial.hpp"
+
+#include <algorithm>
+#include <cstring>
+#include <fstream>
+#include <stdexcept>
+#include <vector>
+
+namespace Format = ActsExamples::BinaryMaterialFormat;
+
+namespace {
+
+/// Appends the records to an output stream, keeping track of the offset
+class RecordStream {
+ public:
+  explicit RecordStream(std::ofstream& out) : m_out(out) {}
+
+  std::uint64_t offset() const { return m_offset; }
+
+  template <typename T>
+  void write(const T& object) {
+    write(&object, sizeof(T));
+  }
+
+  void write(const void* data, std::size_t size) {
+    m_out.write(static_cast<const char*>(data), size);
+    m_offset += size;
+  }
+
+  void align() {
+    static const char zeros[Format::alignment] = {};
+    write(zeros, Format::aligned(m_offset) - m_offset);
+  }
+
+ private:
+  std::ofstream& m_out;
+  std::uint64_t m_offset = 0;
+};
+
+void writeBinning(RecordStream& stream, const Acts::BinningData& bData) {
+  Format::BinningRecord record{};
+  record.type = static_cast<std::uint8_t>(bData.type);
+  record.option = static_cast<std::uint8_t>(bData.option);
+  record.value = static_cast<std::uint8_t>(bData.binvalue);
+  record.zdim = bData.zdim;
+  record.bins = bData.bins();
+  record.min = bData.min;
+  record.max = bData.max;
+  stream.write(record);
+  if (bData.type == Acts::arbitrary) {
+    const auto& boundaries = bData.boundaries();
+    stream.write(boundaries.data(), boundaries.size() * sizeof(float));
+  }
+  stream.align();
+}
+
+}  // namespace
+
+ActsExamples::BinaryMaterialWriter::BinaryMaterialWriter(
+    const ActsExamples::BinaryMaterialWriter::Config& config,
+    Acts::Logging::Level level)
+    : m_cfg(config),
+      m_logger{Acts::getDefaultLogger("BinaryMaterialWriter", level)} {
+  if (m_cfg.fileName.empty()) {
+    throw std::invalid_argument("Missing file name");
+  }
+}
+
+void ActsExamples::BinaryMaterialWriter::writeMaterial(
+    const Acts::DetectorMaterialMaps& detMaterial) {
+  ACTS_DEBUG("Writing to file: " << m_cfg.fileName);
+  std::ofstream out(m_cfg.fileName, std::ios::out | std::ios::binary);
+  if (!out) {
+    throw std::ios_base::failure("Could not open '" + m_cfg.fileName +
+                                 "' to write");
+  }
+  RecordStream stream(out);
+
+  Format::Header header{};
+  std::memcpy(header.magic, Format::magic, sizeof(header.magic));
+  header.version = Format::version;
+  header.slabSize = sizeof(Acts::MaterialSlab);
+  // written again with the index offsets at the end
+  stream.write(header);
+  stream.align();
+
+  // The maps are ordered by geometry identifier, so are the indices
+  std::vector<Format::IndexEntry> surfaceIndex;
+  for (const auto& [geoId, sMaterial] : detMaterial.first) {
+    Format::SurfaceRecord record{};
+    record.mappingType = sMaterial->mappingType();
+    // there is no accessor for the split factor itself
+    record.splitFactor = sMaterial->factor(
+        Acts::Direction::Positive, Acts::MaterialUpdateStage::PostUpdate);
+
+    std::vector<const Acts::BinningData*> binning;
+    std::vector<const Acts::MaterialSlab*> rows;
+    Acts::Transform3 transform = Acts::Transform3::Identity();
+    if (auto bsm =
+            dynamic_cast<const Acts::BinnedSurfaceMaterial*>(sMaterial.get());
+        bsm != nullptr) {
+      const auto& matrix = bsm->fullMaterial();
+      record.type = Format::SurfaceType::Binned;
+      record.nBins1 = matrix.size();
+      record.nBins0 = matrix.empty() ? 0 : matrix.front().size();
+      if (std::any_of(matrix.begin(), matrix.end(), [&](const auto& row) {
+            return row.size() != record.nBins0;
+          })) {
+        ACTS_WARNING("Skipping surface " << geoId
+                                         << " with irregular material bins");
+        continue;
+      }
+      for (const auto& row : matrix) {
+        rows.push_back(row.data());
+      }
+      for (const auto& bData : bsm->binUtility().binningData()) {
+        binning.push_back(&bData);
+      }
+      transform = bsm->binUtility().transform();
+    } else if (auto msm =
+                   dynamic_cast<const MappedSurfaceMaterial*>(sMaterial.get());
+               msm != nullptr) {
+      record.type = Format::SurfaceType::Binned;
+      record.nBins0 = msm->nBins0();
+      record.nBins1 = msm->nBins1();
+      for (std::size_t ib1 = 0; ib1 < msm->nBins1(); ++ib1) {
+        rows.push_back(&msm->materialSlab(0, ib1));
+      }
+      for (const auto& bData : msm->binUtility().binningData()) {
+        binning.push_back(&bData);
+      }
+      transform = msm->binUtility().transform();
+    } else if (auto hsm = dynamic_cast<const Acts::HomogeneousSurfaceMaterial*>(
+                   sMaterial.get());
+               hsm != nullptr) {
+      record.type = Format::SurfaceType::Homogeneous;
+      record.nBins0 = 1;
+      record.nBins1 = 1;
+      rows.push_back(&hsm->materialSlab(0, 0));
+    } else {
+      ACTS_WARNING("Skipping surface " << geoId
+                                       << " with unsupported material type");
+      continue;
+    }
+    record.nBinningData = binning.size();
+    std::copy_n(transform.matrix().data(), 16, record.transform);
+
+    if (std::any_of(binning.begin(), binning.end(), [](const auto* bData) {
+          return bData->subBinningData != nullptr;
+        })) {
+      ACTS_WARNING("Skipping surface " << geoId << " with sub binning");
+      continue;
+    }
+
+    surfaceIndex.push_back({geoId.value(), stream.offset()});
+    stream.write(record);
+    stream.align();
+    for (const auto* bData : binning) {
+      writeBinning(stream, *bData);
+    }
+    for (const auto* row : rows) {
+      stream.write(row, record.nBins0 * sizeof(Acts::MaterialSlab));
+    }
+    stream.align();
+  }
+
+  std::vector<Format::IndexEntry> volumeIndex;
+  for (const auto& [geoId, vMaterial] : detMaterial.second) {
+    auto hvm =
+        dynamic_cast<const Acts::HomogeneousVolumeMaterial*>(vMaterial.get());
+    if (hvm == nullptr) {
+      ACTS_WARNING("Skipping volume " << geoId
+                                      << " with unsupported material type");
+      continue;
+    }
+    Format::VolumeRecord record{};
+    record.type = Format::VolumeType::Homogeneous;
+    auto parameters = hvm->material(Acts::Vector3::Zero()).parameters();
+    std::copy_n(parameters.data(), 5, record.parameters);
+
+    volumeIndex.push_back({geoId.value(), stream.offset()});
+    stream.write(record);
+    stream.align();
+  }
+
+  header.nSurfaces = surfaceIndex.size();
+  header.surfaceIndex = stream.offset();
+  stream.write(surfaceIndex.data(),
+               surfaceIndex.size() * sizeof(Format::IndexEntry));
+  header.nVolumes = volumeIndex.size();
+  header.volumeIndex = stream.offset();
+  stream.write(volumeIndex.data(),
+               volumeIndex.size() * sizeof(Format::IndexEntry));
+
+  out.seekp(0);
+  out.write(reinterpret_cast<const char*>(&header), sizeof(header));
+  if (!out) {
+    throw std::ios_base::failure("Could not write '" + m_cfg.fileName + "'");
+  }
+  ACTS_INFO("Wrote material of " << header.nSurfaces << " surfaces and "
+                                 << header.nVolumes << " volumes to "
+                                 << m_cfg.fileName);
+}
+
+void ActsExamples::BinaryMaterialWriter::write(
+    const Acts::TrackingGeometry& tGeometry) {
+  // Create a detector material map and loop recursively through it
+  Acts::DetectorMaterialMaps detMatMap;
+  auto hVolume = tGeometry.highestTrackingVolume();
+  if (hVolume != nullptr) {
+    collectMaterial(*hVolume, detMatMap);
+  }
+  writeMaterial(detMatMap);
+}
+
+void ActsExamples::BinaryMaterialWriter::collectMaterial(
+    const Acts::TrackingVolume& tVolume,
+    Acts::DetectorMaterialMaps& detMatMap) const {
+  if (tVolume.volumeMaterialSharedPtr() != nullptr) {
+    detMatMap.second[tVolume.geometryId()] = tVolume.volumeMaterialSharedPtr();
+  }
+
+  if (tVolume.confinedLayers() != nullptr) {
+    for (auto& lay : tVolume.confinedLayers()->arrayObjects()) {
+      collectMaterial(*lay, detMatMap);
+    }
+  }
+
+  for (auto& bou : tVolume.boundarySurfaces()) {
+    const auto& bSurface = bou->surfaceRepresentation();
+    if (bSurface.surfaceMaterialSharedPtr() != nullptr) {
+      detMatMap.first[bSurface.geometryId()] =
+          bSurface.surfaceMaterialSharedPtr();
+    }
+  }
+
+  if (tVolume.confinedVolumes() != nullptr) {
+    for (auto& tvol : tVolume.confinedVolumes()->arrayObjects()) {
+      collectMaterial(*tvol, detMatMap);
+    }
+  }
+}
+
+void ActsExamples::BinaryMaterialWriter::collectMaterial(
+    const Acts::Layer& tLayer, Acts::DetectorMaterialMaps& detMatMap) const {
+  const auto& rSurface = tLayer.surfaceRepresentation();
+  if (rSurface.surfaceMaterialSharedPtr() != nullptr) {
+    detMatMap.first[rSurface.geometryId()] =
+        rSurface.surfaceMaterialSharedPtr();
+  }
+
+  if (tLayer.approachDescriptor() != nullptr) {
+    for (auto& aSurface : tLayer.approachDescriptor()->containedSurfaces()) {
+      if (aSurface->surfaceMaterialSharedPtr() != nullptr) {
+        detMatMap.first[aSurface->geometryId()] =
+            aSurface->surfaceMaterialSharedPtr();
+      }
+    }
+  }
+
+  if (tLayer.surfaceArray() != nullptr) {
+    for (auto& sSurface : tLayer.surfaceArray()->surfaces()) {
+      if (sSurface->surfaceMaterialSharedPtr() != nullptr) {
+        detMatMap.first[sSurface->geometryId()] =
+            sSurface->surfaceMaterialSharedPtr();
+      }
+    }
+  }
+}
@@ -0,0 +1,257 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#include "ActsExamples/MaterialMapping/MaterialAssociationIndex.hpp"
+
+#include "Acts/Geometry/ApproachDescriptor.hpp"
+#include "Acts/Geometry/BoundarySurfaceT.hpp"
+#include "Acts/Geometry/Layer.hpp"
+#include "Acts/Geometry/TrackingGeometry.hpp"
+#include "Acts/Geometry/TrackingVolume.hpp"
+#include "Acts/Geometry/VolumeBounds.hpp"
+#include "Acts/Material/ISurfaceMaterial.hpp"
+#include "Acts/Surfaces/Surface.hpp"
+#include "Acts/Surfaces/SurfaceArray.hpp"
+#include "Acts/Surfaces/SurfaceBounds.hpp"
+#include "ActsExamples/MaterialMapping/MaterialAssociationFormat.hpp"
+
+#include <algorithm>
+#include <cstring>
+#include <stdexcept>
+#include <utility>
+#include <vector>
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+namespace Format = ActsExamples::MaterialAssociationFormat;
+
+namespace {
+
+/// FNV-1a, stable across platforms with the same byte order
+class Hasher {
+ public:
+  void add(const void* data, std::size_t size) {
+    const auto* bytes = static_cast<const unsigned char*>(data);
+    for (std::size_t i = 0; i < size; ++i) {
+      m_hash = (m_hash ^ bytes[i]) * 1099511628211ull;
+    }
+  }
+
+  template <typename T>
+  void add(const T& value) {
+    add(&value, sizeof(T));
+  }
+
+  void add(const std::vector<double>& values) {
+    add(values.size());
+    add(values.data(), values.size() * sizeof(double));
+  }
+
+  void add(const Acts::Transform3& transform) {
+    add(transform.matrix().data(), 16 * sizeof(double));
+  }
+
+  std::uint64_t value() const { return m_hash; }
+
+ private:
+  std::uint64_t m_hash = 14695981039346656037ull;
+};
+
+void hashSurface(Hasher& hasher, const Acts::Surface& surface,
+                 const Acts::GeometryContext& gctx) {
+  if (surface.surfaceMaterial() == nullptr) {
+    return;
+  }
+  hasher.add(surface.geometryId().value());
+  hasher.add(static_cast<int>(surface.type()));
+  hasher.add(static_cast<int>(surface.surfaceMaterial()->mappingType()));
+  hasher.add(surface.transform(gctx));
+  hasher.add(static_cast<int>(surface.bounds().type()));
+  hasher.add(surface.bounds().values());
+}
+
+void hashVolume(Hasher& hasher, const Acts::TrackingVolume& tVolume,
+                const Acts::GeometryContext& gctx) {
+  if (tVolume.volumeMaterial() != nullptr) {
+    hasher.add(tVolume.geometryId().value());
+    hasher.add(tVolume.transform());
+    hasher.add(tVolume.volumeBounds().values());
+  }
+
+  if (tVolume.confinedLayers() != nullptr) {
+    for (const auto& layer : tVolume.confinedLayers()->arrayObjects()) {
+      hashSurface(hasher, layer->surfaceRepresentation(), gctx);
+      if (layer->approachDescriptor() != nullptr) {
+        for (const auto* aSurface :
+             layer->approachDescriptor()->containedSurfaces()) {
+          hashSurface(hasher, *aSurface, gctx);
+        }
+      }
+      if (layer->surfaceArray() != nullptr) {
+        for (const auto* sSurface : layer->surfaceArray()->surfaces()) {
+          hashSurface(hasher, *sSurface, gctx);
+        }
+      }
+    }
+  }
+
+  for (const auto& boundary : tVolume.boundarySurfaces()) {
+    hashSurface(hasher, boundary->surfaceRepresentation(), gctx);
+  }
+
+  if (tVolume.confinedVolumes() != nullptr) {
+    for (const auto& volume : tVolume.confinedVolumes()->arrayObjects()) {
+      hashVolume(hasher, *volume, gctx);
+    }
+  }
+}
+
+}  // namespace
+
+ActsExamples::MaterialAssociationIndex::MaterialAssociationIndex(
+    const std::string& fileName)
+    : m_fileName(fileName) {
+  int fd = ::open(m_fileName.c_str(), O_RDONLY);
+  if (fd < 0) {
+    throw std::ios_base::failure("Could not open '" + m_fileName + "'");
+  }
+  struct stat st {};
+  if (::fstat(fd, &st) != 0 ||
+      static_cast<std::size_t>(st.st_size) < sizeof(Format::Header)) {
+    ::close(fd);
+    throw std::runtime_error("'" + m_fileName +
+                             "' is not a material association index");
+  }
+  m_size = st.st_size;
+  void* addr = ::mmap(nullptr, m_size, PROT_READ, MAP_SHARED, fd, 0);
+  // the mapping stays valid after closing the file
+  ::close(fd);
+  if (addr == MAP_FAILED) {
+    throw std::runtime_error("Could not map '" + m_fileName + "'");
+  }
+  std::size_t size = m_size;
+  m_data = std::shared_ptr<const std::byte>(
+      static_cast<const std::byte*>(addr), [size](const std::byte* p) {
+        ::munmap(const_cast<std::byte*>(p), size);
+      });
+
+  const auto& header = *reinterpret_cast<const Format::Header*>(m_data.get());
+  if (std::memcmp(header.magic, Format::magic, sizeof(header.magic)) != 0) {
+    throw std::runtime_error("'" + m_fileName +
+                             "' is not a material association index");
+  }
+  if (header.version != Format::version) {
+    throw std::runtime_error("'" + m_fileName +
+                             "' was written by an incompatible version");
+  }
+  if (header.eventIndex % alignof(Format::EventEntry) != 0 ||
+      header.eventIndex > m_size ||
+      header.nEvents >
+          (m_size - header.eventIndex) / sizeof(Format::EventEntry)) {
+    throw std::runtime_error("'" + m_fileName + "' is truncated");
+  }
+}
+
+std::uint64_t ActsExamples::MaterialAssociationIndex::geometryHash() const {
+  return reinterpret_cast<const Format::Header*>(m_data.get())->geometryHash;
+}
+
+std::uint64_t ActsExamples::MaterialAssociationIndex::inputHash() const {
+  return reinterpret_cast<const Format::Header*>(m_data.get())->inputHash;
+}
+
+std::size_t ActsExamples::MaterialAssociationIndex::nEvents() const {
+  return reinterpret_cast<const Format::Header*>(m_data.get())->nEvents;
+}
+
+bool ActsExamples::MaterialAssociationIndex::apply(
+    std::size_t eventNumber, MaterialTrackCollection& tracks) const {
+  const std::byte* data = m_data.get();
+  const auto& header = *reinterpret_cast<const Format::Header*>(data);
+  const auto* begin =
+      reinterpret_cast<const Format::EventEntry*>(data + header.eventIndex);
+  const auto* end = begin + header.nEvents;
+  const auto* it = std::lower_bound(
+      begin, end, eventNumber,
+      [](const Format::EventEntry& entry, std::uint64_t value) {
+        return entry.eventNumber < value;
+      });
+  if (it == end || it->eventNumber != eventNumber) {
+    return false;
+  }
+
+  auto truncated = [&]() {
+    return std::runtime_error("Event " + std::to_string(eventNumber) +
+                              " exceeds the file '" + m_fileName + "'");
+  };
+  auto mismatch = [&]() {
+    return std::runtime_error("The material tracks of event " +
+                              std::to_string(eventNumber) +
+                              " do not match the index '" + m_fileName + "'");
+  };
+  std::size_t pos = it->offset;
+  auto read = [&](auto& object) {
+    if (pos > m_size || sizeof(object) > m_size - pos) {
+      throw truncated();
+    }
+    std::memcpy(&object, data + pos, sizeof(object));
+    pos += sizeof(object);
+  };
+
+  std::uint64_t nTracks = 0;
+  read(nTracks);
+  if (nTracks != tracks.size()) {
+    throw mismatch();
+  }
+  for (std::uint64_t itrk = 0; itrk < nTracks; ++itrk) {
+    Format::TrackRecord trackRecord{};
+    read(trackRecord);
+    auto track = tracks.find(trackRecord.trackKey);
+    if (track == tracks.end()) {
+      throw mismatch();
+    }
+    auto& rMaterial = track->second.second.materialInteractions;
+    std::vector<Acts::MaterialInteraction> associated;
+    associated.reserve(trackRecord.nAssociations);
+    for (std::uint32_t ia = 0; ia < trackRecord.nAssociations; ++ia) {
+      Format::AssociationRecord record{};
+      read(record);
+      Acts::MaterialInteraction mInteraction;
+      if (record.step >= 0) {
+        if (static_cast<std::size_t>(record.step) >= rMaterial.size()) {
+          throw mismatch();
+        }
+        mInteraction = rMaterial[record.step];
+      }
+      mInteraction.intersectionID = Acts::GeometryIdentifier(record.geometryId);
+      mInteraction.intersection =
+          Acts::Vector3(record.intersection[0], record.intersection[1],
+                        record.intersection[2]);
+      mInteraction.pathCorrection = record.pathCorrection;
+      associated.push_back(std::move(mInteraction));
+    }
+    if (!associated.empty()) {
+      rMaterial = std::move(associated);
+    }
+  }
+  return true;
+}
+
+std::uint64_t ActsExamples::MaterialAssociationIndex::geometryHash(
+    const Acts::TrackingGeometry& tGeometry,
+    const Acts::GeometryContext& gctx) {
+  Hasher hasher;
+  hasher.add(Format::version);
+  if (tGeometry.highestTrackingVolume() != nullptr) {
+    hashVolume(hasher, *tGeometry.highestTrackingVolume(), gctx);
+  }
+  return hasher.value();
+}
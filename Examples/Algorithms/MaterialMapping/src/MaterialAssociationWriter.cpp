@@ -0,0 +1,170 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#include "ActsExamples/MaterialMapping/MaterialAssociationWriter.hpp"
+
+#include "Acts/Surfaces/Surface.hpp"
+#include "ActsExamples/Framework/AlgorithmContext.hpp"
+
+#include <algorithm>
+#include <cstdio>
+#include <cstring>
+#include <ios>
+#include <stdexcept>
+
+#include <unistd.h>
+
+namespace Format = ActsExamples::MaterialAssociationFormat;
+
+namespace {
+
+template <typename T>
+void appendRecord(std::string& block, const T& record) {
+  block.append(reinterpret_cast<const char*>(&record), sizeof(T));
+}
+
+}  // namespace
+
+ActsExamples::MaterialAssociationWriter::MaterialAssociationWriter(
+    const ActsExamples::MaterialAssociationWriter::Config& config,
+    Acts::Logging::Level level)
+    : WriterT(config.collection, "MaterialAssociationWriter", level),
+      m_cfg(config) {
+  if (m_cfg.inputMaterialTracks.empty()) {
+    throw std::invalid_argument("Missing input material tracks");
+  }
+  if (m_cfg.fileName.empty()) {
+    throw std::invalid_argument("Missing file name");
+  }
+  m_inputMaterialTracks.initialize(m_cfg.inputMaterialTracks);
+
+  // The index only appears under its name once it is complete, so that
+  // concurrent jobs never read a partial index
+  m_partialFileName =
+      m_cfg.fileName + ".part" + std::to_string(static_cast<long>(::getpid()));
+  m_outputFile.open(m_partialFileName, std::ios::out | std::ios::binary);
+  if (!m_outputFile) {
+    throw std::ios_base::failure("Could not open '" + m_partialFileName +
+                                 "' to write");
+  }
+  // Reserve the header, it is written once the event index is known
+  Format::Header header{};
+  m_outputFile.write(reinterpret_cast<const char*>(&header), sizeof(header));
+}
+
+ActsExamples::ProcessCode ActsExamples::MaterialAssociationWriter::writeT(
+    const AlgorithmContext& context,
+    const std::unordered_map<size_t, Acts::RecordedMaterialTrack>&
+        mappedTracks) {
+  const auto& inputTracks = m_inputMaterialTracks(context);
+
+  // Assemble the event block before taking the lock
+  std::string block;
+  appendRecord(block, static_cast<std::uint64_t>(mappedTracks.size()));
+  for (const auto& [trackKey, mTrack] : mappedTracks) {
+    const auto& mapped = mTrack.second.materialInteractions;
+    auto input = inputTracks.find(trackKey);
+    if (input == inputTracks.end()) {
+      ACTS_ERROR("Material track " << trackKey << " of event "
+                                   << context.eventNumber
+                                   << " is missing in the input");
+      return ProcessCode::ABORT;
+    }
+    const auto& steps = input->second.second.materialInteractions;
+
+    std::vector<Format::AssociationRecord> records;
+    records.reserve(mapped.size());
+    // The mapping keeps the order of the steps it associated, so they are
+    // found by walking through the input steps once
+    std::size_t is = 0;
+    for (const auto& mInteraction : mapped) {
+      if (mInteraction.surface == nullptr ||
+          mInteraction.intersectionID != mInteraction.surface->geometryId()) {
+        continue;
+      }
+      Format::AssociationRecord record{};
+      record.geometryId = mInteraction.intersectionID.value();
+      record.step = -1;
+      // empty hits added by the mapping carry no material
+      if (mInteraction.materialSlab.thickness() > 0) {
+        while (is < steps.size() &&
+               steps[is].position != mInteraction.position) {
+          ++is;
+        }
+        if (is == steps.size()) {
+          ACTS_ERROR("Mapped material track " << trackKey << " of event "
+                                              << context.eventNumber
+                                              << " does not match the input");
+          return ProcessCode::ABORT;
+        }
+        record.step = is++;
+      }
+      record.pathCorrection = mInteraction.pathCorrection;
+      for (unsigned int i = 0; i < 3; ++i) {
+        record.intersection[i] = mInteraction.intersection[i];
+      }
+      records.push_back(record);
+    }
+
+    Format::TrackRecord trackRecord{};
+    trackRecord.trackKey = trackKey;
+    trackRecord.nAssociations = records.size();
+    appendRecord(block, trackRecord);
+    for (const auto& record : records) {
+      appendRecord(block, record);
+    }
+  }
+
+  std::lock_guard<std::mutex> lock(m_writeMutex);
+  Format::EventEntry entry{};
+  entry.eventNumber = context.eventNumber;
+  entry.offset = m_outputFile.tellp();
+  m_eventIndex.push_back(entry);
+  m_outputFile.write(block.data(), block.size());
+  if (!m_outputFile) {
+    ACTS_ERROR("Could not write '" << m_cfg.fileName << "'");
+    return ProcessCode::ABORT;
+  }
+  return ProcessCode::SUCCESS;
+}
+
+ActsExamples::ProcessCode ActsExamples::MaterialAssociationWriter::finalize() {
+  std::sort(m_eventIndex.begin(), m_eventIndex.end(),
+            [](const auto& a, const auto& b) {
+              return a.eventNumber < b.eventNumber;
+            });
+
+  // The event index is aligned to its entries for memory mapping
+  auto position = static_cast<std::uint64_t>(m_outputFile.tellp());
+  std::uint64_t padding =
+      (alignof(Format::EventEntry) - position % alignof(Format::EventEntry)) %
+      alignof(Format::EventEntry);
+  m_outputFile.write(std::string(padding, '\0').data(), padding);
+
+  Format::Header header{};
+  std::memcpy(header.magic, Format::magic, sizeof(header.magic));
+  header.version = Format::version;
+  header.geometryHash = m_cfg.geometryHash;
+  header.inputHash = m_cfg.inputHash;
+  header.nEvents = m_eventIndex.size();
+  header.eventIndex = position + padding;
+  m_outputFile.write(reinterpret_cast<const char*>(m_eventIndex.data()),
+                     m_eventIndex.size() * sizeof(Format::EventEntry));
+  m_outputFile.seekp(0);
+  m_outputFile.write(reinterpret_cast<const char*>(&header), sizeof(header));
+  m_outputFile.close();
+  if (!m_outputFile ||
+      std::rename(m_partialFileName.c_str(), m_cfg.fileName.c_str()) != 0) {
+    ACTS_ERROR("Could not write '" << m_cfg.fileName << "'");
+    return ProcessCode::ABORT;
+  }
+
+  ACTS_INFO("Wrote the material association of "
+            << header.nEvents << " events to " << m_cfg.fileName);
+  return ProcessCode::SUCCESS;
+}
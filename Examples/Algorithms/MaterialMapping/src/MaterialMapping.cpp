@@ -11,7 +11,9 @@
 #include "Acts/Material/AccumulatedMaterialSlab.hpp"
 #include "Acts/Material/AccumulatedSurfaceMaterial.hpp"
 #include "ActsExamples/MaterialMapping/IMaterialWriter.hpp"
+#include "ActsExamples/MaterialMapping/MaterialMappingCheckpoint.hpp"
 
+#include <exception>
 #include <iostream>
 #include <stdexcept>
 #include <unordered_map>
@@ -20,25 +22,64 @@ namespace ActsExamples {
 struct AlgorithmContext;
 }  // namespace ActsExamples
 
+namespace {
+
+/// Merge the accumulated material of the grids in `source` into `target`
+template <typename grid_map_t>
+void mergeGrids(grid_map_t& target, grid_map_t& source) {
+  for (auto& [geoId, grid] : source) {
+    auto it = target.find(geoId);
+    if (it == target.end()) {
+      target.emplace(geoId, std::move(grid));
+      continue;
+    }
+    for (size_t ib = 0; ib < grid.size(); ++ib) {
+      it->second.at(ib).merge(grid.at(ib));
+    }
+  }
+}
+
+}  // namespace
+
 ActsExamples::MaterialMapping::MaterialMapping(
     const ActsExamples::MaterialMapping::Config& cfg,
     Acts::Logging::Level level)
     : ActsExamples::IAlgorithm("MaterialMapping", level),
       m_cfg(cfg),
       m_mappingState(cfg.geoContext, cfg.magFieldContext),
-      m_mappingStateVol(cfg.geoContext, cfg.magFieldContext) {
+      m_mappingStateVol(cfg.geoContext, cfg.magFieldContext),
+      m_threadStates([this]() {
+        ThreadState state{{m_cfg.geoContext, m_cfg.magFieldContext},
+                          {m_cfg.geoContext, m_cfg.magFieldContext}};
+        if (m_cfg.materialSurfaceMapper) {
+          state.surface = m_cfg.materialSurfaceMapper->createState(
+              m_cfg.geoContext, m_cfg.magFieldContext, *m_cfg.trackingGeometry);
+        }
+        if (m_cfg.materialVolumeMapper) {
+          state.volume = m_cfg.materialVolumeMapper->createState(
+              m_cfg.geoContext, m_cfg.magFieldContext, *m_cfg.trackingGeometry);
+        }
+        return state;
+      }) {
   if (!m_cfg.materialSurfaceMapper && !m_cfg.materialVolumeMapper) {
     throw std::invalid_argument("Missing material mapper");
   } else if (!m_cfg.trackingGeometry) {
     throw std::invalid_argument("Missing tracking geometry");
+  } else if (m_cfg.associationIndex && m_cfg.materialVolumeMapper) {
+    throw std::invalid_argument(
+        "The association index does not support volume material mapping");
+  }
+  if (m_cfg.associationIndex &&
+      m_cfg.associationIndex->geometryHash() !=
+          MaterialAssociationIndex::geometryHash(*m_cfg.trackingGeometry,
+                                                 m_cfg.geoContext)) {
+    throw std::invalid_argument(
+        "The association index was produced for different mapping surfaces");
   }
 
   m_inputMaterialTracks.initialize(m_cfg.collection);
   m_outputMaterialTracks.initialize(m_cfg.mappingMaterialCollection);
 
-  ACTS_INFO("This algorithm requires inter-event information, "
-            << "run in single-threaded mode!");
-
   if (m_cfg.materialSurfaceMapper) {
     // Generate and retrieve the central cache object
     m_mappingState = m_cfg.materialSurfaceMapper->createState(
@@ -49,9 +90,18 @@ ActsExamples::MaterialMapping::MaterialMapping(
     m_mappingStateVol = m_cfg.materialVolumeMapper->createState(
         m_cfg.geoContext, m_cfg.magFieldContext, *m_cfg.trackingGeometry);
   }
+  for (const auto& checkpoint : m_cfg.inputCheckpoints) {
+    ACTS_INFO("Merging the accumulated material of " << checkpoint);
+    MaterialMappingCheckpoint::merge(
+        checkpoint, m_cfg.materialSurfaceMapper ? &m_mappingState : nullptr,
+        m_cfg.materialVolumeMapper ? &m_mappingStateVol : nullptr);
+  }
 }
 
 ActsExamples::MaterialMapping::~MaterialMapping() {
+  // in case the algorithm was not finalised by the sequencer
+  mergeThreadStates();
+
   Acts::DetectorMaterialMaps detectorMaterial;
 
   if (m_cfg.materialSurfaceMapper && m_cfg.materialVolumeMapper) {
@@ -104,23 +154,24 @@ ActsExamples::ProcessCode ActsExamples::MaterialMapping::execute(
   std::unordered_map<size_t, Acts::RecordedMaterialTrack> mtrackCollection =
       m_inputMaterialTracks(context);
 
+  // The mapping states of this thread
+  ThreadState& state = m_threadStates.local();
+
+  if (m_cfg.associationIndex &&
+      !m_cfg.associationIndex->apply(context.eventNumber, mtrackCollection)) {
+    ACTS_WARNING("Event " << context.eventNumber
+                          << " is missing in the association index");
+  }
   if (m_cfg.materialSurfaceMapper) {
-    // To make it work with the framework needs a lock guard
-    auto mappingState =
-        const_cast<Acts::SurfaceMaterialMapper::State*>(&m_mappingState);
     for (auto& [idTrack, mTrack] : mtrackCollection) {
       // Map this one onto the geometry
-      m_cfg.materialSurfaceMapper->mapMaterialTrack(*mappingState, mTrack);
+      m_cfg.materialSurfaceMapper->mapMaterialTrack(state.surface, mTrack);
     }
   }
   if (m_cfg.materialVolumeMapper) {
-    // To make it work with the framework needs a lock guard
-    auto mappingState =
-        const_cast<Acts::VolumeMaterialMapper::State*>(&m_mappingStateVol);
-
     for (auto& [idTrack, mTrack] : mtrackCollection) {
       // Map this one onto the geometry
-      m_cfg.materialVolumeMapper->mapMaterialTrack(*mappingState, mTrack);
+      m_cfg.materialVolumeMapper->mapMaterialTrack(state.volume, mTrack);
     }
   }
   // Write take the collection to the EventStore
@@ -128,6 +179,45 @@ ActsExamples::ProcessCode ActsExamples::MaterialMapping::execute(
   return ActsExamples::ProcessCode::SUCCESS;
 }
 
+ActsExamples::ProcessCode ActsExamples::MaterialMapping::finalize() {
+  mergeThreadStates();
+
+  if (!m_cfg.outputCheckpoint.empty()) {
+    ACTS_INFO("Writing the accumulated material to " << m_cfg.outputCheckpoint);
+    try {
+      MaterialMappingCheckpoint::write(
+          m_cfg.outputCheckpoint,
+          m_cfg.materialSurfaceMapper ? &m_mappingState : nullptr,
+          m_cfg.materialVolumeMapper ? &m_mappingStateVol : nullptr);
+    } catch (const std::exception& e) {
+      ACTS_ERROR("Could not write the checkpoint " << m_cfg.outputCheckpoint
+                                                   << ": " << e.what());
+      return ActsExamples::ProcessCode::ABORT;
+    }
+  }
+  return ActsExamples::ProcessCode::SUCCESS;
+}
+
+void ActsExamples::MaterialMapping::mergeThreadStates() {
+  for (auto& state : m_threadStates) {
+    for (auto& [geoId, accMaterial] : state.surface.accumulatedMaterial) {
+      auto it = m_mappingState.accumulatedMaterial.find(geoId);
+      if (it == m_mappingState.accumulatedMaterial.end()) {
+        m_mappingState.accumulatedMaterial.emplace(geoId,
+                                                   std::move(accMaterial));
+      } else {
+        it->second.merge(accMaterial);
+      }
+    }
+    for (auto& [geoId, accMaterial] : state.volume.homogeneousGrid) {
+      m_mappingStateVol.homogeneousGrid[geoId].merge(accMaterial);
+    }
+    mergeGrids(m_mappingStateVol.grid2D, state.volume.grid2D);
+    mergeGrids(m_mappingStateVol.grid3D, state.volume.grid3D);
+  }
+  m_threadStates.clear();
+}
+
 std::vector<std::pair<double, int>>
 ActsExamples::MaterialMapping::scoringParameters(uint64_t surfaceID) {
   std::vector<std::pair<double, int>> scoringParameters;
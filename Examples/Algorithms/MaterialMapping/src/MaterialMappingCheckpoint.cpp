@@ -0,0 +1,255 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#include "ActsExamples/MaterialMapping/MaterialMappingCheckpoint.hpp"
+
+#include "Acts/Material/AccumulatedMaterialSlab.hpp"
+#include "Acts/Material/AccumulatedSurfaceMaterial.hpp"
+#include "Acts/Material/AccumulatedVolumeMaterial.hpp"
+#include "Acts/Material/MaterialSlab.hpp"
+
+#include <cstdint>
+#include <cstring>
+#include <fstream>
+#include <stdexcept>
+#include <string>
+#include <tuple>
+#include <type_traits>
+
+namespace {
+
+static_assert(std::is_trivially_copyable_v<Acts::MaterialSlab>,
+              "Material slabs are stored as raw bytes");
+
+constexpr char magic[8] = {'A', 'C', 'T', 'S', 'A', 'C', 'C', '\0'};
+constexpr std::uint32_t version = 1;
+
+struct Header {
+  char magic[8];
+  std::uint32_t version;
+  /// sizeof(Acts::MaterialSlab) of the writer
+  std::uint32_t slabSize;
+  std::uint64_t nSurfaces;
+  std::uint64_t nVolumes;
+};
+
+/// Followed by nBins0 * nBins1 bins, stored row by row in bin 1
+struct SurfaceRecord {
+  std::uint64_t geometryId;
+  std::uint32_t nBins0;
+  std::uint32_t nBins1;
+};
+
+struct BinRecord {
+  Acts::MaterialSlab totalAverage;
+  float totalVariance;
+  std::uint32_t totalCount;
+};
+
+/// Followed by nPoints material slabs
+struct VolumeRecord {
+  std::uint64_t geometryId;
+  std::uint32_t dimensions;
+  std::uint32_t reserved;
+  std::uint64_t nPoints;
+};
+
+template <typename T>
+void writeRecord(std::ofstream& out, const T& record) {
+  out.write(reinterpret_cast<const char*>(&record), sizeof(T));
+}
+
+template <typename T>
+T readRecord(std::ifstream& in, const std::string& fileName) {
+  T record{};
+  if (!in.read(reinterpret_cast<char*>(&record), sizeof(T))) {
+    throw std::runtime_error("'" + fileName + "' is truncated");
+  }
+  return record;
+}
+
+/// Calls `fn(geoId, dimensions, nPoints, point)` for the accumulated material
+/// of each volume, `point(i)` returns the accumulated material of a point
+template <typename state_t, typename function_t>
+void forEachVolume(state_t& state, function_t&& fn) {
+  for (const auto& [geoId, binUtility] : state.materialBin) {
+    std::size_t dimensions = binUtility.dimensions();
+    if (dimensions == 0) {
+      auto it = state.homogeneousGrid.find(geoId);
+      if (it != state.homogeneousGrid.end()) {
+        fn(
+            geoId, dimensions,
+            1u, [&](std::size_t /*ip*/) -> auto& { return it->second; });
+      }
+    } else if (dimensions == 2) {
+      auto it = state.grid2D.find(geoId);
+      if (it != state.grid2D.end()) {
+        fn(
+            geoId, dimensions, it->second.size(), [&](std::size_t ip) -> auto& {
+              return it->second.at(ip);
+            });
+      }
+    } else if (dimensions == 3) {
+      auto it = state.grid3D.find(geoId);
+      if (it != state.grid3D.end()) {
+        fn(
+            geoId, dimensions, it->second.size(), [&](std::size_t ip) -> auto& {
+              return it->second.at(ip);
+            });
+      }
+    }
+  }
+}
+
+}  // namespace
+
+void ActsExamples::MaterialMappingCheckpoint::write(
+    const std::string& fileName,
+    const Acts::SurfaceMaterialMapper::State* surfaceState,
+    const Acts::VolumeMaterialMapper::State* volumeState) {
+  std::ofstream out(fileName, std::ios::out | std::ios::binary);
+  if (!out) {
+    throw std::ios_base::failure("Could not open '" + fileName + "' to write");
+  }
+
+  Header header{};
+  std::memcpy(header.magic, magic, sizeof(header.magic));
+  header.version = version;
+  header.slabSize = sizeof(Acts::MaterialSlab);
+  if (surfaceState != nullptr) {
+    header.nSurfaces = surfaceState->accumulatedMaterial.size();
+  }
+  if (volumeState != nullptr) {
+    forEachVolume(*volumeState, [&](auto&&...) { ++header.nVolumes; });
+  }
+  writeRecord(out, header);
+
+  if (surfaceState != nullptr) {
+    for (const auto& [geoId, accMaterial] : surfaceState->accumulatedMaterial) {
+      const auto& matrix = accMaterial.accumulatedMaterial();
+      SurfaceRecord record{};
+      record.geometryId = geoId.value();
+      record.nBins1 = matrix.size();
+      record.nBins0 = matrix.empty() ? 0 : matrix.front().size();
+      writeRecord(out, record);
+      for (const auto& accVec : matrix) {
+        for (const auto& slab : accVec) {
+          BinRecord bin{};
+          std::tie(bin.totalAverage, bin.totalCount) = slab.totalAverage();
+          bin.totalVariance = slab.totalVariance().first;
+          writeRecord(out, bin);
+        }
+      }
+    }
+  }
+
+  if (volumeState != nullptr) {
+    forEachVolume(*volumeState,
+                  [&](Acts::GeometryIdentifier geoId, std::size_t dimensions,
+                      std::size_t nPoints, auto&& point) {
+                    VolumeRecord record{};
+                    record.geometryId = geoId.value();
+                    record.dimensions = dimensions;
+                    record.nPoints = nPoints;
+                    writeRecord(out, record);
+                    for (std::size_t ip = 0; ip < nPoints; ++ip) {
+                      writeRecord(out, point(ip).accumulated());
+                    }
+                  });
+  }
+
+  if (!out) {
+    throw std::ios_base::failure("Could not write '" + fileName + "'");
+  }
+}
+
+void ActsExamples::MaterialMappingCheckpoint::merge(
+    const std::string& fileName,
+    Acts::SurfaceMaterialMapper::State* surfaceState,
+    Acts::VolumeMaterialMapper::State* volumeState) {
+  std::ifstream in(fileName, std::ios::in | std::ios::binary);
+  if (!in) {
+    throw std::ios_base::failure("Could not open '" + fileName + "'");
+  }
+
+  auto header = readRecord<Header>(in, fileName);
+  if (std::memcmp(header.magic, magic, sizeof(header.magic)) != 0) {
+    throw std::runtime_error("'" + fileName +
+                             "' is not a material mapping checkpoint");
+  }
+  if (header.version != version ||
+      header.slabSize != sizeof(Acts::MaterialSlab)) {
+    throw std::runtime_error("'" + fileName +
+                             "' was written by an incompatible version");
+  }
+  auto mismatch = [&](const char* kind, std::uint64_t geoId) {
+    return std::runtime_error("The " + std::string(kind) + " " +
+                              std::to_string(geoId) + " in '" + fileName +
+                              "' does not match the mapped geometry");
+  };
+
+  if (header.nSurfaces != 0 && surfaceState == nullptr) {
+    throw std::runtime_error("'" + fileName +
+                             "' contains surface material, but no surface "
+                             "material is mapped");
+  }
+  for (std::uint64_t is = 0; is < header.nSurfaces; ++is) {
+    auto record = readRecord<SurfaceRecord>(in, fileName);
+    auto it = surfaceState->accumulatedMaterial.find(
+        Acts::GeometryIdentifier(record.geometryId));
+    if (it == surfaceState->accumulatedMaterial.end()) {
+      throw mismatch("surface", record.geometryId);
+    }
+    Acts::AccumulatedSurfaceMaterial::AccumulatedMatrix matrix(
+        record.nBins1,
+        Acts::AccumulatedSurfaceMaterial::AccumulatedVector(record.nBins0));
+    for (auto& accVec : matrix) {
+      for (auto& slab : accVec) {
+        auto bin = readRecord<BinRecord>(in, fileName);
+        slab = Acts::AccumulatedMaterialSlab(bin.totalAverage, bin.totalCount,
+                                             bin.totalVariance);
+      }
+    }
+    try {
+      it->second.merge(Acts::AccumulatedSurfaceMaterial(
+          it->second.binUtility(), std::move(matrix),
+          it->second.splitFactor()));
+    } catch (const std::invalid_argument&) {
+      throw mismatch("surface", record.geometryId);
+    }
+  }
+
+  if (header.nVolumes != 0 && volumeState == nullptr) {
+    throw std::runtime_error("'" + fileName +
+                             "' contains volume material, but no volume "
+                             "material is mapped");
+  }
+  for (std::uint64_t iv = 0; iv < header.nVolumes; ++iv) {
+    auto record = readRecord<VolumeRecord>(in, fileName);
+    bool found = false;
+    forEachVolume(*volumeState, [&](Acts::GeometryIdentifier geoId,
+                                    std::size_t dimensions, std::size_t nPoints,
+                                    auto&& point) {
+      if (geoId.value() != record.geometryId) {
+        return;
+      }
+      if (dimensions != record.dimensions || nPoints != record.nPoints) {
+        throw mismatch("volume", record.geometryId);
+      }
+      for (std::size_t ip = 0; ip < nPoints; ++ip) {
+        Acts::AccumulatedVolumeMaterial accumulated;
+        accumulated.accumulate(readRecord<Acts::MaterialSlab>(in, fileName));
+        point(ip).merge(accumulated);
+      }
+      found = true;
+    });
+    if (!found) {
+      throw mismatch("volume", record.geometryId);
+    }
+  }
+}
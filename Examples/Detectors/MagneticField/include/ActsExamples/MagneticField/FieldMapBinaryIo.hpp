@@ -0,0 +1,51 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include "Acts/MagneticField/InterpolatedBFieldMap.hpp"
+#include "ActsExamples/MagneticField/MagneticField.hpp"
+
+#include <memory>
+#include <string>
+
+namespace ActsExamples {
+
+/// Write the grid of a field map in (r,z) to a binary file
+///
+/// The file holds the axes and the values of all bins of the grid in the
+/// byte order of the machine. It is read back by
+/// makeMagneticFieldMapFromBinary without any conversion.
+///
+/// @param[in] field The field map, e.g. from Acts::solenoidFieldMap or
+///            makeMagneticFieldMapRzFromRoot
+/// @param[in] fieldMapFile Path of the output file
+void writeMagneticFieldMapBinary(
+    const detail::InterpolatedMagneticField2& field,
+    const std::string& fieldMapFile);
+
+/// Write the grid of a field map in (x,y,z) to a binary file
+///
+/// @param[in] field The field map, e.g. from makeMagneticFieldMapXyzFromRoot
+/// @param[in] fieldMapFile Path of the output file
+void writeMagneticFieldMapBinary(
+    const detail::InterpolatedMagneticField3& field,
+    const std::string& fieldMapFile);
+
+/// Memory map a field map written by writeMagneticFieldMapBinary
+///
+/// The grid values are not copied, all processes reading the same file
+/// share its pages.
+///
+/// @param[in] fieldMapFile Path of the binary field map
+/// @return a MappedBFieldMap<2> or MappedBFieldMap<3>, interpolating like
+///         the field map that was written
+std::shared_ptr<Acts::InterpolatedMagneticField> makeMagneticFieldMapFromBinary(
+    const std::string& fieldMapFile);
+
+}  // namespace ActsExamples
@@ -0,0 +1,114 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include "Acts/Definitions/Algebra.hpp"
+#include "Acts/MagneticField/InterpolatedBFieldMap.hpp"
+#include "Acts/MagneticField/MagneticFieldContext.hpp"
+#include "Acts/MagneticField/MagneticFieldProvider.hpp"
+#include "Acts/Utilities/Result.hpp"
+#include "Acts/Utilities/detail/Axis.hpp"
+#include "Acts/Utilities/detail/AxisFwd.hpp"
+#include "Acts/Utilities/detail/Grid.hpp"
+
+#include <array>
+#include <cstddef>
+#include <memory>
+#include <tuple>
+#include <type_traits>
+#include <vector>
+
+namespace ActsExamples {
+
+/// @class MappedBFieldMap
+///
+/// @brief Interpolated magnetic field map with the grid values in a memory
+/// mapped file, see FieldMapBinaryIo.hpp.
+///
+/// The values are read in place, so processes using the same file share its
+/// pages. The field is interpolated like the InterpolatedBFieldMap it was
+/// written from: in (r,z) for two dimensions, with the field given as (Br,Bz),
+/// and in (x,y,z) for three dimensions.
+///
+/// @tparam DIM the dimension of the grid, 2 or 3
+template <std::size_t DIM>
+class MappedBFieldMap final : public Acts::InterpolatedMagneticField {
+  static_assert(DIM == 2 || DIM == 3, "Only (r,z) and (x,y,z) maps exist");
+
+ public:
+  using FieldType = Acts::ActsVector<DIM>;
+  using Axes = std::conditional_t<
+      DIM == 2,
+      std::tuple<Acts::detail::EquidistantAxis, Acts::detail::EquidistantAxis>,
+      std::tuple<Acts::detail::EquidistantAxis, Acts::detail::EquidistantAxis,
+                 Acts::detail::EquidistantAxis>>;
+  /// Grid type of the equivalent InterpolatedBFieldMap
+  using Grid = std::conditional_t<
+      DIM == 2,
+      Acts::detail::Grid<FieldType, Acts::detail::EquidistantAxis,
+                         Acts::detail::EquidistantAxis>,
+      Acts::detail::Grid<FieldType, Acts::detail::EquidistantAxis,
+                         Acts::detail::EquidistantAxis,
+                         Acts::detail::EquidistantAxis>>;
+  using FieldCell = typename Acts::InterpolatedBFieldMap<Grid>::FieldCell;
+  using Cache = typename Acts::InterpolatedBFieldMap<Grid>::Cache;
+
+  /// Constructor
+  ///
+  /// @param axes the axes of the grid
+  /// @param values the field values of all bins of the grid, including the
+  ///        under- and overflow bins, stored as DIM doubles per bin
+  MappedBFieldMap(Axes axes, std::shared_ptr<const double> values);
+
+  std::vector<std::size_t> getNBins() const final;
+
+  std::vector<double> getMin() const final;
+
+  std::vector<double> getMax() const final;
+
+  bool isInside(const Acts::Vector3& position) const final;
+
+  Acts::Vector3 getFieldUnchecked(const Acts::Vector3& position) const final;
+
+  Acts::Result<Acts::Vector3> getField(
+      const Acts::Vector3& position,
+      Acts::MagneticFieldProvider::Cache& cache) const final;
+
+  Acts::Result<Acts::Vector3> getFieldGradient(
+      const Acts::Vector3& position, Acts::ActsMatrix<3, 3>& derivative,
+      Acts::MagneticFieldProvider::Cache& cache) const final;
+
+  Acts::MagneticFieldProvider::Cache makeCache(
+      const Acts::MagneticFieldContext& mctx) const final;
+
+  /// Field value stored for a global bin of the grid
+  FieldType at(std::size_t globalBin) const;
+
+  /// Number of bins of the grid, including the under- and overflow bins
+  std::size_t size() const;
+
+ private:
+  Acts::ActsVector<DIM> transformPos(const Acts::Vector3& position) const;
+
+  Acts::Vector3 transformBField(const FieldType& field,
+                                const Acts::Vector3& position) const;
+
+  bool isInsideLocal(const Acts::ActsVector<DIM>& gridPosition) const;
+
+  Acts::Result<FieldCell> getFieldCell(const Acts::Vector3& position) const;
+
+  Axes m_axes;
+  /// Points into the mapped file, which it keeps alive
+  std::shared_ptr<const double> m_values;
+
+  std::array<double, DIM> m_lowerLeft{};
+  std::array<double, DIM> m_upperRight{};
+};
+
+}  // namespace ActsExamples
@@ -0,0 +1,156 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#include "ActsExamples/MagneticField/FieldMapBinaryIo.hpp"
+
+#include "ActsExamples/MagneticField/MappedBFieldMap.hpp"
+
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <fstream>
+#include <ios>
+#include <stdexcept>
+#include <tuple>
+#include <utility>
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+namespace {
+
+constexpr char magic[8] = {'A', 'C', 'T', 'S', 'B', 'F', 'M', '\0'};
+constexpr std::uint32_t version = 1;
+
+/// Followed by the DIM values of each bin of the grid, including the under-
+/// and overflow bins, in the order of its global bin index
+struct Header {
+  char magic[8];
+  std::uint32_t version;
+  /// 2 for a map in (r,z), 3 for (x,y,z)
+  std::uint32_t dimensions;
+  double min[3];
+  double max[3];
+  std::uint64_t nBins[3];
+  std::uint64_t nValues;
+};
+
+template <typename grid_t>
+void writeGrid(const grid_t& grid, const std::string& fieldMapFile) {
+  constexpr std::size_t DIM = grid_t::DIM;
+
+  Header header{};
+  std::memcpy(header.magic, magic, sizeof(header.magic));
+  header.version = version;
+  header.dimensions = DIM;
+  auto min = grid.minPosition();
+  auto max = grid.maxPosition();
+  auto nBins = grid.numLocalBins();
+  for (std::size_t i = 0; i < DIM; ++i) {
+    header.min[i] = min[i];
+    header.max[i] = max[i];
+    header.nBins[i] = nBins[i];
+  }
+  header.nValues = grid.size();
+
+  std::ofstream out(fieldMapFile, std::ios::out | std::ios::binary);
+  if (!out) {
+    throw std::ios_base::failure("Could not open '" + fieldMapFile +
+                                 "' to write");
+  }
+  out.write(reinterpret_cast<const char*>(&header), sizeof(header));
+  for (std::size_t ib = 0; ib < grid.size(); ++ib) {
+    const auto& value = grid.at(ib);
+    for (std::size_t i = 0; i < DIM; ++i) {
+      double component = value[i];
+      out.write(reinterpret_cast<const char*>(&component), sizeof(double));
+    }
+  }
+  if (!out) {
+    throw std::ios_base::failure("Could not write '" + fieldMapFile + "'");
+  }
+}
+
+template <std::size_t DIM, std::size_t... I>
+std::shared_ptr<Acts::InterpolatedMagneticField> makeMap(
+    const Header& header, std::shared_ptr<const double> values,
+    std::index_sequence<I...> /*axes*/) {
+  using Map = ActsExamples::MappedBFieldMap<DIM>;
+  typename Map::Axes axes{Acts::detail::EquidistantAxis(
+      header.min[I], header.max[I], header.nBins[I])...};
+  auto map = std::make_shared<Map>(std::move(axes), std::move(values));
+  if (map->size() != header.nValues) {
+    throw std::runtime_error("Inconsistent binning of the field map");
+  }
+  return map;
+}
+
+}  // namespace
+
+void ActsExamples::writeMagneticFieldMapBinary(
+    const detail::InterpolatedMagneticField2& field,
+    const std::string& fieldMapFile) {
+  writeGrid(field.getGrid(), fieldMapFile);
+}
+
+void ActsExamples::writeMagneticFieldMapBinary(
+    const detail::InterpolatedMagneticField3& field,
+    const std::string& fieldMapFile) {
+  writeGrid(field.getGrid(), fieldMapFile);
+}
+
+std::shared_ptr<Acts::InterpolatedMagneticField>
+ActsExamples::makeMagneticFieldMapFromBinary(const std::string& fieldMapFile) {
+  int fd = ::open(fieldMapFile.c_str(), O_RDONLY);
+  if (fd < 0) {
+    throw std::ios_base::failure("Could not open '" + fieldMapFile + "'");
+  }
+  struct stat st {};
+  if (::fstat(fd, &st) != 0 ||
+      static_cast<std::size_t>(st.st_size) < sizeof(Header)) {
+    ::close(fd);
+    throw std::runtime_error("'" + fieldMapFile +
+                             "' is not a binary magnetic field map");
+  }
+  std::size_t size = st.st_size;
+  void* addr = ::mmap(nullptr, size, PROT_READ, MAP_SHARED, fd, 0);
+  // the mapping stays valid after closing the file
+  ::close(fd);
+  if (addr == MAP_FAILED) {
+    throw std::runtime_error("Could not map '" + fieldMapFile + "'");
+  }
+  std::shared_ptr<const std::byte> data(
+      static_cast<const std::byte*>(addr), [size](const std::byte* p) {
+        ::munmap(const_cast<std::byte*>(p), size);
+      });
+
+  const auto& header = *reinterpret_cast<const Header*>(data.get());
+  if (std::memcmp(header.magic, magic, sizeof(header.magic)) != 0) {
+    throw std::runtime_error("'" + fieldMapFile +
+                             "' is not a binary magnetic field map");
+  }
+  if (header.version != version) {
+    throw std::runtime_error("'" + fieldMapFile +
+                             "' was written by an incompatible version");
+  }
+  if ((header.dimensions != 2 && header.dimensions != 3) ||
+      header.nValues >
+          (size - sizeof(Header)) / (header.dimensions * sizeof(double))) {
+    throw std::runtime_error("'" + fieldMapFile + "' is truncated");
+  }
+
+  // the values share the ownership of the mapping
+  std::shared_ptr<const double> values(
+      data, reinterpret_cast<const double*>(data.get() + sizeof(Header)));
+  if (header.dimensions == 2) {
+    return makeMap<2>(header, std::move(values), std::make_index_sequence<2>());
+  }
+  return makeMap<3>(header, std::move(values), std::make_index_sequence<3>());
+}
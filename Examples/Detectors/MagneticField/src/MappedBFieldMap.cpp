@@ -0,0 +1,186 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#include "ActsExamples/MagneticField/MappedBFieldMap.hpp"
+
+#include "Acts/MagneticField/MagneticFieldError.hpp"
+#include "Acts/Utilities/Interpolation.hpp"
+#include "Acts/Utilities/VectorHelpers.hpp"
+#include "Acts/Utilities/detail/grid_helper.hpp"
+
+#include <cmath>
+#include <limits>
+#include <utility>
+
+using Acts::detail::grid_helper;
+
+template <std::size_t DIM>
+ActsExamples::MappedBFieldMap<DIM>::MappedBFieldMap(
+    Axes axes, std::shared_ptr<const double> values)
+    : m_axes(std::move(axes)), m_values(std::move(values)) {
+  typename Grid::index_t minBin{};
+  minBin.fill(1);
+  m_lowerLeft = grid_helper::getLowerLeftBinEdge(minBin, m_axes);
+  m_upperRight =
+      grid_helper::getLowerLeftBinEdge(grid_helper::getNBins(m_axes), m_axes);
+}
+
+template <std::size_t DIM>
+std::vector<std::size_t> ActsExamples::MappedBFieldMap<DIM>::getNBins() const {
+  auto nBinsArray = grid_helper::getNBins(m_axes);
+  return std::vector<std::size_t>(nBinsArray.begin(), nBinsArray.end());
+}
+
+template <std::size_t DIM>
+std::vector<double> ActsExamples::MappedBFieldMap<DIM>::getMin() const {
+  return std::vector<double>(m_lowerLeft.begin(), m_lowerLeft.end());
+}
+
+template <std::size_t DIM>
+std::vector<double> ActsExamples::MappedBFieldMap<DIM>::getMax() const {
+  return std::vector<double>(m_upperRight.begin(), m_upperRight.end());
+}
+
+template <std::size_t DIM>
+bool ActsExamples::MappedBFieldMap<DIM>::isInside(
+    const Acts::Vector3& position) const {
+  return isInsideLocal(transformPos(position));
+}
+
+template <std::size_t DIM>
+Acts::Vector3 ActsExamples::MappedBFieldMap<DIM>::getFieldUnchecked(
+    const Acts::Vector3& position) const {
+  const auto gridPosition = transformPos(position);
+  const auto& llIndices = grid_helper::getLocalBinIndices(gridPosition, m_axes);
+
+  std::array<FieldType, (1 << DIM)> neighbors{};
+  std::size_t i = 0;
+  for (std::size_t index :
+       grid_helper::closestPointsIndices(llIndices, m_axes)) {
+    neighbors.at(i++) = at(index);
+  }
+
+  return transformBField(
+      Acts::interpolate(
+          gridPosition, grid_helper::getLowerLeftBinEdge(llIndices, m_axes),
+          grid_helper::getUpperRightBinEdge(llIndices, m_axes), neighbors),
+      position);
+}
+
+template <std::size_t DIM>
+Acts::Result<Acts::Vector3> ActsExamples::MappedBFieldMap<DIM>::getField(
+    const Acts::Vector3& position,
+    Acts::MagneticFieldProvider::Cache& cache) const {
+  Cache& lcache = cache.get<Cache>();
+  const auto gridPosition = transformPos(position);
+  if (!lcache.fieldCell || !(*lcache.fieldCell).isInside(gridPosition)) {
+    auto res = getFieldCell(position);
+    if (!res.ok()) {
+      return Acts::Result<Acts::Vector3>::failure(res.error());
+    }
+    lcache.fieldCell = *res;
+  }
+  return Acts::Result<Acts::Vector3>::success(
+      (*lcache.fieldCell).getField(gridPosition));
+}
+
+template <std::size_t DIM>
+Acts::Result<Acts::Vector3>
+ActsExamples::MappedBFieldMap<DIM>::getFieldGradient(
+    const Acts::Vector3& position, Acts::ActsMatrix<3, 3>& /*derivative*/,
+    Acts::MagneticFieldProvider::Cache& cache) const {
+  return getField(position, cache);
+}
+
+template <std::size_t DIM>
+Acts::MagneticFieldProvider::Cache
+ActsExamples::MappedBFieldMap<DIM>::makeCache(
+    const Acts::MagneticFieldContext& mctx) const {
+  return Acts::MagneticFieldProvider::Cache::make<Cache>(mctx);
+}
+
+template <std::size_t DIM>
+typename ActsExamples::MappedBFieldMap<DIM>::FieldType
+ActsExamples::MappedBFieldMap<DIM>::at(std::size_t globalBin) const {
+  return Eigen::Map<const FieldType>(m_values.get() + DIM * globalBin);
+}
+
+template <std::size_t DIM>
+std::size_t ActsExamples::MappedBFieldMap<DIM>::size() const {
+  std::size_t size = 1;
+  for (std::size_t nBins : grid_helper::getNBins(m_axes)) {
+    size *= nBins + 2;
+  }
+  return size;
+}
+
+template <std::size_t DIM>
+Acts::ActsVector<DIM> ActsExamples::MappedBFieldMap<DIM>::transformPos(
+    const Acts::Vector3& position) const {
+  if constexpr (DIM == 2) {
+    return Acts::Vector2(Acts::VectorHelpers::perp(position), position.z());
+  } else {
+    return position;
+  }
+}
+
+template <std::size_t DIM>
+Acts::Vector3 ActsExamples::MappedBFieldMap<DIM>::transformBField(
+    const FieldType& field, const Acts::Vector3& position) const {
+  if constexpr (DIM == 2) {
+    // map (Br,Bz) -> (Bx,By,Bz) as done by Acts::fieldMapRZ
+    double r_sin_theta_2 =
+        position.x() * position.x() + position.y() * position.y();
+    double cos_phi = 1., sin_phi = 0.;
+    if (r_sin_theta_2 > std::numeric_limits<double>::min()) {
+      double inv_r_sin_theta = 1. / std::sqrt(r_sin_theta_2);
+      cos_phi = position.x() * inv_r_sin_theta;
+      sin_phi = position.y() * inv_r_sin_theta;
+    }
+    return Acts::Vector3(field.x() * cos_phi, field.x() * sin_phi, field.y());
+  } else {
+    (void)position;
+    return field;
+  }
+}
+
+template <std::size_t DIM>
+bool ActsExamples::MappedBFieldMap<DIM>::isInsideLocal(
+    const Acts::ActsVector<DIM>& gridPosition) const {
+  for (unsigned int i = 0; i < DIM; ++i) {
+    if (gridPosition[i] < m_lowerLeft[i] ||
+        gridPosition[i] >= m_upperRight[i]) {
+      return false;
+    }
+  }
+  return true;
+}
+
+template <std::size_t DIM>
+Acts::Result<typename ActsExamples::MappedBFieldMap<DIM>::FieldCell>
+ActsExamples::MappedBFieldMap<DIM>::getFieldCell(
+    const Acts::Vector3& position) const {
+  const auto gridPosition = transformPos(position);
+  if (!isInsideLocal(gridPosition)) {
+    return Acts::MagneticFieldError::OutOfBounds;
+  }
+  const auto& indices = grid_helper::getLocalBinIndices(gridPosition, m_axes);
+
+  std::array<Acts::Vector3, FieldCell::N> neighbors;
+  std::size_t i = 0;
+  for (std::size_t index : grid_helper::closestPointsIndices(indices, m_axes)) {
+    neighbors.at(i++) = transformBField(at(index), position);
+  }
+
+  return FieldCell(grid_helper::getLowerLeftBinEdge(indices, m_axes),
+                   grid_helper::getUpperRightBinEdge(indices, m_axes),
+                   std::move(neighbors));
+}
+
+template class ActsExamples::MappedBFieldMap<2>;
+template class ActsExamples::MappedBFieldMap<3>;
@@ -12,9 +12,13 @@
 #include "Acts/EventData/TrackParameters.hpp"
 #include "Acts/EventData/VectorMultiTrajectory.hpp"
 #include "Acts/EventData/VectorTrackContainer.hpp"
+#include "ActsExamples/Framework/ObjectSize.hpp"
 
+#include <string>
 #include <vector>
 
+#include <boost/histogram.hpp>
+
 namespace ActsExamples {
 
 /// (Reconstructed) track parameters e.g. close to the vertex.
@@ -30,4 +34,34 @@ using ConstTrackContainer =
     Acts::TrackContainer<Acts::ConstVectorTrackContainer,
                          Acts::ConstVectorMultiTrajectory, std::shared_ptr>;
 
+/// Memory used by the tracks and their track states
+template <>
+struct ObjectSize<ConstTrackContainer> {
+  static std::size_t bytes(const ConstTrackContainer& tracks) {
+    using namespace boost::histogram;
+
+    auto stats = tracks.trackStateContainer().statistics();
+    const auto& h = stats.hist;
+    auto columns = axis::get<axis::category<std::string>>(h.axis(0));
+    auto types = axis::get<axis::category<>>(h.axis(1));
+    double stateBytes = 0;
+    for (int t = 0; t < types.size(); t++) {
+      for (int c = 0; c < columns.size(); c++) {
+        if (columns.bin(c) != "count") {
+          stateBytes += h.at(c, t);
+        }
+      }
+    }
+
+    // parameters, covariance, tip index and reference surface of each track
+    constexpr std::size_t trackBytes =
+        sizeof(Acts::BoundVector) + sizeof(Acts::BoundSquareMatrix) +
+        sizeof(Acts::MultiTrajectoryTraits::IndexType) +
+        sizeof(std::shared_ptr<const Acts::Surface>);
+
+    return sizeof(tracks) + static_cast<std::size_t>(stateBytes) +
+           tracks.size() * trackBytes;
+  }
+};
+
 }  // namespace ActsExamples
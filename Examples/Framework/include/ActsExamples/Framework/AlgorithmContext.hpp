@@ -13,6 +13,8 @@
 #include <Acts/MagneticField/MagneticFieldContext.hpp>
 #include <Acts/Utilities/CalibrationContext.hpp>
 
+#include <atomic>
+#include <cstddef>
 #include <memory>
 
 namespace ActsExamples {
@@ -47,6 +49,9 @@ struct AlgorithmContext {
   Acts::CalibrationContext calibContext;  ///< Per-event calibration context
 
   Acts::FpeMonitor* fpeMonitor = nullptr;
+
+  /// Number of events currently processed by the sequencer, if known
+  const std::atomic<std::size_t>* eventsInFlight = nullptr;
 };
 
 }  // namespace ActsExamples
@@ -13,6 +13,7 @@
 #include "ActsExamples/Framework/WhiteBoard.hpp"
 
 #include <iostream>
+#include <memory>
 #include <stdexcept>
 #include <typeinfo>
 
@@ -120,6 +121,16 @@ class ReadDataHandle final : public DataHandleBase {
     return wb.get<T>(m_key.value());
   }
 
+  /// Shared access to the object, which stays valid after the object has
+  /// been removed from the white board.
+  std::shared_ptr<const T> getShared(const WhiteBoard& wb) const {
+    if (!isInitialized()) {
+      throw std::runtime_error{"ReadDataHandle '" + fullName() +
+                               "' not initialized"};
+    }
+    return wb.getShared<T>(m_key.value());
+  }
+
   bool isCompatible(const DataHandleBase& other) const override {
     return dynamic_cast<const WriteDataHandle<T>*>(&other) != nullptr;
   }
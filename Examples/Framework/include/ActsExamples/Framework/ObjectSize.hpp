@@ -0,0 +1,100 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <cstddef>
+#include <iterator>
+#include <type_traits>
+#include <utility>
+
+namespace ActsExamples {
+
+namespace detail {
+
+template <typename T, typename = void>
+struct IsContainer : std::false_type {};
+template <typename T>
+struct IsContainer<T, std::void_t<typename T::value_type,
+                                  decltype(std::declval<const T&>().size()),
+                                  decltype(std::declval<const T&>().begin()),
+                                  decltype(std::declval<const T&>().end())>>
+    : std::true_type {};
+
+template <typename T, typename = void>
+struct HasCapacity : std::false_type {};
+template <typename T>
+struct HasCapacity<T,
+                   std::void_t<decltype(std::declval<const T&>().capacity())>>
+    : std::true_type {};
+
+template <typename T, typename = void>
+struct HasKeyType : std::false_type {};
+template <typename T>
+struct HasKeyType<T, std::void_t<typename T::key_type>> : std::true_type {};
+
+template <typename T, typename = void>
+struct HasBucketCount : std::false_type {};
+template <typename T>
+struct HasBucketCount<
+    T, std::void_t<decltype(std::declval<const T&>().bucket_count())>>
+    : std::true_type {};
+
+template <typename T>
+struct IsPair : std::false_type {};
+template <typename T1, typename T2>
+struct IsPair<std::pair<T1, T2>> : std::true_type {};
+
+}  // namespace detail
+
+/// Estimate of the memory in bytes used by an object, including the memory it
+/// owns on the heap.
+///
+/// Contiguous containers (`std::vector`, flat sets and maps, strings)
+/// contribute their capacity, node based associative containers an
+/// approximate per-node overhead, and the elements are inspected
+/// recursively. Everything else is counted with its `sizeof`. This can be
+/// specialized for types that own heap memory in other ways.
+template <typename T, typename Enable = void>
+struct ObjectSize {
+  static std::size_t bytes(const T& object);
+};
+
+/// Convenience wrapper around `ObjectSize<T>::bytes`.
+template <typename T>
+std::size_t objectSize(const T& object) {
+  return ObjectSize<T>::bytes(object);
+}
+
+template <typename T, typename Enable>
+std::size_t ObjectSize<T, Enable>::bytes(const T& object) {
+  std::size_t bytes = sizeof(T);
+  if constexpr (detail::IsPair<T>::value) {
+    bytes += objectSize(object.first) - sizeof(object.first);
+    bytes += objectSize(object.second) - sizeof(object.second);
+  } else if constexpr (detail::IsContainer<T>::value) {
+    using Value = typename T::value_type;
+    if constexpr (detail::HasCapacity<T>::value) {
+      bytes += object.capacity() * sizeof(Value);
+    } else if constexpr (detail::HasKeyType<T>::value) {
+      // allocated nodes with two or three pointers, plus the bucket array
+      bytes += object.size() * (sizeof(Value) + 3 * sizeof(void*));
+      if constexpr (detail::HasBucketCount<T>::value) {
+        bytes += object.bucket_count() * sizeof(void*);
+      }
+    }
+    if constexpr (!std::is_trivially_copyable_v<Value>) {
+      for (const auto& value : object) {
+        bytes += objectSize(value) - sizeof(Value);
+      }
+    }
+  }
+  return bytes;
+}
+
+}  // namespace ActsExamples
@@ -18,6 +18,7 @@
 #include <Acts/Utilities/Logger.hpp>
 
 #include <cstddef>
+#include <functional>
 #include <memory>
 #include <optional>
 #include <stdexcept>
@@ -64,6 +65,60 @@ class Sequencer {
     std::size_t count;
   };
 
+  /// Per-event time spent in each context decorator and sequence element
+  struct EventTimings {
+    /// Unique identifiers of the timed elements, as in the timing file
+    std::vector<std::string> names;
+    /// Processed event numbers in ascending order
+    std::vector<std::size_t> events;
+    /// Durations in seconds, one row of `names.size()` values per event
+    std::vector<double> durations;
+  };
+
+  /// Per-event memory used by each whiteboard collection, see
+  /// `Config::trackWhiteBoardMemory`
+  struct WhiteBoardMemory {
+    /// Names of all collections seen in any event, in alphabetical order
+    std::vector<std::string> names;
+    /// Processed event numbers in ascending order
+    std::vector<std::size_t> events;
+    /// Estimated sizes in bytes, one row of `names.size()` values per event
+    /// with zero for collections that are missing in an event
+    std::vector<std::size_t> bytes;
+    /// Peak memory of the collections on the whiteboard during each event
+    std::vector<std::size_t> peakBytes;
+    /// Memory of all collections created in each event, which is the peak
+    /// if no collections are released
+    std::vector<std::size_t> totalBytes;
+  };
+
+  /// Metrics of one processed event, see `Config::metricsCallback`
+  struct EventMetrics {
+    /// Event number
+    std::size_t event = 0;
+    /// Time since the start of the event loop when the event was finished, in
+    /// seconds
+    double time = 0;
+    /// Wall time to process the event, in seconds
+    double wallTime = 0;
+    /// Time spent in each element in seconds, ordered as
+    /// `EventTimings::names`
+    std::vector<double> durations;
+    /// Resident set size of the process after the event, in bytes. Where the
+    /// current one is not available, i.e. outside of Linux, this is the peak
+    /// resident set size of the process so far.
+    std::size_t rss = 0;
+    /// Number of objects on the whiteboard at the end of the event
+    std::size_t whiteBoardObjects = 0;
+    /// Estimated memory of the objects on the whiteboard at the end of the
+    /// event in bytes, see `ObjectSize`
+    std::size_t whiteBoardBytes = 0;
+  };
+
+  /// Receives the identifiers of the timed elements and a batch of metrics
+  using MetricsCallback = std::function<void(
+      const std::vector<std::string> &, const std::vector<EventMetrics> &)>;
+
   struct Config {
     /// number of events to skip at the beginning
     size_t skip = 0;
@@ -78,9 +133,45 @@ class Sequencer {
     std::string outputDir;
     /// output name of the timing file
     std::string outputTimingFile = "timing.tsv";
+    /// output name of the per-event timing file, written as a NumPy `.npy`
+    /// record array with the event number and the time of each sequence
+    /// element in seconds, e.g. `timing_events.npy`, empty to disable
+    std::string outputEventTimingFile;
+    /// Keep the time spent in each sequence element for every event, see
+    /// `eventTimings()`. Implied by `outputEventTimingFile`. The memory grows
+    /// with the number of events times the number of elements, the
+    /// percentiles in the timing file are estimated without it.
+    bool trackEventTimings = false;
     /// Callback that is invoked in the event loop.
     /// @warning This function can be called from multiple threads and should therefore be thread-safe
     IterationCallback iterationCallback = []() {};
+    /// Callback that receives the metrics of processed events in batches of
+    /// `metricsBatchSize`, the remaining ones are passed at the end of the
+    /// run. It is never invoked concurrently, but from varying threads, and
+    /// is called without holding up other events, so batches can arrive out
+    /// of order.
+    MetricsCallback metricsCallback;
+    /// Number of events to collect before invoking `metricsCallback`
+    std::size_t metricsBatchSize = 100;
+    /// Run independent sequence elements of the same event concurrently.
+    /// The dependencies are derived from the read and write data handles,
+    /// elements without any data handles are never run concurrently with
+    /// others. Requires multi-threading.
+    bool intraEventParallelism = false;
+    /// Remove collections from the whiteboard once the last sequence element
+    /// reading them has been executed, as determined from the data handles.
+    /// Collections that are never read are removed right after they are
+    /// written. A collection is kept as long as any collection written by an
+    /// element that read it, since it might be pointed to, e.g. space points
+    /// by seeds. Elements without any data handles are assumed to read all
+    /// collections, elements with handles must declare everything they read.
+    bool releaseWhiteBoardObjects = false;
+    /// Estimate the memory used by each whiteboard collection at the end of
+    /// every event, see `ObjectSize` to customize the estimate for a type
+    bool trackWhiteBoardMemory = false;
+    /// output name of the whiteboard memory summary, only written if the
+    /// memory is tracked
+    std::string outputWhiteBoardMemoryFile = "whiteboard_memory.tsv";
     /// Run data flow consistency checks
     /// Defaults to false right now until all components are migrated
     bool runDataFlowChecks = true;
@@ -155,9 +246,25 @@ class Sequencer {
   /// Get const access to the config
   const Config &config() const { return m_cfg; }
 
+  /// Get the per-event timing of the last call to `run()`, without events
+  /// unless `Config::trackEventTimings` or `Config::outputEventTimingFile` is
+  /// set
+  const EventTimings &eventTimings() const { return m_eventTimings; }
+
+  /// Get the per-event whiteboard memory of the last call to `run()`, empty
+  /// unless `Config::trackWhiteBoardMemory` is set
+  const WhiteBoardMemory &whiteBoardMemory() const {
+    return m_whiteBoardMemory;
+  }
+
  private:
-  /// List of all configured algorithm names.
+  /// List of all configured algorithm names, made unique by appending the
+  /// occurrence to repeated ones, e.g. `Writer:CsvParticleWriter#2`.
   std::vector<std::string> listAlgorithmNames() const;
+  /// Whiteboard keys written or read by each sequence element
+  std::vector<std::vector<std::string>> whiteBoardKeys() const;
+  /// Indices of the sequence elements each sequence element depends on
+  std::vector<std::vector<std::size_t>> dataFlowDependencies() const;
   /// Determine range of (requested) events; [SIZE_MAX, SIZE_MAX) for error.
   std::pair<size_t, size_t> determineEventsRange() const;
 
@@ -184,6 +291,9 @@ class Sequencer {
 
   std::atomic<std::size_t> m_nUnmaskedFpe = 0;
 
+  EventTimings m_eventTimings;
+  WhiteBoardMemory m_whiteBoardMemory;
+
   const Acts::Logger &logger() const { return *m_logger; }
 };
 
@@ -8,12 +8,18 @@
 
 #pragma once
 
+#include "ActsExamples/Framework/ObjectSize.hpp"
 #include <Acts/Utilities/Logger.hpp>
 
 #include <algorithm>
+#include <atomic>
 #include <cstddef>
+#include <limits>
 #include <memory>
+#include <mutex>
+#include <optional>
 #include <ostream>
+#include <shared_mutex>
 #include <stdexcept>
 #include <string>
 #include <string_view>
@@ -31,6 +37,9 @@ namespace ActsExamples {
 /// added to it. Once an object has been added, it can only be read but not
 /// be modified. Trying to replace an existing object is considered an error.
 /// Its lifetime is bound to the lifetime of the white board.
+///
+/// Objects can be added and read concurrently, e.g. by sequence elements of
+/// the same event that are executed in parallel.
 class WhiteBoard {
  public:
   WhiteBoard(std::unique_ptr<const Acts::Logger> logger =
@@ -43,6 +52,17 @@ class WhiteBoard {
 
   bool exists(const std::string& name) const;
 
+  /// Number of stored objects, aliases are counted separately
+  std::size_t size() const {
+    std::shared_lock lock(m_mutex);
+    return m_store.size();
+  }
+
+  /// Estimate the memory used by each stored object, see `ObjectSize`.
+  ///
+  /// @return pairs of name and size in bytes, without aliases
+  std::vector<std::pair<std::string, std::size_t>> memoryUsage() const;
+
  private:
   /// Store an object on the white board and transfer ownership.
   ///
@@ -60,6 +80,32 @@ class WhiteBoard {
   template <typename T>
   const T& get(const std::string& name) const;
 
+  /// Get shared access to a stored object.
+  ///
+  /// The returned pointer keeps the object alive after it has been removed
+  /// from the white board, or after the white board has been destroyed.
+  ///
+  /// @param[in] name Identifier for the object
+  /// @return shared pointer to the stored object
+  /// @throws std::out_of_range if no object is stored under the requested name
+  template <typename T>
+  std::shared_ptr<const T> getShared(const std::string& name) const;
+
+  /// Remove an object from the white board.
+  ///
+  /// Only used by the sequencer to release objects that are not read anymore,
+  /// any alias of the object is kept.
+  ///
+  /// @param name Identifier of the object
+  /// @return true if the object is not stored under any other name
+  bool remove(const std::string& name);
+
+  /// Estimated memory used by a stored object, see `ObjectSize`.
+  ///
+  /// @param name Identifier of the object
+  /// @return size in bytes, zero if no object is stored under the name
+  std::size_t objectBytes(const std::string& name) const;
+
  private:
   /// Find similar names for suggestions with levenshtein-distance
   std::vector<std::string_view> similarNames(const std::string_view& name,
@@ -70,6 +116,7 @@ class WhiteBoard {
   struct IHolder {
     virtual ~IHolder() = default;
     virtual const std::type_info& type() const = 0;
+    virtual std::size_t bytes() const = 0;
   };
   template <typename T,
             typename =
@@ -79,11 +126,27 @@ class WhiteBoard {
 
     HolderT(T&& v) : value(std::move(v)) {}
     const std::type_info& type() const override { return typeid(T); }
+    std::size_t bytes() const override {
+      // the value can not change anymore once it is on the white board.
+      // readers only hold a shared lock, concurrent calls compute the same
+      // size and the last store wins.
+      std::size_t size = cachedBytes.load(std::memory_order_relaxed);
+      if (size == kUnknownBytes) {
+        size = objectSize(value);
+        cachedBytes.store(size, std::memory_order_relaxed);
+      }
+      return size;
+    }
+
+    static constexpr std::size_t kUnknownBytes =
+        std::numeric_limits<std::size_t>::max();
+    mutable std::atomic<std::size_t> cachedBytes{kUnknownBytes};
   };
 
   std::unique_ptr<const Acts::Logger> m_logger;
   std::unordered_map<std::string, std::shared_ptr<IHolder>> m_store;
   std::unordered_map<std::string, std::string> m_objectAliases;
+  mutable std::shared_mutex m_mutex;
 
   const Acts::Logger& logger() const { return *m_logger; }
 
@@ -95,6 +158,8 @@ class WhiteBoard {
 
   template <typename T>
   friend class ReadDataHandle;
+
+  friend class Sequencer;
 };
 
 }  // namespace ActsExamples
@@ -109,6 +174,7 @@ inline void ActsExamples::WhiteBoard::add(const std::string& name, T&& object) {
   if (name.empty()) {
     throw std::invalid_argument("Object can not have an empty name");
   }
+  std::unique_lock lock(m_mutex);
   if (0 < m_store.count(name)) {
     throw std::invalid_argument("Object '" + name + "' already exists");
   }
@@ -123,8 +189,15 @@ inline void ActsExamples::WhiteBoard::add(const std::string& name, T&& object) {
 
 template <typename T>
 inline const T& ActsExamples::WhiteBoard::get(const std::string& name) const {
+  return *getShared<T>(name);
+}
+
+template <typename T>
+inline std::shared_ptr<const T> ActsExamples::WhiteBoard::getShared(
+    const std::string& name) const {
   ACTS_VERBOSE("Attempt to get object '" << name << "' of type "
                                          << typeid(T).name());
+  std::shared_lock lock(m_mutex);
   auto it = m_store.find(name);
   if (it == m_store.end()) {
     const auto names = similarNames(name, 10, 3);
@@ -141,18 +214,40 @@ inline const T& ActsExamples::WhiteBoard::get(const std::string& name) const {
     throw std::out_of_range("Object '" + name + "' does not exists" + ss.str());
   }
 
-  const IHolder* holder = it->second.get();
+  const std::shared_ptr<IHolder>& holder = it->second;
 
-  const auto* castedHolder = dynamic_cast<const HolderT<T>*>(holder);
+  const auto* castedHolder = dynamic_cast<const HolderT<T>*>(holder.get());
   if (castedHolder == nullptr) {
     throw std::out_of_range(
         typeMismatchMessage(name, typeid(T).name(), holder->type().name()));
   }
 
   ACTS_VERBOSE("Retrieved object '" << name << "'");
-  return castedHolder->value;
+  return std::shared_ptr<const T>(holder, &castedHolder->value);
+}
+
+inline bool ActsExamples::WhiteBoard::remove(const std::string& name) {
+  std::unique_lock lock(m_mutex);
+  auto it = m_store.find(name);
+  if (it == m_store.end()) {
+    return false;
+  }
+  std::shared_ptr<IHolder> holder = std::move(it->second);
+  m_store.erase(it);
+  ACTS_VERBOSE("Removed object '" << name << "'");
+  return std::none_of(m_store.begin(), m_store.end(), [&](const auto& entry) {
+    return entry.second == holder;
+  });
+}
+
+inline std::size_t ActsExamples::WhiteBoard::objectBytes(
+    const std::string& name) const {
+  std::shared_lock lock(m_mutex);
+  auto it = m_store.find(name);
+  return it != m_store.end() ? it->second->bytes() : 0;
 }
 
 inline bool ActsExamples::WhiteBoard::exists(const std::string& name) const {
+  std::shared_lock lock(m_mutex);
   return m_store.find(name) != m_store.end();
 }
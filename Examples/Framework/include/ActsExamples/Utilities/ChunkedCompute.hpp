@@ -0,0 +1,119 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include <algorithm>
+#include <cstddef>
+#include <stdexcept>
+#include <vector>
+
+#ifndef ACTS_EXAMPLES_NO_TBB
+#include <tbb/blocked_range.h>
+#include <tbb/parallel_for.h>
+#include <tbb/task_arena.h>
+#endif
+
+namespace ActsExamples {
+
+namespace detail {
+inline void checkNumThreads(int numThreads) {
+  if (numThreads < 1 && numThreads != -1) {
+    throw std::invalid_argument(
+        "Number of threads needs to be positive or -1 for all available ones");
+  }
+#ifdef ACTS_EXAMPLES_NO_TBB
+  if (numThreads != 1) {
+    throw std::runtime_error(
+        "tbb is not available, so can't do multi-threading.");
+  }
+#endif
+}
+}  // namespace detail
+
+/// Call func(begin, end) for consecutive blocks of the indices [0, n), which
+/// are distributed over up to numThreads threads.
+///
+/// The threads run in a task arena local to this call, so unlike the tbbWrap
+/// arena of the Sequencer it can be used from several threads at once. The
+/// caller is responsible for releasing the GIL when called from Python.
+///
+/// @param n the number of indices
+/// @param numThreads the number of threads, -1 for all available ones
+/// @param func called as func(begin, end), concurrently for disjoint blocks
+template <typename Func>
+void forEachBlock(std::size_t n, int numThreads, const Func& func) {
+  detail::checkNumThreads(numThreads);
+
+  constexpr std::size_t blockSize = 1024;
+  const std::size_t nBlocks = (n + blockSize - 1) / blockSize;
+  auto processBlocks = [&](std::size_t firstBlock, std::size_t lastBlock) {
+    for (std::size_t block = firstBlock; block != lastBlock; ++block) {
+      const std::size_t begin = block * blockSize;
+      func(begin, std::min(begin + blockSize, n));
+    }
+  };
+
+  if (numThreads == 1 || nBlocks <= 1) {
+    processBlocks(0, nBlocks);
+    return;
+  }
+#ifndef ACTS_EXAMPLES_NO_TBB
+  // copied, passing the static member itself would odr-use it
+  const int concurrency =
+      numThreads == -1 ? tbb::task_arena::automatic : numThreads;
+  tbb::task_arena arena(concurrency);
+  arena.execute([&] {
+    tbb::parallel_for(tbb::blocked_range<std::size_t>(0, nBlocks),
+                      [&](const tbb::blocked_range<std::size_t>& range) {
+                        processBlocks(range.begin(), range.end());
+                      });
+  });
+#endif
+}
+
+/// Compute values for the indices [0, n) and consume them in order, chunk by
+/// chunk.
+///
+/// Within a chunk the values are computed in parallel with forEachBlock. The
+/// values of the chunk are then consumed sequentially in index order. Only
+/// one chunk of values is held in memory at any time.
+///
+/// @tparam Value the type of the computed values
+/// @param n the number of indices
+/// @param chunkSize the maximum number of values held at once
+/// @param numThreads the number of threads, -1 for all available ones
+/// @param compute called as compute(begin, end, values) to fill the values of
+///        the indices [begin, end), concurrently for disjoint blocks
+/// @param consume called as consume(index, value) in index order
+template <typename Value, typename Compute, typename Consume>
+void computeChunked(std::size_t n, std::size_t chunkSize, int numThreads,
+                    const Compute& compute, const Consume& consume) {
+  if (chunkSize == 0) {
+    throw std::invalid_argument("Chunk size needs to be positive");
+  }
+  detail::checkNumThreads(numThreads);
+
+  std::vector<Value> values;
+  for (std::size_t begin = 0; begin < n; begin += chunkSize) {
+    const std::size_t end = std::min(n, begin + chunkSize);
+    values.resize(end - begin);
+
+    forEachBlock(end - begin, numThreads,
+                 [&](std::size_t blockBegin, std::size_t blockEnd) {
+                   compute(begin + blockBegin, begin + blockEnd,
+                           values.data() + blockBegin);
+                 });
+
+    for (std::size_t i = begin; i < end; ++i) {
+      consume(i, values[i - begin]);
+    }
+  }
+}
+
+}  // namespace ActsExamples
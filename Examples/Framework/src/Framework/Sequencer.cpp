@@ -26,12 +26,15 @@
 #include <atomic>
 #include <cctype>
 #include <chrono>
+#include <cmath>
 #include <cstdint>
 #include <cstdlib>
 #include <exception>
+#include <fstream>
 #include <functional>
 #include <iterator>
 #include <limits>
+#include <mutex>
 #include <numeric>
 #include <ostream>
 #include <ratio>
@@ -40,11 +43,16 @@
 #include <string>
 #include <string_view>
 #include <typeinfo>
+#include <unordered_map>
+#include <unordered_set>
 
 #include <boost/stacktrace/stacktrace.hpp>
+#include <sys/resource.h>
+#include <unistd.h>
 
 #ifndef ACTS_EXAMPLES_NO_TBB
 #include <TROOT.h>
+#include <tbb/task_group.h>
 #endif
 
 #include <boost/algorithm/string.hpp>
@@ -286,9 +294,112 @@ std::vector<std::string> Sequencer::listAlgorithmNames() const {
                     algorithm->name());
   }
 
+  // Elements can share a name, e.g. several writers of the same type. The
+  // identifiers label the columns of the timing outputs and have to be
+  // unique, so repeated ones get the number of their occurrence appended.
+  std::unordered_set<std::string> used(names.begin(), names.end());
+  std::unordered_map<std::string, std::size_t> occurrences;
+  for (auto& name : names) {
+    std::size_t& n = occurrences[name];
+    if (++n == 1) {
+      continue;
+    }
+    std::string unique = name + "#" + std::to_string(n);
+    while (used.count(unique) > 0) {
+      unique = name + "#" + std::to_string(++n);
+    }
+    used.insert(unique);
+    name = std::move(unique);
+  }
+
   return names;
 }
 
+std::vector<std::vector<std::string>> Sequencer::whiteBoardKeys() const {
+  std::vector<std::vector<std::string>> keys(m_sequenceElements.size());
+  for (std::size_t i = 0; i < m_sequenceElements.size(); ++i) {
+    const auto& element = *m_sequenceElements[i].sequenceElement;
+    for (const auto* handle : element.writeHandles()) {
+      if (!handle->isInitialized()) {
+        continue;
+      }
+      keys[i].push_back(handle->key());
+      if (auto it = m_whiteboardObjectAliases.find(handle->key());
+          it != m_whiteboardObjectAliases.end()) {
+        keys[i].push_back(it->second);
+      }
+    }
+    for (const auto* handle : element.readHandles()) {
+      if (handle->isInitialized()) {
+        keys[i].push_back(handle->key());
+      }
+    }
+  }
+  return keys;
+}
+
+std::vector<std::vector<std::size_t>> Sequencer::dataFlowDependencies() const {
+  std::vector<std::vector<std::size_t>> dependencies(m_sequenceElements.size());
+  // element writing each key
+  std::unordered_map<std::string, std::size_t> producers;
+  std::optional<std::size_t> lastBarrier;
+
+  for (std::size_t i = 0; i < m_sequenceElements.size(); ++i) {
+    const auto& element = *m_sequenceElements[i].sequenceElement;
+    auto initialized = [](const auto& handles) {
+      return std::any_of(handles.begin(), handles.end(),
+                         [](const auto* h) { return h->isInitialized(); });
+    };
+
+    auto& deps = dependencies[i];
+    if (!initialized(element.readHandles()) &&
+        !initialized(element.writeHandles())) {
+      // without any data handles nothing is known about the element, so it
+      // runs after all previous and before all following elements
+      for (std::size_t j = 0; j < i; ++j) {
+        deps.push_back(j);
+      }
+      lastBarrier = i;
+    } else {
+      if (lastBarrier.has_value()) {
+        deps.push_back(*lastBarrier);
+      }
+      for (const auto* handle : element.readHandles()) {
+        if (!handle->isInitialized()) {
+          continue;
+        }
+        if (auto it = producers.find(handle->key()); it != producers.end()) {
+          deps.push_back(it->second);
+        }
+      }
+      std::sort(deps.begin(), deps.end());
+      deps.erase(std::unique(deps.begin(), deps.end()), deps.end());
+    }
+
+    for (const auto* handle : element.writeHandles()) {
+      if (!handle->isInitialized()) {
+        continue;
+      }
+      producers[handle->key()] = i;
+      if (auto it = m_whiteboardObjectAliases.find(handle->key());
+          it != m_whiteboardObjectAliases.end()) {
+        producers[it->second] = i;
+      }
+    }
+  }
+
+  for (std::size_t i = 0; i < dependencies.size(); ++i) {
+    const auto& element = *m_sequenceElements[i].sequenceElement;
+    std::stringstream ss;
+    for (auto j : dependencies[i]) {
+      ss << " " << m_sequenceElements[j].sequenceElement->name();
+    }
+    ACTS_DEBUG(getAlgorithmType(element)
+               << ": " << element.name() << " depends on:" << ss.str());
+  }
+  return dependencies;
+}
+
 std::pair<std::size_t, std::size_t> Sequencer::determineEventsRange() const {
   constexpr auto kInvalidEventsRange = std::make_pair(SIZE_MAX, SIZE_MAX);
 
@@ -385,18 +496,88 @@ inline std::string perEvent(D duration, size_t numEvents) {
   return asString(duration / numEvents) + "/event";
 }
 
+// Histogram of the per-event time of one element with logarithmic bins,
+// which estimates the percentiles in constant memory. The bins cover 1 ns to
+// 1e5 s with 100 bins per decade, i.e. a relative resolution of about 2%.
+class DurationHistogram {
+ public:
+  DurationHistogram() : m_counts(kBins) {}
+
+  // Thread-safe
+  void fill(double seconds) {
+    m_counts[bin(seconds)].fetch_add(1, std::memory_order_relaxed);
+  }
+
+  // Percentile for q in [0, 1], interpolated linearly between the closest
+  // ranks like the `numpy.percentile` default, with every value replaced by
+  // the center of its bin
+  double percentile(double q) const {
+    std::uint64_t total = 0;
+    for (const auto& count : m_counts) {
+      total += count.load(std::memory_order_relaxed);
+    }
+    if (total == 0) {
+      return 0;
+    }
+    double pos = q * (total - 1);
+    std::uint64_t lo = static_cast<std::uint64_t>(pos);
+    std::uint64_t hi = std::min(lo + 1, total - 1);
+    double valueLo = valueAtRank(lo);
+    return valueLo + (pos - lo) * (valueAtRank(hi) - valueLo);
+  }
+
+ private:
+  static constexpr double kMin = 1e-9;
+  static constexpr std::size_t kBinsPerDecade = 100;
+  // first bin for durations below kMin, the last one for the overflow
+  static constexpr std::size_t kBins = 14 * kBinsPerDecade + 2;
+
+  static std::size_t bin(double seconds) {
+    if (!(seconds >= kMin)) {
+      return 0;
+    }
+    double i = std::log10(seconds / kMin) * kBinsPerDecade;
+    return std::min(static_cast<std::size_t>(i) + 1, kBins - 1);
+  }
+
+  static double center(std::size_t i) {
+    if (i == 0) {
+      return 0;
+    }
+    return kMin * std::pow(10., (i - 0.5) / kBinsPerDecade);
+  }
+
+  double valueAtRank(std::uint64_t rank) const {
+    std::uint64_t seen = 0;
+    for (std::size_t i = 0; i < kBins; ++i) {
+      seen += m_counts[i].load(std::memory_order_relaxed);
+      if (rank < seen) {
+        return center(i);
+      }
+    }
+    return center(kBins - 1);
+  }
+
+  std::vector<std::atomic<std::uint64_t>> m_counts;
+};
+
 // Store timing data
 struct TimingInfo {
   std::string identifier;
   double time_total_s = 0;
   double time_perevent_s = 0;
+  double time_p50_s = 0;
+  double time_p95_s = 0;
+  double time_p99_s = 0;
 
-  DFE_NAMEDTUPLE(TimingInfo, identifier, time_total_s, time_perevent_s);
+  DFE_NAMEDTUPLE(TimingInfo, identifier, time_total_s, time_perevent_s,
+                 time_p50_s, time_p95_s, time_p99_s);
 };
 
 void storeTiming(const std::vector<std::string>& identifiers,
-                 const std::vector<Duration>& durations, std::size_t numEvents,
-                 const std::string& path) {
+                 const std::vector<Duration>& durations,
+                 const std::vector<DurationHistogram>& histograms,
+                 std::size_t numEvents, const std::string& path) {
   dfe::NamedTupleTsvWriter<TimingInfo> writer(path, 4);
   for (size_t i = 0; i < identifiers.size(); ++i) {
     TimingInfo info;
@@ -404,9 +585,164 @@ void storeTiming(const std::vector<std::string>& identifiers,
     info.time_total_s =
         std::chrono::duration_cast<Seconds>(durations[i]).count();
     info.time_perevent_s = info.time_total_s / numEvents;
+    info.time_p50_s = histograms[i].percentile(0.50);
+    info.time_p95_s = histograms[i].percentile(0.95);
+    info.time_p99_s = histograms[i].percentile(0.99);
     writer.append(info);
   }
 }
+
+// Execute the nodes of a dependency graph as soon as all their predecessors
+// are done, independent nodes run concurrently
+template <typename F>
+void runDataFlowGraph(const std::vector<std::vector<std::size_t>>& successors,
+                      const std::vector<std::size_t>& numPredecessors,
+                      const F& execute) {
+#ifndef ACTS_EXAMPLES_NO_TBB
+  std::vector<std::atomic<std::size_t>> pending(numPredecessors.size());
+  for (std::size_t i = 0; i < numPredecessors.size(); ++i) {
+    pending[i] = numPredecessors[i];
+  }
+
+  tbb::task_group group;
+  std::function<void(std::size_t)> launch = [&](std::size_t i) {
+    group.run([&, i] {
+      execute(i);
+      for (auto j : successors[i]) {
+        if (--pending[j] == 0) {
+          launch(j);
+        }
+      }
+    });
+  };
+  for (std::size_t i = 0; i < numPredecessors.size(); ++i) {
+    if (numPredecessors[i] == 0) {
+      launch(i);
+    }
+  }
+  group.wait();
+#else
+  static_cast<void>(successors);
+  for (std::size_t i = 0; i < numPredecessors.size(); ++i) {
+    execute(i);
+  }
+#endif
+}
+
+// Store the summary of the per-event whiteboard memory
+struct WhiteBoardMemoryInfo {
+  std::string collection;
+  double bytes_mean = 0;
+  std::size_t bytes_max = 0;
+  std::size_t event_max = 0;
+
+  DFE_NAMEDTUPLE(WhiteBoardMemoryInfo, collection, bytes_mean, bytes_max,
+                 event_max);
+};
+
+std::vector<WhiteBoardMemoryInfo> summarizeWhiteBoardMemory(
+    const Sequencer::WhiteBoardMemory& memory) {
+  const std::size_t nNames = memory.names.size();
+  std::vector<WhiteBoardMemoryInfo> infos(nNames);
+  for (std::size_t j = 0; j < nNames; ++j) {
+    auto& info = infos[j];
+    info.collection = memory.names[j];
+    for (std::size_t i = 0; i < memory.events.size(); ++i) {
+      std::size_t bytes = memory.bytes[i * nNames + j];
+      info.bytes_mean += bytes;
+      if (bytes > info.bytes_max) {
+        info.bytes_max = bytes;
+        info.event_max = memory.events[i];
+      }
+    }
+    if (!memory.events.empty()) {
+      info.bytes_mean /= memory.events.size();
+    }
+  }
+  std::stable_sort(
+      infos.begin(), infos.end(),
+      [](const auto& a, const auto& b) { return a.bytes_max > b.bytes_max; });
+  return infos;
+}
+
+// Current resident set size of the process in bytes, falls back to the peak
+// resident set size where the current one is not available
+std::size_t residentSetSize() {
+#if defined(__linux__)
+  std::ifstream statm("/proc/self/statm");
+  std::size_t pages = 0;
+  std::size_t resident = 0;
+  if (statm >> pages >> resident) {
+    return resident * static_cast<std::size_t>(sysconf(_SC_PAGESIZE));
+  }
+#endif
+  struct rusage usage {};
+  getrusage(RUSAGE_SELF, &usage);
+#if defined(__APPLE__)
+  return usage.ru_maxrss;
+#else
+  return usage.ru_maxrss * 1024u;
+#endif
+}
+
+// Store the per-event timing as a NumPy record array, see
+// https://numpy.org/doc/stable/reference/generated/numpy.lib.format.html
+void storeEventTimings(const Sequencer::EventTimings& timings,
+                       const std::string& path) {
+  const std::uint16_t probe = 1;
+  const char endian = *reinterpret_cast<const char*>(&probe) == 1 ? '<' : '>';
+
+  auto quote = [](const std::string& str) {
+    std::string out = "'";
+    for (char c : str) {
+      if (c == '\\' || c == '\'') {
+        out += '\\';
+      }
+      out += c;
+    }
+    return out + "'";
+  };
+
+  std::string header = "{'descr': [('event_nr', '";
+  header += endian;
+  header += "u8')";
+  for (const auto& name : timings.names) {
+    header += ", (" + quote(name) + ", '" + endian + "f8')";
+  }
+  header += "], 'fortran_order': False, 'shape': (" +
+            std::to_string(timings.events.size()) + ",), }";
+
+  // The header is padded such that the data is aligned to 64 bytes, format
+  // version 2.0 is only needed for very long headers.
+  const std::string magic = "\x93NUMPY";
+  const bool v1 = header.size() + 1 + 10 < 65536;
+  const std::size_t prefix = magic.size() + 2 + (v1 ? 2 : 4);
+  const std::size_t total = (prefix + header.size() + 1 + 63) / 64 * 64;
+  header.append(total - prefix - header.size() - 1, ' ');
+  header += '\n';
+
+  std::ofstream os(path, std::ios::binary);
+  if (!os) {
+    throw std::ios_base::failure("Could not open '" + path + "' to write");
+  }
+  os.write(magic.data(), magic.size());
+  os.put(v1 ? 1 : 2);
+  os.put(0);
+  std::uint32_t length = header.size();
+  for (std::size_t i = 0; i < (v1 ? 2u : 4u); ++i) {
+    os.put(static_cast<char>((length >> (8 * i)) & 0xff));
+  }
+  os.write(header.data(), header.size());
+
+  const std::size_t nNames = timings.names.size();
+  for (std::size_t i = 0; i < timings.events.size(); ++i) {
+    std::uint64_t event = timings.events[i];
+    os.write(reinterpret_cast<const char*>(&event), sizeof(event));
+    os.write(
+        reinterpret_cast<const char*>(timings.durations.data() + i * nNames),
+        nNames * sizeof(double));
+  }
+}
 }  // namespace
 
 int Sequencer::run() {
@@ -463,6 +799,144 @@ int Sequencer::run() {
   // execute the parallel event loop
   std::atomic<size_t> nProcessedEvents = 0;
   size_t nTotalEvents = eventsRange.second - eventsRange.first;
+
+  // the percentiles are estimated from histograms, the time of every single
+  // event is only kept on request; every event writes its own row, no
+  // synchronization needed
+  std::vector<DurationHistogram> timingHistograms(names.size());
+  const bool keepEventTimings =
+      m_cfg.trackEventTimings || !m_cfg.outputEventTimingFile.empty();
+  m_eventTimings = {};
+  m_eventTimings.names = names;
+  if (keepEventTimings) {
+    m_eventTimings.events.resize(nTotalEvents);
+    std::iota(m_eventTimings.events.begin(), m_eventTimings.events.end(),
+              eventsRange.first);
+    m_eventTimings.durations.assign(nTotalEvents * names.size(), 0.);
+  }
+
+  // whiteboard keys used by each element, and number of elements using each
+  // key, to release objects once all their users have been executed
+  std::vector<std::string> releaseKeys;
+  std::vector<std::vector<std::size_t>> releaseKeysOfElement;
+  std::vector<std::size_t> releaseUsers;
+  // keys read by the elements writing each key, and number of keys written
+  // from each key. A collection can point into the collections it was made
+  // from, e.g. seeds into space points, so these are only released after it.
+  std::vector<std::vector<std::size_t>> releaseSources;
+  std::vector<std::size_t> releaseDependents;
+  if (m_cfg.releaseWhiteBoardObjects) {
+    std::unordered_map<std::string, std::size_t> indices;
+    std::vector<std::size_t> opaqueElements;
+    for (const auto& keys : whiteBoardKeys()) {
+      if (keys.empty()) {
+        opaqueElements.push_back(releaseKeysOfElement.size());
+      }
+      auto& elementKeys = releaseKeysOfElement.emplace_back();
+      for (const auto& key : keys) {
+        auto [it, inserted] = indices.try_emplace(key, releaseKeys.size());
+        if (inserted) {
+          releaseKeys.push_back(key);
+          releaseUsers.push_back(0);
+        }
+        elementKeys.push_back(it->second);
+        releaseUsers[it->second]++;
+      }
+    }
+    releaseSources.resize(releaseKeys.size());
+    releaseDependents.resize(releaseKeys.size(), 0);
+    for (const auto& [alg, fpe] : m_sequenceElements) {
+      std::vector<std::size_t> inputs;
+      for (const auto* handle : alg->readHandles()) {
+        if (handle->isInitialized()) {
+          inputs.push_back(indices.at(handle->key()));
+        }
+      }
+      for (const auto* handle : alg->writeHandles()) {
+        if (!handle->isInitialized()) {
+          continue;
+        }
+        std::vector<std::string> outputs = {handle->key()};
+        if (auto it = m_whiteboardObjectAliases.find(handle->key());
+            it != m_whiteboardObjectAliases.end()) {
+          outputs.push_back(it->second);
+        }
+        for (const auto& output : outputs) {
+          auto& sources = releaseSources[indices.at(output)];
+          sources.insert(sources.end(), inputs.begin(), inputs.end());
+        }
+      }
+    }
+    for (std::size_t k = 0; k < releaseKeys.size(); ++k) {
+      auto& sources = releaseSources[k];
+      std::sort(sources.begin(), sources.end());
+      sources.erase(std::unique(sources.begin(), sources.end()), sources.end());
+      sources.erase(std::remove(sources.begin(), sources.end(), k),
+                    sources.end());
+      for (auto source : sources) {
+        releaseDependents[source]++;
+      }
+    }
+
+    // without any data handles, e.g. a Python algorithm accessing the event
+    // store directly, an element might read any collection, so nothing is
+    // released before it has run
+    for (auto i : opaqueElements) {
+      const auto& element = *m_sequenceElements[i].sequenceElement;
+      ACTS_DEBUG(getAlgorithmType(element)
+                 << ": " << element.name()
+                 << " has no data handles, keeping all collections until it "
+                    "has been executed");
+      auto& elementKeys = releaseKeysOfElement[i];
+      for (std::size_t k = 0; k < releaseKeys.size(); ++k) {
+        elementKeys.push_back(k);
+        releaseUsers[k]++;
+      }
+    }
+  }
+
+  // collections are accounted for under their original name, even if only
+  // an alias is left on the whiteboard
+  std::unordered_map<std::string, std::string> aliasObjects;
+  for (const auto& [objectName, aliasName] : m_whiteboardObjectAliases) {
+    aliasObjects.emplace(aliasName, objectName);
+  }
+  auto collectionName = [&](const std::string& key) -> const std::string& {
+    auto it = aliasObjects.find(key);
+    return it != aliasObjects.end() ? it->second : key;
+  };
+
+  std::vector<std::vector<std::size_t>> successors;
+  std::vector<std::size_t> numPredecessors;
+  const bool runGraph = m_cfg.intraEventParallelism && tbbWrap::enableTBB();
+  if (m_cfg.intraEventParallelism && !runGraph) {
+    ACTS_WARNING(
+        "Intra-event parallelism requires multi-threading, "
+        "running the sequence elements in order");
+  }
+  if (runGraph) {
+    auto dependencies = dataFlowDependencies();
+    successors.resize(dependencies.size());
+    for (std::size_t i = 0; i < dependencies.size(); ++i) {
+      numPredecessors.push_back(dependencies[i].size());
+      for (auto j : dependencies[i]) {
+        successors[j].push_back(i);
+      }
+    }
+  }
+
+  std::vector<std::vector<std::pair<std::string, std::size_t>>>
+      eventMemoryUsage(m_cfg.trackWhiteBoardMemory ? nTotalEvents : 0);
+  std::vector<std::size_t> eventPeakBytes(eventMemoryUsage.size(), 0);
+
+  // metrics are collected from all threads and passed on in batches
+  std::vector<EventMetrics> metricsBatch;
+  tbbWrap::queuing_mutex metricsMutex;
+  // serializes the callback without blocking threads that only add metrics
+  tbbWrap::queuing_mutex metricsCallbackMutex;
+  // events that have started but not yet run all sequence elements
+  std::atomic<std::size_t> eventsInFlight = 0;
+  const Timepoint clockLoopStart = Clock::now();
   m_taskArena.execute([&] {
     tbbWrap::parallel_for(
         tbb::blocked_range<size_t>(eventsRange.first, eventsRange.second),
@@ -470,22 +944,28 @@ int Sequencer::run() {
           std::vector<Duration> localClocksAlgorithms(names.size(),
                                                       Duration::zero());
 
+          std::vector<Duration> eventClocksAlgorithms(names.size());
+          std::vector<double> eventDurations(names.size());
+
           for (size_t event = r.begin(); event != r.end(); ++event) {
             ACTS_DEBUG("start processing event " << event);
+            Timepoint clockEventStart = Clock::now();
+            std::fill(eventClocksAlgorithms.begin(),
+                      eventClocksAlgorithms.end(), Duration::zero());
             m_cfg.iterationCallback();
             // Use per-event store
             WhiteBoard eventStore(
                 Acts::getDefaultLogger("EventStore#" + std::to_string(event),
                                        m_cfg.logLevel),
                 m_whiteboardObjectAliases);
-            // If we ever wanted to run algorithms in parallel, this needs to
-            // be changed to Algorithm context copies
             AlgorithmContext context(0, event, eventStore);
+            context.eventsInFlight = &eventsInFlight;
+            ++eventsInFlight;
             size_t ialgo = 0;
 
             /// Decorate the context
             for (auto& cdr : m_decorators) {
-              StopWatch sw(localClocksAlgorithms[ialgo++]);
+              StopWatch sw(eventClocksAlgorithms[ialgo++]);
               ACTS_VERBOSE("Execute context decorator: " << cdr->name());
               if (cdr->decorate(++context) != ProcessCode::SUCCESS) {
                 throw std::runtime_error("Failed to decorate event context");
@@ -494,16 +974,79 @@ int Sequencer::run() {
 
             ACTS_VERBOSE("Execute sequence elements");
 
-            for (auto& [alg, fpe] : m_sequenceElements) {
+            // objects already removed from the whiteboard
+            std::vector<std::pair<std::string, std::size_t>> released;
+            std::size_t peakBytes = 0;
+            std::mutex releaseMutex;
+            // only accessed while holding the release mutex
+            std::vector<std::size_t> remainingUsers = releaseUsers;
+            std::vector<std::size_t> remainingDependents = releaseDependents;
+            std::vector<bool> releasedKeys(releaseKeys.size(), false);
+
+            auto release = [&](std::size_t ielement) {
+              std::lock_guard<std::mutex> lock(releaseMutex);
+
+              // a key is released once all its users have run and all keys
+              // made from it are released, which can release its sources
+              std::vector<std::size_t> pending;
+              for (auto k : releaseKeysOfElement[ielement]) {
+                if (--remainingUsers[k] == 0) {
+                  pending.push_back(k);
+                }
+              }
+              std::vector<std::string> keys;
+              while (!pending.empty()) {
+                std::size_t k = pending.back();
+                pending.pop_back();
+                if (releasedKeys[k] || remainingUsers[k] != 0 ||
+                    remainingDependents[k] != 0) {
+                  continue;
+                }
+                releasedKeys[k] = true;
+                keys.push_back(releaseKeys[k]);
+                for (auto source : releaseSources[k]) {
+                  if (--remainingDependents[source] == 0) {
+                    pending.push_back(source);
+                  }
+                }
+              }
+
+              if (m_cfg.trackWhiteBoardMemory) {
+                std::size_t live = 0;
+                for (const auto& [name, bytes] : eventStore.memoryUsage()) {
+                  live += bytes;
+                }
+                peakBytes = std::max(peakBytes, live);
+              }
+              for (const auto& key : keys) {
+                std::size_t bytes = m_cfg.trackWhiteBoardMemory
+                                        ? eventStore.objectBytes(key)
+                                        : 0;
+                // an object that is still stored under another name is
+                // accounted for once that one is released
+                if (eventStore.remove(key) && m_cfg.trackWhiteBoardMemory) {
+                  released.emplace_back(collectionName(key), bytes);
+                }
+              }
+            };
+
+            // every element gets its own context copy, the algorithm
+            // numbers are the same as for sequential execution
+            auto execute = [&](std::size_t ielement) {
+              auto& [alg, fpe] = m_sequenceElements[ielement];
+              AlgorithmContext localContext = context;
+              localContext.algorithmNumber += ielement + 1;
+
               std::optional<Acts::FpeMonitor> mon;
               if (m_cfg.trackFpes) {
                 mon.emplace();
-                context.fpeMonitor = &mon.value();
+                localContext.fpeMonitor = &mon.value();
               }
-              StopWatch sw(localClocksAlgorithms[ialgo++]);
+              StopWatch sw(
+                  eventClocksAlgorithms[m_decorators.size() + ielement]);
               ACTS_VERBOSE("Execute " << getAlgorithmType(*alg) << ": "
                                       << alg->name());
-              if (alg->internalExecute(++context) != ProcessCode::SUCCESS) {
+              if (alg->internalExecute(localContext) != ProcessCode::SUCCESS) {
                 ACTS_FATAL("Failed to execute " << getAlgorithmType(*alg)
                                                 << ": " << alg->name());
                 throw std::runtime_error("Failed to process event data");
@@ -539,7 +1082,88 @@ int Sequencer::run() {
 
                 local.merge(mon->result());
               }
-              context.fpeMonitor = nullptr;
+
+              if (m_cfg.releaseWhiteBoardObjects) {
+                release(ielement);
+              }
+            };
+
+            if (runGraph) {
+              runDataFlowGraph(successors, numPredecessors, execute);
+            } else {
+              for (std::size_t i = 0; i < m_sequenceElements.size(); ++i) {
+                execute(i);
+              }
+            }
+            --eventsInFlight;
+
+            for (size_t i = 0; i < names.size(); ++i) {
+              localClocksAlgorithms[i] += eventClocksAlgorithms[i];
+              eventDurations[i] =
+                  std::chrono::duration_cast<Seconds>(eventClocksAlgorithms[i])
+                      .count();
+              timingHistograms[i].fill(eventDurations[i]);
+            }
+            if (keepEventTimings) {
+              std::copy(eventDurations.begin(), eventDurations.end(),
+                        m_eventTimings.durations.begin() +
+                            (event - eventsRange.first) * names.size());
+            }
+
+            if (m_cfg.trackWhiteBoardMemory) {
+              auto& usage = eventMemoryUsage[event - eventsRange.first];
+              usage = eventStore.memoryUsage();
+              for (auto& [name, bytes] : usage) {
+                name = collectionName(name);
+              }
+              usage.insert(usage.end(), released.begin(), released.end());
+              std::size_t total = 0;
+              for (const auto& [name, bytes] : usage) {
+                total += bytes;
+              }
+              // without releasing, all objects are kept until the end
+              eventPeakBytes[event - eventsRange.first] =
+                  m_cfg.releaseWhiteBoardObjects ? peakBytes : total;
+              for (const auto& [name, bytes] : usage) {
+                ACTS_VERBOSE("Whiteboard collection '" << name << "' uses "
+                                                       << bytes << " bytes");
+              }
+              ACTS_DEBUG("Whiteboard memory of event "
+                         << event << ": " << total << " bytes, peak "
+                         << eventPeakBytes[event - eventsRange.first]
+                         << " bytes");
+            }
+
+            if (m_cfg.metricsCallback) {
+              Timepoint clockEventEnd = Clock::now();
+              EventMetrics metrics;
+              metrics.event = event;
+              metrics.time = std::chrono::duration_cast<Seconds>(clockEventEnd -
+                                                                 clockLoopStart)
+                                 .count();
+              metrics.wallTime = std::chrono::duration_cast<Seconds>(
+                                     clockEventEnd - clockEventStart)
+                                     .count();
+              metrics.durations = eventDurations;
+              metrics.rss = residentSetSize();
+              metrics.whiteBoardObjects = eventStore.size();
+              for (const auto& [name, bytes] : eventStore.memoryUsage()) {
+                metrics.whiteBoardBytes += bytes;
+              }
+
+              std::vector<EventMetrics> batch;
+              {
+                tbbWrap::queuing_mutex::scoped_lock lock(metricsMutex);
+                metricsBatch.push_back(std::move(metrics));
+                if (metricsBatch.size() >=
+                    std::max<std::size_t>(m_cfg.metricsBatchSize, 1)) {
+                  batch.swap(metricsBatch);
+                }
+              }
+              if (!batch.empty()) {
+                tbbWrap::queuing_mutex::scoped_lock lock(metricsCallbackMutex);
+                m_cfg.metricsCallback(names, batch);
+              }
             }
 
             nProcessedEvents++;
@@ -563,6 +1187,39 @@ int Sequencer::run() {
         });
   });
 
+  if (m_cfg.metricsCallback && !metricsBatch.empty()) {
+    m_cfg.metricsCallback(names, metricsBatch);
+  }
+
+  m_whiteBoardMemory = {};
+  if (m_cfg.trackWhiteBoardMemory) {
+    auto& memory = m_whiteBoardMemory;
+    for (const auto& usage : eventMemoryUsage) {
+      for (const auto& [name, bytes] : usage) {
+        memory.names.push_back(name);
+      }
+    }
+    std::sort(memory.names.begin(), memory.names.end());
+    memory.names.erase(std::unique(memory.names.begin(), memory.names.end()),
+                       memory.names.end());
+    memory.events.resize(nTotalEvents);
+    std::iota(memory.events.begin(), memory.events.end(), eventsRange.first);
+    memory.bytes.assign(nTotalEvents * memory.names.size(), 0);
+    memory.peakBytes = eventPeakBytes;
+    memory.totalBytes.assign(nTotalEvents, 0);
+    for (std::size_t i = 0; i < nTotalEvents; ++i) {
+      for (const auto& [name, bytes] : eventMemoryUsage[i]) {
+        memory.totalBytes[i] += bytes;
+      }
+      for (const auto& [name, bytes] : eventMemoryUsage[i]) {
+        auto it =
+            std::lower_bound(memory.names.begin(), memory.names.end(), name);
+        memory.bytes[i * memory.names.size() +
+                     std::distance(memory.names.begin(), it)] = bytes;
+      }
+    }
+  }
+
   ACTS_VERBOSE("Finalize sequence elements");
   for (auto& [alg, fpe] : m_sequenceElements) {
     ACTS_VERBOSE("Finalize " << getAlgorithmType(*alg) << ": " << alg->name());
@@ -583,15 +1240,52 @@ int Sequencer::run() {
   ACTS_INFO("Processed " << numEvents << " events in " << asString(totalWall)
                          << " (wall clock)");
   ACTS_INFO("Average time per event: " << perEvent(totalReal, numEvents));
-  ACTS_DEBUG("Average time per algorithm:");
+  ACTS_DEBUG("Average time per algorithm (p50 / p95 / p99):");
   for (size_t i = 0; i < names.size(); ++i) {
+    const auto& h = timingHistograms[i];
     ACTS_DEBUG("  " << names[i] << ": "
-                    << perEvent(clocksAlgorithms[i], numEvents));
+                    << perEvent(clocksAlgorithms[i], numEvents) << " ("
+                    << asString(Seconds(h.percentile(0.50))) << " / "
+                    << asString(Seconds(h.percentile(0.95))) << " / "
+                    << asString(Seconds(h.percentile(0.99))) << ")");
+  }
+
+  if (m_cfg.trackWhiteBoardMemory) {
+    ACTS_INFO("Whiteboard memory per collection (mean / max per event):");
+    for (const auto& info : summarizeWhiteBoardMemory(m_whiteBoardMemory)) {
+      ACTS_INFO("  " << info.collection << ": "
+                     << static_cast<std::size_t>(info.bytes_mean) << " / "
+                     << info.bytes_max << " bytes (event " << info.event_max
+                     << ")");
+    }
+    const auto& memory = m_whiteBoardMemory;
+    if (m_cfg.releaseWhiteBoardObjects && !memory.events.empty()) {
+      std::size_t peak =
+          *std::max_element(memory.peakBytes.begin(), memory.peakBytes.end());
+      std::size_t total =
+          *std::max_element(memory.totalBytes.begin(), memory.totalBytes.end());
+      ACTS_INFO("Whiteboard peak memory per event: "
+                << peak << " bytes with released collections instead of "
+                << total << " bytes (saved "
+                << (total > 0 ? 100. * (total - peak) / total : 0.) << "%)");
+    }
   }
 
   if (!m_cfg.outputDir.empty()) {
-    storeTiming(names, clocksAlgorithms, numEvents,
+    storeTiming(names, clocksAlgorithms, timingHistograms, numEvents,
                 joinPaths(m_cfg.outputDir, m_cfg.outputTimingFile));
+    if (m_cfg.trackWhiteBoardMemory &&
+        !m_cfg.outputWhiteBoardMemoryFile.empty()) {
+      dfe::NamedTupleTsvWriter<WhiteBoardMemoryInfo> writer(
+          joinPaths(m_cfg.outputDir, m_cfg.outputWhiteBoardMemoryFile), 4);
+      for (const auto& info : summarizeWhiteBoardMemory(m_whiteBoardMemory)) {
+        writer.append(info);
+      }
+    }
+    if (!m_cfg.outputEventTimingFile.empty()) {
+      storeEventTimings(m_eventTimings, joinPaths(m_cfg.outputDir,
+                                                  m_cfg.outputEventTimingFile));
+    }
   }
 
   if (m_nUnmaskedFpe > 0) {
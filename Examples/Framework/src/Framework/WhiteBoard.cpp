@@ -10,6 +10,7 @@
 
 #include <array>
 #include <string_view>
+#include <unordered_set>
 
 #include <Eigen/Core>
 #include <boost/core/demangle.hpp>
@@ -84,3 +85,23 @@ std::string ActsExamples::WhiteBoard::typeMismatchMessage(
                      boost::core::demangle(req) + " but actually " +
                      boost::core::demangle(act)};
 }
+
+std::vector<std::pair<std::string, std::size_t>>
+ActsExamples::WhiteBoard::memoryUsage() const {
+  std::shared_lock lock(m_mutex);
+  std::unordered_set<std::string_view> aliases;
+  for (const auto &[name, alias] : m_objectAliases) {
+    // an alias is only listed after the original was removed
+    if (m_store.count(name) > 0) {
+      aliases.insert(alias);
+    }
+  }
+
+  std::vector<std::pair<std::string, std::size_t>> usage;
+  for (const auto &[name, holder] : m_store) {
+    if (aliases.count(name) == 0) {
+      usage.emplace_back(name, holder->bytes());
+    }
+  }
+  return usage;
+}
@@ -85,6 +85,13 @@ class CsvBFieldWriter {
     std::shared_ptr<std::add_const_t<std::conditional_t<
         Grid, Acts::InterpolatedMagneticField, Acts::MagneticFieldProvider>>>
         bField;
+
+    /// @brief Number of points whose field is evaluated before they are
+    /// written, this bounds the memory use for large grids.
+    std::size_t chunkSize = 100000;
+
+    /// @brief Number of threads evaluating the field of a chunk, -1 for all.
+    int numThreads = 1;
   };
 
   ///@brief Write magnetic field data to a CSV file.
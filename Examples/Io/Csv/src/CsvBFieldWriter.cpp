@@ -15,6 +15,7 @@
 #include "Acts/Utilities/Logger.hpp"
 #include "Acts/Utilities/Result.hpp"
 #include "Acts/Utilities/VectorHelpers.hpp"
+#include "ActsExamples/Utilities/ChunkedCompute.hpp"
 
 #include <iomanip>
 #include <ostream>
@@ -107,10 +108,45 @@ void CsvBFieldWriter::run(const Config<Coord, Grid>& config,
     delta[i] = (max[i] - min[i]) / (bins[i] - 1);
   }
 
-  // Create the appropriate magnetic field context and cache to interact with
-  // the B fields.
+  // The field is evaluated chunk by chunk, in blocks which can run in
+  // parallel. Each block uses its own cache to interact with the B field.
   Acts::MagneticFieldContext mctx{};
-  typename FieldType::Cache cache = field.makeCache(mctx);
+  auto fillFields = [&](auto&& position, std::size_t begin, std::size_t end,
+                        Acts::Vector3* bFields) {
+    typename FieldType::Cache cache = field.makeCache(mctx);
+    for (std::size_t idx = begin; idx < end; ++idx) {
+      Acts::Vector3 pos = position(idx);
+      Acts::Vector3& bField = bFields[idx - begin];
+      if (auto fieldMap =
+              dynamic_cast<const Acts::InterpolatedMagneticField*>(&field)) {
+        // InterpolatedMagneticField::getField() returns an error for the
+        // final point (upper edge), which is just outside the field volume.
+        // So we use getFieldUnchecked instead.
+        bField = fieldMap->getFieldUnchecked(pos);
+      } else {
+        Acts::Result<Acts::Vector3> flx = field.getField(pos, cache);
+
+        // The aforementioned method is not guaranteed to succeed, so we must
+        // check for a valid result before writing it to disk. If the result
+        // is invalid, throw an exception.
+        if (flx.ok()) {
+          bField = *flx;
+        } else {
+          throw std::runtime_error("B-field returned a non-extant value!");
+        }
+      }
+    }
+  };
+
+  // This is some diagnostic to convince the user that the program is still
+  // running. We periodically provide the user with some useful data.
+  auto reportProgress = [&](std::size_t idx, std::size_t total_items) {
+    if (idx % 10000 == 0 || idx == total_items) {
+      ACTS_VERBOSE("Wrote " << idx << " out of " << total_items << " items ("
+                            << std::setprecision(3)
+                            << ((100.f * idx) / total_items) << "%).");
+    }
+  };
 
   // Finally, we can begin to fill the output file with data from our B field.
   // Again, the procedure is slightly different depending on whether we are
@@ -123,57 +159,30 @@ void CsvBFieldWriter::run(const Config<Coord, Grid>& config,
     std::size_t total_items = bins[0] * bins[1] * bins[2];
 
     // For Cartesian coordinates, iterate over bins in the x, y, and z
-    // directions. Note that we iterate one additional time because we are
-    // writing the _edges_ of the bins, and the final bin needs to be closed.
-    for (std::size_t x = 0; x < bins[0]; ++x) {
-      for (std::size_t y = 0; y < bins[1]; ++y) {
-        for (std::size_t z = 0; z < bins[2]; ++z) {
-          // Compute the geometric position of this bin, then request the
-          // magnetic field vector at that position.
-          Acts::Vector3 pos = {x * delta[0] + min[0], y * delta[1] + min[1],
-                               z * delta[2] + min[2]};
-
-          Acts::Vector3 bField;
-          if (auto fieldMap =
-                  dynamic_cast<const Acts::InterpolatedMagneticField*>(
-                      &field)) {
-            // InterpolatedMagneticField::getField() returns an error for the
-            // final point (upper edge), which is just outside the field volume.
-            // So we use getFieldUnchecked instead.
-            bField = fieldMap->getFieldUnchecked(pos);
-          } else {
-            Acts::Result<Acts::Vector3> flx = field.getField(pos, cache);
-
-            // The aforementioned method is not guaranteed to succeed, so we
-            // must check for a valid result, and then write it to disk. If the
-            // result is invalid, throw an exception.
-            if (flx.ok()) {
-              bField = *flx;
-            } else {
-              throw std::runtime_error("B-field returned a non-extant value!");
-            }
-          }
-
+    // directions, and compute the geometric position of each bin.
+    auto position = [&](std::size_t idx) {
+      std::size_t x = idx / (bins[1] * bins[2]);
+      std::size_t y = (idx / bins[2]) % bins[1];
+      std::size_t z = idx % bins[2];
+      return Acts::Vector3(x * delta[0] + min[0], y * delta[1] + min[1],
+                           z * delta[2] + min[2]);
+    };
+
+    computeChunked<Acts::Vector3>(
+        total_items, config.chunkSize, config.numThreads,
+        [&](std::size_t begin, std::size_t end, Acts::Vector3* bFields) {
+          fillFields(position, begin, end, bFields);
+        },
+        [&](std::size_t idx, const Acts::Vector3& bField) {
+          Acts::Vector3 pos = position(idx);
           writer.append(pos[0] / Acts::UnitConstants::mm,
                         pos[1] / Acts::UnitConstants::mm,
                         pos[2] / Acts::UnitConstants::mm,
                         bField[0] / Acts::UnitConstants::T,
                         bField[1] / Acts::UnitConstants::T,
                         bField[2] / Acts::UnitConstants::T);
-
-          // This final part is some diagnostic to convince the user that the
-          // program is still running. We periodically provide the user with
-          // some useful data.
-          std::size_t idx = (x * bins[1] * bins[2]) + (y * bins[2]) + z + 1;
-
-          if (idx % 10000 == 0 || idx == total_items) {
-            ACTS_VERBOSE("Wrote " << idx << " out of " << total_items
-                                  << " items (" << std::setprecision(3)
-                                  << ((100.f * idx) / total_items) << "%).");
-          }
-        }
-      }
-    }
+          reportProgress(idx + 1, total_items);
+        });
   } else {
     ACTS_INFO("Writing RZ field of size " << bins[0] << " x " << bins[1]
                                           << " to file " << config.fileName
@@ -183,50 +192,31 @@ void CsvBFieldWriter::run(const Config<Coord, Grid>& config,
 
     // For cylindrical coordinates, we only need to iterate over the r and z
     // coordinates, because we assume rotational cylindrical symmetry. This
-    // makes the procedure quite a bit faster, too. Great!
-    for (std::size_t r = 0; r < bins[0]; ++r) {
-      for (std::size_t z = 0; z < bins[1]; ++z) {
-        // Calculate the position (still in three dimensions), assuming that
-        // the phi coordinate is zero. Then grab the field.
-        Acts::Vector3 pos(min[0] + r * delta[0], 0.f, min[1] + z * delta[1]);
-
-        Acts::Vector3 bField;
-        if (auto fieldMap =
-                dynamic_cast<const Acts::InterpolatedMagneticField*>(&field)) {
-          // InterpolatedMagneticField::getField() returns an error for the
-          // final point (upper edge), which is just outside the field volume.
-          // So we use getFieldUnchecked instead.
-          bField = fieldMap->getFieldUnchecked(pos);
-        } else {
-          Acts::Result<Acts::Vector3> flx = field.getField(pos, cache);
-
-          // Check the result, then write to disk. We write the r and z
-          // positions as they are, then we write the z component of the result
-          // vector as is, and we compute the r-value from the other components
-          // of the vector.
-          if (flx.ok()) {
-            bField = *flx;
-          } else {
-            throw std::runtime_error("B-field returned a non-extant value!");
-          }
-        }
-
-        writer.append(
-            pos[0] / Acts::UnitConstants::mm, pos[2] / Acts::UnitConstants::mm,
-            Acts::VectorHelpers::perp(bField) / Acts::UnitConstants::T,
-            bField[2] / Acts::UnitConstants::T);
-
-        // As before, print some progress reports for the user to enjoy while
-        // they wait.
-        std::size_t idx = (r * bins[1]) + z + 1;
-
-        if (idx % 10000 == 0 || idx == total_items) {
-          ACTS_VERBOSE("Wrote " << idx << " out of " << total_items
-                                << " items (" << std::setprecision(3)
-                                << ((100.f * idx) / total_items) << "%).");
-        }
-      }
-    }
+    // makes the procedure quite a bit faster, too. Great! The position is
+    // still in three dimensions, assuming that the phi coordinate is zero.
+    auto position = [&](std::size_t idx) {
+      std::size_t r = idx / bins[1];
+      std::size_t z = idx % bins[1];
+      return Acts::Vector3(min[0] + r * delta[0], 0.f, min[1] + z * delta[1]);
+    };
+
+    computeChunked<Acts::Vector3>(
+        total_items, config.chunkSize, config.numThreads,
+        [&](std::size_t begin, std::size_t end, Acts::Vector3* bFields) {
+          fillFields(position, begin, end, bFields);
+        },
+        [&](std::size_t idx, const Acts::Vector3& bField) {
+          // We write the r and z positions as they are, then we write the z
+          // component of the result vector as is, and we compute the r-value
+          // from the other components of the vector.
+          Acts::Vector3 pos = position(idx);
+          writer.append(
+              pos[0] / Acts::UnitConstants::mm,
+              pos[2] / Acts::UnitConstants::mm,
+              Acts::VectorHelpers::perp(bField) / Acts::UnitConstants::T,
+              bField[2] / Acts::UnitConstants::T);
+          reportProgress(idx + 1, total_items);
+        });
   }
 }
 
@@ -8,11 +8,14 @@
 
 #include "ActsExamples/Io/Json/JsonMaterialWriter.hpp"
 
+#include "Acts/Material/BinnedSurfaceMaterial.hpp"
 #include "Acts/Utilities/Helpers.hpp"
+#include "ActsExamples/MaterialMapping/MappedSurfaceMaterial.hpp"
 
 #include <fstream>
 #include <iomanip>
 #include <ios>
+#include <memory>
 #include <vector>
 
 #include <nlohmann/json.hpp>
@@ -29,8 +32,17 @@ ActsExamples::JsonMaterialWriter::~JsonMaterialWriter() = default;
 
 void ActsExamples::JsonMaterialWriter::writeMaterial(
     const Acts::DetectorMaterialMaps& detMaterial) {
+  // memory mapped bins are written like binned material
+  Acts::DetectorMaterialMaps converted = detMaterial;
+  for (auto& [geoId, material] : converted.first) {
+    if (const auto* msm =
+            dynamic_cast<const MappedSurfaceMaterial*>(material.get());
+        msm != nullptr) {
+      material = std::make_shared<Acts::BinnedSurfaceMaterial>(msm->toBinned());
+    }
+  }
   // Evoke the converter
-  auto jOut = m_converter->materialMapsToJson(detMaterial);
+  auto jOut = m_converter->materialMapsToJson(converted);
   // And write the file(s)
   if (ACTS_CHECK_BIT(m_cfg.writeFormat, ActsExamples::JsonFormat::Json)) {
     std::string fileName = m_cfg.fileName + ".json";
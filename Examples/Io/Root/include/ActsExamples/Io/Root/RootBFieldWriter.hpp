@@ -74,6 +74,14 @@ class RootBFieldWriter {
     // @note setting this parameter is optional, in case no bin numbers are
     /// handed over the full magnetic field map will be printed out
     size_t phiBins = 100;
+    /// Number of grid points whose field is evaluated before they are written,
+    /// this bounds the memory use for large grids
+    size_t chunkSize = 100000;
+    /// Number of threads evaluating the field of a chunk, -1 for all
+    int numThreads = 1;
+    /// [optional] ROOT compression settings of the output file, i.e.
+    /// 100 * algorithm + level, e.g. 505 for ZSTD at level 5
+    std::optional<int> compression;
   };
 
   /// Write down an interpolated magnetic field map
@@ -0,0 +1,56 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#pragma once
+
+#include "Acts/Utilities/Logger.hpp"
+
+#include <memory>
+#include <string>
+#include <vector>
+
+namespace ActsExamples {
+
+/// @class RootFileMerger
+///
+/// Merges ROOT files written for separate event ranges, e.g. by the
+/// per-chunk outputs of a multi-process run, into a single file.
+///
+/// Trees are concatenated and ordered by their event number branch. If the
+/// input trees are already sorted and cover disjoint event ranges, the
+/// compressed baskets are copied as they are, without decompressing and
+/// recompressing the entries. Otherwise the entries are copied one by one in
+/// event order, keeping the original order of entries within one event.
+/// Other objects, e.g. histograms, are merged with their `Merge` method.
+class RootFileMerger {
+ public:
+  struct Config {
+    /// The input files, in the order in which they are concatenated for
+    /// identical event numbers
+    std::vector<std::string> inputFiles;
+    /// The name of the output file
+    std::string outputFile;
+    /// Candidate names of the event number branch, the first one found in a
+    /// tree is used
+    std::vector<std::string> eventBranches = {"event_nr", "event_id",
+                                              "eventNr"};
+    /// Sort trees by the event number branch
+    bool sortByEvent = true;
+  };
+
+  /// Merge the input files into the output file
+  ///
+  /// @throws std::invalid_argument on incomplete configuration
+  /// @throws std::runtime_error if the file contents are not compatible
+  static void run(const Config& config,
+                  std::unique_ptr<const Acts::Logger> p_logger =
+                      Acts::getDefaultLogger("RootFileMerger",
+                                             Acts::Logging::INFO));
+};
+
+}  // namespace ActsExamples
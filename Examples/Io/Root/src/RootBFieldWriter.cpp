@@ -13,6 +13,7 @@
 #include "Acts/MagneticField/InterpolatedBFieldMap.hpp"
 #include "Acts/MagneticField/MagneticFieldContext.hpp"
 #include "Acts/Utilities/VectorHelpers.hpp"
+#include "ActsExamples/Utilities/ChunkedCompute.hpp"
 
 #include <cassert>
 #include <ios>
@@ -53,6 +54,9 @@ void RootBFieldWriter::run(const Config& config,
   if (outputFile == nullptr) {
     throw std::ios_base::failure("Could not open '" + config.fileName + "'");
   }
+  if (config.compression) {
+    outputFile->SetCompressionSettings(*config.compression);
+  }
   TTree* outputTree = new TTree(config.treeName.c_str(),
                                 config.treeName.c_str(), 99, outputFile);
   if (outputTree == nullptr) {
@@ -172,25 +176,33 @@ void RootBFieldWriter::run(const Config& config,
     double stepY = (maxY - minY) / (nBinsY - 1);
     double stepZ = (maxZ - minZ) / (nBinsZ - 1);
 
-    for (size_t i = 0; i < nBinsX; i++) {
-      double raw_x = minX + i * stepX;
-      for (size_t j = 0; j < nBinsY; j++) {
-        double raw_y = minY + j * stepY;
-        for (size_t k = 0; k < nBinsZ; k++) {
-          double raw_z = minZ + k * stepZ;
-          Acts::Vector3 position(raw_x, raw_y, raw_z);
-          Vector3 bField = config.bField->getFieldUnchecked(position);
-
-          x = raw_x / Acts::UnitConstants::mm;
-          y = raw_y / Acts::UnitConstants::mm;
-          z = raw_z / Acts::UnitConstants::mm;
+    // The grid is traversed in x, y, z order, the field is evaluated and
+    // written chunk by chunk
+    auto positionXYZ = [&](size_t index) {
+      size_t i = index / (nBinsY * nBinsZ);
+      size_t j = (index / nBinsZ) % nBinsY;
+      size_t k = index % nBinsZ;
+      return Acts::Vector3(minX + i * stepX, minY + j * stepY,
+                           minZ + k * stepZ);
+    };
+    computeChunked<Vector3>(
+        nBinsX * nBinsY * nBinsZ, config.chunkSize, config.numThreads,
+        [&](size_t begin, size_t end, Vector3* bFields) {
+          for (size_t index = begin; index < end; index++) {
+            bFields[index - begin] =
+                config.bField->getFieldUnchecked(positionXYZ(index));
+          }
+        },
+        [&](size_t index, const Vector3& bField) {
+          Acts::Vector3 position = positionXYZ(index);
+          x = position.x() / Acts::UnitConstants::mm;
+          y = position.y() / Acts::UnitConstants::mm;
+          z = position.z() / Acts::UnitConstants::mm;
           Bx = bField.x() / Acts::UnitConstants::T;
           By = bField.y() / Acts::UnitConstants::T;
           Bz = bField.z() / Acts::UnitConstants::T;
           outputTree->Fill();
-        }  // for z
-      }    // for y
-    }      // for x
+        });
 
   } else {
     ACTS_INFO("Map will be written out in cylinder coordinates (r,z).");
@@ -258,20 +270,29 @@ void RootBFieldWriter::run(const Config& config,
     double stepR = (maxR - minR) / (nBinsR - 1);
     double stepZ = (maxZ - minZ) / (nBinsZ - 1);
 
-    for (size_t k = 0; k < nBinsZ; k++) {
-      double raw_z = minZ + k * stepZ;
-      for (size_t j = 0; j < nBinsR; j++) {
-        double raw_r = minR + j * stepR;
-        Acts::Vector3 position(raw_r, 0.0, raw_z);  // position at phi=0
-        ACTS_VERBOSE("Requesting position: " << position.transpose());
-        auto bField = config.bField->getFieldUnchecked(position);
-        z = raw_z / Acts::UnitConstants::mm;
-        r = raw_r / Acts::UnitConstants::mm;
-        Bz = bField.z() / Acts::UnitConstants::T;
-        Br = VectorHelpers::perp(bField) / Acts::UnitConstants::T;
-        outputTree->Fill();
-      }  // for R
-    }    // for z
+    // The grid is traversed in z, r order, at phi=0
+    auto positionRZ = [&](size_t index) {
+      size_t k = index / nBinsR;
+      size_t j = index % nBinsR;
+      return Acts::Vector3(minR + j * stepR, 0.0, minZ + k * stepZ);
+    };
+    computeChunked<Vector3>(
+        nBinsR * nBinsZ, config.chunkSize, config.numThreads,
+        [&](size_t begin, size_t end, Vector3* bFields) {
+          for (size_t index = begin; index < end; index++) {
+            bFields[index - begin] =
+                config.bField->getFieldUnchecked(positionRZ(index));
+          }
+        },
+        [&](size_t index, const Vector3& bField) {
+          Acts::Vector3 position = positionRZ(index);
+          ACTS_VERBOSE("Requesting position: " << position.transpose());
+          z = position.z() / Acts::UnitConstants::mm;
+          r = position.x() / Acts::UnitConstants::mm;
+          Bz = bField.z() / Acts::UnitConstants::T;
+          Br = VectorHelpers::perp(bField) / Acts::UnitConstants::T;
+          outputTree->Fill();
+        });
   }
 
   // Tear down ROOT I/O
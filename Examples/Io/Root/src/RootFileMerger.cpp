@@ -0,0 +1,312 @@
+// This file is part of the Acts project.
+//
+// Copyright (C) 2023 CERN for the benefit of the Acts project
+//
+// This Source Code Form is subject to the terms of the Mozilla Public
+// License, v. 2.0. If a copy of the MPL was not distributed with this
+// file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+#include "ActsExamples/Io/Root/RootFileMerger.hpp"
+
+#include <algorithm>
+#include <ios>
+#include <numeric>
+#include <set>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <TClass.h>
+#include <TDirectory.h>
+#include <TFile.h>
+#include <TKey.h>
+#include <TLeaf.h>
+#include <TList.h>
+#include <TObject.h>
+#include <TTree.h>
+
+namespace ActsExamples {
+
+namespace {
+
+/// Description of the branch layout of a tree used to check compatibility
+std::vector<std::string> treeSchema(TTree& tree) {
+  std::vector<std::string> schema;
+  TIter next(tree.GetListOfLeaves());
+  while (auto* leaf = static_cast<TLeaf*>(next())) {
+    schema.push_back(std::string(leaf->GetName()) + ":" + leaf->GetTypeName());
+  }
+  return schema;
+}
+
+/// Read all values of a scalar branch
+std::vector<double> readColumn(TTree& tree, const std::string& branch) {
+  tree.SetEstimate(tree.GetEntries() + 1);
+  Long64_t n = tree.Draw(branch.c_str(), "", "goff");
+  if (n <= 0) {
+    return {};
+  }
+  return {tree.GetV1(), tree.GetV1() + n};
+}
+
+class Merger {
+ public:
+  Merger(const RootFileMerger::Config& cfg, const Acts::Logger& logger)
+      : m_cfg(cfg), m_logger(logger) {}
+
+  void mergeDirectory(const std::vector<TDirectory*>& inputs,
+                      TDirectory& output, const std::string& path) {
+    // Names of the objects of all inputs in the order they first appear
+    std::vector<std::string> names;
+    std::set<std::string> seen;
+    for (auto* input : inputs) {
+      TIter next(input->GetListOfKeys());
+      while (auto* key = static_cast<TKey*>(next())) {
+        // Keys of older cycles follow the most recent one
+        if (seen.insert(key->GetName()).second) {
+          names.push_back(key->GetName());
+        }
+      }
+    }
+
+    for (const auto& name : names) {
+      std::string fullName = path.empty() ? name : path + "/" + name;
+
+      std::vector<TDirectory*> present;
+      TKey* key = nullptr;
+      for (auto* input : inputs) {
+        if (auto* inputKey = input->GetKey(name.c_str()); inputKey != nullptr) {
+          present.push_back(input);
+          if (key == nullptr) {
+            key = inputKey;
+          }
+        }
+      }
+      if (present.size() != inputs.size()) {
+        ACTS_WARNING("Object '" << fullName << "' is only present in "
+                                << present.size() << " of " << inputs.size()
+                                << " inputs");
+      }
+
+      TClass* cls = TClass::GetClass(key->GetClassName());
+      if (cls == nullptr) {
+        ACTS_WARNING("Skipping '" << fullName << "' of unknown class "
+                                  << key->GetClassName());
+        continue;
+      }
+
+      if (cls->InheritsFrom(TDirectory::Class())) {
+        std::vector<TDirectory*> subInputs;
+        for (auto* input : present) {
+          subInputs.push_back(getObject<TDirectory>(*input, name, fullName));
+        }
+        TDirectory* subOutput = output.mkdir(name.c_str());
+        mergeDirectory(subInputs, *subOutput, fullName);
+      } else if (cls->InheritsFrom(TTree::Class())) {
+        std::vector<TTree*> trees;
+        for (auto* input : present) {
+          trees.push_back(getObject<TTree>(*input, name, fullName));
+        }
+        mergeTrees(trees, output, fullName);
+      } else {
+        mergeObjects(present, output, name, fullName);
+      }
+    }
+  }
+
+ private:
+  const RootFileMerger::Config& m_cfg;
+  const Acts::Logger& m_logger;
+
+  const Acts::Logger& logger() const { return m_logger; }
+
+  template <typename T>
+  T* getObject(TDirectory& dir, const std::string& name,
+               const std::string& fullName) const {
+    auto* obj = dynamic_cast<T*>(dir.Get(name.c_str()));
+    if (obj == nullptr) {
+      throw std::runtime_error("Object '" + fullName + "' is missing in '" +
+                               dir.GetFile()->GetName() + "'");
+    }
+    return obj;
+  }
+
+  std::string eventBranch(TTree& tree) const {
+    if (!m_cfg.sortByEvent) {
+      return "";
+    }
+    for (const auto& branch : m_cfg.eventBranches) {
+      if (tree.GetBranch(branch.c_str()) != nullptr) {
+        return branch;
+      }
+    }
+    return "";
+  }
+
+  void mergeTrees(const std::vector<TTree*>& trees, TDirectory& output,
+                  const std::string& fullName) {
+    const auto schema = treeSchema(*trees.front());
+    for (auto* tree : trees) {
+      if (treeSchema(*tree) != schema) {
+        throw std::runtime_error("Tree '" + fullName + "' in '" +
+                                 tree->GetCurrentFile()->GetName() +
+                                 "' has a different set of branches");
+      }
+    }
+
+    const std::string branch = eventBranch(*trees.front());
+    std::vector<std::vector<double>> events;
+    if (!branch.empty()) {
+      for (auto* tree : trees) {
+        events.push_back(readColumn(*tree, branch));
+      }
+    }
+
+    // Order in which the trees can be concatenated. This is possible as long
+    // as every tree is sorted and the event ranges do not overlap.
+    std::vector<TTree*> ordered;
+    bool concatenate = true;
+    if (branch.empty()) {
+      ordered = trees;
+    } else {
+      std::vector<std::pair<std::pair<double, double>, TTree*>> ranges;
+      for (std::size_t i = 0; i < trees.size(); ++i) {
+        if (events[i].empty()) {
+          continue;
+        }
+        if (!std::is_sorted(events[i].begin(), events[i].end())) {
+          concatenate = false;
+          break;
+        }
+        ranges.push_back({{events[i].front(), events[i].back()}, trees[i]});
+      }
+      std::stable_sort(ranges.begin(), ranges.end(),
+                       [](const auto& a, const auto& b) {
+                         return a.first.first < b.first.first;
+                       });
+      for (std::size_t i = 1; concatenate && i < ranges.size(); ++i) {
+        concatenate = ranges[i - 1].first.second <= ranges[i].first.first;
+      }
+      for (const auto& [range, tree] : ranges) {
+        ordered.push_back(tree);
+      }
+    }
+
+    output.cd();
+
+    if (concatenate) {
+      ACTS_DEBUG("Concatenate baskets of tree '" << fullName << "'");
+      TTree* merged = trees.front()->CloneTree(0);
+      for (auto* tree : ordered) {
+        if (merged->CopyEntries(tree, -1, "fast") < 0) {
+          throw std::runtime_error("Failed to copy tree '" + fullName + "'");
+        }
+      }
+      merged->Write("", TObject::kOverwrite);
+      return;
+    }
+
+    ACTS_DEBUG("Sort entries of tree '" << fullName << "' by " << branch);
+    // Every input is read in the order of its entries sorted by event, which
+    // is sequential for sorted inputs, and the inputs are merged by event.
+    // Entries of the same event keep the order of the inputs.
+    std::vector<std::vector<Long64_t>> entries(trees.size());
+    std::vector<std::size_t> next(trees.size(), 0);
+    for (std::size_t i = 0; i < trees.size(); ++i) {
+      entries[i].resize(events[i].size());
+      std::iota(entries[i].begin(), entries[i].end(), 0);
+      std::stable_sort(
+          entries[i].begin(), entries[i].end(),
+          [&](auto a, auto b) { return events[i][a] < events[i][b]; });
+    }
+    auto nextEvent = [&](std::size_t i) {
+      return events[i][entries[i][next[i]]];
+    };
+
+    TTree* merged = trees.front()->CloneTree(0);
+    TTree* current = nullptr;
+    while (true) {
+      std::size_t input = trees.size();
+      for (std::size_t i = 0; i < trees.size(); ++i) {
+        if (next[i] < entries[i].size() &&
+            (input == trees.size() || nextEvent(i) < nextEvent(input))) {
+          input = i;
+        }
+      }
+      if (input == trees.size()) {
+        break;
+      }
+      if (trees[input] != current) {
+        if (current != nullptr) {
+          current->CopyAddresses(merged, true);
+        }
+        current = trees[input];
+        current->CopyAddresses(merged);
+      }
+      current->GetEntry(entries[input][next[input]++]);
+      merged->Fill();
+    }
+    if (current != nullptr) {
+      current->CopyAddresses(merged, true);
+    }
+    merged->Write("", TObject::kOverwrite);
+  }
+
+  void mergeObjects(const std::vector<TDirectory*>& inputs, TDirectory& output,
+                    const std::string& name, const std::string& fullName) {
+    TObject* obj = getObject<TObject>(*inputs.front(), name, fullName);
+    if (auto merge = obj->IsA()->GetMerge(); merge != nullptr) {
+      TList others;
+      for (std::size_t i = 1; i < inputs.size(); ++i) {
+        others.Add(getObject<TObject>(*inputs[i], name, fullName));
+      }
+      merge(obj, &others, nullptr);
+    } else {
+      ACTS_WARNING("Object '" << fullName << "' of type " << obj->ClassName()
+                              << " cannot be merged, keeping the first one");
+    }
+    output.cd();
+    obj->Write(name.c_str(), TObject::kOverwrite);
+  }
+};
+
+}  // namespace
+
+void RootFileMerger::run(const Config& config,
+                         std::unique_ptr<const Acts::Logger> p_logger) {
+  ACTS_LOCAL_LOGGER(std::move(p_logger))
+
+  if (config.inputFiles.empty()) {
+    throw std::invalid_argument("Missing input files");
+  } else if (config.outputFile.empty()) {
+    throw std::invalid_argument("Missing output file");
+  }
+
+  std::vector<std::unique_ptr<TFile>> inputs;
+  std::vector<TDirectory*> inputDirs;
+  for (const auto& fileName : config.inputFiles) {
+    inputs.emplace_back(TFile::Open(fileName.c_str(), "READ"));
+    if (inputs.back() == nullptr || inputs.back()->IsZombie()) {
+      throw std::ios_base::failure("Could not open '" + fileName + "'");
+    }
+    inputDirs.push_back(inputs.back().get());
+  }
+
+  ACTS_INFO("Merging " << inputs.size() << " files into " << config.outputFile);
+  std::unique_ptr<TFile> output{
+      TFile::Open(config.outputFile.c_str(), "RECREATE")};
+  if (output == nullptr || output->IsZombie()) {
+    throw std::ios_base::failure("Could not open '" + config.outputFile + "'");
+  }
+
+  Merger merger(config, logger());
+  merger.mergeDirectory(inputDirs, *output, "");
+
+  output->Close();
+  for (auto& input : inputs) {
+    input->Close();
+  }
+}
+
+}  // namespace ActsExamples
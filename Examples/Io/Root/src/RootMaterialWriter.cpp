@@ -25,11 +25,13 @@
 #include "Acts/Utilities/BinnedArray.hpp"
 #include "Acts/Utilities/BinningData.hpp"
 #include "Acts/Utilities/Logger.hpp"
+#include "ActsExamples/MaterialMapping/MappedSurfaceMaterial.hpp"
 #include <Acts/Geometry/GeometryIdentifier.hpp>
 #include <Acts/Material/BinnedSurfaceMaterial.hpp>
 
 #include <cstddef>
 #include <ios>
+#include <optional>
 #include <stdexcept>
 #include <type_traits>
 #include <vector>
@@ -68,6 +70,13 @@ void ActsExamples::RootMaterialWriter::writeMaterial(
   for (auto& [key, value] : surfaceMaps) {
     // Get the Surface material
     const Acts::ISurfaceMaterial* sMaterial = value.get();
+    // memory mapped bins are written like binned material
+    std::optional<Acts::BinnedSurfaceMaterial> mappedBins;
+    if (const auto* msm = dynamic_cast<const MappedSurfaceMaterial*>(sMaterial);
+        msm != nullptr) {
+      mappedBins = msm->toBinned();
+      sMaterial = &mappedBins.value();
+    }
 
     // get the geometry ID
     Acts::GeometryIdentifier geoID = key;
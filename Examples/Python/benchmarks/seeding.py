@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+"""
+Measure the seeding algorithms on recorded events: the standard, the orthogonal
+and the Hough transform seeding.
+
+The measurements of Pythia8 ttbar events are recorded once per detector and
+pile-up. Every seeding algorithm then runs in isolation on the recorded events
+in a fresh process, which reports the seeds per second, the percentiles of the
+per-event latency, the memory of the seeding and the seed efficiency. The result
+is written in the headwind collector format, like the one of ``startup.py``.
+
+The memory of the seeding is given by two measures. The first is how much
+higher the peak memory of the process is than that of a baseline replay, which
+reads the events and makes the space points without seeding them. It also
+contains the matching of the seeds to the particles for the efficiency. The
+second is the largest size of the whiteboard collections the seeding writes in
+an event.
+"""
+import argparse
+import importlib.util
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+srcdir = Path(__file__).resolve().parent.parent.parent.parent
+
+# exit code of a run whose optional components are not available
+SKIPPED = 77
+
+percentiles = (50, 95, 99)
+
+
+class Skip(Exception):
+    pass
+
+
+def _require(module: str):
+    if importlib.util.find_spec(module) is None:
+        raise Skip(f"{module} is not available")
+
+
+def generic_detector(args):
+    import acts
+    import acts.examples
+    from acts.examples.reconstruction import (
+        SeedFinderConfigArg,
+        SeedFinderOptionsArg,
+        SeedFilterConfigArg,
+        SpacePointGridConfigArg,
+        SeedingAlgorithmConfigArg,
+    )
+
+    u = acts.UnitConstants
+    detector, trackingGeometry, decorators = acts.examples.GenericDetector.create()
+    seedingConfig = (
+        SeedingAlgorithmConfigArg(),
+        SeedFinderConfigArg(
+            r=(None, 200 * u.mm),
+            deltaR=(1 * u.mm, 60 * u.mm),
+            collisionRegion=(-250 * u.mm, 250 * u.mm),
+            z=(-2000 * u.mm, 2000 * u.mm),
+            maxSeedsPerSpM=1,
+            sigmaScattering=5,
+            radLengthPerSeed=0.1,
+            minPt=500 * u.MeV,
+            impactMax=3 * u.mm,
+        ),
+        SeedFinderOptionsArg(bFieldInZ=2 * u.T, beamPos=(0.0, 0.0)),
+        SeedFilterConfigArg(),
+        SpacePointGridConfigArg(),
+    )
+    return dict(
+        detector=detector,
+        trackingGeometry=trackingGeometry,
+        digiConfig=srcdir
+        / "Examples/Algorithms/Digitization/share/default-smearing-config-generic.json",
+        geoSelection=srcdir
+        / "Examples/Algorithms/TrackFinding/share/geoSelection-genericDetector.json",
+        seedingConfig=seedingConfig,
+        etaMax=2.5,
+    )
+
+
+def odd_detector(args):
+    _require("acts.ActsPythonBindingsDD4hep")
+    oddDir = args.odd_dir
+    if not (oddDir / "xml" / "OpenDataDetector.xml").exists():
+        raise Skip(f"OpenDataDetector not found in {oddDir}")
+
+    import acts
+    import acts.examples
+    from acts.examples.odd import getOpenDataDetector
+    from acts.examples.reconstruction import (
+        SeedFinderConfigArg,
+        SeedFinderOptionsArg,
+        SeedFilterConfigArg,
+        SpacePointGridConfigArg,
+        SeedingAlgorithmConfigArg,
+    )
+
+    u = acts.UnitConstants
+    materialMap = oddDir / "data/odd-material-maps.root"
+    detector, trackingGeometry, decorators = getOpenDataDetector(
+        oddDir,
+        mdecorator=acts.IMaterialDecorator.fromFile(materialMap)
+        if materialMap.exists()
+        else None,
+        logLevel=acts.logging.WARNING,
+    )
+    seedingConfig = (
+        SeedingAlgorithmConfigArg(),
+        SeedFinderConfigArg(),
+        SeedFinderOptionsArg(bFieldInZ=2 * u.T, beamPos=(0.0, 0.0)),
+        SeedFilterConfigArg(),
+        SpacePointGridConfigArg(),
+    )
+    return dict(
+        detector=detector,
+        trackingGeometry=trackingGeometry,
+        digiConfig=oddDir / "config/odd-digi-smearing-config.json",
+        geoSelection=oddDir / "config/odd-seeding-config.json",
+        seedingConfig=seedingConfig,
+        etaMax=3.0,
+    )
+
+
+def itk_detector(args):
+    if args.itk_geometry is None:
+        raise Skip("no ITk geometry given, see --itk-geometry")
+
+    from acts.examples.itk import (
+        buildITkGeometry,
+        itkSeedingAlgConfig,
+        InputSpacePointsType,
+    )
+
+    detector, trackingGeometry, decorators = buildITkGeometry(args.itk_geometry)
+    return dict(
+        detector=detector,
+        trackingGeometry=trackingGeometry,
+        digiConfig=args.itk_geometry / "itk-hgtd/itk-smearing-config.json",
+        geoSelection=args.itk_geometry / "itk-hgtd/geoSelection-ITk.json",
+        seedingConfig=itkSeedingAlgConfig(InputSpacePointsType.PixelSpacePoints),
+        etaMax=4.0,
+    )
+
+
+detectors = {
+    "generic": generic_detector,
+    "odd": odd_detector,
+    "itk": itk_detector,
+}
+
+
+def record(args, inputDir: Path):
+    """Simulate and digitize the events of one detector and pile-up"""
+    import acts
+    import acts.examples
+
+    if not hasattr(acts.examples, "pythia8"):
+        raise Skip("Pythia8 is not available")
+
+    from acts.examples.simulation import (
+        addPythia8,
+        addFatras,
+        addDigitization,
+        ParticleSelectorConfig,
+    )
+
+    u = acts.UnitConstants
+    geo = detectors[args.detector](args)
+    # the field only enters the simulation, the seeding is configured with the
+    # field of a 2 T solenoid
+    field = acts.ConstantBField(acts.Vector3(0, 0, 2 * u.T))
+    rnd = acts.examples.RandomNumbers(seed=42)
+
+    s = acts.examples.Sequencer(
+        events=args.events,
+        numThreads=-1,
+        outputDir=str(inputDir),
+        logLevel=acts.logging.WARNING,
+    )
+    addPythia8(
+        s,
+        hardProcess=["Top:qqbar2ttbar=on"],
+        npileup=args.pileup,
+        vtxGen=acts.examples.GaussianVertexGenerator(
+            mean=acts.Vector4(0, 0, 0, 0),
+            stddev=acts.Vector4(0.0125 * u.mm, 0.0125 * u.mm, 55.5 * u.mm, 5.0 * u.ns),
+        ),
+        rnd=rnd,
+    )
+    addFatras(
+        s,
+        geo["trackingGeometry"],
+        field,
+        preSelectParticles=ParticleSelectorConfig(
+            rho=(0.0, 24 * u.mm),
+            absZ=(0.0, 1.0 * u.m),
+            eta=(-geo["etaMax"], geo["etaMax"]),
+            pt=(150 * u.MeV, None),
+            removeNeutral=True,
+        ),
+        outputDirCsv=inputDir,
+        rnd=rnd,
+    )
+    addDigitization(
+        s,
+        geo["trackingGeometry"],
+        field,
+        digiConfigFile=geo["digiConfig"],
+        outputDirCsv=inputDir,
+        rnd=rnd,
+    )
+    s.run()
+
+
+def replay(args, inputDir: Path) -> dict:
+    """Run one seeding algorithm, or only its inputs for the baseline, on the
+    recorded events"""
+    _require("uproot")
+
+    import numpy
+    import uproot
+    import acts
+    import acts.examples
+    from acts.examples.reconstruction import (
+        addSeedingTruthSelection,
+        addSpacePointsMaking,
+        addStandardSeeding,
+        addOrthogonalSeeding,
+        addHoughTransformSeeding,
+        TruthSeedRanges,
+    )
+
+    u = acts.UnitConstants
+    geo = detectors[args.detector](args)
+    logLevel = acts.logging.WARNING
+
+    with tempfile.TemporaryDirectory() as outputDir:
+        outputDir = Path(outputDir)
+        s = acts.examples.Sequencer(
+            numThreads=1,
+            outputDir=str(outputDir),
+            logLevel=logLevel,
+            trackWhiteBoardMemory=True,
+        )
+        s.addReader(
+            acts.examples.CsvParticleReader(
+                level=logLevel,
+                inputDir=str(inputDir),
+                inputStem="particles_initial",
+                outputParticles="particles",
+            )
+        )
+        s.addReader(
+            acts.examples.CsvSimHitReader(
+                level=logLevel,
+                inputDir=str(inputDir),
+                inputStem="hits",
+                outputSimHits="simhits",
+            )
+        )
+        s.addReader(
+            acts.examples.CsvMeasurementReader(
+                level=logLevel,
+                inputDir=str(inputDir),
+                outputMeasurements="measurements",
+                outputSourceLinks="sourcelinks",
+                outputMeasurementSimHitsMap="measurement_simhits_map",
+                outputMeasurementParticlesMap="measurement_particles_map",
+                inputSimHits="simhits",
+            )
+        )
+        addSeedingTruthSelection(
+            s,
+            "particles",
+            "truth_seeds_selected",
+            TruthSeedRanges(
+                pt=(1.0 * u.GeV, None),
+                eta=(-geo["etaMax"], geo["etaMax"]),
+                nHits=(9, None),
+            ),
+            logLevel,
+        )
+        spacePoints = addSpacePointsMaking(
+            s, geo["trackingGeometry"], geo["geoSelection"], logLevel
+        )
+        if args.algorithm == "baseline":
+            s.run()
+            return {}
+
+        (
+            seedingAlgorithmConfigArg,
+            seedFinderConfigArg,
+            seedFinderOptionsArg,
+            seedFilterConfigArg,
+            spacePointGridConfigArg,
+        ) = geo["seedingConfig"]
+        if args.algorithm == "hough":
+            config = acts.examples.HoughTransformSeeder.Config()
+            config.inputSpacePoints = [spacePoints]
+            config.inputMeasurements = "measurements"
+            config.inputSourceLinks = "sourcelinks"
+            config.outputProtoTracks = "prototracks"
+            config.outputSeeds = "seeds"
+            config.trackingGeometry = geo["trackingGeometry"]
+            config.geometrySelection = acts.examples.readJsonGeometryList(
+                str(geo["geoSelection"])
+            )
+            addHoughTransformSeeding(s, config, logLevel)
+            prototracks = config.outputProtoTracks
+            outputs = [config.outputProtoTracks, config.outputSeeds]
+            timing = "Algorithm:HoughTransformSeeder"
+        else:
+            if args.algorithm == "standard":
+                seeds = addStandardSeeding(
+                    s,
+                    spacePoints,
+                    seedingAlgorithmConfigArg,
+                    seedFinderConfigArg,
+                    seedFinderOptionsArg,
+                    seedFilterConfigArg,
+                    spacePointGridConfigArg,
+                    logLevel,
+                )
+            else:
+                seeds = addOrthogonalSeeding(
+                    s,
+                    spacePoints,
+                    seedFinderConfigArg,
+                    seedFinderOptionsArg,
+                    seedFilterConfigArg,
+                    logLevel,
+                )
+            outputs = [seeds]
+            # the orthogonal seeding uses the name of the standard one
+            timing = "Algorithm:SeedingAlgorithm"
+            prototracks = "seed-prototracks"
+            s.addAlgorithm(
+                acts.examples.SeedsToPrototracks(
+                    level=logLevel,
+                    inputSeeds=seeds,
+                    outputProtoTracks=prototracks,
+                )
+            )
+
+        # the seeds of all algorithms are matched to the particles as proto
+        # tracks, as the Hough transform does not produce seeds
+        s.addWriter(
+            acts.examples.TrackFinderPerformanceWriter(
+                level=logLevel,
+                inputProtoTracks=prototracks,
+                inputParticles="truth_seeds_selected",
+                inputMeasurementParticlesMap="measurement_particles_map",
+                filePath=str(outputDir / "performance_seeding.root"),
+            )
+        )
+
+        s.run()
+
+        # the proto tracks made from the seeds here are not counted
+        memory = s.whiteBoardMemory
+        outputBytes = sum(
+            memory[name].astype(float) for name in outputs if name in memory.dtype.names
+        )
+
+        with uproot.open(outputDir / "performance_seeding.root") as f:
+            nSeeds = f["track_finder_tracks"].num_entries
+            matched = f["track_finder_particles"]["ntracks_majority"].array(
+                library="np"
+            )
+
+    return dict(
+        times=[float(t) for t in s.eventTimings[timing]],
+        seeds=int(nSeeds),
+        output_bytes=int(numpy.max(outputBytes, initial=0)),
+        # particles with at least one seed whose hits are mostly theirs
+        efficiency=float((matched > 0).mean()) if len(matched) > 0 else 0.0,
+    )
+
+
+def maxRss() -> int:
+    """Peak resident set size of this process in bytes"""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on linux, bytes on macOS
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def inputDirectory(args) -> Path:
+    return args.input_dir / f"{args.detector}_mu{args.pileup}"
+
+
+def runChild(args):
+    inputDir = inputDirectory(args)
+    try:
+        if args.child == "record":
+            record(args, inputDir)
+            result = {}
+        else:
+            result = replay(args, inputDir)
+    except Skip as e:
+        print(e, file=sys.stderr)
+        sys.exit(SKIPPED)
+    result["max_rss"] = maxRss()
+    # not on stdout, which is shared with the logging of the C++ components
+    args.result.write_text(json.dumps(result))
+
+
+def runInChild(args, child, detector, pileup, algorithm=None):
+    """Run record or replay in a fresh process, returns None if it is not available"""
+    cmd = [sys.executable, __file__, "--child", child]
+    cmd += ["--detector", detector, "--pileup", str(pileup)]
+    cmd += ["--events", str(args.events), "--input-dir", str(args.input_dir)]
+    cmd += ["--odd-dir", str(args.odd_dir)]
+    if args.itk_geometry is not None:
+        cmd += ["--itk-geometry", str(args.itk_geometry)]
+    if algorithm is not None:
+        cmd += ["--algorithm", algorithm]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        result = Path(tmp) / "result.json"
+        cmd += ["--result", str(result)]
+        proc = subprocess.run(cmd, stdout=subprocess.DEVNULL)
+        if proc.returncode == SKIPPED:
+            return None
+        if proc.returncode != 0:
+            raise RuntimeError(
+                f"{child} of {detector} at pile-up {pileup} failed with code {proc.returncode}"
+            )
+        return json.loads(result.read_text())
+
+
+def measure(args, detector, pileup, algorithm):
+    inputDir = args.input_dir / f"{detector}_mu{pileup}"
+    # only a complete recording is marked, a partial one is redone
+    complete = inputDir / "complete"
+    if not complete.exists():
+        inputDir.mkdir(parents=True, exist_ok=True)
+        if runInChild(args, "record", detector, pileup) is None:
+            print(f"Skipping {detector} at pile-up {pileup}", file=sys.stderr)
+            return None
+        complete.touch()
+
+    result = runInChild(args, "replay", detector, pileup, algorithm)
+    if result is None:
+        print(f"Skipping {algorithm} on {detector}", file=sys.stderr)
+    return result
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__)
+    p.add_argument(
+        "--algorithms",
+        nargs="+",
+        choices=["standard", "orthogonal", "hough"],
+        default=["standard", "orthogonal", "hough"],
+        help="Seeding algorithms to measure",
+    )
+    p.add_argument(
+        "--detectors",
+        nargs="+",
+        choices=list(detectors.keys()),
+        default=list(detectors.keys()),
+        help="Detectors to measure",
+    )
+    p.add_argument(
+        "--pileup",
+        nargs="+",
+        type=int,
+        default=[50, 100, 200],
+        help="Pile-up values to measure",
+    )
+    p.add_argument(
+        "--events", "-n", type=int, default=10, help="Number of recorded events"
+    )
+    p.add_argument(
+        "--input-dir",
+        type=Path,
+        default=Path.cwd() / "seeding_benchmark",
+        help="Directory of the recorded events, reused between runs",
+    )
+    p.add_argument(
+        "--odd-dir",
+        type=Path,
+        default=srcdir / "thirdparty" / "OpenDataDetector",
+        help="OpenDataDetector source directory",
+    )
+    p.add_argument("--itk-geometry", type=Path, help="ITk geometry directory")
+    p.add_argument(
+        "--output", "-o", type=Path, help="Output JSON file, stdout if not given"
+    )
+    p.add_argument("--child", choices=["record", "replay"], help=argparse.SUPPRESS)
+    p.add_argument("--detector", help=argparse.SUPPRESS)
+    p.add_argument("--algorithm", help=argparse.SUPPRESS)
+    p.add_argument("--result", type=Path, help=argparse.SUPPRESS)
+    args = p.parse_args()
+
+    if args.child is not None:
+        args.pileup = args.pileup[0]
+        runChild(args)
+        return
+
+    import numpy
+
+    metrics = []
+    for detector in args.detectors:
+        for pileup in args.pileup:
+            # the memory of the process without seeding, e.g. of the geometry
+            baseline = measure(args, detector, pileup, "baseline")
+            if baseline is None:
+                continue
+
+            for algorithm in args.algorithms:
+                result = measure(args, detector, pileup, algorithm)
+                if result is None:
+                    continue
+
+                name = f"{algorithm}_{detector}_mu{pileup}"
+                times = numpy.array(result["times"])
+                throughput = result["seeds"] / times.sum() if times.sum() > 0 else 0.0
+                rss = max(0, result["max_rss"] - baseline["max_rss"]) / 1024**3  # GB
+                output = result["output_bytes"] / 1024**2  # MB
+                print(
+                    f"{name}: {throughput:.1f} seeds/s, {rss:.3f} GB, "
+                    f"{output:.1f} MB of seeds, "
+                    f"efficiency {result['efficiency']:.3f}",
+                    file=sys.stderr,
+                )
+                metrics.append(
+                    dict(
+                        name=f"seeding_throughput_{name}",
+                        value=throughput,
+                        unit="seeds/s",
+                        group="seeding_throughput",
+                    )
+                )
+                for q, value in zip(percentiles, numpy.percentile(times, percentiles)):
+                    metrics.append(
+                        dict(
+                            name=f"seeding_latency_p{q}_{name}",
+                            value=value,
+                            unit="seconds",
+                            group="seeding_latency",
+                        )
+                    )
+                metrics.append(
+                    dict(
+                        name=f"seeding_max_rss_delta_{name}",
+                        value=rss,
+                        unit="GB",
+                        group="seeding_max_rss_delta",
+                    )
+                )
+                metrics.append(
+                    dict(
+                        name=f"seeding_output_memory_{name}",
+                        value=output,
+                        unit="MB",
+                        group="seeding_output_memory",
+                    )
+                )
+                metrics.append(
+                    dict(
+                        name=f"seeding_efficiency_{name}",
+                        value=result["efficiency"],
+                        unit="fraction",
+                        group="seeding_efficiency",
+                    )
+                )
+
+    output = json.dumps({"metrics": metrics}, indent=2)
+    if args.output is not None:
+        args.output.write_text(output)
+    else:
+        sys.stdout.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Measure how long the python bindings take to start up: importing the modules,
+building the detectors and processing the first event.
+
+Every phase runs in a fresh interpreter, so imports are not cached, and is
+repeated to report the median. The result is written in the headwind
+collector format, like the compile metrics of ``CI/perf_headwind.py``.
+"""
+import argparse
+import importlib.util
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+srcdir = Path(__file__).resolve().parent.parent.parent.parent
+
+# exit code of a phase whose optional components are not available
+SKIPPED = 77
+
+
+class Skip(Exception):
+    pass
+
+
+def _require(module: str):
+    if importlib.util.find_spec(module) is None:
+        raise Skip(f"{module} is not available")
+
+
+def import_acts(args) -> float:
+    start = time.perf_counter()
+    import acts
+
+    return time.perf_counter() - start
+
+
+def import_acts_examples(args) -> float:
+    import acts
+
+    start = time.perf_counter()
+    import acts.examples
+
+    return time.perf_counter() - start
+
+
+def generic_detector(args) -> float:
+    import acts.examples
+
+    start = time.perf_counter()
+    acts.examples.GenericDetector.create()
+    return time.perf_counter() - start
+
+
+def odd_detector(args) -> float:
+    _require("acts.ActsPythonBindingsDD4hep")
+    oddDir = args.odd_dir
+    if not (oddDir / "xml" / "OpenDataDetector.xml").exists():
+        raise Skip(f"OpenDataDetector not found in {oddDir}")
+
+    import acts.examples
+    from acts.examples.odd import getOpenDataDetector
+
+    start = time.perf_counter()
+    getOpenDataDetector(oddDir, logLevel=acts.logging.WARNING)
+    return time.perf_counter() - start
+
+
+def itk_geometry(args) -> float:
+    if args.itk_geometry is None:
+        raise Skip("no ITk geometry given, see --itk-geometry")
+
+    import acts.examples
+    from acts.examples.itk import buildITkGeometry
+
+    start = time.perf_counter()
+    buildITkGeometry(args.itk_geometry)
+    return time.perf_counter() - start
+
+
+def first_event(args) -> float:
+    import acts
+    import acts.examples
+    from acts.examples.simulation import addParticleGun, addFatras
+
+    u = acts.UnitConstants
+    detector, trackingGeometry, decorators = acts.examples.GenericDetector.create()
+    field = acts.ConstantBField(acts.Vector3(0, 0, 2 * u.T))
+    rnd = acts.examples.RandomNumbers(seed=42)
+
+    with tempfile.TemporaryDirectory() as outputDir:
+        s = acts.examples.Sequencer(
+            events=1,
+            numThreads=1,
+            outputDir=outputDir,
+            logLevel=acts.logging.WARNING,
+        )
+        addParticleGun(s, rnd=rnd)
+        addFatras(s, trackingGeometry, field, rnd=rnd)
+
+        start = time.perf_counter()
+        s.run()
+        return time.perf_counter() - start
+
+
+phases = {
+    f.__name__: f
+    for f in (
+        import_acts,
+        import_acts_examples,
+        generic_detector,
+        odd_detector,
+        itk_geometry,
+        first_event,
+    )
+}
+
+
+def maxRss() -> int:
+    """Peak resident set size of this process in bytes"""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on linux, bytes on macOS
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def runPhase(args):
+    try:
+        duration = phases[args.child](args)
+    except Skip as e:
+        print(e, file=sys.stderr)
+        sys.exit(SKIPPED)
+    # not on stdout, which is shared with the logging of the C++ components
+    args.result.write_text(json.dumps({"time": duration, "max_rss": maxRss()}))
+
+
+def measure(args, phase):
+    """Run a phase `args.repeat` times, returns None if it is not available"""
+    cmd = [sys.executable, __file__, "--child", phase]
+    cmd += ["--odd-dir", str(args.odd_dir)]
+    if args.itk_geometry is not None:
+        cmd += ["--itk-geometry", str(args.itk_geometry)]
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        result = Path(tmp) / "result.json"
+        cmd += ["--result", str(result)]
+        for _ in range(args.repeat):
+            proc = subprocess.run(cmd, stdout=subprocess.DEVNULL)
+            if proc.returncode == SKIPPED:
+                print(f"Skipping {phase}", file=sys.stderr)
+                return None
+            if proc.returncode != 0:
+                raise RuntimeError(f"Phase {phase} failed with code {proc.returncode}")
+            results.append(json.loads(result.read_text()))
+    return results
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__)
+    p.add_argument(
+        "--phases",
+        nargs="+",
+        choices=list(phases.keys()),
+        default=list(phases.keys()),
+        help="Phases to measure",
+    )
+    p.add_argument(
+        "--repeat", type=int, default=5, help="Number of fresh runs per phase"
+    )
+    p.add_argument(
+        "--odd-dir",
+        type=Path,
+        default=srcdir / "thirdparty" / "OpenDataDetector",
+        help="OpenDataDetector source directory",
+    )
+    p.add_argument("--itk-geometry", type=Path, help="ITk geometry directory")
+    p.add_argument(
+        "--output", "-o", type=Path, help="Output JSON file, stdout if not given"
+    )
+    p.add_argument("--child", choices=list(phases.keys()), help=argparse.SUPPRESS)
+    p.add_argument("--result", type=Path, help=argparse.SUPPRESS)
+    args = p.parse_args()
+
+    if args.child is not None:
+        runPhase(args)
+        return
+
+    metrics = []
+    for phase in args.phases:
+        results = measure(args, phase)
+        if results is None:
+            continue
+        time_s = statistics.median(r["time"] for r in results)
+        rss = max(r["max_rss"] for r in results) / 1024 / 1024 / 1024  # GB
+        print(f"{phase}: {time_s:.3f} s, {rss:.3f} GB", file=sys.stderr)
+        metrics.append(
+            dict(
+                name=f"startup_time_{phase}",
+                value=time_s,
+                unit="seconds",
+                group="startup_time",
+            )
+        )
+        metrics.append(
+            dict(
+                name=f"startup_max_rss_{phase}",
+                value=rss,
+                unit="GB",
+                group="startup_max_rss",
+            )
+        )
+
+    output = json.dumps({"metrics": metrics}, indent=2)
+    if args.output is not None:
+        args.output.write_text(output)
+    else:
+        sys.stdout.write(output)
+
+
+if __name__ == "__main__":
+    main()
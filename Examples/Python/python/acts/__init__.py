@@ -4,20 +4,23 @@ import os
 import warnings
 
 
-from .ActsPythonBindings import *
-from .ActsPythonBindings import __version__
+from .ActsPythonBindings import __version__, __commit_hash__
 from . import ActsPythonBindings
-from ._adapter import _patch_config
+from ._adapter import _lazy_bindings
 
+# The bound names are resolved, and their classes patched, on first access
+__getattr__, __dir__ = _lazy_bindings(globals(), [ActsPythonBindings])
+
+_threshold = ActsPythonBindings.logging.getFailureThreshold().name
 if (
     "ACTS_LOG_FAILURE_THRESHOLD" in os.environ
-    and os.environ["ACTS_LOG_FAILURE_THRESHOLD"] != logging.getFailureThreshold().name
+    and os.environ["ACTS_LOG_FAILURE_THRESHOLD"] != _threshold
 ):
     error = (
         "Runtime log failure threshold is given in environment variable "
         f"`ACTS_LOG_FAILURE_THRESHOLD={os.environ['ACTS_LOG_FAILURE_THRESHOLD']}`"
         "However, a compile-time value is set via CMake, i.e. "
-        f"`ACTS_LOG_FAILURE_THRESHOLD={logging.getFailureThreshold().name}`. "
+        f"`ACTS_LOG_FAILURE_THRESHOLD={_threshold}`. "
         "or `ACTS_ENABLE_LOG_FAILURE_THRESHOLD=OFF`, which disables runtime thresholds."
     )
     if "PYTEST_CURRENT_TEST" in os.environ:
@@ -42,14 +45,14 @@ def Propagator(stepper, navigator):
     raise TypeError(f"Unknown stepper {type(stepper).__name__}")
 
 
-_patch_config(ActsPythonBindings)
-
-
 @staticmethod
 def _decoratorFromFile(file: Union[str, Path], **kwargs):
     if isinstance(file, str):
         file = Path(file)
 
+    # resolved through the modules, so the constructors are patched
+    import acts.examples
+
     kwargs.setdefault("level", ActsPythonBindings.logging.INFO)
 
     if file.suffix in (".json", ".cbor"):
@@ -58,13 +61,15 @@ def _decoratorFromFile(file: Union[str, Path], **kwargs):
             if hasattr(c, k):
                 setattr(c, k, kwargs.pop(k))
 
-        return ActsPythonBindings.JsonMaterialDecorator(
-            jFileName=str(file), rConfig=c, **kwargs
-        )
+        return acts.JsonMaterialDecorator(jFileName=str(file), rConfig=c, **kwargs)
+    elif file.suffix == ".bin":
+        c = acts.examples.BinaryMaterialDecorator.Config(fileName=str(file))
+        for k in ("clearSurfaceMaterial", "clearVolumeMaterial"):
+            if k in kwargs:
+                setattr(c, k, kwargs.pop(k))
+        return acts.examples.BinaryMaterialDecorator(config=c, **kwargs)
     elif file.suffix == ".root":
-        return ActsPythonBindings._examples.RootMaterialDecorator(
-            fileName=str(file), **kwargs
-        )
+        return acts.examples.RootMaterialDecorator(fileName=str(file), **kwargs)
     else:
         raise ValueError(f"Unknown file type {file.suffix}")
 
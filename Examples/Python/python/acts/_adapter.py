@@ -1,10 +1,97 @@
+import atexit
 import inspect
 import functools
-from typing import Optional, Callable, Dict, Any
+import json
+import pkgutil
+import re
+from typing import Optional, Callable, Dict, Any, FrozenSet, List
 from pathlib import Path
 
 import acts
 
+# The config field tables are persisted across processes, so that short jobs
+# do not reflect on every class again. The file is keyed by the version and
+# the files of the bindings, and only extended at exit if new classes were seen.
+_persistedFields: Optional[Dict[str, List[str]]] = None
+_newFields: Dict[str, List[str]] = {}
+
+
+def _config_fields_path() -> Path:
+    from acts.examples._cache import cacheDir, contentHash
+
+    bindings = sorted(
+        Path(acts.ActsPythonBindings.__file__).parent.glob("ActsPythonBindings*")
+    )
+    key = contentHash(
+        {
+            "acts": list(acts.__version__),
+            "commit": acts.__commit_hash__,
+            "bindings": [
+                (str(f), f.stat().st_size, f.stat().st_mtime_ns) for f in bindings
+            ],
+        }
+    )
+    return cacheDir("ACTS_CONFIG_CACHE", "config") / f"fields_{key[:16]}.json"
+
+
+def _store_config_fields():
+    if not _newFields:
+        return
+    try:
+        from acts.examples._cache import writeAtomic
+
+        path = _config_fields_path()
+        fields = dict(_newFields)
+        # other processes might have added classes in the meantime
+        try:
+            fields.update(json.loads(path.read_text()))
+        except (OSError, ValueError):
+            pass
+        writeAtomic(path, lambda tmp: Path(tmp).write_text(json.dumps(fields)))
+    except (OSError, ImportError):
+        pass
+
+
+def _persisted_config_fields() -> Dict[str, List[str]]:
+    global _persistedFields
+    if _persistedFields is None:
+        _persistedFields = {}
+        try:
+            _persistedFields = json.loads(_config_fields_path().read_text())
+        except (OSError, ValueError, ImportError):
+            pass
+        atexit.register(_store_config_fields)
+    return _persistedFields
+
+
+@functools.lru_cache(maxsize=None)
+def _config_fields(cls) -> FrozenSet[str]:
+    """Names of the attributes of a (config) class that keyword arguments are
+    assigned to. Computed once per class and persisted across processes,
+    methods and dunder names are excluded."""
+    key = f"{cls.__module__}.{cls.__qualname__}"
+    persisted = _persisted_config_fields()
+    if key in persisted:
+        return frozenset(persisted[key])
+
+    fields = sorted(
+        name
+        for klass in cls.__mro__
+        for name, attr in vars(klass).items()
+        if not (name.startswith("__") and name.endswith("__"))
+        and not inspect.isroutine(attr)
+    )
+    _newFields[key] = fields
+    return frozenset(fields)
+
+
+def _field_type(cls, name: str) -> Optional[str]:
+    """Type of a bound attribute, as given in the signature of its getter"""
+    prop = getattr(cls, name, None)
+    doc = getattr(getattr(prop, "fget", None), "__doc__", None) or ""
+    match = re.search(r"->\s*(.+)", doc)
+    return match.group(1).strip() if match is not None else None
+
 
 def _make_config_adapter(fn):
     @functools.wraps(fn)
@@ -22,17 +109,24 @@ def _make_config_adapter(fn):
             return
 
         cfg = type(self).Config()
+        fields = _config_fields(type(cfg))
         _kwargs = {}
         for k, v in kwargs.items():
             if isinstance(v, Path):
                 v = str(v)
 
-            if hasattr(cfg, k):
+            if k in fields:
                 try:
                     setattr(cfg, k, v)
                 except TypeError as e:
+                    expected = _field_type(type(cfg), k)
                     raise RuntimeError(
-                        "{}: Failed to set {}={}".format(type(cfg), k, v)
+                        "{}: Failed to set {}={}{}".format(
+                            type(cfg),
+                            k,
+                            v,
+                            "" if expected is None else f" (expected {expected})",
+                        )
                     ) from e
             else:
                 _kwargs[k] = v
@@ -50,8 +144,7 @@ def _make_config_adapter(fn):
             )
             print("\n".join(textwrap.wrap(message, width=80)))
             print("->", ", ".join(_kwargs.keys()))
-            members = inspect.getmembers(type(cfg), lambda a: not inspect.isroutine(a))
-            members = [m for m, _ in members if not m.startswith("_")]
+            members = sorted(m for m in fields if not m.startswith("_"))
             print(type(cfg), "has the following properties:\n->", ", ".join(members))
             print("-" * 80)
             raise e
@@ -66,9 +159,10 @@ def _make_config_constructor(
 
     @functools.wraps(fn)
     def wrapped(self, *args, **kwargs):
+        fields = _config_fields(cls)
         _kwargs = {}
         for k in list(kwargs.keys()):
-            if hasattr(cls, k):
+            if k in fields:
                 _kwargs[k] = kwargs.pop(k)
 
         fn(self, *args, **kwargs)
@@ -87,17 +181,97 @@ def _patchKwargsConstructor(
     cls.__init__ = _make_config_constructor(cls, proc)
 
 
+def _classes(m):
+    # cheaper than inspect.getmembers, which sorts and resolves every member
+    return [(name, obj) for name, obj in vars(m).items() if isinstance(obj, type)]
+
+
+# Classes whose constructors were adapted already, as they can be reached
+# from several modules
+_patched = set()
+
+
+def _patch_class(name: str, cls):
+    if cls in _patched:
+        return
+    _patched.add(cls)
+
+    if name == "Config":
+        _patchKwargsConstructor(cls)
+
+    if name.endswith("Detector"):
+        return
+
+    if hasattr(cls, "Config"):
+        cls.__init__ = _make_config_adapter(cls.__init__)
+        _patchKwargsConstructor(cls.Config)
+
+
 def _patch_config(m):
-    for name, cls in inspect.getmembers(m, inspect.isclass):
-        if name == "Config":
-            _patchKwargsConstructor(cls)
+    for name, cls in _classes(m):
+        _patch_class(name, cls)
 
-        if name.endswith("Detector"):
-            continue
 
-        if hasattr(cls, "Config"):
-            cls.__init__ = _make_config_adapter(cls.__init__)
-            _patchKwargsConstructor(cls.Config)
+def _add_components(*names: str):
+    """Register the bindings of the optional components ``names``, or of all
+    components that were not requested yet"""
+    bindings = acts.ActsPythonBindings
+    for name in names or bindings._pendingComponents():
+        bindings._addComponent(name)
+
+
+def _lazy_bindings(
+    namespace: Dict[str, Any], modules: List[Any], patch: Callable = _patch_class
+):
+    """Module ``__getattr__`` and ``__dir__`` exporting the public names of the
+    bound ``modules`` into ``namespace``, like a star import would.
+
+    Names are resolved on first access, and only then are classes passed to
+    ``patch``. The optional components are registered when a name is not
+    found otherwise, or when all names are requested with ``__all__``.
+    """
+
+    def public():
+        names = {n for m in modules for n in vars(m) if not n.startswith("_")}
+        return names | {n for n in namespace if not n.startswith("_")}
+
+    def lookup(name):
+        for m in modules:
+            if name in vars(m):
+                return vars(m)[name]
+        raise KeyError(name)
+
+    def __getattr__(name):
+        if name == "__all__":
+            _add_components()
+            return sorted(public())
+        if name.startswith("_"):
+            raise AttributeError(
+                f"module {namespace['__name__']!r} has no attribute {name!r}"
+            )
+        try:
+            obj = lookup(name)
+        except KeyError:
+            # e.g. `from acts import examples` probes for the submodule first
+            if name not in {
+                m.name for m in pkgutil.iter_modules(namespace.get("__path__", []))
+            }:
+                _add_components()
+            try:
+                obj = lookup(name)
+            except KeyError:
+                raise AttributeError(
+                    f"module {namespace['__name__']!r} has no attribute {name!r}"
+                ) from None
+        if isinstance(obj, type):
+            patch(name, obj)
+        namespace[name] = obj
+        return obj
+
+    def __dir__():
+        return sorted(set(namespace) | public())
+
+    return __getattr__, __dir__
 
 
 def _detector_create(cls, config_class=None):
@@ -123,6 +297,6 @@ def _detector_create(cls, config_class=None):
 
 
 def _patch_detectors(m):
-    for name, cls in inspect.getmembers(m, inspect.isclass):
+    for name, cls in _classes(m):
         if name.endswith("Detector"):
             cls.create = _detector_create(cls)
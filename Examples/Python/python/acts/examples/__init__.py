@@ -1,13 +1,76 @@
 import sys, inspect
 from pathlib import Path
-from typing import Optional, Protocol, Union, List, Dict, Tuple
+from typing import Optional, Protocol, Union, List, Dict, Tuple, Callable
 import os
 import re
+import shutil
 
-from acts.ActsPythonBindings._examples import *
 from acts import ActsPythonBindings
 import acts
-from acts._adapter import _patch_config, _patch_detectors, _patchKwargsConstructor
+from acts._adapter import (
+    _detector_create,
+    _lazy_bindings,
+    _patch_class,
+    _patchKwargsConstructor,
+)
+
+# Submodules that can be reached as attributes, e.g. ``acts.examples.onnx``,
+# without importing them explicitly. They are imported on first access, as
+# some need optional components.
+_submodules = {
+    "dd4hep",
+    "detector",
+    "edm4hep",
+    "field_cache",
+    "geant4",
+    "geometry_cache",
+    "hepmc3",
+    "itk",
+    "metrics",
+    "mockupbuilder",
+    "odd",
+    "odd_light",
+    "onnx",
+    "reconstruction",
+    "simulation",
+}
+
+
+# ExaTrkX classes, which are only present if the plugin is built
+_kwargsConstructors = {
+    "TorchMetricLearning",
+    "OnnxMetricLearning",
+    "TorchEdgeClassifier",
+    "OnnxEdgeClassifier",
+}
+
+
+def _patch(name, cls):
+    if name.endswith("Detector"):
+        cls.create = _detector_create(cls)
+    _patch_class(name, cls)
+    if name in _kwargsConstructors:
+        _patchKwargsConstructor(cls)
+
+
+# The bound names are resolved, and their classes patched, on first access
+_bindingsGetattr, _bindingsDir = _lazy_bindings(
+    globals(), [ActsPythonBindings._examples], _patch
+)
+
+
+def __getattr__(name):
+    if name in _submodules:
+        import importlib
+
+        # the import sets the attribute, this is only called once
+        return importlib.import_module(f"{__name__}.{name}")
+    return _bindingsGetattr(name)
+
+
+def __dir__():
+    return sorted(set(_bindingsDir()) | _submodules)
+
 
 _propagators = []
 _concrete_propagators = []
@@ -26,20 +89,10 @@ def ConcretePropagator(propagator):
     raise TypeError(f"Unknown propagator {type(propagator).__name__}")
 
 
-_patch_config(ActsPythonBindings._examples)
-
-_patch_detectors(ActsPythonBindings._examples)
-
-# Manually patch ExaTrkX constructors
-# Need to do it this way, since they are not always present
-for module in [
-    "TorchMetricLearning",
-    "OnnxMetricLearning",
-    "TorchEdgeClassifier",
-    "OnnxEdgeClassifier",
-]:
-    if hasattr(ActsPythonBindings._examples, module):
-        _patchKwargsConstructor(getattr(ActsPythonBindings._examples, module))
+# used below, and as the base of `Sequencer`
+TGeoDetector = __getattr__("TGeoDetector")
+Interval = __getattr__("Interval")
+_patch_class("_Sequencer", ActsPythonBindings._examples._Sequencer)
 
 
 def _makeLayerTriplet(*args, **kwargs):
@@ -346,7 +399,21 @@ def defaultLogging(
 class Sequencer(ActsPythonBindings._examples._Sequencer):
     _autoFpeMasks: Optional[List["FpeMask"]] = None
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, numProcesses: int = 1, **kwargs):
+        """
+        Accepts the fields of `Sequencer.Config` as keyword arguments.
+
+        With `numProcesses > 1`, `run` has to be given a function that configures
+        the sequence. The requested events are then split into contiguous ranges,
+        each one processed by a fresh sequencer in a separate process, and the
+        outputs are merged into `outputDir` in event order afterwards. A
+        ``metricsCallback`` is not supported in this mode, as it would be called
+        in the worker processes. The ``iterationCallback`` is always the signal
+        check installed by the bindings, in every worker.
+        """
+        self.numProcesses = numProcesses
+        self._mergedEventTimings = None
+
         # if we have the argument already in kwargs, we optionally convert them from tuples
         if "fpeMasks" in kwargs:
             m = kwargs["fpeMasks"]
@@ -354,7 +421,11 @@ class Sequencer(ActsPythonBindings._examples._Sequencer):
                 n = []
                 for loc, fpe, count in m:
                     file, lines = self.FpeMask.parse_loc(loc)
-                    t = _fpe_types_to_enum[fpe] if isinstance(fpe, str) else fpe
+                    t = (
+                        self.FpeMask._fpe_types_to_enum[fpe]
+                        if isinstance(fpe, str)
+                        else fpe
+                    )
                     n.append(self.FpeMask(file, lines, t, count))
                 kwargs["fpeMasks"] = n
 
@@ -379,6 +450,159 @@ class Sequencer(ActsPythonBindings._examples._Sequencer):
 
         super().__init__(cfg)
 
+    def run(self, build: Optional[Callable[["Sequencer", Path], None]] = None):
+        """
+        Run the event loop.
+
+        If given, ``build(sequencer, outputDir)`` is called first to add the
+        components to the sequence. It is required for ``numProcesses > 1``,
+        where it is called once per worker process with a per-worker output
+        directory, and has to be picklable (i.e. a module level function).
+        """
+        outputDir = Path(self.config.outputDir or Path.cwd())
+
+        if self.numProcesses <= 1:
+            if build is not None:
+                build(self, outputDir)
+            return super().run()
+
+        if build is None:
+            raise ValueError("Running with numProcesses > 1 requires a build function")
+        if self.config.events is None:
+            raise ValueError(
+                "Running with numProcesses > 1 requires a number of events"
+            )
+        if self.config.trackWhiteBoardMemory:
+            raise ValueError(
+                "Tracking the whiteboard memory is not supported with numProcesses > 1"
+            )
+        if self.config.metricsCallback is not None:
+            raise ValueError(
+                "A metrics callback is not supported with numProcesses > 1"
+            )
+
+        from multiprocessing import Pool
+        from functools import partial
+        from acts.examples import _parallel
+
+        begin = self.config.skip
+        end = begin + self.config.events
+        ranges = _parallel.splitEventRange(begin, end, self.numProcesses)
+        chunkDirs = [outputDir / f"chunk_{b}_{e}" for b, e in ranges]
+
+        # the workers always record the per-event timing, which is needed for
+        # the merged percentiles, it is only kept if it was requested
+        eventTimingFile = self.config.outputEventTimingFile or "timing_events.npy"
+
+        auto = {(m.file, tuple(m.lines), m.type, m.count) for m in self._autoFpeMasks}
+        config = {
+            "logLevel": self.config.logLevel,
+            "numThreads": self.config.numThreads,
+            "outputTimingFile": self.config.outputTimingFile,
+            "outputEventTimingFile": eventTimingFile,
+            "intraEventParallelism": self.config.intraEventParallelism,
+            "releaseWhiteBoardObjects": self.config.releaseWhiteBoardObjects,
+            "trackFpes": self.config.trackFpes,
+            "failOnFirstFpe": self.config.failOnFirstFpe,
+            "fpeStackTraceLength": self.config.fpeStackTraceLength,
+            # auto-discovered masks are added again by each worker
+            "fpeMasks": [
+                (f"{m.file}:({m.lines[0]}, {m.lines[1]}]", m.type, m.count)
+                for m in self.config.fpeMasks
+                if (m.file, tuple(m.lines), m.type, m.count) not in auto
+            ],
+        }
+
+        with Pool(len(ranges)) as p:
+            p.starmap(
+                partial(_parallel.runEventRange, build, config),
+                [(b, e, d) for (b, e), d in zip(ranges, chunkDirs)],
+            )
+
+        self._mergedEventTimings = _parallel.mergeChunkOutputs(
+            chunkDirs,
+            outputDir,
+            self.config.outputTimingFile,
+            eventTimingFile,
+            end - begin,
+            storeEventTimings=bool(self.config.outputEventTimingFile),
+        )
+        for d in chunkDirs:
+            shutil.rmtree(d)
+
+    @property
+    def eventTimings(self) -> "numpy.ndarray":
+        """
+        Per-event timing of the last run as a NumPy record array with the
+        ``event_nr`` and the time in seconds spent in each element, e.g.
+        ``s.eventTimings["Algorithm:TrackFindingAlgorithm"]``.
+
+        The layout is the same as the one of ``outputEventTimingFile``, which
+        can be read with `numpy.load`. Without ``trackEventTimings=True`` or an
+        ``outputEventTimingFile`` the array has no rows.
+        """
+        if self._mergedEventTimings is not None:
+            return self._mergedEventTimings
+
+        import numpy
+
+        return self._recordArray(*self._eventTimings, numpy.float64)
+
+    @property
+    def whiteBoardMemory(self) -> "numpy.ndarray":
+        """
+        Estimated memory in bytes used by each whiteboard collection at the end
+        of every event of the last run, as a NumPy record array with the
+        ``event_nr`` and one field per collection, e.g.
+        ``s.whiteBoardMemory["ckfTracks"]``.
+
+        Requires ``trackWhiteBoardMemory=True`` and is not available with
+        ``numProcesses > 1``.
+        """
+        import numpy
+
+        return self._recordArray(*self._whiteBoardMemory, numpy.uint64)
+
+    @property
+    def whiteBoardPeakMemory(self) -> "numpy.ndarray":
+        """
+        Peak memory of the whiteboard during each event of the last run, as a
+        NumPy record array with the fields ``event_nr``, ``peak_bytes`` and
+        ``total_bytes``. The latter is the memory of all collections created in
+        the event, which is the peak without ``releaseWhiteBoardObjects``.
+
+        Requires ``trackWhiteBoardMemory=True``.
+        """
+        import numpy
+
+        return self._recordArray(*self._whiteBoardPeakMemory, numpy.uint64)
+
+    @staticmethod
+    def _recordArray(names, events, values, dtype) -> "numpy.ndarray":
+        import numpy
+
+        array = numpy.empty(
+            len(events),
+            dtype=[("event_nr", numpy.uint64)] + [(n, dtype) for n in names],
+        )
+        array["event_nr"] = events
+        for i, name in enumerate(names):
+            array[name] = values[:, i]
+        return array
+
+    @staticmethod
+    def timingPercentiles(
+        timings: "numpy.ndarray", percentiles: Tuple[float, ...] = (50, 95, 99)
+    ) -> Dict[str, "numpy.ndarray"]:
+        """Percentiles of the per-event time of each element in ``timings``, see `eventTimings`"""
+        import numpy
+
+        return {
+            name: numpy.percentile(timings[name], percentiles)
+            for name in timings.dtype.names
+            if name != "event_nr"
+        }
+
     class FpeMask(ActsPythonBindings._examples._Sequencer._FpeMask):
         @classmethod
         def fromFile(cls, file: Union[str, Path]) -> List["FpeMask"]:
@@ -449,18 +673,111 @@ class Sequencer(ActsPythonBindings._examples._Sequencer):
     def srcdir(cls) -> Path:
         return Path(cls._sourceLocation).parent.parent.parent.parent
 
+    _fpeMaskIndexVersion = 1
+
+    @staticmethod
+    def _parseFpeMaskMarkers(
+        lines: List[str], rel: str
+    ) -> List[Tuple[int, int, str, int]]:
+        """Extract FPE mask markers as ``(start, end, type, count)`` tuples from the lines of a single source file"""
+        masks = []
+        for i, line in enumerate(lines):
+            if "MARK" not in line:
+                continue
+
+            if m := re.match(r".*\/\/ ?MARK: ?(fpeMask\(.*)$", line):
+                exp = m.group(1)
+                for m in re.findall(r"fpeMask\( ?(\w+), ?(\d+) ?, ?#(\d+) ?\)", exp):
+                    fpeType, count, _ = m
+                    masks.append((i + 1, i + 2, fpeType, int(count)))
+
+            if m := re.match(
+                r".*\/\/ ?MARK: ?fpeMaskBegin\( ?(\w+), ?(\d+) ?, ?#?(\d+) ?\)",
+                line,
+            ):
+                fpeType, count, _ = m.groups()
+                count = int(count)
+
+                start = i + 1
+                end = None
+
+                # look for end marker
+                for j, line2 in enumerate(lines[i:]):
+                    if m := re.match(r".*\/\/ ?MARK: ?fpeMaskEnd\( ?(\w+) ?\)$", line2):
+                        endType = m.group(1)
+                        if endType == fpeType:
+                            end = i + j + 1
+                            break
+
+                if end is None:
+                    raise ValueError(
+                        f"Found fpeMaskBegin but no fpeMaskEnd for {rel}:{start}"
+                    )
+                masks.append((start, end + 1, fpeType, count))
+
+        return masks
+
     @classmethod
-    def _getAutoFpeMasks(cls) -> List[FpeMask]:
-        if cls._autoFpeMasks is not None:
-            return cls._autoFpeMasks
+    def _fpeMaskIndexPath(cls) -> Path:
+        """Location of the persistent FPE mask index for the current source tree.
+        Can be overridden with ``ACTS_SEQUENCER_FPE_MASK_CACHE``."""
+        if "ACTS_SEQUENCER_FPE_MASK_CACHE" in os.environ:
+            return Path(os.environ["ACTS_SEQUENCER_FPE_MASK_CACHE"])
 
-        srcdir = cls.srcdir()
+        import hashlib
 
-        cls._autoFpeMasks = []
+        cachedir = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        key = hashlib.sha1(str(cls.srcdir().resolve()).encode("utf8")).hexdigest()
+        return cachedir / "acts" / f"fpe_masks_{key[:16]}.json"
+
+    @classmethod
+    def _prebuiltFpeMaskIndexPath(cls) -> Path:
+        """Location of a mask index shipped alongside the installed bindings"""
+        return Path(acts.__file__).parent / "fpe_masks.json"
+
+    @classmethod
+    def _loadFpeMaskIndex(cls, path: Path) -> Dict[str, dict]:
+        import json
+
+        try:
+            with path.open() as fh:
+                index = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+
+        if index.get("version") != cls._fpeMaskIndexVersion:
+            return {}
+        return index.get("files", {})
 
-        for root, _, files in os.walk(srcdir):
+    @classmethod
+    def _storeFpeMaskIndex(cls, path: Path, files: Dict[str, dict]):
+        import json
+        import tempfile
+
+        # Write to a temporary file first and move it in place, so that
+        # concurrent processes never see a partially written index.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as fh:
+                json.dump({"version": cls._fpeMaskIndexVersion, "files": files}, fh)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    @classmethod
+    def _scanFpeMaskIndex(
+        cls, srcdir: Path, index: Dict[str, dict]
+    ) -> Tuple[Dict[str, dict], bool]:
+        """Walk the source tree and only re-parse files that changed with respect to ``index``.
+        Returns the new index and whether it differs from ``index``."""
+        files = {}
+        changed = False
+
+        for root, _, fnames in os.walk(srcdir):
             root = Path(root)
-            for f in files:
+            for f in fnames:
                 if (
                     not f.endswith(".hpp")
                     and not f.endswith(".cpp")
@@ -468,60 +785,72 @@ class Sequencer(ActsPythonBindings._examples._Sequencer):
                 ):
                     continue
                 f = root / f
-                #  print(f)
+                rel = str(f.relative_to(srcdir))
+                st = f.stat()
+
+                entry = index.get(rel)
+                if (
+                    entry is not None
+                    and entry["mtime"] == st.st_mtime_ns
+                    and entry["size"] == st.st_size
+                ):
+                    files[rel] = entry
+                    continue
+
+                changed = True
                 with f.open("r") as fh:
                     lines = fh.readlines()
-                for i, line in enumerate(lines):
-                    if m := re.match(r".*\/\/ ?MARK: ?(fpeMask\(.*)$", line):
-                        exp = m.group(1)
-                        for m in re.findall(
-                            r"fpeMask\( ?(\w+), ?(\d+) ?, ?#(\d+) ?\)", exp
-                        ):
-                            fpeType, count, _ = m
-                            count = int(count)
-                            rel = f.relative_to(srcdir)
-                            cls._autoFpeMasks.append(
-                                cls.FpeMask(
-                                    str(rel),
-                                    (i + 1, i + 2),
-                                    cls.FpeMask._fpe_types_to_enum[fpeType],
-                                    count,
-                                )
-                            )
-
-                    if m := re.match(
-                        r".*\/\/ ?MARK: ?fpeMaskBegin\( ?(\w+), ?(\d+) ?, ?#?(\d+) ?\)",
-                        line,
-                    ):
-                        fpeType, count, _ = m.groups()
-                        count = int(count)
-                        rel = f.relative_to(srcdir)
-
-                        start = i + 1
-                        end = None
-
-                        # look for end marker
-                        for j, line2 in enumerate(lines[i:]):
-                            if m := re.match(
-                                r".*\/\/ ?MARK: ?fpeMaskEnd\( ?(\w+) ?\)$", line2
-                            ):
-                                endType = m.group(1)
-                                if endType == fpeType:
-                                    end = i + j + 1
-                                    break
-
-                        if end is None:
-                            raise ValueError(
-                                f"Found fpeMaskBegin but no fpeMaskEnd for {rel}:{start}"
-                            )
-                        cls._autoFpeMasks.append(
-                            cls.FpeMask(
-                                str(rel),
-                                (start, end + 1),
-                                cls.FpeMask._fpe_types_to_enum[fpeType],
-                                count,
-                            )
-                        )
+                files[rel] = {
+                    "mtime": st.st_mtime_ns,
+                    "size": st.st_size,
+                    "masks": cls._parseFpeMaskMarkers(lines, rel),
+                }
+
+        return files, changed or len(files) != len(index)
+
+    @classmethod
+    def writeFpeMaskIndex(cls, path: Union[str, Path]):
+        """Write the FPE mask index of the current source tree to ``path``.
+        Placing it next to the installed bindings as ``fpe_masks.json`` avoids scanning the source tree at startup.
+        """
+        files, _ = cls._scanFpeMaskIndex(cls.srcdir(), {})
+        cls._storeFpeMaskIndex(Path(path), files)
+
+    @classmethod
+    def _getAutoFpeMasks(cls) -> List[FpeMask]:
+        if cls._autoFpeMasks is not None:
+            return cls._autoFpeMasks
+
+        srcdir = cls.srcdir()
+
+        if srcdir.exists():
+            indexPath = cls._fpeMaskIndexPath()
+            files, changed = cls._scanFpeMaskIndex(
+                srcdir, cls._loadFpeMaskIndex(indexPath)
+            )
+            if changed:
+                try:
+                    cls._storeFpeMaskIndex(indexPath, files)
+                except OSError:
+                    # The index is only an optimization, a read-only cache
+                    # location is not an error
+                    pass
+        else:
+            # pure install without a source tree: use a shipped index, if any
+            files = cls._loadFpeMaskIndex(cls._prebuiltFpeMaskIndexPath())
+
+        cls._autoFpeMasks = []
+
+        for rel, entry in sorted(files.items()):
+            for start, end, fpeType, count in entry["masks"]:
+                cls._autoFpeMasks.append(
+                    cls.FpeMask(
+                        rel,
+                        (start, end),
+                        cls.FpeMask._fpe_types_to_enum[fpeType],
+                        count,
+                    )
+                )
 
         return cls._autoFpeMasks
 
@@ -540,6 +869,8 @@ class Sequencer(ActsPythonBindings._examples._Sequencer):
 
         error = False
         srcdir = cls.srcdir()
+        # without a source tree (e.g. masks from a shipped index), locations cannot be checked
+        checkFiles = srcdir.exists()
 
         if not have_rich or not sys.stdout.isatty():
             print("FPE masks:")
@@ -547,7 +878,7 @@ class Sequencer(ActsPythonBindings._examples._Sequencer):
                 s = f"{mask.file}:{mask.lines[0]}: {mask.type.name}: {mask.count}"
 
                 full_path = srcdir / mask.file
-                if not full_path.exists():
+                if checkFiles and not full_path.exists():
                     print(f"- {s}\n  [File at {full_path} does not exist!]")
                     error = True
                 else:
@@ -569,6 +900,9 @@ class Sequencer(ActsPythonBindings._examples._Sequencer):
                     rich.print(rich.rule.Rule())
                 full_path = srcdir / mask.file
                 if not full_path.exists():
+                    if not checkFiles:
+                        rich.print(rich.panel.Panel(md(f"**{mask}**"), title=f"{mask}"))
+                        continue
                     rich.print(
                         rich.panel.Panel(
                             md(f"File at **{full_path}** does not exist"),
@@ -617,7 +951,7 @@ class Sequencer(ActsPythonBindings._examples._Sequencer):
                     line_str,
                     mask.type.name,
                     str(mask.count),
-                    style="red" if not full_path.exists() else None,
+                    style="red" if checkFiles and not full_path.exists() else None,
                 )
 
             rich.print(table)
@@ -0,0 +1,59 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Union
+
+# Helpers shared by the persistent caches, see `acts.examples.geometry_cache`
+# and `acts.examples.field_cache`.
+
+
+def _hashInput(h, path: Path):
+    # Only names relative to the input are hashed, so that copies of the
+    # inputs in different locations share the cached object
+    files = (
+        sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+    )
+    for file in files:
+        rel = file.relative_to(path) if path.is_dir() else Path(file.name)
+        h.update(str(rel).encode("utf8"))
+        with file.open("rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                h.update(chunk)
+
+
+def contentHash(
+    parameters: Dict[str, Any], inputs: Iterable[Union[str, Path]] = ()
+) -> str:
+    """Hash of JSON serializable ``parameters`` and the content of the files or directories ``inputs``"""
+    h = hashlib.sha256()
+    h.update(json.dumps(parameters, sort_keys=True, default=str).encode("utf8"))
+    for path in inputs:
+        _hashInput(h, Path(path))
+    return h.hexdigest()
+
+
+def cacheDir(envVar: str, name: str) -> Path:
+    """Location of a cache, ``$XDG_CACHE_HOME/acts/<name>`` unless overridden with ``envVar``"""
+    if envVar in os.environ:
+        return Path(os.environ[envVar])
+    cachedir = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return cachedir / "acts" / name
+
+
+def writeAtomic(path: Path, write: Callable[[str], None]):
+    """Create ``path`` with ``write(filename)``.
+
+    The file is written to a temporary file first and moved in place, so that
+    concurrent jobs never see a partially written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
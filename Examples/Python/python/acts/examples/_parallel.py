@@ -0,0 +1,176 @@
+import os
+import shutil
+import filecmp
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+# Helpers for running a Sequencer workflow over event ranges in separate
+# processes, see `acts.examples.Sequencer(numProcesses=...)`.
+
+
+def splitEventRange(begin: int, end: int, n: int) -> List[Tuple[int, int]]:
+    """Split ``[begin, end)`` into at most ``n`` contiguous, ordered chunks of (almost) equal size"""
+    total = end - begin
+    n = max(1, min(n, total))
+    size, rest = divmod(total, n)
+
+    ranges = []
+    start = begin
+    for i in range(n):
+        stop = start + size + (1 if i < rest else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def runEventRange(
+    build: Callable[[Any, Path], None],
+    config: Dict[str, Any],
+    begin: int,
+    end: int,
+    outputDir: Path,
+):
+    """Worker entry point: build a fresh sequencer for ``[begin, end)`` and run it"""
+    import acts.examples
+
+    outputDir.mkdir(parents=True, exist_ok=True)
+
+    s = acts.examples.Sequencer(
+        **config,
+        skip=begin,
+        events=end - begin,
+        outputDir=str(outputDir),
+    )
+    build(s, outputDir)
+    s.run()
+    del s
+
+
+def mergeEventTimingFiles(files: List[Path], target: Optional[Path]):
+    """Concatenate the per-event timing record arrays of the chunks in event order,
+    and store them in ``target`` if given"""
+    import numpy
+
+    timings = numpy.concatenate([numpy.load(f) for f in files])
+    timings = timings[numpy.argsort(timings["event_nr"], kind="stable")]
+    if target is not None:
+        numpy.save(target, timings)
+    return timings
+
+
+def mergeTimingFiles(
+    files: List[Path], target: Path, numEvents: int, eventTimings=None
+):
+    """Sum up the per-algorithm totals of the timing files written by the chunks.
+
+    The percentiles are recomputed from the merged per-event timing if given,
+    and are not available otherwise.
+    """
+    import numpy
+
+    identifiers = []
+    totals = {}
+    for file in files:
+        with file.open() as fh:
+            header = fh.readline().strip().split("\t")
+            for line in fh:
+                row = dict(zip(header, line.strip().split("\t")))
+                ident = row["identifier"]
+                if ident not in totals:
+                    identifiers.append(ident)
+                    totals[ident] = 0.0
+                totals[ident] += float(row["time_total_s"])
+
+    with target.open("w") as fh:
+        fh.write(
+            "identifier\ttime_total_s\ttime_perevent_s\ttime_p50_s\ttime_p95_s\ttime_p99_s\n"
+        )
+        for ident in identifiers:
+            total = totals[ident]
+            if eventTimings is not None and ident in eventTimings.dtype.names:
+                p = numpy.percentile(eventTimings[ident], [50, 95, 99])
+            else:
+                p = [float("nan")] * 3
+            fh.write(
+                f"{ident}\t{total:.4g}\t{total / numEvents:.4g}\t"
+                + "\t".join(f"{v:.4g}" for v in p)
+                + "\n"
+            )
+
+
+def mergeRootFiles(files: List[Path], target: Path):
+    """Concatenate ROOT files, ordering the entries of all trees by event number"""
+    import acts
+    import acts.examples
+
+    acts.examples.RootFileMerger.run(
+        acts.examples.RootFileMerger.Config(
+            inputFiles=[str(f) for f in files], outputFile=str(target)
+        ),
+        acts.logging.WARNING,
+    )
+
+
+def mergeChunkOutputs(
+    chunkDirs: List[Path],
+    outputDir: Path,
+    timingFile: str,
+    eventTimingFile: str,
+    numEvents: int,
+    storeEventTimings: bool = True,
+):
+    """Combine the outputs of all chunks into ``outputDir``.
+
+    Files that only exist once (e.g. per-event CSV files) are moved, ROOT files
+    and the timing files are merged in chunk order. Any other file written by
+    more than one chunk has to be identical across chunks. The merged per-event
+    timing is only written with ``storeEventTimings``.
+
+    Returns the merged per-event timing, if it was written by the chunks.
+    """
+    merge: Dict[Path, List[Path]] = {}
+    timingFiles = (
+        {Path(timingFile), Path(eventTimingFile)}
+        if eventTimingFile
+        else {Path(timingFile)}
+    )
+
+    for chunkDir in chunkDirs:
+        for root, _, files in os.walk(chunkDir):
+            root = Path(root)
+            for f in files:
+                f = root / f
+                rel = f.relative_to(chunkDir)
+                if f.suffix == ".root" or rel in timingFiles:
+                    merge.setdefault(rel, []).append(f)
+                    continue
+
+                target = outputDir / rel
+                if target.exists():
+                    if not filecmp.cmp(f, target, shallow=False):
+                        raise RuntimeError(
+                            f"Output file {rel} was written by several processes with different content"
+                        )
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.move(f, target)
+
+    eventTimings = None
+    if eventTimingFile and Path(eventTimingFile) in merge:
+        target = None
+        if storeEventTimings:
+            target = outputDir / eventTimingFile
+            target.parent.mkdir(parents=True, exist_ok=True)
+        eventTimings = mergeEventTimingFiles(merge.pop(Path(eventTimingFile)), target)
+
+    for rel, files in sorted(merge.items()):
+        target = outputDir / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if rel == Path(timingFile):
+            mergeTimingFiles(files, target, numEvents, eventTimings)
+        elif len(files) == 1:
+            shutil.move(files[0], target)
+        else:
+            mergeRootFiles(files, target)
+
+    return eventTimings
@@ -1,6 +1,8 @@
-from acts._adapter import _patch_config
+from acts._adapter import _add_components, _patch_config
 from acts import ActsPythonBindings
 
+_add_components("edm4hep")
+
 if not hasattr(ActsPythonBindings._examples, "_edm4hep"):
     raise ImportError("ActsPythonBindings._examples._edm4hep not found")
 
@@ -0,0 +1,89 @@
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
+
+import acts
+import acts.examples
+from acts.examples._cache import cacheDir as _cacheDir, contentHash, writeAtomic
+
+# Persistent cache of interpolated magnetic field maps. The grid of a map is
+# written once in a binary format that is memory mapped by every process
+# using it, so loading is nearly free and all processes on a node share the
+# same pages.
+
+# Increase when the content of the cached maps changes
+_fieldMapVersion = 1
+
+
+def fieldMapHash(
+    inputs: Iterable[Union[str, Path]] = (), config: Optional[Any] = None
+) -> str:
+    """Hash of everything a cached field map depends on.
+
+    :param inputs: files the field map is read from, their content is hashed
+    :param config: additional JSON serializable parameters of the field map
+    """
+    return contentHash(
+        {
+            "fieldMap": _fieldMapVersion,
+            "acts": list(acts.__version__),
+            "config": config,
+        },
+        inputs,
+    )
+
+
+def fieldCacheDir() -> Path:
+    """Location of the field map cache, can be overridden with ``ACTS_FIELD_CACHE``"""
+    return _cacheDir("ACTS_FIELD_CACHE", "bfield")
+
+
+def cachedFieldMap(
+    build: Callable[[], "acts.InterpolatedMagneticField"],
+    name: str,
+    inputs: Iterable[Union[str, Path]] = (),
+    config: Optional[Any] = None,
+    cacheDir: Optional[Union[str, Path]] = None,
+    logLevel=acts.logging.INFO,
+):
+    """Memory map a field map from the cache, or build it and store it.
+
+    The map is keyed by :func:`fieldMapHash` of ``inputs`` and ``config``, so
+    changing any of them triggers a rebuild. ``build`` has to return a field
+    map in (r,z) or (x,y,z), e.g. from ``acts.solenoidFieldMap`` or
+    ``acts.examples.MagneticFieldMapRz``. An unwritable cache location is not
+    an error, the built field map is then returned directly.
+
+    :param build: builds the field map, only called on a cache miss
+    :param name: name of the field map file
+    :param inputs: files the field map is read from
+    :param config: additional JSON serializable parameters of the field map
+    :param cacheDir: defaults to :func:`fieldCacheDir`
+    """
+    logger = acts.logging.getLogger("FieldCache")
+    logger.setLevel(logLevel)
+
+    cacheDir = Path(cacheDir) if cacheDir is not None else fieldCacheDir()
+    key = fieldMapHash(list(inputs), config)
+    path = cacheDir / f"{name}_{key[:16]}.bin"
+
+    if path.exists():
+        try:
+            field = acts.examples.MagneticFieldMapBinary(str(path))
+            logger.info("Mapped field map %s from %s", name, path)
+            return field
+        except RuntimeError as e:
+            logger.warning("Could not read %s, rebuilding: %s", path, e)
+
+    field = build()
+
+    try:
+        writeAtomic(
+            path, lambda tmp: acts.examples.writeMagneticFieldMapBinary(field, tmp)
+        )
+        logger.info("Wrote field map %s to %s", name, path)
+    except (OSError, RuntimeError) as e:
+        logger.warning("Could not store field map in %s: %s", cacheDir, e)
+        return field
+
+    # Use the mapped file from the start, so that every process shares it
+    return acts.examples.MagneticFieldMapBinary(str(path))
@@ -0,0 +1,138 @@
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
+
+import acts
+import acts.examples
+from acts.examples._cache import cacheDir as _cacheDir, contentHash, writeAtomic
+
+# Persistent cache of detector snapshots, so that jobs reading the same
+# geometry inputs only build the detector once. A snapshot holds the
+# surfaces with their bounds, transforms, geometry identifiers and material,
+# and the volume and portal structure, written as CBOR by the Json plugin.
+#
+# The Gen1 tracking geometries built from DD4hep or TGeo keep the detector
+# elements of their source, so they can not be restored from a snapshot. For
+# them, the JSON material maps they are decorated with are cached as CBOR.
+
+# Increase when the content of the snapshot changes
+_snapshotVersion = 1
+
+
+def geometryHash(
+    inputs: Iterable[Union[str, Path]] = (), config: Optional[Any] = None
+) -> str:
+    """Hash of everything a detector snapshot depends on.
+
+    :param inputs: files or directories the detector is built from, their content is hashed
+    :param config: additional JSON serializable build parameters
+    """
+    return contentHash(
+        {
+            "snapshot": _snapshotVersion,
+            "acts": list(acts.__version__),
+            # the converters can change between releases
+            "commit": acts.__commit_hash__,
+            "config": config,
+        },
+        inputs,
+    )
+
+
+def geometryCacheDir() -> Path:
+    """Location of the geometry cache, can be overridden with ``ACTS_GEOMETRY_CACHE``"""
+    return _cacheDir("ACTS_GEOMETRY_CACHE", "geometry")
+
+
+def cachedDetector(
+    build: Callable[[], "acts.Detector"],
+    name: str,
+    inputs: Iterable[Union[str, Path]] = (),
+    config: Optional[Any] = None,
+    geoContext: Optional[acts.GeometryContext] = None,
+    cacheDir: Optional[Union[str, Path]] = None,
+    logLevel=acts.logging.INFO,
+):
+    """Read a detector from the cache, or build it and store the snapshot.
+
+    The snapshot is keyed by :func:`geometryHash` of ``inputs`` and
+    ``config``, so changing any of them triggers a rebuild. An unreadable
+    cache location is not an error, the detector is then built every time.
+
+    :param build: builds the detector, only called on a cache miss
+    :param name: name of the snapshot file
+    :param inputs: files or directories the detector is built from
+    :param config: additional JSON serializable build parameters
+    :param cacheDir: defaults to :func:`geometryCacheDir`
+    """
+    logger = acts.logging.getLogger("GeometryCache")
+    logger.setLevel(logLevel)
+
+    inputs = list(inputs)
+    geoContext = geoContext or acts.GeometryContext()
+    cacheDir = Path(cacheDir) if cacheDir is not None else geometryCacheDir()
+    key = geometryHash(inputs, config)
+    path = cacheDir / f"{name}_{key[:16]}.cbor"
+
+    if path.exists():
+        try:
+            detector = acts.examples.readDetectorFromCbor(geoContext, str(path))
+            logger.info("Read detector %s from %s", name, path)
+            return detector
+        except RuntimeError as e:
+            logger.warning("Could not read %s, rebuilding: %s", path, e)
+
+    detector = build()
+
+    try:
+        writeAtomic(
+            path,
+            lambda tmp: acts.examples.writeDetectorToCbor(geoContext, detector, tmp),
+        )
+        logger.info("Wrote detector %s to %s", name, path)
+    except (OSError, RuntimeError) as e:
+        logger.warning("Could not store detector snapshot in %s: %s", cacheDir, e)
+
+    return detector
+
+
+def cachedMaterialFile(
+    file: Union[str, Path],
+    cacheDir: Optional[Union[str, Path]] = None,
+    logLevel=acts.logging.INFO,
+) -> Path:
+    """CBOR copy of a JSON material map or material mapping configuration.
+
+    Large JSON maps are considerably faster to read from CBOR, which
+    ``acts.JsonMaterialDecorator`` and ``acts.IMaterialDecorator.fromFile``
+    accept as well. The copy is keyed by :func:`geometryHash` of ``file``.
+    Other file types, and maps that can not be converted or stored, are
+    returned unchanged.
+
+    :param file: the material file
+    :param cacheDir: defaults to :func:`geometryCacheDir`
+    """
+    logger = acts.logging.getLogger("GeometryCache")
+    logger.setLevel(logLevel)
+
+    file = Path(file)
+    if file.suffix != ".json":
+        return file
+
+    cacheDir = Path(cacheDir) if cacheDir is not None else geometryCacheDir()
+    key = geometryHash([file], {"material": file.name})
+    path = cacheDir / f"{file.stem}_{key[:16]}.cbor"
+    if path.exists():
+        logger.debug("Read material %s from %s", file, path)
+        return path
+
+    try:
+        convert = acts.examples.convertJsonToCbor
+        writeAtomic(path, lambda tmp: convert(str(file), tmp))
+        logger.info("Wrote material %s to %s", file, path)
+        return path
+    except AttributeError:
+        # built without the Json plugin
+        return file
+    except (OSError, RuntimeError) as e:
+        logger.warning("Could not store material %s in %s: %s", file, cacheDir, e)
+        return file
@@ -44,8 +44,10 @@ def buildITkGeometry(
         else:
             file = geo_dir / "itk-hgtd/material-maps-ITk-HGTD.json"
             logger.info("Adding material from %s", file.absolute())
+        from acts.examples.geometry_cache import cachedMaterialFile
+
         matDeco = acts.IMaterialDecorator.fromFile(
-            file,
+            cachedMaterialFile(file, logLevel=customLogLevel()),
             level=customLogLevel(maxLevel=acts.logging.INFO),
         )
 
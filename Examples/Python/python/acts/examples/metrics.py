@@ -0,0 +1,110 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Union
+
+import acts.examples
+
+# Exporters for the event metrics of a running sequencer, to be passed as
+# ``acts.examples.Sequencer(metricsCallback=...)``. They receive the metrics in
+# batches of ``metricsBatchSize`` events and are never called concurrently.
+
+EventMetrics = acts.examples.Sequencer.EventMetrics
+
+
+class JsonLinesExporter:
+    """Append one JSON object per processed event to ``path``"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # truncate once, every batch is appended afterwards
+        self.path.write_text("")
+
+    def __call__(self, names: List[str], batch: List[EventMetrics]):
+        with self.path.open("a") as fh:
+            for m in batch:
+                record = {
+                    "event": m.event,
+                    "time_s": m.time,
+                    "wall_time_s": m.wallTime,
+                    "rss_bytes": m.rss,
+                    "whiteboard_objects": m.whiteBoardObjects,
+                    "whiteboard_bytes": m.whiteBoardBytes,
+                    "durations_s": dict(zip(names, m.durations)),
+                }
+                fh.write(json.dumps(record) + "\n")
+
+
+class PrometheusTextfileExporter:
+    """
+    Keep a file in the Prometheus text exposition format up to date, as read
+    by the node exporter's textfile collector. The file is replaced atomically
+    after every batch.
+    """
+
+    def __init__(self, path: Union[str, Path], job: str = "acts"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.job = job
+        self.events = 0
+        self.eventSeconds = 0.0
+        self.elementSeconds: Dict[str, float] = {}
+        self.elapsed = 0.0
+        self.rss = 0
+        self.whiteBoardObjects = 0
+        self.whiteBoardBytes = 0
+
+    def _labels(self, **labels) -> str:
+        labels = {"job": self.job, **labels}
+        escaped = (
+            (k, str(v).replace("\\", "\\\\").replace('"', '\\"'))
+            for k, v in labels.items()
+        )
+        return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+    def __call__(self, names: List[str], batch: List[EventMetrics]):
+        for m in batch:
+            self.events += 1
+            self.eventSeconds += m.wallTime
+            for name, duration in zip(names, m.durations):
+                self.elementSeconds[name] = self.elementSeconds.get(name, 0) + duration
+        last = max(batch, key=lambda m: m.time)
+        self.elapsed = max(self.elapsed, last.time)
+        self.rss = last.rss
+        self.whiteBoardObjects = last.whiteBoardObjects
+        self.whiteBoardBytes = last.whiteBoardBytes
+
+        lines = [
+            "# HELP acts_sequencer_events_total Number of processed events",
+            "# TYPE acts_sequencer_events_total counter",
+            f"acts_sequencer_events_total{self._labels()} {self.events}",
+            "# HELP acts_sequencer_event_seconds_total Wall time spent processing events",
+            "# TYPE acts_sequencer_event_seconds_total counter",
+            f"acts_sequencer_event_seconds_total{self._labels()} {self.eventSeconds}",
+            "# HELP acts_sequencer_throughput_events_per_second Processed events per second since the start of the event loop",
+            "# TYPE acts_sequencer_throughput_events_per_second gauge",
+            f"acts_sequencer_throughput_events_per_second{self._labels()} "
+            f"{self.events / self.elapsed if self.elapsed > 0 else 0}",
+            "# HELP acts_sequencer_rss_bytes Resident set size of the process",
+            "# TYPE acts_sequencer_rss_bytes gauge",
+            f"acts_sequencer_rss_bytes{self._labels()} {self.rss}",
+            "# HELP acts_sequencer_whiteboard_objects Number of objects on the whiteboard at the end of the last event",
+            "# TYPE acts_sequencer_whiteboard_objects gauge",
+            f"acts_sequencer_whiteboard_objects{self._labels()} {self.whiteBoardObjects}",
+            "# HELP acts_sequencer_whiteboard_bytes Estimated memory of the objects on the whiteboard at the end of the last event",
+            "# TYPE acts_sequencer_whiteboard_bytes gauge",
+            f"acts_sequencer_whiteboard_bytes{self._labels()} {self.whiteBoardBytes}",
+            "# HELP acts_sequencer_element_seconds_total Time spent in each sequence element",
+            "# TYPE acts_sequencer_element_seconds_total counter",
+        ]
+        for name, seconds in self.elementSeconds.items():
+            lines.append(
+                f"acts_sequencer_element_seconds_total{self._labels(element=name)} {seconds}"
+            )
+
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as fh:
+            fh.write("\n".join(lines) + "\n")
+        os.replace(tmp, self.path)
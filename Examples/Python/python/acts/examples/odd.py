@@ -74,9 +74,16 @@ def getOpenDataDetector(
 
     config = acts.MaterialMapJsonConverter.Config()
     if mdecorator is None:
+        from acts.examples.geometry_cache import cachedMaterialFile
+
         mdecorator = acts.JsonMaterialDecorator(
             rConfig=config,
-            jFileName=str(odd_dir / "config/odd-material-mapping-config.json"),
+            jFileName=str(
+                cachedMaterialFile(
+                    odd_dir / "config/odd-material-mapping-config.json",
+                    logLevel=customLogLevel(),
+                )
+            ),
             level=customLogLevel(minLevel=acts.logging.WARNING),
         )
 
@@ -8,13 +8,222 @@
 
 #include "Acts/EventData/ParticleHypothesis.hpp"
 #include "Acts/Plugins/Python/Utilities.hpp"
+#include "ActsExamples/EventData/IndexSourceLink.hpp"
+#include "ActsExamples/EventData/Measurement.hpp"
+#include "ActsExamples/EventData/SimHit.hpp"
+#include "ActsExamples/EventData/SimSpacePoint.hpp"
+#include "ActsExamples/EventData/Track.hpp"
+#include "ActsExamples/Framework/AlgorithmContext.hpp"
+#include "ActsExamples/Framework/DataHandle.hpp"
+#include "ActsExamples/Framework/SequenceElement.hpp"
 
+#include <algorithm>
+#include <any>
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <memory>
+#include <optional>
+#include <string>
+#include <utility>
+#include <variant>
+#include <vector>
+
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
 namespace py = pybind11;
 
 using namespace Acts;
+using namespace ActsExamples;
+
+namespace {
+
+struct Field {
+  const char* name;
+  const char* format;
+  py::ssize_t offset;
+};
+
+py::dtype makeDtype(const std::vector<Field>& fields, py::ssize_t itemsize) {
+  py::list names, formats, offsets;
+  for (const auto& field : fields) {
+    names.append(field.name);
+    formats.append(field.format);
+    offsets.append(field.offset);
+  }
+  return py::dtype(names, formats, offsets, itemsize);
+}
+
+/// Flat copy of a simulated hit
+struct SimHitRecord {
+  std::uint64_t geometryId;
+  std::uint64_t particleId;
+  std::int32_t index;
+  double fourPosition[4];
+  double momentum4Before[4];
+  double momentum4After[4];
+};
+
+py::dtype simHitDtype() {
+  return makeDtype(
+      {
+          {"geometry_id", "u8", offsetof(SimHitRecord, geometryId)},
+          {"particle_id", "u8", offsetof(SimHitRecord, particleId)},
+          {"index", "i4", offsetof(SimHitRecord, index)},
+          {"four_position", "(4,)f8", offsetof(SimHitRecord, fourPosition)},
+          {"momentum4_before", "(4,)f8",
+           offsetof(SimHitRecord, momentum4Before)},
+          {"momentum4_after", "(4,)f8", offsetof(SimHitRecord, momentum4After)},
+      },
+      sizeof(SimHitRecord));
+}
+
+/// Flat copy of a space point
+struct SpacePointRecord {
+  double x;
+  double y;
+  double z;
+  double r;
+  double varR;
+  double varZ;
+  float topHalfStripLength;
+  float bottomHalfStripLength;
+  double topStripDirection[3];
+  double bottomStripDirection[3];
+  double stripCenterDistance[3];
+  double topStripCenterPosition[3];
+};
+
+py::dtype simSpacePointDtype() {
+  return makeDtype(
+      {
+          {"x", "f8", offsetof(SpacePointRecord, x)},
+          {"y", "f8", offsetof(SpacePointRecord, y)},
+          {"z", "f8", offsetof(SpacePointRecord, z)},
+          {"r", "f8", offsetof(SpacePointRecord, r)},
+          {"var_r", "f8", offsetof(SpacePointRecord, varR)},
+          {"var_z", "f8", offsetof(SpacePointRecord, varZ)},
+          {"top_half_strip_length", "f4",
+           offsetof(SpacePointRecord, topHalfStripLength)},
+          {"bottom_half_strip_length", "f4",
+           offsetof(SpacePointRecord, bottomHalfStripLength)},
+          {"top_strip_direction", "(3,)f8",
+           offsetof(SpacePointRecord, topStripDirection)},
+          {"bottom_strip_direction", "(3,)f8",
+           offsetof(SpacePointRecord, bottomStripDirection)},
+          {"strip_center_distance", "(3,)f8",
+           offsetof(SpacePointRecord, stripCenterDistance)},
+          {"top_strip_center_position", "(3,)f8",
+           offsetof(SpacePointRecord, topStripCenterPosition)},
+      },
+      sizeof(SpacePointRecord));
+}
+
+/// Copy the first `n` coefficients of a vector into a plain array
+template <typename vector_t>
+void copyCoefficients(const vector_t& vector, double* out, std::size_t n) {
+  for (std::size_t i = 0; i < n; ++i) {
+    out[i] = vector[i];
+  }
+}
+
+/// Flat copy of a measurement, unused dimensions have an index of -1
+struct MeasurementRecord {
+  std::uint64_t geometryId;
+  std::uint32_t index;
+  std::uint8_t size;
+  std::int8_t indices[eBoundSize];
+  double parameters[eBoundSize];
+  double covariance[eBoundSize][eBoundSize];
+};
+
+py::dtype measurementDtype() {
+  return makeDtype(
+      {
+          {"geometry_id", "u8", offsetof(MeasurementRecord, geometryId)},
+          {"index", "u4", offsetof(MeasurementRecord, index)},
+          {"size", "u1", offsetof(MeasurementRecord, size)},
+          {"indices", "(6,)i1", offsetof(MeasurementRecord, indices)},
+          {"parameters", "(6,)f8", offsetof(MeasurementRecord, parameters)},
+          {"covariance", "(6,6)f8", offsetof(MeasurementRecord, covariance)},
+      },
+      sizeof(MeasurementRecord));
+}
+
+/// Capsule owning a reference to a white board object, used as the base of
+/// the arrays viewing it
+template <typename T>
+py::capsule keepAlive(std::shared_ptr<const T> object) {
+  return py::capsule(
+      new std::shared_ptr<const T>(std::move(object)),
+      [](void* ptr) { delete static_cast<std::shared_ptr<const T>*>(ptr); });
+}
+
+py::array readOnly(py::array array) {
+  array.attr("setflags")(py::arg("write") = false);
+  return array;
+}
+
+/// Read-only record array with one record per element of a container,
+/// filled by `fill(element, record)` in one pass
+template <typename record_t, typename T, typename fill_t>
+py::array copyElements(const T& container, const py::dtype& dtype,
+                       fill_t fill) {
+  py::array records(dtype, py::array::ShapeContainer{container.size()});
+  auto* out = static_cast<record_t*>(records.mutable_data());
+  for (const auto& element : container) {
+    record_t& record = *out++;
+    std::memset(&record, 0, sizeof(record));
+    fill(element, record);
+  }
+  return readOnly(records);
+}
+
+/// Read-only view of one column of a track container, with the given shape
+/// and strides of the column values
+template <typename column_t, typename scalar_t = column_t>
+py::array viewTrackColumn(
+    const std::shared_ptr<const ConstTrackContainer>& tracks, const char* key,
+    std::vector<py::ssize_t> shape = {},
+    std::vector<py::ssize_t> strides = {}) {
+  const column_t* data = nullptr;
+  if (tracks->size() > 0) {
+    data = std::any_cast<const column_t*>(
+        tracks->container().component_impl(hashString(key), 0));
+  }
+  shape.insert(shape.begin(), tracks->size());
+  strides.insert(strides.begin(), sizeof(column_t));
+  return readOnly(py::array(py::dtype::of<scalar_t>(), shape, strides,
+                            reinterpret_cast<const scalar_t*>(data),
+                            keepAlive(tracks)));
+}
+
+/// Bind a read handle returning the white board object converted by `convert`
+template <typename T, typename convert_t>
+void bindReadHandle(py::module_& mex, const char* name, convert_t convert) {
+  py::class_<ReadDataHandle<T>>(mex, name)
+      // the parent keeps a pointer to its handles
+      .def(py::init<SequenceElement*, const std::string&>(), py::arg("parent"),
+           py::arg("name"), py::keep_alive<1, 2>(), py::keep_alive<2, 1>())
+      .def("initialize", &ReadDataHandle<T>::initialize, py::arg("key"))
+      .def_property_readonly("name", &ReadDataHandle<T>::name)
+      .def_property_readonly(
+          "key",
+          [](const ReadDataHandle<T>& self) -> std::optional<std::string> {
+            if (!self.isInitialized()) {
+              return std::nullopt;
+            }
+            return self.key();
+          })
+      .def("__call__", [convert](const ReadDataHandle<T>& self,
+                                 const AlgorithmContext& context) {
+        return convert(self.getShared(context.eventStore));
+      });
+}
+
+}  // namespace
 
 namespace Acts::Python {
 
@@ -39,6 +248,104 @@ void addEventData(Context& ctx) {
       .def_property_readonly_static("electron", [](py::object /* self */) {
         return Acts::ParticleHypothesis::electron();
       });
+
+  // the hits and space points keep their members private, they are copied
+  // into flat record arrays in one pass
+  bindReadHandle<SimHitContainer>(
+      mex, "SimHitReadHandle", [](std::shared_ptr<const SimHitContainer> hits) {
+        return copyElements<SimHitRecord>(
+            *hits, simHitDtype(), [](const SimHit& hit, SimHitRecord& record) {
+              record.geometryId = hit.geometryId().value();
+              record.particleId = hit.particleId().value();
+              record.index = hit.index();
+              copyCoefficients(hit.fourPosition(), record.fourPosition, 4);
+              copyCoefficients(hit.momentum4Before(), record.momentum4Before,
+                               4);
+              copyCoefficients(hit.momentum4After(), record.momentum4After, 4);
+            });
+      });
+
+  bindReadHandle<SimSpacePointContainer>(
+      mex, "SpacePointReadHandle",
+      [](std::shared_ptr<const SimSpacePointContainer> spacePoints) {
+        return copyElements<SpacePointRecord>(
+            *spacePoints, simSpacePointDtype(),
+            [](const SimSpacePoint& sp, SpacePointRecord& record) {
+              record.x = sp.x();
+              record.y = sp.y();
+              record.z = sp.z();
+              record.r = sp.r();
+              record.varR = sp.varianceR();
+              record.varZ = sp.varianceZ();
+              record.topHalfStripLength = sp.topHalfStripLength();
+              record.bottomHalfStripLength = sp.bottomHalfStripLength();
+              copyCoefficients(sp.topStripDirection(), record.topStripDirection,
+                               3);
+              copyCoefficients(sp.bottomStripDirection(),
+                               record.bottomStripDirection, 3);
+              copyCoefficients(sp.stripCenterDistance(),
+                               record.stripCenterDistance, 3);
+              copyCoefficients(sp.topStripCenterPosition(),
+                               record.topStripCenterPosition, 3);
+            });
+      });
+
+  // the measurements are a variant of different sizes without a common
+  // layout, they are flattened the same way
+  bindReadHandle<MeasurementContainer>(
+      mex, "MeasurementReadHandle",
+      [](std::shared_ptr<const MeasurementContainer> measurements) {
+        return copyElements<MeasurementRecord>(
+            *measurements, measurementDtype(),
+            [](const auto& measurement, MeasurementRecord& record) {
+              std::fill(std::begin(record.indices), std::end(record.indices),
+                        -1);
+              std::visit(
+                  [&](const auto& meas) {
+                    const auto& sl =
+                        meas.sourceLink().template get<IndexSourceLink>();
+                    record.geometryId = sl.geometryId().value();
+                    record.index = sl.index();
+                    record.size = meas.size();
+                    const auto indices = meas.indices();
+                    for (std::size_t i = 0; i < meas.size(); ++i) {
+                      record.indices[i] = static_cast<std::int8_t>(indices[i]);
+                      record.parameters[i] = meas.parameters()[i];
+                      for (std::size_t j = 0; j < meas.size(); ++j) {
+                        record.covariance[i][j] = meas.covariance()(i, j);
+                      }
+                    }
+                  },
+                  measurement);
+            });
+      });
+
+  bindReadHandle<ConstTrackContainer>(
+      mex, "TrackReadHandle",
+      [](std::shared_ptr<const ConstTrackContainer> tracks) {
+        using IndexType = MultiTrajectoryTraits::IndexType;
+        using Parameters = detail_lt::Types<eBoundSize>::Coefficients;
+        using Covariance = detail_lt::Types<eBoundSize>::Covariance;
+        constexpr py::ssize_t d = sizeof(double);
+        py::dict columns;
+        columns["tipIndex"] = viewTrackColumn<IndexType>(tracks, "tipIndex");
+        columns["stemIndex"] = viewTrackColumn<IndexType>(tracks, "stemIndex");
+        columns["params"] = viewTrackColumn<Parameters, double>(
+            tracks, "params", {eBoundSize}, {d});
+        // column-major storage
+        columns["cov"] = viewTrackColumn<Covariance, double>(
+            tracks, "cov", {eBoundSize, eBoundSize}, {d, eBoundSize * d});
+        columns["nMeasurements"] =
+            viewTrackColumn<unsigned int>(tracks, "nMeasurements");
+        columns["nHoles"] = viewTrackColumn<unsigned int>(tracks, "nHoles");
+        columns["chi2"] = viewTrackColumn<float>(tracks, "chi2");
+        columns["ndf"] = viewTrackColumn<unsigned int>(tracks, "ndf");
+        columns["nOutliers"] =
+            viewTrackColumn<unsigned int>(tracks, "nOutliers");
+        columns["nSharedHits"] =
+            viewTrackColumn<unsigned int>(tracks, "nSharedHits");
+        return columns;
+      });
 }
 
 }  // namespace Acts::Python
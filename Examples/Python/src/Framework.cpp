@@ -17,6 +17,18 @@
 #include "ActsExamples/Framework/Sequencer.hpp"
 #include "ActsExamples/Framework/WhiteBoard.hpp"
 
+#include <algorithm>
+#include <chrono>
+#include <condition_variable>
+#include <exception>
+#include <memory>
+#include <mutex>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include <pybind11/functional.h>
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
@@ -73,6 +85,146 @@ class PyIAlgorithm : public IAlgorithm {
   }
 };
 
+/// Python algorithm that processes several events at once.
+///
+/// The events in flight are collected until `batchSize` of them are waiting,
+/// or until `timeout` has passed since the first one arrived. A batch is
+/// executed right away once all events the sequencer is processing are
+/// waiting, so the batch size is effectively limited to the number of
+/// threads. One thread then calls `execute_batch` with all their contexts, so
+/// the GIL is taken once per batch, while the other threads wait for the
+/// result.
+class IBatchAlgorithm : public IAlgorithm {
+ public:
+  IBatchAlgorithm(const std::string& name, Acts::Logging::Level level,
+                  std::size_t batchSize, double timeout)
+      : IAlgorithm(name, level), m_batchSize(batchSize), m_timeout(timeout) {
+    if (m_batchSize == 0) {
+      throw std::invalid_argument("Batch size must be at least one");
+    }
+  }
+
+  /// Process the contexts of a batch of events, called with the GIL held.
+  ///
+  /// @return a process code for all events, or a sequence with one per event
+  virtual py::object executeBatch(const py::list& contexts) const = 0;
+
+  ProcessCode execute(const AlgorithmContext& context) const final {
+    std::unique_lock lock(m_mutex);
+    if (m_open == nullptr) {
+      m_open = std::make_shared<Batch>();
+    }
+    std::shared_ptr<Batch> batch = m_open;
+    const std::size_t slot = batch->contexts.size();
+    batch->contexts.push_back(&context);
+    if (batch->contexts.size() >= batchLimit(context)) {
+      m_open.reset();
+      m_cv.notify_all();
+    }
+
+    if (slot != 0) {
+      m_cv.wait(lock, [&] { return batch->done; });
+      if (batch->failed) {
+        throw std::runtime_error("Batch of '" + name() +
+                                 "' failed: " + batch->message);
+      }
+      return batch->codes.at(slot);
+    }
+
+    // the first event of a batch executes it
+    m_cv.wait_for(lock, m_timeout, [&] { return m_open != batch; });
+    if (m_open == batch) {
+      m_open.reset();
+    }
+    lock.unlock();
+
+    ACTS_VERBOSE("Execute batch of " << batch->contexts.size() << " events");
+    std::exception_ptr error;
+    {
+      py::gil_scoped_acquire acquire{};
+      try {
+        py::list contexts;
+        for (const AlgorithmContext* ctx : batch->contexts) {
+          contexts.append(py::cast(ctx, py::return_value_policy::reference));
+        }
+        batch->codes = processCodes(executeBatch(contexts), contexts.size());
+      } catch (py::error_already_set& e) {
+        batch->message = e.what();
+        error = std::current_exception();
+      } catch (std::runtime_error& e) {
+        batch->message = e.what();
+        error = std::make_exception_ptr(py::type_error(
+            "Python batch algorithm did not conform to interface: " +
+            batch->message));
+      }
+    }
+
+    lock.lock();
+    batch->failed = (error != nullptr);
+    batch->done = true;
+    m_cv.notify_all();
+    lock.unlock();
+
+    if (error != nullptr) {
+      std::rethrow_exception(error);
+    }
+    return batch->codes.at(slot);
+  }
+
+  std::size_t batchSize() const { return m_batchSize; }
+  double timeout() const { return m_timeout.count(); }
+
+ private:
+  struct Batch {
+    std::vector<const AlgorithmContext*> contexts;
+    std::vector<ProcessCode> codes;
+    bool done = false;
+    bool failed = false;
+    std::string message;
+  };
+
+  /// Number of events to wait for, no more events can arrive than the
+  /// sequencer has in flight
+  std::size_t batchLimit(const AlgorithmContext& context) const {
+    if (context.eventsInFlight == nullptr) {
+      return m_batchSize;
+    }
+    return std::clamp<std::size_t>(context.eventsInFlight->load(), 1,
+                                   m_batchSize);
+  }
+
+  static std::vector<ProcessCode> processCodes(const py::object& result,
+                                               std::size_t size) {
+    if (py::isinstance<ProcessCode>(result)) {
+      return std::vector<ProcessCode>(size, result.cast<ProcessCode>());
+    }
+    auto codes = result.cast<std::vector<ProcessCode>>();
+    if (codes.size() != size) {
+      throw py::value_error(
+          "execute_batch returned " + std::to_string(codes.size()) +
+          " process codes for " + std::to_string(size) + " events");
+    }
+    return codes;
+  }
+
+  std::size_t m_batchSize;
+  std::chrono::duration<double> m_timeout;
+
+  mutable std::mutex m_mutex;
+  mutable std::condition_variable m_cv;
+  mutable std::shared_ptr<Batch> m_open;
+};
+
+class PyIBatchAlgorithm : public IBatchAlgorithm {
+ public:
+  using IBatchAlgorithm::IBatchAlgorithm;
+
+  py::object executeBatch(const py::list& contexts) const override {
+    PYBIND11_OVERRIDE_PURE_NAME(py::object, IBatchAlgorithm, "execute_batch",
+                                executeBatch, contexts);
+  }
+};
+
 void trigger_divbyzero() {
   volatile float j = 0.0;
   volatile float r = 123 / j;  // MARK: divbyzero
@@ -147,6 +299,15 @@ void addFramework(Context& ctx) {
                py::arg("name"), py::arg("level"))
           .def("execute", &IAlgorithm::execute);
 
+  py::class_<IBatchAlgorithm, std::shared_ptr<IBatchAlgorithm>, IAlgorithm,
+             PyIBatchAlgorithm>(mex, "IBatchAlgorithm")
+      .def(py::init_alias<const std::string&, Acts::Logging::Level, std::size_t,
+                          double>(),
+           py::arg("name"), py::arg("level"), py::arg("batchSize"),
+           py::arg("timeout") = 0.01)
+      .def_property_readonly("batchSize", &IBatchAlgorithm::batchSize)
+      .def_property_readonly("timeout", &IBatchAlgorithm::timeout);
+
   using ActsExamples::Sequencer;
   using Config = Sequencer::Config;
   auto sequencer =
@@ -175,6 +336,49 @@ void addFramework(Context& ctx) {
           .def("addWhiteboardAlias", &Sequencer::addWhiteboardAlias)
           .def_property_readonly("config", &Sequencer::config)
           .def_property_readonly("fpeResult", &Sequencer::fpeResult)
+          .def_property_readonly(
+              "_eventTimings",
+              [](const Sequencer& self) {
+                const auto& timings = self.eventTimings();
+                py::array_t<std::uint64_t> events(timings.events.size());
+                std::copy(timings.events.begin(), timings.events.end(),
+                          events.mutable_data());
+                py::array_t<double> durations(
+                    {timings.events.size(), timings.names.size()});
+                std::copy(timings.durations.begin(), timings.durations.end(),
+                          durations.mutable_data());
+                return py::make_tuple(timings.names, events, durations);
+              })
+          .def_property_readonly(
+              "_whiteBoardMemory",
+              [](const Sequencer& self) {
+                const auto& memory = self.whiteBoardMemory();
+                py::array_t<std::uint64_t> events(memory.events.size());
+                std::copy(memory.events.begin(), memory.events.end(),
+                          events.mutable_data());
+                py::array_t<std::uint64_t> bytes(
+                    {memory.events.size(), memory.names.size()});
+                std::copy(memory.bytes.begin(), memory.bytes.end(),
+                          bytes.mutable_data());
+                return py::make_tuple(memory.names, events, bytes);
+              })
+          .def_property_readonly(
+              "_whiteBoardPeakMemory",
+              [](const Sequencer& self) {
+                const auto& memory = self.whiteBoardMemory();
+                py::array_t<std::uint64_t> events(memory.events.size());
+                std::copy(memory.events.begin(), memory.events.end(),
+                          events.mutable_data());
+                py::array_t<std::uint64_t> bytes(
+                    {memory.events.size(), std::size_t{2}});
+                for (std::size_t i = 0; i < memory.events.size(); ++i) {
+                  bytes.mutable_at(i, 0) = memory.peakBytes[i];
+                  bytes.mutable_at(i, 1) = memory.totalBytes[i];
+                }
+                return py::make_tuple(
+                    std::vector<std::string>{"peak_bytes", "total_bytes"},
+                    events, bytes);
+              })
           .def_property_readonly_static(
               "_sourceLocation",
               [](py::object /*self*/) { return std::string{__FILE__}; });
@@ -188,12 +392,33 @@ void addFramework(Context& ctx) {
   ACTS_PYTHON_MEMBER(numThreads);
   ACTS_PYTHON_MEMBER(outputDir);
   ACTS_PYTHON_MEMBER(outputTimingFile);
+  ACTS_PYTHON_MEMBER(outputEventTimingFile);
+  ACTS_PYTHON_MEMBER(trackEventTimings);
+  ACTS_PYTHON_MEMBER(metricsCallback);
+  ACTS_PYTHON_MEMBER(metricsBatchSize);
+  ACTS_PYTHON_MEMBER(intraEventParallelism);
+  ACTS_PYTHON_MEMBER(releaseWhiteBoardObjects);
+  ACTS_PYTHON_MEMBER(trackWhiteBoardMemory);
+  ACTS_PYTHON_MEMBER(outputWhiteBoardMemoryFile);
   ACTS_PYTHON_MEMBER(trackFpes);
   ACTS_PYTHON_MEMBER(fpeMasks);
   ACTS_PYTHON_MEMBER(failOnFirstFpe);
   ACTS_PYTHON_MEMBER(fpeStackTraceLength);
   ACTS_PYTHON_STRUCT_END();
 
+  auto em = py::class_<Sequencer::EventMetrics>(sequencer, "EventMetrics")
+                .def(py::init<>());
+
+  ACTS_PYTHON_STRUCT_BEGIN(em, Sequencer::EventMetrics);
+  ACTS_PYTHON_MEMBER(event);
+  ACTS_PYTHON_MEMBER(time);
+  ACTS_PYTHON_MEMBER(wallTime);
+  ACTS_PYTHON_MEMBER(durations);
+  ACTS_PYTHON_MEMBER(rss);
+  ACTS_PYTHON_MEMBER(whiteBoardObjects);
+  ACTS_PYTHON_MEMBER(whiteBoardBytes);
+  ACTS_PYTHON_STRUCT_END();
+
   auto fpem =
       py::class_<Sequencer::FpeMask>(sequencer, "_FpeMask")
           .def(py::init<>())
@@ -20,9 +20,12 @@
 #include "ActsExamples/Io/Json/JsonSurfacesReader.hpp"
 #include "ActsExamples/Io/Json/JsonSurfacesWriter.hpp"
 
+#include <cstdint>
 #include <fstream>
 #include <initializer_list>
+#include <iterator>
 #include <memory>
+#include <stdexcept>
 #include <string>
 #include <tuple>
 #include <vector>
@@ -216,5 +219,67 @@ void addJson(Context& ctx) {
           return Acts::DetectorJsonConverter::fromJson(gctx, jDetectorIn);
         });
   }
+
+  {
+    mex.def(
+        "writeDetectorToCbor",
+        [](const Acts::GeometryContext& gctx,
+           const Acts::Experimental::Detector& detector,
+           const std::string& fileName) -> void {
+          auto jDetector = Acts::DetectorJsonConverter::toJson(gctx, detector);
+          std::vector<std::uint8_t> cborOut =
+              nlohmann::json::to_cbor(jDetector);
+          std::ofstream out(fileName,
+                            std::ofstream::out | std::ofstream::binary);
+          out.write(reinterpret_cast<const char*>(cborOut.data()),
+                    cborOut.size());
+          if (!out) {
+            throw std::runtime_error("Could not write detector to " + fileName);
+          }
+        },
+        py::arg("gctx"), py::arg("detector"), py::arg("fileName"));
+  }
+
+  {
+    mex.def(
+        "readDetectorFromCbor",
+        [](const Acts::GeometryContext& gctx,
+           const std::string& fileName) -> auto {
+          std::ifstream in(fileName, std::ifstream::in | std::ifstream::binary);
+          if (!in) {
+            throw std::runtime_error("Could not open " + fileName);
+          }
+          // read the whole snapshot at once, parsing from the stream is
+          // considerably slower for large detectors
+          std::vector<std::uint8_t> cborIn((std::istreambuf_iterator<char>(in)),
+                                           std::istreambuf_iterator<char>());
+          nlohmann::json jDetectorIn = nlohmann::json::from_cbor(cborIn);
+
+          return Acts::DetectorJsonConverter::fromJson(gctx, jDetectorIn);
+        },
+        py::arg("gctx"), py::arg("fileName"));
+  }
+
+  {
+    mex.def(
+        "convertJsonToCbor",
+        [](const std::string& inputFile, const std::string& outputFile) {
+          std::ifstream in(inputFile,
+                           std::ifstream::in | std::ifstream::binary);
+          if (!in) {
+            throw std::runtime_error("Could not open " + inputFile);
+          }
+          std::vector<std::uint8_t> cborOut =
+              nlohmann::json::to_cbor(nlohmann::json::parse(in));
+          std::ofstream out(outputFile,
+                            std::ofstream::out | std::ofstream::binary);
+          out.write(reinterpret_cast<const char*>(cborOut.data()),
+                    cborOut.size());
+          if (!out) {
+            throw std::runtime_error("Could not write " + outputFile);
+          }
+        },
+        py::arg("inputFile"), py::arg("outputFile"));
+  }
 }
 }  // namespace Acts::Python
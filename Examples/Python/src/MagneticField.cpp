@@ -11,29 +11,58 @@
 #include "Acts/Definitions/Units.hpp"
 #include "Acts/MagneticField/BFieldMapUtils.hpp"
 #include "Acts/MagneticField/ConstantBField.hpp"
+#include "Acts/MagneticField/MagneticFieldContext.hpp"
 #include "Acts/MagneticField/MagneticFieldProvider.hpp"
 #include "Acts/MagneticField/NullBField.hpp"
 #include "Acts/MagneticField/SolenoidBField.hpp"
 #include "Acts/Plugins/Python/Utilities.hpp"
+#include "ActsExamples/MagneticField/FieldMapBinaryIo.hpp"
 #include "ActsExamples/MagneticField/FieldMapRootIo.hpp"
 #include "ActsExamples/MagneticField/FieldMapTextIo.hpp"
+#include "ActsExamples/MagneticField/MappedBFieldMap.hpp"
+#include "ActsExamples/Utilities/ChunkedCompute.hpp"
 
+#include <algorithm>
 #include <array>
 #include <cstddef>
 #include <filesystem>
+#include <limits>
 #include <memory>
 #include <stdexcept>
 #include <string>
 #include <tuple>
 #include <type_traits>
 #include <utility>
+#include <vector>
 
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
 namespace py = pybind11;
 using namespace pybind11::literals;
 
+namespace {
+
+/// Evaluate the solenoid field at many (r,z) positions in parallel
+void getSolenoidField(const Acts::SolenoidBField& field,
+                      const std::vector<Acts::Vector2>& positions,
+                      std::vector<Acts::Vector2>& fields, int numThreads) {
+  fields.resize(positions.size());
+  py::gil_scoped_release release;
+  ActsExamples::forEachBlock(
+      positions.size(), numThreads, [&](std::size_t begin, std::size_t end) {
+        std::vector<Acts::Vector2> blockPositions(positions.begin() + begin,
+                                                  positions.begin() + end);
+        std::vector<Acts::Vector2> blockFields;
+        field.getField(blockPositions, blockFields);
+        std::copy(blockFields.begin(), blockFields.end(),
+                  fields.begin() + begin);
+      });
+}
+
+}  // namespace
+
 namespace Acts::Python {
 
 void addMagneticField(Context& ctx) {
@@ -41,14 +70,65 @@ void addMagneticField(Context& ctx) {
 
   py::class_<Acts::MagneticFieldProvider,
              std::shared_ptr<Acts::MagneticFieldProvider>>(
-      m, "MagneticFieldProvider");
+      m, "MagneticFieldProvider")
+      .def(
+          "getFieldBatch",
+          [](const Acts::MagneticFieldProvider& self,
+             const py::array_t<double, py::array::c_style |
+                                           py::array::forcecast>& positions,
+             int numThreads) {
+            if (positions.ndim() != 2 || positions.shape(1) != 3) {
+              throw std::invalid_argument(
+                  "Positions need to have the shape (N, 3)");
+            }
+            py::array_t<double> result({positions.shape(0), py::ssize_t{3}});
+            const double* in = positions.data();
+            double* out = result.mutable_data();
 
-  py::class_<Acts::InterpolatedMagneticField,
+            {
+              py::gil_scoped_release release;
+              ActsExamples::forEachBlock(
+                  positions.shape(0), numThreads,
+                  [&](std::size_t begin, std::size_t end) {
+                    // one cache per block, so interpolated field maps reuse
+                    // their field cell for neighbouring positions
+                    auto cache = self.makeCache(Acts::MagneticFieldContext{});
+                    for (std::size_t i = begin; i < end; ++i) {
+                      auto field =
+                          self.getField(Acts::Vector3(in[3 * i], in[3 * i + 1],
+                                                      in[3 * i + 2]),
+                                        cache);
+                      for (std::size_t j = 0; j < 3; ++j) {
+                        out[3 * i + j] =
+                            field.ok()
+                                ? (*field)[j]
+                                : std::numeric_limits<double>::quiet_NaN();
+                      }
+                    }
+                  });
+            }
+            return result;
+          },
+          py::arg("positions"), py::arg("numThreads") = 1);
+
+  py::class_<Acts::InterpolatedMagneticField, Acts::MagneticFieldProvider,
              std::shared_ptr<Acts::InterpolatedMagneticField>>(
       m, "InterpolatedMagneticField");
 
-  m.def("solenoidFieldMap", &Acts::solenoidFieldMap, py::arg("rlim"),
-        py::arg("zlim"), py::arg("nbins"), py::arg("field"));
+  m.def(
+      "solenoidFieldMap",
+      [](std::pair<double, double> rlim, std::pair<double, double> zlim,
+         std::pair<std::size_t, std::size_t> nbins,
+         const Acts::SolenoidBField& field, int numThreads) {
+        return Acts::solenoidFieldMap(
+            rlim, zlim, nbins,
+            [&](const std::vector<Acts::Vector2>& positions,
+                std::vector<Acts::Vector2>& fields) {
+              getSolenoidField(field, positions, fields, numThreads);
+            });
+      },
+      py::arg("rlim"), py::arg("zlim"), py::arg("nbins"), py::arg("field"),
+      py::arg("numThreads") = 1);
 
   py::class_<Acts::ConstantBField, Acts::MagneticFieldProvider,
              std::shared_ptr<Acts::ConstantBField>>(m, "ConstantBField")
@@ -64,6 +144,16 @@ void addMagneticField(Context& ctx) {
              std::shared_ptr<ActsExamples::detail::InterpolatedMagneticField3>>(
       mex, "InterpolatedMagneticField3");
 
+  py::class_<ActsExamples::MappedBFieldMap<2>, Acts::InterpolatedMagneticField,
+             Acts::MagneticFieldProvider,
+             std::shared_ptr<ActsExamples::MappedBFieldMap<2>>>(
+      mex, "MappedBFieldMap2");
+
+  py::class_<ActsExamples::MappedBFieldMap<3>, Acts::InterpolatedMagneticField,
+             Acts::MagneticFieldProvider,
+             std::shared_ptr<ActsExamples::MappedBFieldMap<3>>>(
+      mex, "MappedBFieldMap3");
+
   py::class_<Acts::NullBField, Acts::MagneticFieldProvider,
              std::shared_ptr<Acts::NullBField>>(m, "NullBField")
       .def(py::init<>());
@@ -81,7 +171,36 @@ void addMagneticField(Context& ctx) {
                        Config{radius, length, nCoils, bMagCenter}};
                  }),
                  py::arg("radius"), py::arg("length"), py::arg("nCoils"),
-                 py::arg("bMagCenter"));
+                 py::arg("bMagCenter"))
+            .def(
+                "getFieldRz",
+                [](const Acts::SolenoidBField& self,
+                   const py::array_t<double, py::array::c_style |
+                                                 py::array::forcecast>& rz,
+                   int numThreads) {
+                  if (rz.ndim() != 2 || rz.shape(1) != 2) {
+                    throw std::invalid_argument(
+                        "Positions need to have the shape (N, 2)");
+                  }
+                  auto in = rz.unchecked<2>();
+                  std::vector<Acts::Vector2> positions;
+                  positions.reserve(in.shape(0));
+                  for (py::ssize_t i = 0; i < in.shape(0); ++i) {
+                    positions.emplace_back(in(i, 0), in(i, 1));
+                  }
+
+                  std::vector<Acts::Vector2> fields;
+                  getSolenoidField(self, positions, fields, numThreads);
+
+                  py::array_t<double> result({in.shape(0), py::ssize_t{2}});
+                  auto out = result.mutable_unchecked<2>();
+                  for (py::ssize_t i = 0; i < in.shape(0); ++i) {
+                    out(i, 0) = fields[i][0];
+                    out(i, 1) = fields[i][1];
+                  }
+                  return result;
+                },
+                py::arg("positions"), py::arg("numThreads") = 1);
 
     py::class_<Config>(sol, "Config")
         .def(py::init<>())
@@ -155,6 +274,23 @@ void addMagneticField(Context& ctx) {
       py::arg("lengthUnit") = Acts::UnitConstants::mm,
       py::arg("BFieldUnit") = Acts::UnitConstants::T,
       py::arg("firstQuadrant") = false);
+
+  mex.def("MagneticFieldMapBinary",
+          &ActsExamples::makeMagneticFieldMapFromBinary, py::arg("file"));
+
+  mex.def(
+      "writeMagneticFieldMapBinary",
+      py::overload_cast<const ActsExamples::detail::InterpolatedMagneticField2&,
+                        const std::string&>(
+          &ActsExamples::writeMagneticFieldMapBinary),
+      py::arg("field"), py::arg("file"));
+
+  mex.def(
+      "writeMagneticFieldMapBinary",
+      py::overload_cast<const ActsExamples::detail::InterpolatedMagneticField3&,
+                        const std::string&>(
+          &ActsExamples::writeMagneticFieldMapBinary),
+      py::arg("field"), py::arg("file"));
 }
 
 }  // namespace Acts::Python
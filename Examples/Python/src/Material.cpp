@@ -15,7 +15,9 @@
 #include "Acts/Utilities/Logger.hpp"
 #include "ActsExamples/Framework/ProcessCode.hpp"
 #include "ActsExamples/Io/Root/RootMaterialDecorator.hpp"
+#include "ActsExamples/MaterialMapping/BinaryMaterialDecorator.hpp"
 #include "ActsExamples/MaterialMapping/MappingMaterialDecorator.hpp"
+#include "ActsExamples/MaterialMapping/MaterialAssociationIndex.hpp"
 #include "ActsExamples/MaterialMapping/MaterialMapping.hpp"
 
 #include <array>
@@ -82,6 +84,28 @@ void addMaterial(Context& ctx) {
     ACTS_PYTHON_STRUCT_END();
   }
 
+  {
+    auto bmd = py::class_<BinaryMaterialDecorator, Acts::IMaterialDecorator,
+                          std::shared_ptr<BinaryMaterialDecorator>>(
+                   mex, "BinaryMaterialDecorator")
+                   .def(py::init<BinaryMaterialDecorator::Config,
+                                 Acts::Logging::Level>(),
+                        py::arg("config"), py::arg("level"))
+                   .def_property_readonly("nSurfaces",
+                                          &BinaryMaterialDecorator::nSurfaces)
+                   .def_property_readonly("nVolumes",
+                                          &BinaryMaterialDecorator::nVolumes);
+
+    using Config = BinaryMaterialDecorator::Config;
+    auto c = py::class_<Config>(bmd, "Config").def(py::init<>());
+
+    ACTS_PYTHON_STRUCT_BEGIN(c, Config);
+    ACTS_PYTHON_MEMBER(fileName);
+    ACTS_PYTHON_MEMBER(clearSurfaceMaterial);
+    ACTS_PYTHON_MEMBER(clearVolumeMaterial);
+    ACTS_PYTHON_STRUCT_END();
+  }
+
   {
     py::class_<MappingMaterialDecorator, Acts::IMaterialDecorator,
                std::shared_ptr<MappingMaterialDecorator>>(
@@ -95,6 +119,25 @@ void addMaterial(Context& ctx) {
         .def("setBinningMap", &MappingMaterialDecorator::setBinningMap);
   }
 
+  {
+    py::class_<MaterialAssociationIndex,
+               std::shared_ptr<MaterialAssociationIndex>>(
+        mex, "MaterialAssociationIndex")
+        .def(py::init<const std::string&>(), py::arg("fileName"))
+        .def_property_readonly(
+            "geometryHash",
+            py::overload_cast<>(&MaterialAssociationIndex::geometryHash,
+                                py::const_))
+        .def_property_readonly("inputHash",
+                               &MaterialAssociationIndex::inputHash)
+        .def_property_readonly("nEvents", &MaterialAssociationIndex::nEvents)
+        .def_static("hashGeometry",
+                    py::overload_cast<const Acts::TrackingGeometry&,
+                                      const Acts::GeometryContext&>(
+                        &MaterialAssociationIndex::geometryHash),
+                    py::arg("trackingGeometry"), py::arg("context"));
+  }
+
   {
     using Alg = ActsExamples::MaterialMapping;
 
@@ -116,6 +159,9 @@ void addMaterial(Context& ctx) {
     ACTS_PYTHON_MEMBER(materialVolumeMapper);
     ACTS_PYTHON_MEMBER(materialWriters);
     ACTS_PYTHON_MEMBER(trackingGeometry);
+    ACTS_PYTHON_MEMBER(inputCheckpoints);
+    ACTS_PYTHON_MEMBER(outputCheckpoint);
+    ACTS_PYTHON_MEMBER(associationIndex);
     ACTS_PYTHON_MEMBER(geoContext);
     ACTS_PYTHON_MEMBER(magFieldContext);
     ACTS_PYTHON_STRUCT_END();
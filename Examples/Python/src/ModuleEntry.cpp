@@ -19,6 +19,7 @@
 #include <cstdint>
 #include <cstdlib>
 #include <limits>
+#include <map>
 #include <memory>
 #include <optional>
 #include <stdexcept>
@@ -92,6 +93,7 @@ PYBIND11_MODULE(ActsPythonBindings, m) {
 
   m.attr("__version__") =
       std::tuple{Acts::VersionMajor, Acts::VersionMinor, Acts::VersionPatch};
+  m.attr("__commit_hash__") = Acts::CommitHash;
 
   addUnits(ctx);
   addFramework(ctx);
@@ -121,12 +123,40 @@ PYBIND11_MODULE(ActsPythonBindings, m) {
   addDigitization(ctx);
   addPythia8(ctx);
   addJson(ctx);
-  addHepMC3(ctx);
-  addExaTrkXTrackFinding(ctx);
-  addEDM4hep(ctx);
   addObj(ctx);
-  addSvg(ctx);
-  addOnnx(ctx);
-  addOnnxMlpack(ctx);
-  addOnnxNeuralCalibrator(ctx);
+
+  // The optional components are only registered when they are requested, see
+  // `acts._adapter._add_components`, which keeps importing the bindings cheap
+  // for jobs that do not use them. The context and the table are
+  // intentionally leaked, so they are not destroyed after the interpreter.
+  using Adder = void (*)(Context&);
+  auto* lazyCtx = new Context(ctx);
+  auto* components = new std::map<std::string, std::vector<Adder>>{
+      {"edm4hep", {addEDM4hep}},
+      {"exatrkx", {addExaTrkXTrackFinding}},
+      {"hepmc3", {addHepMC3}},
+      {"onnx", {addOnnx, addOnnxMlpack, addOnnxNeuralCalibrator}},
+      {"svg", {addSvg}},
+  };
+
+  m.def("_pendingComponents", [components]() {
+    std::vector<std::string> names;
+    for (const auto& [name, adders] : *components) {
+      names.push_back(name);
+    }
+    return names;
+  });
+
+  m.def("_addComponent", [lazyCtx, components](const std::string& name) {
+    auto it = components->find(name);
+    if (it == components->end()) {
+      // unknown, or already registered
+      return;
+    }
+    auto adders = std::move(it->second);
+    components->erase(it);
+    for (auto add : adders) {
+      add(*lazyCtx);
+    }
+  });
 }
@@ -29,6 +29,7 @@
 #include "ActsExamples/Io/Performance/TrackFitterPerformanceWriter.hpp"
 #include "ActsExamples/Io/Performance/VertexPerformanceWriter.hpp"
 #include "ActsExamples/Io/Root/RootBFieldWriter.hpp"
+#include "ActsExamples/Io/Root/RootFileMerger.hpp"
 #include "ActsExamples/Io/Root/RootMaterialTrackWriter.hpp"
 #include "ActsExamples/Io/Root/RootMaterialWriter.hpp"
 #include "ActsExamples/Io/Root/RootMeasurementWriter.hpp"
@@ -40,7 +41,9 @@
 #include "ActsExamples/Io/Root/RootTrackParameterWriter.hpp"
 #include "ActsExamples/Io/Root/RootTrajectoryStatesWriter.hpp"
 #include "ActsExamples/Io/Root/RootTrajectorySummaryWriter.hpp"
+#include "ActsExamples/MaterialMapping/BinaryMaterialWriter.hpp"
 #include "ActsExamples/MaterialMapping/IMaterialWriter.hpp"
+#include "ActsExamples/MaterialMapping/MaterialAssociationWriter.hpp"
 #include "ActsExamples/Plugins/Obj/ObjPropagationStepsWriter.hpp"
 #include "ActsExamples/Plugins/Obj/ObjTrackingGeometryWriter.hpp"
 
@@ -92,6 +95,8 @@ void register_csv_bfield_writer_binding(
   ACTS_PYTHON_MEMBER(bField);
   ACTS_PYTHON_MEMBER(range);
   ACTS_PYTHON_MEMBER(bins);
+  ACTS_PYTHON_MEMBER(chunkSize);
+  ACTS_PYTHON_MEMBER(numThreads);
   ACTS_PYTHON_STRUCT_END();
 }
 }  // namespace
@@ -202,6 +207,10 @@ void addOutput(Context& ctx) {
                              fileMode, treeName, recalculateTotals, prePostStep,
                              storeSurface, storeVolume, collapseInteractions);
 
+  ACTS_PYTHON_DECLARE_WRITER(ActsExamples::MaterialAssociationWriter, mex,
+                             "MaterialAssociationWriter", inputMaterialTracks,
+                             collection, fileName, geometryHash, inputHash);
+
   {
     using Writer = ActsExamples::RootBFieldWriter;
     auto w =
@@ -230,6 +239,31 @@ void addOutput(Context& ctx) {
     ACTS_PYTHON_MEMBER(rBins);
     ACTS_PYTHON_MEMBER(zBins);
     ACTS_PYTHON_MEMBER(phiBins);
+    ACTS_PYTHON_MEMBER(chunkSize);
+    ACTS_PYTHON_MEMBER(numThreads);
+    ACTS_PYTHON_MEMBER(compression);
+    ACTS_PYTHON_STRUCT_END();
+  }
+
+  {
+    using Merger = ActsExamples::RootFileMerger;
+    auto m =
+        py::class_<Merger>(mex, "RootFileMerger")
+            .def_static(
+                "run",
+                [](const Merger::Config& config, Acts::Logging::Level level) {
+                  py::gil_scoped_release release;
+                  Merger::run(config,
+                              Acts::getDefaultLogger("RootFileMerger", level));
+                },
+                py::arg("config"), py::arg("level"));
+
+    auto c = py::class_<Merger::Config>(m, "Config").def(py::init<>());
+    ACTS_PYTHON_STRUCT_BEGIN(c, Merger::Config);
+    ACTS_PYTHON_MEMBER(inputFiles);
+    ACTS_PYTHON_MEMBER(outputFile);
+    ACTS_PYTHON_MEMBER(eventBranches);
+    ACTS_PYTHON_MEMBER(sortByEvent);
     ACTS_PYTHON_STRUCT_END();
   }
 
@@ -304,6 +338,22 @@ void addOutput(Context& ctx) {
     ACTS_PYTHON_STRUCT_END();
   }
 
+  {
+    using Writer = ActsExamples::BinaryMaterialWriter;
+    auto w = py::class_<Writer, IMaterialWriter, std::shared_ptr<Writer>>(
+                 mex, "BinaryMaterialWriter")
+                 .def(py::init<const Writer::Config&, Acts::Logging::Level>(),
+                      py::arg("config"), py::arg("level"))
+                 .def("writeMaterial", &Writer::writeMaterial)
+                 .def("write", &Writer::write);
+
+    auto c = py::class_<Writer::Config>(w, "Config").def(py::init<>());
+
+    ACTS_PYTHON_STRUCT_BEGIN(c, Writer::Config);
+    ACTS_PYTHON_MEMBER(fileName);
+    ACTS_PYTHON_STRUCT_END();
+  }
+
   ACTS_PYTHON_DECLARE_WRITER(ActsExamples::RootPlanarClusterWriter, mex,
                              "RootPlanarClusterWriter", inputClusters,
                              inputSimHits, filePath, fileMode, treeName,
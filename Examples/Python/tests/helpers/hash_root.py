@@ -2,66 +2,129 @@
 import hashlib
 from pathlib import Path
 import sys
-from typing import Optional
+from typing import Optional, List, Tuple
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 import uproot
 import numpy as np
 import awkward as ak
 
 
-def hash_root_file(path: Path, ordering_invariant: bool = True) -> str:
+def _branch_buffer(arr: ak.Array) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten one branch into a byte buffer plus the byte length of each entry.
+
+    Scalar values are widened to 64 bit (as python scalars would be when
+    converted with ``np.array([obj])``), jagged values keep their type.
+    """
+    if arr.ndim == 1:
+        data = ak.to_numpy(arr)
+        if data.dtype.kind == "f":
+            data = data.astype(np.float64)
+        elif data.dtype.kind in "iu" and data.dtype != np.uint64:
+            data = data.astype(np.int64)
+        data = np.ascontiguousarray(data)
+        lengths = np.full(len(data), data.dtype.itemsize, dtype=np.int64)
+    else:
+        while arr.ndim > 2:
+            arr = ak.flatten(arr, axis=2)
+        data = np.ascontiguousarray(ak.to_numpy(ak.flatten(arr, axis=None)))
+        lengths = ak.to_numpy(ak.num(arr, axis=1)).astype(np.int64)
+        lengths *= data.dtype.itemsize
+
+    return data.view(np.uint8).reshape(-1), lengths
+
+
+def _row_major_buffer(
+    buffers: List[Tuple[np.ndarray, np.ndarray]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Interleave the per-branch buffers so that the bytes of each entry are
+    contiguous, returns the buffer and the entry offsets.
+    """
+    nrows = len(buffers[0][1]) if len(buffers) > 0 else 0
+    row_lengths = np.zeros(nrows, dtype=np.int64)
+    for _, lengths in buffers:
+        row_lengths += lengths
+
+    row_offsets = np.zeros(nrows + 1, dtype=np.int64)
+    np.cumsum(row_lengths, out=row_offsets[1:])
+
+    out = np.empty(row_offsets[-1], dtype=np.uint8)
+    # destination of the current branch within each entry
+    dst = row_offsets[:-1].copy()
+    for data, lengths in buffers:
+        src = np.zeros(nrows, dtype=np.int64)
+        np.cumsum(lengths[:-1], out=src[1:])
+        # scatter variable length segments: byte k of the branch goes to
+        # (dst - src) of its entry, plus k
+        shift = np.repeat(dst - src, lengths)
+        out[shift + np.arange(len(data), dtype=np.int64)] = data
+        dst += lengths
+
+    return out, row_offsets
+
+
+def _hash_tree(tree: uproot.TTree, ordering_invariant: bool) -> bytes:
+    keys = list(sorted(tree.keys()))
+
+    branches = tree.arrays(library="ak")
+
+    if not ordering_invariant:
+        h = hashlib.sha256()
+        for name in keys:
+            h.update(name.encode("utf8"))
+            arr = branches[name]
+            arr = ak.flatten(arr, axis=None)
+            arr = np.array(arr)
+            h.update(arr.tobytes())
+        return h.digest()
+
+    buf, offsets = _row_major_buffer([_branch_buffer(branches[b]) for b in keys])
+    view = memoryview(buf)
+    digests = b"".join(
+        hashlib.md5(view[b:e]).digest() for b, e in zip(offsets[:-1], offsets[1:])
+    )
+    # per-entry hashes are stored in 32 byte slots
+    items = np.frombuffer(digests, dtype="S16").astype("S32")
+    items.sort()
+
+    h = hashlib.sha256()
+    h.update("".join(keys).encode("utf8"))
+    h.update(items.tobytes())
+    return h.digest()
+
+
+def hash_root_file(
+    path: Path, ordering_invariant: bool = True, jobs: Optional[int] = None
+) -> str:
     rf = uproot.open(path)
 
     gh = hashlib.sha256()
 
-    for tree_name in sorted(rf.keys(cycle=False)):
-        gh.update(tree_name.encode("utf8"))
-
+    names = sorted(rf.keys(cycle=False))
+    trees = {}
+    for tree_name in names:
         try:
             tree = rf[tree_name]
             if not isinstance(tree, uproot.TTree):
                 continue
         except NotImplementedError:
             continue
-        keys = list(sorted(tree.keys()))
-
-        branches = tree.arrays(library="ak")
-
-        if not ordering_invariant:
-
-            h = hashlib.sha256()
-            for name in keys:
-                h.update(name.encode("utf8"))
-                arr = branches[name]
-                arr = ak.flatten(arr, axis=None)
-                arr = np.array(arr)
-                h.update(arr.tobytes())
-            gh.update(h.digest())
-
-        else:
-            items = np.array([])
-
-            for row in zip(*[branches[b] for b in keys]):
-                h = hashlib.md5()
-                for obj in row:
-                    if isinstance(obj, ak.highlevel.Array):
-                        if obj.ndim == 1:
-                            h.update(ak.to_numpy(obj).tobytes())
-                        else:
-                            arr = ak.to_numpy(ak.flatten(obj, axis=None))
-                            h.update(arr.tobytes())
-                    else:
-                        h.update(np.array([obj]).tobytes())
-                items = np.append(items, h.digest())
-
-            items.sort()
-
-            h = hashlib.sha256()
-            h.update("".join(keys).encode("utf8"))
-            h.update(items.tobytes())
-
-            gh.update(h.digest())
+        trees[tree_name] = tree
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        digests = {
+            name: pool.submit(_hash_tree, tree, ordering_invariant)
+            for name, tree in trees.items()
+        }
+
+        for tree_name in names:
+            gh.update(tree_name.encode("utf8"))
+            if tree_name in digests:
+                gh.update(digests[tree_name].result())
+
     return gh.hexdigest()
 
 
@@ -79,6 +142,13 @@ if "__main__" == __name__:
         action="store_true",
         help="Calculate a hash that is not invariant under reordering of entries? (faster than invariant)",
     )
+    p.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Number of trees to hash in parallel",
+    )
 
     args = p.parse_args()
 
@@ -86,5 +156,6 @@ if "__main__" == __name__:
         hash_root_file(
             path=args.input_file,
             ordering_invariant=not args.no_ordering_invariant,
+            jobs=args.jobs,
         )
     )
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 
 import acts
 
@@ -71,6 +72,78 @@ def test_sequencer_multi_threaded(ptcl_gun, capfd):
     assert "Processed 2 events" in cap.out
 
 
+def _build_particle_gun(s, outputDir):
+    from acts.examples.simulation import addParticleGun
+    from helpers import AssertCollectionExistsAlg
+
+    addParticleGun(
+        s,
+        outputDirCsv=outputDir / "csv",
+        rnd=acts.examples.RandomNumbers(seed=42),
+    )
+    # elements sharing a name are timed separately
+    for _ in range(2):
+        s.addAlgorithm(
+            AssertCollectionExistsAlg(
+                "particles_input", "check_alg", acts.logging.WARNING
+            )
+        )
+
+
+def test_sequencer_multi_process(tmp_path):
+    import filecmp
+
+    single = tmp_path / "single"
+    single.mkdir()
+    s = acts.examples.Sequencer(events=10, numThreads=1, outputDir=str(single))
+    s.run(_build_particle_gun)
+
+    multi = tmp_path / "multi"
+    multi.mkdir()
+    s = acts.examples.Sequencer(
+        events=10,
+        numThreads=1,
+        numProcesses=3,
+        outputDir=str(multi),
+        outputEventTimingFile="timing_events.npy",
+    )
+    s.run(_build_particle_gun)
+
+    files = sorted(f.name for f in (single / "csv").iterdir())
+    assert len(files) == 10
+    assert sorted(f.name for f in (multi / "csv").iterdir()) == files
+    for f in files:
+        assert filecmp.cmp(single / "csv" / f, multi / "csv" / f, shallow=False)
+
+    assert (multi / "timing.tsv").exists()
+    timings = np.load(multi / "timing_events.npy")
+    assert list(timings["event_nr"]) == list(range(10))
+    assert np.array_equal(s.eventTimings, timings)
+    assert {"Algorithm:check_alg", "Algorithm:check_alg#2"} <= set(timings.dtype.names)
+    assert not any(d.name.startswith("chunk_") for d in multi.iterdir())
+
+    # the per-event timing is only written on request
+    assert not (single / "timing_events.npy").exists()
+    multi = tmp_path / "multi_default"
+    multi.mkdir()
+    s = acts.examples.Sequencer(
+        events=4, numThreads=1, numProcesses=2, outputDir=str(multi)
+    )
+    s.run(_build_particle_gun)
+    assert not (multi / "timing_events.npy").exists()
+    assert list(s.eventTimings["event_nr"]) == list(range(4))
+
+    s = acts.examples.Sequencer(events=10, numProcesses=2)
+    with pytest.raises(ValueError):
+        s.run()
+
+    s = acts.examples.Sequencer(
+        events=10, numProcesses=2, metricsCallback=lambda names, metrics: None
+    )
+    with pytest.raises(ValueError, match="metrics callback"):
+        s.run(_build_particle_gun)
+
+
 def test_random_number():
     rnd = acts.examples.RandomNumbers(seed=42)
 
@@ -80,3 +153,489 @@ def test_constructors():
     print(s1)
     s2 = acts.examples.Sequencer()
     print(s2)
+
+
+def test_submodule_attributes():
+    import subprocess
+    import sys
+
+    # in a fresh interpreter, the test session may have imported them already
+    code = """
+import sys
+import acts.examples
+
+submodules = acts.examples._submodules
+loaded = [m for m in submodules if f"acts.examples.{m}" in sys.modules]
+assert not loaded, f"imported eagerly: {loaded}"
+assert "metrics" in dir(acts.examples)
+assert acts.examples.metrics is sys.modules["acts.examples.metrics"]
+"""
+    subprocess.check_call([sys.executable, "-c", code])
+
+    with pytest.raises(AttributeError):
+        acts.examples.does_not_exist
+
+
+def test_config_fields():
+    from acts._adapter import _config_fields
+
+    cls = acts.examples.ParticleSelector.Config
+    fields = _config_fields(cls)
+    assert {"inputParticles", "outputParticles", "ptMin"} <= fields
+    assert "__init__" not in fields
+    # computed once per class
+    assert _config_fields(cls) is fields
+
+    with pytest.raises(RuntimeError, match="ptMin"):
+        acts.examples.ParticleSelector(level=acts.logging.INFO, ptMin="abc")
+
+
+def test_config_fields_persisted(tmp_path):
+    import json
+    import os
+    import subprocess
+    import sys
+
+    code = """
+import acts.examples
+from acts._adapter import _config_fields
+print(sorted(_config_fields(acts.examples.ParticleSelector.Config)))
+"""
+    env = {**os.environ, "ACTS_CONFIG_CACHE": str(tmp_path)}
+    subprocess.check_call([sys.executable, "-c", code], env=env)
+    (file,) = tmp_path.glob("fields_*.json")
+    fields = json.loads(file.read_text())
+    (key,) = [k for k in fields if k.endswith("ParticleSelector.Config")]
+    assert "ptMin" in fields[key]
+
+    # later processes read the table instead of inspecting the class
+    fields[key].append("persisted")
+    file.write_text(json.dumps(fields))
+    out = subprocess.check_output([sys.executable, "-c", code], env=env, text=True)
+    assert "'persisted'" in out
+
+
+def test_import_is_lazy():
+    import subprocess
+    import sys
+
+    code = """
+import sys
+import acts.examples
+from acts import ActsPythonBindings
+from acts._adapter import _patched
+
+print(sorted(m for m in sys.modules if m.startswith("acts")))
+print(ActsPythonBindings._pendingComponents())
+Config = ActsPythonBindings._examples.ParticleSelector.Config
+print(Config in _patched)
+acts.examples.ParticleSelector
+print(Config in _patched)
+acts.examples.__all__
+print(ActsPythonBindings._pendingComponents())
+"""
+    out = subprocess.check_output([sys.executable, "-c", code], text=True)
+    modules, pending, before, after, pendingAfter = out.splitlines()
+
+    # the optional submodules and their bindings are not loaded by the import
+    for name in ("reconstruction", "simulation", "geant4", "dd4hep", "onnx"):
+        assert f"'acts.examples.{name}'" not in modules
+    assert "ActsPythonBindingsGeant4" not in modules
+    assert "ActsPythonBindingsDD4hep" not in modules
+    assert pending == str(["edm4hep", "exatrkx", "hepmc3", "onnx", "svg"])
+
+    # classes are patched on first access
+    assert before == "False"
+    assert after == "True"
+
+    # star imports need all names, which registers the components
+    assert pendingAfter == "[]"
+
+
+def test_sequencer_event_timing(tmp_path, ptcl_gun):
+    from helpers import AssertCollectionExistsAlg
+
+    s = acts.examples.Sequencer(
+        events=10,
+        skip=3,
+        numThreads=2,
+        outputDir=tmp_path,
+        outputEventTimingFile="timing_events.npy",
+    )
+    evGen = ptcl_gun(s)
+    for _ in range(2):
+        s.addAlgorithm(
+            AssertCollectionExistsAlg(
+                evGen.config.outputParticles, "check_alg", acts.logging.WARNING
+            )
+        )
+    s.run()
+
+    timings = s.eventTimings
+    assert list(timings["event_nr"]) == list(range(3, 13))
+    names = timings.dtype.names[1:]
+    assert len(names) > 0
+    assert all(
+        n.split(":")[0] in ("Decorator", "Algorithm", "Reader", "Writer") for n in names
+    )
+    assert all(np.all(timings[n] >= 0) for n in names)
+    # elements sharing a name get unique identifiers
+    assert names.count("Algorithm:check_alg") == 1
+    assert names.count("Algorithm:check_alg#2") == 1
+
+    assert np.array_equal(np.load(tmp_path / "timing_events.npy"), timings)
+
+    percentiles = s.timingPercentiles(timings)
+    assert set(percentiles.keys()) == set(names)
+    for name, (p50, p95, p99) in percentiles.items():
+        assert p50 <= p95 <= p99 <= timings[name].max()
+
+    with (tmp_path / "timing.tsv").open() as fh:
+        header = fh.readline().strip().split("\t")
+        rows = [dict(zip(header, line.strip().split("\t"))) for line in fh]
+    assert header[:3] == ["identifier", "time_total_s", "time_perevent_s"]
+    assert [r["identifier"] for r in rows] == list(names)
+    # the timing file estimates the percentiles from histograms
+    for row in rows:
+        assert float(row["time_p99_s"]) == pytest.approx(
+            percentiles[row["identifier"]][2], rel=2e-2, abs=1e-6
+        )
+
+    # the time of every single event is only kept on request
+    s = acts.examples.Sequencer(events=3, numThreads=1, outputDir=tmp_path / "default")
+    ptcl_gun(s)
+    s.run()
+    assert len(s.eventTimings) == 0
+    assert (tmp_path / "default" / "timing.tsv").exists()
+
+    s = acts.examples.Sequencer(events=3, numThreads=1, trackEventTimings=True)
+    ptcl_gun(s)
+    s.run()
+    assert list(s.eventTimings["event_nr"]) == list(range(3))
+
+
+def test_sequencer_metrics_callback(tmp_path, ptcl_gun):
+    import json
+    from acts.examples.metrics import JsonLinesExporter, PrometheusTextfileExporter
+
+    batches = []
+
+    def callback(names, batch):
+        batches.append((list(names), list(batch)))
+
+    s = acts.examples.Sequencer(
+        events=10, numThreads=2, metricsCallback=callback, metricsBatchSize=4
+    )
+    ptcl_gun(s)
+    s.run()
+
+    assert [len(b) for _, b in batches] == [4, 4, 2]
+    names = batches[0][0]
+    metrics = sorted((m for _, b in batches for m in b), key=lambda m: m.event)
+    assert [m.event for m in metrics] == list(range(10))
+    for m in metrics:
+        assert len(m.durations) == len(names)
+        assert m.wallTime >= sum(m.durations)
+        assert m.time >= m.wallTime
+        assert m.rss > 0
+        assert m.whiteBoardObjects > 0
+        assert m.whiteBoardBytes > 0
+
+    jsonl = JsonLinesExporter(tmp_path / "metrics.jsonl")
+    prom = PrometheusTextfileExporter(tmp_path / "metrics.prom")
+    for exporter in (jsonl, prom):
+        s = acts.examples.Sequencer(
+            events=5, numThreads=1, metricsCallback=exporter, metricsBatchSize=2
+        )
+        ptcl_gun(s)
+        s.run()
+
+    records = [json.loads(l) for l in (tmp_path / "metrics.jsonl").open()]
+    assert [r["event"] for r in records] == list(range(5))
+    assert set(records[0]["durations_s"].keys()) == set(names)
+    assert all(r["whiteboard_bytes"] > 0 for r in records)
+
+    prom = (tmp_path / "metrics.prom").read_text()
+    assert 'acts_sequencer_events_total{job="acts"} 5' in prom
+    assert "acts_sequencer_rss_bytes" in prom
+    assert "acts_sequencer_whiteboard_bytes" in prom
+
+
+def test_sequencer_whiteboard_memory(tmp_path, ptcl_gun):
+    s = acts.examples.Sequencer(
+        events=5, numThreads=1, outputDir=tmp_path, trackWhiteBoardMemory=True
+    )
+    evGen = ptcl_gun(s)
+    s.run()
+
+    memory = s.whiteBoardMemory
+    assert list(memory["event_nr"]) == list(range(5))
+    particles = evGen.config.outputParticles
+    assert particles in memory.dtype.names
+    # 4 particles per event, each one stored by value
+    assert np.all(memory[particles] >= 4 * 8 * 8)
+
+    with (tmp_path / "whiteboard_memory.tsv").open() as fh:
+        header = fh.readline().strip().split("\t")
+        rows = {
+            r["collection"]: r
+            for r in (dict(zip(header, l.strip().split("\t"))) for l in fh)
+        }
+    assert int(rows[particles]["bytes_max"]) == memory[particles].max()
+
+    s = acts.examples.Sequencer(events=5, numThreads=1)
+    ptcl_gun(s)
+    s.run()
+    assert len(s.whiteBoardMemory.dtype.names) == 1
+
+
+def test_sequencer_release_whiteboard_objects(tmp_path, ptcl_gun):
+    import filecmp
+
+    def run(release):
+        out = tmp_path / ("release" if release else "keep")
+        out.mkdir()
+        s = acts.examples.Sequencer(
+            events=3,
+            numThreads=1,
+            trackWhiteBoardMemory=True,
+            releaseWhiteBoardObjects=release,
+        )
+        evGen = ptcl_gun(s)
+        # two branches, each ending in a writer
+        for i in range(2):
+            s.addAlgorithm(
+                acts.examples.ParticleSelector(
+                    level=acts.logging.INFO,
+                    inputParticles=evGen.config.outputParticles,
+                    outputParticles=f"particles_selected_{i}",
+                )
+            )
+            inputParticles = f"particles_selected_{i}"
+            if i == 1:
+                # the original is released before the alias
+                s.addWhiteboardAlias("particles_final", inputParticles)
+                inputParticles = "particles_final"
+            s.addWriter(
+                acts.examples.CsvParticleWriter(
+                    level=acts.logging.INFO,
+                    inputParticles=inputParticles,
+                    outputStem=f"particles_{i}",
+                    outputDir=str(out),
+                )
+            )
+        s.run()
+        return out, s.whiteBoardMemory, s.whiteBoardPeakMemory
+
+    keep, keepMemory, keepPeak = run(False)
+    release, releaseMemory, releasePeak = run(True)
+
+    files = sorted(f.name for f in keep.iterdir())
+    assert len(files) == 6
+    for f in files:
+        assert filecmp.cmp(keep / f, release / f, shallow=False)
+
+    # released collections are still accounted for
+    assert keepMemory.dtype.names == releaseMemory.dtype.names
+    assert np.array_equal(keepPeak["peak_bytes"], keepPeak["total_bytes"])
+    assert np.array_equal(releasePeak["total_bytes"], keepPeak["total_bytes"])
+    # the first branch is released before the second one is selected, the
+    # input particles are kept until both selections are released
+    assert np.all(releasePeak["peak_bytes"] < releasePeak["total_bytes"])
+
+
+def test_sequencer_release_without_handles(ptcl_gun):
+    from helpers import AssertCollectionExistsAlg
+
+    s = acts.examples.Sequencer(events=3, numThreads=1, releaseWhiteBoardObjects=True)
+    evGen = ptcl_gun(s)
+    s.addAlgorithm(
+        acts.examples.ParticleSelector(
+            level=acts.logging.INFO,
+            inputParticles=evGen.config.outputParticles,
+            outputParticles="particles_selected",
+        )
+    )
+    # only accesses the event store directly, so nothing is released before
+    alg = AssertCollectionExistsAlg(
+        [evGen.config.outputParticles, "particles_selected"], "check_alg"
+    )
+    s.addAlgorithm(alg)
+    s.run()
+    assert alg.events_seen == 3
+
+
+@pytest.mark.parametrize("release", [False, True])
+def test_sequencer_intra_event_parallelism(tmp_path, ptcl_gun, release):
+    import filecmp
+
+    def run(parallel):
+        out = tmp_path / ("parallel" if parallel else "sequential")
+        out.mkdir()
+        s = acts.examples.Sequencer(
+            events=4,
+            numThreads=4,
+            intraEventParallelism=parallel,
+            releaseWhiteBoardObjects=release,
+        )
+        evGen = ptcl_gun(s)
+        # two independent branches reading the same input
+        for name, cut in [("low", (0, 5)), ("high", (5, 100))]:
+            s.addAlgorithm(
+                acts.examples.ParticleSelector(
+                    level=acts.logging.INFO,
+                    inputParticles=evGen.config.outputParticles,
+                    outputParticles=f"particles_{name}",
+                    ptMin=cut[0] * acts.UnitConstants.GeV,
+                    ptMax=cut[1] * acts.UnitConstants.GeV,
+                )
+            )
+            s.addWriter(
+                acts.examples.CsvParticleWriter(
+                    level=acts.logging.INFO,
+                    inputParticles=f"particles_{name}",
+                    outputStem=f"particles_{name}",
+                    outputDir=str(out),
+                )
+            )
+        s.run()
+        return out
+
+    sequential = run(False)
+    parallel = run(True)
+
+    files = sorted(f.name for f in sequential.iterdir())
+    assert len(files) == 8
+    assert sorted(f.name for f in parallel.iterdir()) == files
+    for f in files:
+        assert filecmp.cmp(sequential / f, parallel / f, shallow=False)
+
+
+def test_event_data_views(tmp_path, fatras):
+    import csv
+
+    s = acts.examples.Sequencer(events=2, numThreads=1, releaseWhiteBoardObjects=True)
+    evGen, simAlg, digiAlg = fatras(s)
+
+    class Inspect(acts.examples.IAlgorithm):
+        def __init__(self):
+            acts.examples.IAlgorithm.__init__(self, "Inspect", acts.logging.INFO)
+            self.hits = acts.examples.SimHitReadHandle(self, "InputSimHits")
+            self.hits.initialize(simAlg.config.outputSimHits)
+            self.measurements = acts.examples.MeasurementReadHandle(
+                self, "InputMeasurements"
+            )
+            self.measurements.initialize(digiAlg.config.outputMeasurements)
+            self.events = {}
+
+        def execute(self, context):
+            self.events[context.eventNumber] = (
+                self.hits(context),
+                self.measurements(context),
+            )
+            return acts.examples.ProcessCode.SUCCESS
+
+    inspect = Inspect()
+    assert inspect.hits.key == simAlg.config.outputSimHits
+    s.addAlgorithm(inspect)
+    s.addWriter(
+        acts.examples.CsvSimHitWriter(
+            level=acts.logging.INFO,
+            inputSimHits=simAlg.config.outputSimHits,
+            outputDir=str(tmp_path),
+            outputStem="hits",
+        )
+    )
+    s.run()
+
+    assert sorted(inspect.events.keys()) == [0, 1]
+    # the arrays stay valid after the objects have been released
+    for event, (hits, measurements) in inspect.events.items():
+        assert not hits.flags.writeable
+        assert not measurements.flags.writeable
+        with pytest.raises(ValueError):
+            hits["index"][0] = 0
+
+        with (tmp_path / f"event{event:09d}-hits.csv").open() as fh:
+            rows = list(csv.DictReader(fh))
+        assert len(hits) == len(rows) > 0
+        assert [int(r["geometry_id"]) for r in rows] == list(hits["geometry_id"])
+        assert [int(r["particle_id"]) for r in rows] == list(hits["particle_id"])
+        assert np.allclose(
+            [float(r["tx"]) for r in rows], hits["four_position"][:, 0], rtol=1e-6
+        )
+
+        assert 0 < len(measurements) <= len(hits)
+        assert np.array_equal(measurements["index"], np.arange(len(measurements)))
+        assert set(measurements["geometry_id"]) <= set(hits["geometry_id"])
+        assert np.all((measurements["size"] >= 1) & (measurements["size"] <= 6))
+
+
+def test_batch_algorithm(ptcl_gun):
+    class Counter(acts.examples.IBatchAlgorithm):
+        def __init__(self):
+            acts.examples.IBatchAlgorithm.__init__(
+                self, "Counter", acts.logging.INFO, batchSize=4, timeout=0.01
+            )
+            self.batches = []
+
+        def execute_batch(self, contexts):
+            self.batches.append([c.eventNumber for c in contexts])
+            return [acts.examples.ProcessCode.SUCCESS] * len(contexts)
+
+    s = acts.examples.Sequencer(events=20, numThreads=4)
+    ptcl_gun(s)
+    alg = Counter()
+    assert alg.batchSize == 4
+    s.addAlgorithm(alg)
+    s.run()
+
+    events = sorted(e for batch in alg.batches for e in batch)
+    assert events == list(range(20))
+    assert all(1 <= len(batch) <= 4 for batch in alg.batches)
+
+    with pytest.raises(ValueError):
+        acts.examples.IBatchAlgorithm("Invalid", acts.logging.INFO, batchSize=0)
+
+
+def test_batch_algorithm_single_thread(ptcl_gun):
+    import time
+
+    class Counter(acts.examples.IBatchAlgorithm):
+        def __init__(self):
+            acts.examples.IBatchAlgorithm.__init__(
+                self, "Counter", acts.logging.INFO, batchSize=8, timeout=60
+            )
+            self.batches = []
+
+        def execute_batch(self, contexts):
+            self.batches.append([c.eventNumber for c in contexts])
+            return acts.examples.ProcessCode.SUCCESS
+
+    s = acts.examples.Sequencer(events=3, numThreads=1)
+    ptcl_gun(s)
+    alg = Counter()
+    s.addAlgorithm(alg)
+    start = time.monotonic()
+    s.run()
+
+    # no other event can arrive, so the batches do not wait for the timeout
+    assert time.monotonic() - start < 30
+    assert alg.batches == [[0], [1], [2]]
+
+
+def test_batch_algorithm_error(ptcl_gun):
+    class Failing(acts.examples.IBatchAlgorithm):
+        def __init__(self):
+            acts.examples.IBatchAlgorithm.__init__(
+                self, "Failing", acts.logging.INFO, batchSize=2
+            )
+
+        def execute_batch(self, contexts):
+            raise KeyError("failed")
+
+    s = acts.examples.Sequencer(events=4, numThreads=2)
+    ptcl_gun(s)
+    s.addAlgorithm(Failing())
+    with pytest.raises((KeyError, RuntimeError)):
+        s.run()
@@ -0,0 +1,99 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import acts
+import acts.examples
+
+# The benchmark scripts are run in subprocesses, as they measure the startup
+# and the resources of a fresh interpreter.
+
+benchmarkDir = Path(__file__).parent.parent / "benchmarks"
+
+
+def test_startup_benchmark(tmp_path):
+    script = benchmarkDir / "startup.py"
+    output = tmp_path / "startup.json"
+    subprocess.check_call(
+        [
+            sys.executable,
+            str(script),
+            "--phases",
+            "import_acts",
+            "import_acts_examples",
+            "itk_geometry",
+            "--repeat",
+            "1",
+            "--output",
+            str(output),
+        ]
+    )
+
+    metrics = {m["name"]: m for m in json.loads(output.read_text())["metrics"]}
+    # the ITk geometry is not available and skipped
+    assert set(metrics.keys()) == {
+        "startup_time_import_acts",
+        "startup_max_rss_import_acts",
+        "startup_time_import_acts_examples",
+        "startup_max_rss_import_acts_examples",
+    }
+    assert all(m["value"] > 0 for m in metrics.values())
+    assert metrics["startup_time_import_acts"]["unit"] == "seconds"
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not hasattr(acts.examples, "pythia8"), reason="Pythia8 not set up")
+def test_seeding_benchmark(tmp_path):
+    pytest.importorskip("uproot")
+
+    script = benchmarkDir / "seeding.py"
+    output = tmp_path / "seeding.json"
+    args = [
+        sys.executable,
+        str(script),
+        "--detectors",
+        "generic",
+        "itk",
+        "--algorithms",
+        "standard",
+        "orthogonal",
+        "--pileup",
+        "1",
+        "--events",
+        "2",
+        "--input-dir",
+        str(tmp_path / "input"),
+        "--output",
+        str(output),
+    ]
+    subprocess.check_call(args)
+
+    metrics = {m["name"]: m for m in json.loads(output.read_text())["metrics"]}
+    # the ITk geometry is not available and skipped
+    assert set(metrics.keys()) == {
+        f"seeding_{m}_{alg}_generic_mu1"
+        for alg in ("standard", "orthogonal")
+        for m in (
+            "throughput",
+            "latency_p50",
+            "latency_p95",
+            "latency_p99",
+            "max_rss_delta",
+            "output_memory",
+            "efficiency",
+        )
+    }
+    assert metrics["seeding_throughput_standard_generic_mu1"]["value"] > 0
+    assert metrics["seeding_output_memory_standard_generic_mu1"]["value"] > 0
+    assert metrics["seeding_max_rss_delta_standard_generic_mu1"]["value"] >= 0
+    assert 0 < metrics["seeding_efficiency_standard_generic_mu1"]["value"] <= 1
+
+    # the recorded events are reused
+    recorded = tmp_path / "input" / "generic_mu1"
+    assert (recorded / "complete").exists()
+    mtime = recorded.stat().st_mtime
+    subprocess.check_call(args)
+    assert recorded.stat().st_mtime == mtime
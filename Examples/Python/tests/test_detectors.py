@@ -171,3 +171,50 @@ def test_tgeo_config_volume(monkeypatch):
 
         v = Volume(**{key: (4, None)})
         assert getattr(v, key) == Interval(4, None)
+
+
+def test_geometry_cache_hash(tmp_path):
+    geometry_cache = pytest.importorskip("acts.examples.geometry_cache")
+    geometryHash = geometry_cache.geometryHash
+
+    a = tmp_path / "a"
+    a.mkdir()
+    (a / "detector.xml").write_text("<detector/>")
+    (a / "material.json").write_text("{}")
+
+    key = geometryHash([a], {"material": True})
+    assert key == geometryHash([a], {"material": True})
+    assert key != geometryHash([a], {"material": False})
+
+    # independent of the location of the inputs
+    b = tmp_path / "b"
+    b.mkdir()
+    for f in a.iterdir():
+        (b / f.name).write_bytes(f.read_bytes())
+    assert key == geometryHash([b], {"material": True})
+
+    (b / "material.json").write_text('{"changed": 1}')
+    assert key != geometryHash([b], {"material": True})
+    assert geometryHash([a / "detector.xml"]) != geometryHash([a / "material.json"])
+
+
+@pytest.mark.skipif(
+    not hasattr(acts.examples, "convertJsonToCbor"), reason="Json plugin not set up"
+)
+def test_geometry_cache_material(tmp_path):
+    from acts.examples.geometry_cache import cachedMaterialFile
+
+    material = tmp_path / "material.json"
+    material.write_text('{"volumes": {"entries": []}}')
+
+    cached = cachedMaterialFile(material, cacheDir=tmp_path / "cache")
+    assert cached.suffix == ".cbor"
+    assert cached.parent == tmp_path / "cache"
+    assert cachedMaterialFile(material, cacheDir=tmp_path / "cache") == cached
+
+    material.write_text('{"volumes": {"entries": [1]}}')
+    assert cachedMaterialFile(material, cacheDir=tmp_path / "cache") != cached
+
+    # other maps are read directly
+    root = tmp_path / "material.root"
+    assert cachedMaterialFile(root, cacheDir=tmp_path / "cache") == root
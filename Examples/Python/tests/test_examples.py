@@ -263,6 +263,34 @@ def test_seeding(tmp_path, trk_geo, field, assert_root_hash):
     assert_csv_output(csv, "particles_initial")
 
 
+def test_seeding_release_whiteboard_objects(tmp_path, trk_geo):
+    from seeding import runSeeding
+    from helpers.hash_root import hash_root_file
+
+    field = acts.ConstantBField(acts.Vector3(0, 0, 2 * acts.UnitConstants.T))
+
+    # the seeds point into the space points, which have to be kept until the
+    # track parameters are estimated from the seeds
+    outputs = {}
+    for release in [False, True]:
+        outputDir = tmp_path / ("release" if release else "keep")
+        (outputDir / "csv").mkdir(parents=True)
+        seq = Sequencer(
+            events=10,
+            numThreads=2,
+            releaseWhiteBoardObjects=release,
+            trackWhiteBoardMemory=True,
+        )
+        runSeeding(trk_geo, field, outputDir=str(outputDir), s=seq).run()
+        outputs[release] = outputDir
+        peak = seq.whiteBoardPeakMemory
+        del seq
+
+    assert (peak["peak_bytes"] <= peak["total_bytes"]).all()
+    for fn in ["estimatedparams.root", "performance_seeding.root"]:
+        assert hash_root_file(outputs[True] / fn) == hash_root_file(outputs[False] / fn)
+
+
 def test_seeding_orthogonal(tmp_path, trk_geo, field, assert_root_hash):
     from seeding import runSeeding, SeedingAlgorithm
 
@@ -750,6 +778,170 @@ def test_material_mapping(material_recording, tmp_path, assert_root_hash):
     assert_root_hash(val_file.name, val_file)
 
 
+@pytest.mark.slow
+@pytest.mark.odd
+@pytest.mark.skipif(not dd4hepEnabled, reason="DD4hep not set up")
+def test_material_mapping_multithreaded(material_recording, tmp_path):
+    detector, trackingGeometry, decorators = getOpenDataDetector(
+        getOpenDataDetectorDirectory()
+    )
+
+    from material_mapping import runMaterialMapping
+
+    maps = {}
+    for numThreads in [1, 2]:
+        outputDir = tmp_path / f"threads{numThreads}"
+        outputDir.mkdir()
+        s = runMaterialMapping(
+            trackingGeometry,
+            decorators,
+            outputDir=str(outputDir),
+            inputDir=material_recording,
+            mappingStep=1,
+            numThreads=numThreads,
+        )
+        s.run()
+
+        # MaterialMapping alg only writes on destruct.
+        del s
+
+        mat_file = outputDir / "material-map.json"
+        assert mat_file.exists()
+        with mat_file.open() as fh:
+            maps[numThreads] = json.load(fh)
+        assert maps[numThreads]
+
+        map_file = outputDir / "material-map_tracks.root"
+        assert_entries(map_file, "material-tracks", 200)
+
+    # the per-thread accumulation only changes the rounding of the averages
+    def compare(a, b, path="$"):
+        if isinstance(a, dict):
+            assert isinstance(b, dict) and a.keys() == b.keys(), path
+            for key in a:
+                compare(a[key], b[key], f"{path}.{key}")
+        elif isinstance(a, list):
+            assert isinstance(b, list) and len(a) == len(b), path
+            for i, (x, y) in enumerate(zip(a, b)):
+                compare(x, y, f"{path}[{i}]")
+        elif isinstance(a, float) or isinstance(b, float):
+            assert a == pytest.approx(b, rel=1e-5, abs=1e-9), path
+        else:
+            assert a == b, path
+
+    compare(maps[2], maps[1])
+
+
+@pytest.mark.slow
+@pytest.mark.odd
+@pytest.mark.skipif(not dd4hepEnabled, reason="DD4hep not set up")
+def test_material_mapping_checkpoints(material_recording, tmp_path):
+    detector, trackingGeometry, decorators = getOpenDataDetector(
+        getOpenDataDetectorDirectory()
+    )
+
+    from material_mapping import runMaterialMapping, mergeMaterialMaps
+
+    # map the two recorded events in independent jobs
+    checkpoints = []
+    for skip in range(2):
+        outputDir = tmp_path / f"partial{skip}"
+        outputDir.mkdir()
+        checkpoint = outputDir / "material-map.acc"
+
+        s = Sequencer(events=1, skip=skip, numThreads=1)
+        runMaterialMapping(
+            trackingGeometry,
+            decorators,
+            outputDir=str(outputDir),
+            inputDir=material_recording,
+            mappingStep=1,
+            outputCheckpoint=str(checkpoint),
+            s=s,
+        )
+        s.run()
+        # written when the algorithm is finalised
+        assert checkpoint.exists()
+        del s
+
+        checkpoints.append(str(checkpoint))
+
+    # a checkpoint that can not be written fails the run
+    s = Sequencer(events=1, numThreads=1)
+    runMaterialMapping(
+        trackingGeometry,
+        decorators,
+        outputDir=str(tmp_path),
+        inputDir=material_recording,
+        mappingStep=1,
+        outputCheckpoint=str(tmp_path / "missing" / "material-map.acc"),
+        s=s,
+    )
+    with pytest.raises(RuntimeError):
+        s.run()
+    del s
+
+    mergeMaterialMaps(
+        trackingGeometry,
+        decorators,
+        outputDir=str(tmp_path),
+        inputCheckpoints=checkpoints,
+        mappingStep=1,
+    )
+
+    mat_file = tmp_path / "material-map.json"
+    assert mat_file.exists()
+    with mat_file.open() as fh:
+        assert json.load(fh)
+
+
+@pytest.mark.slow
+@pytest.mark.odd
+@pytest.mark.skipif(not dd4hepEnabled, reason="DD4hep not set up")
+def test_material_mapping_association(material_recording, tmp_path):
+    detector, trackingGeometry, decorators = getOpenDataDetector(
+        getOpenDataDetectorDirectory()
+    )
+
+    from material_mapping import runMaterialMapping
+
+    associationDir = tmp_path / "association"
+
+    # the first mapping writes the index, the second one reads it
+    for run in ["first", "second"]:
+        outputDir = tmp_path / run
+        outputDir.mkdir()
+
+        s = Sequencer(numThreads=1)
+        runMaterialMapping(
+            trackingGeometry,
+            decorators,
+            outputDir=str(outputDir),
+            inputDir=material_recording,
+            mapVolume=False,
+            associationDir=str(associationDir),
+            s=s,
+        )
+        s.run()
+        del s
+
+        indices = list(associationDir.glob("*.idx"))
+        assert len(indices) == 1
+        index = acts.examples.MaterialAssociationIndex(str(indices[0]))
+        assert index.nEvents == 2
+        # the index is tied to the content of the material track file
+        assert f"{index.inputHash:016x}" in indices[0].name
+
+        mat_file = outputDir / "material-map.json"
+        assert mat_file.exists()
+        with mat_file.open() as fh:
+            assert json.load(fh)
+
+    assert_entries(
+        tmp_path / "second" / "material-map_tracks.root", "material-tracks", 200
+    )
+
+
 @pytest.mark.slow
 @pytest.mark.odd
 @pytest.mark.skipif(not dd4hepEnabled, reason="DD4hep not set up")
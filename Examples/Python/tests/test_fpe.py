@@ -285,3 +285,106 @@ def test_buffer_sufficient():
     res = s.fpeResult
     for x in acts.FpeType.values:
         assert res.count(x) == (s.config.events if x == acts.FpeType.FLTINV else 0)
+
+
+def test_auto_fpe_mask_index(tmp_path, monkeypatch):
+    srcdir = tmp_path / "src"
+    srcdir.mkdir()
+    src = srcdir / "Test.cpp"
+    src.write_text(
+        "\n".join(
+            [
+                "void f() {",
+                "  a = b / c;  // MARK: fpeMask(FLTDIV, 1, #1234)",
+                "  // MARK: fpeMaskBegin(FLTINV, 2, #1235)",
+                "  a = std::sqrt(b);",
+                "  // MARK: fpeMaskEnd(FLTINV)",
+                "}",
+            ]
+        )
+    )
+
+    cache = tmp_path / "cache.json"
+    monkeypatch.setenv("ACTS_SEQUENCER_FPE_MASK_CACHE", str(cache))
+    monkeypatch.setattr(
+        acts.examples.Sequencer, "srcdir", classmethod(lambda cls: srcdir)
+    )
+
+    def masks():
+        monkeypatch.setattr(acts.examples.Sequencer, "_autoFpeMasks", None)
+        return [
+            (m.file, tuple(m.lines), m.type, m.count)
+            for m in acts.examples.Sequencer._getAutoFpeMasks()
+        ]
+
+    exp = [
+        ("Test.cpp", (2, 3), acts.FpeType.FLTDIV, 1),
+        ("Test.cpp", (3, 6), acts.FpeType.FLTINV, 2),
+    ]
+    assert masks() == exp
+    assert cache.exists()
+
+    # unchanged files are served from the index without being parsed
+    parse = acts.examples.Sequencer._parseFpeMaskMarkers
+    monkeypatch.setattr(
+        acts.examples.Sequencer,
+        "_parseFpeMaskMarkers",
+        staticmethod(lambda *args: pytest.fail("unexpected re-parse")),
+    )
+    assert masks() == exp
+
+    # modified files are picked up again
+    monkeypatch.setattr(
+        acts.examples.Sequencer, "_parseFpeMaskMarkers", staticmethod(parse)
+    )
+    src.write_text("void f() {}\n")
+    assert masks() == []
+
+    # an index shipped with the bindings is used if there is no source tree
+    prebuilt = tmp_path / "fpe_masks.json"
+    src.write_text("a = b / c;  // MARK: fpeMask(FLTDIV, 1, #1234)\n")
+    acts.examples.Sequencer.writeFpeMaskIndex(prebuilt)
+    src.unlink()
+    srcdir.rmdir()
+    monkeypatch.setattr(
+        acts.examples.Sequencer,
+        "_prebuiltFpeMaskIndexPath",
+        classmethod(lambda cls: prebuilt),
+    )
+    assert masks() == [("Test.cpp", (1, 2), acts.FpeType.FLTDIV, 1)]
+
+
+def test_auto_fpe_mask_index_readonly(tmp_path, monkeypatch):
+    srcdir = tmp_path / "src"
+    srcdir.mkdir()
+    (srcdir / "Test.cpp").write_text("a = b / c;  // MARK: fpeMask(FLTDIV, 1, #1234)\n")
+    monkeypatch.setattr(
+        acts.examples.Sequencer, "srcdir", classmethod(lambda cls: srcdir)
+    )
+
+    def masks():
+        monkeypatch.setattr(acts.examples.Sequencer, "_autoFpeMasks", None)
+        return [
+            (m.file, tuple(m.lines), m.type, m.count)
+            for m in acts.examples.Sequencer._getAutoFpeMasks()
+        ]
+
+    exp = [("Test.cpp", (1, 2), acts.FpeType.FLTDIV, 1)]
+
+    # an unusable cache location is not an error
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    monkeypatch.setenv("ACTS_SEQUENCER_FPE_MASK_CACHE", str(blocker / "cache.json"))
+    assert masks() == exp
+
+    # an unchanged index is not written again
+    cache = tmp_path / "cache.json"
+    monkeypatch.setenv("ACTS_SEQUENCER_FPE_MASK_CACHE", str(cache))
+    assert masks() == exp
+    assert cache.exists()
+    monkeypatch.setattr(
+        acts.examples.Sequencer,
+        "_storeFpeMaskIndex",
+        classmethod(lambda cls, *args: pytest.fail("unexpected write")),
+    )
+    assert masks() == exp
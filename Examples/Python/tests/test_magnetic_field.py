@@ -36,3 +36,138 @@ def test_solenoid(conf_const):
     )
 
     assert isinstance(field, acts.examples.InterpolatedMagneticField2)
+
+
+def test_solenoid_batched():
+    import numpy
+
+    solenoid = acts.SolenoidBField(
+        radius=1200 * u.mm,
+        length=6000 * u.mm,
+        bMagCenter=2 * u.T,
+        nCoils=1194,
+    )
+
+    rz = numpy.array([[0, 0], [0, 2000 * u.mm], [500 * u.mm, -1000 * u.mm]])
+    fields = solenoid.getFieldRz(rz)
+    assert fields.shape == (3, 2)
+    assert fields[0, 0] == 0
+    assert fields[0, 1] == pytest.approx(2 * u.T)
+    assert numpy.array_equal(solenoid.getFieldRz(rz, numThreads=2), fields)
+
+    with pytest.raises(ValueError):
+        solenoid.getFieldRz(numpy.zeros((3, 3)))
+    with pytest.raises(ValueError):
+        solenoid.getFieldRz(rz, numThreads=0)
+
+    field = acts.solenoidFieldMap(
+        rlim=(0, 1200 * u.mm),
+        zlim=(-5000 * u.mm, 5000 * u.mm),
+        nbins=(10, 10),
+        field=solenoid,
+        numThreads=2,
+    )
+    assert isinstance(field, acts.examples.InterpolatedMagneticField2)
+
+
+def test_binary_field_map(tmp_path):
+    solenoid = acts.SolenoidBField(
+        radius=1200 * u.mm,
+        length=6000 * u.mm,
+        bMagCenter=2 * u.T,
+        nCoils=1194,
+    )
+    field = acts.solenoidFieldMap(
+        rlim=(0, 1200 * u.mm),
+        zlim=(-5000 * u.mm, 5000 * u.mm),
+        nbins=(10, 10),
+        field=solenoid,
+    )
+
+    map_file = tmp_path / "solenoid.bin"
+    acts.examples.writeMagneticFieldMapBinary(field, str(map_file))
+    assert map_file.exists()
+
+    mapped = acts.examples.MagneticFieldMapBinary(str(map_file))
+    assert isinstance(mapped, acts.examples.MappedBFieldMap2)
+
+    with pytest.raises(RuntimeError):
+        acts.examples.MagneticFieldMapBinary(__file__)
+
+
+def test_field_batch(tmp_path):
+    import numpy
+
+    positions = numpy.array(
+        [
+            [0, 0, 0],
+            [100 * u.mm, -200 * u.mm, 1000 * u.mm],
+            [500 * u.mm, 500 * u.mm, -4000 * u.mm],
+            [0, 0, 10000 * u.mm],
+        ]
+    )
+
+    constant = acts.ConstantBField(acts.Vector3(0, 0, 2 * u.T))
+    fields = constant.getFieldBatch(positions)
+    assert fields.shape == (4, 3)
+    assert numpy.all(fields == [0, 0, 2 * u.T])
+
+    with pytest.raises(ValueError):
+        constant.getFieldBatch(positions[:, :2])
+
+    solenoid = acts.SolenoidBField(
+        radius=1200 * u.mm,
+        length=6000 * u.mm,
+        bMagCenter=2 * u.T,
+        nCoils=1194,
+    )
+    field = acts.solenoidFieldMap(
+        rlim=(0, 1200 * u.mm),
+        zlim=(-5000 * u.mm, 5000 * u.mm),
+        nbins=(10, 10),
+        field=solenoid,
+    )
+    fields = field.getFieldBatch(positions, numThreads=2)
+    assert fields[0] == pytest.approx([0, 0, 2 * u.T], rel=1e-2)
+    # outside of the map
+    assert numpy.all(numpy.isnan(fields[3]))
+    assert numpy.array_equal(
+        field.getFieldBatch(positions, numThreads=-1), fields, equal_nan=True
+    )
+    for numThreads in [0, -2]:
+        with pytest.raises(ValueError):
+            field.getFieldBatch(positions, numThreads=numThreads)
+
+    map_file = tmp_path / "solenoid.bin"
+    acts.examples.writeMagneticFieldMapBinary(field, str(map_file))
+    mapped = acts.examples.MagneticFieldMapBinary(str(map_file))
+    assert numpy.array_equal(mapped.getFieldBatch(positions), fields, equal_nan=True)
+
+
+def test_cached_field_map(tmp_path):
+    field_cache = pytest.importorskip("acts.examples.field_cache")
+
+    built = []
+
+    def build():
+        built.append(True)
+        solenoid = acts.SolenoidBField(
+            radius=1200 * u.mm,
+            length=6000 * u.mm,
+            bMagCenter=2 * u.T,
+            nCoils=1194,
+        )
+        return acts.solenoidFieldMap(
+            rlim=(0, 1200 * u.mm),
+            zlim=(-5000 * u.mm, 5000 * u.mm),
+            nbins=(10, 10),
+            field=solenoid,
+        )
+
+    for _ in range(2):
+        field = field_cache.cachedFieldMap(
+            build, "solenoid", config={"nbins": (10, 10)}, cacheDir=tmp_path
+        )
+        assert isinstance(field, acts.examples.MappedBFieldMap2)
+    assert len(built) == 1
+    assert len(list(tmp_path.glob("solenoid_*.bin"))) == 1
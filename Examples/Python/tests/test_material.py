@@ -31,3 +31,103 @@ def test_json_material_decorator():
         ),
         level=acts.logging.WARNING,
     )
+
+
+def test_binary_material_roundtrip(tmp_path):
+    detector, trackingGeometry, _ = acts.examples.GenericDetector.create()
+
+    first = tmp_path / "material.bin"
+    acts.examples.BinaryMaterialWriter(
+        acts.examples.BinaryMaterialWriter.Config(fileName=str(first)),
+        acts.logging.INFO,
+    ).write(trackingGeometry)
+    assert first.stat().st_size > 0
+
+    deco = acts.IMaterialDecorator.fromFile(first)
+    assert isinstance(deco, acts.examples.BinaryMaterialDecorator)
+    assert deco.nSurfaces > 0
+
+    detector, trackingGeometry, _ = acts.examples.GenericDetector.create(
+        mdecorator=deco
+    )
+
+    # the material read from the file is written out unchanged
+    second = tmp_path / "material2.bin"
+    acts.examples.BinaryMaterialWriter(
+        acts.examples.BinaryMaterialWriter.Config(fileName=str(second)),
+        acts.logging.INFO,
+    ).write(trackingGeometry)
+    assert first.read_bytes() == second.read_bytes()
+
+    with pytest.raises(RuntimeError):
+        (tmp_path / "invalid.bin").write_bytes(b"\0" * 64)
+        acts.IMaterialDecorator.fromFile(tmp_path / "invalid.bin")
+
+
+@pytest.mark.root
+@pytest.mark.odd
+def test_binary_material_writers(tmp_path):
+    import gc
+
+    import numpy as np
+    import uproot
+
+    from common import getOpenDataDetectorDirectory
+    from helpers import dd4hepEnabled
+    from acts.examples.odd import getOpenDataDetector
+
+    if not dd4hepEnabled:
+        pytest.skip("DD4hep not set up")
+
+    def writeRoot(trackingGeometry, path):
+        writer = acts.examples.RootMaterialWriter(
+            acts.examples.RootMaterialWriter.Config(filePath=str(path)),
+            acts.logging.INFO,
+        )
+        writer.write(trackingGeometry)
+        # the file is closed by the destructor
+        del writer
+        gc.collect()
+
+    srcdir = Path(__file__).parent.parent.parent.parent
+    detector, trackingGeometry, _ = getOpenDataDetector(
+        getOpenDataDetectorDirectory(),
+        acts.IMaterialDecorator.fromFile(
+            srcdir / "thirdparty/OpenDataDetector/data/odd-material-maps.root"
+        ),
+    )
+    acts.examples.BinaryMaterialWriter(
+        acts.examples.BinaryMaterialWriter.Config(
+            fileName=str(tmp_path / "material.bin")
+        ),
+        acts.logging.INFO,
+    ).write(trackingGeometry)
+    writeRoot(trackingGeometry, tmp_path / "original.root")
+    del detector, trackingGeometry
+
+    detector, trackingGeometry, _ = getOpenDataDetector(
+        getOpenDataDetectorDirectory(),
+        acts.IMaterialDecorator.fromFile(tmp_path / "material.bin"),
+    )
+    # the memory mapped bins are written like binned material
+    writeRoot(trackingGeometry, tmp_path / "mapped.root")
+    with uproot.open(tmp_path / "original.root") as original, uproot.open(
+        tmp_path / "mapped.root"
+    ) as mapped:
+        keys = sorted(k for k in original.keys() if k.endswith("/t;1"))
+        assert len(keys) > 0
+        assert keys == sorted(k for k in mapped.keys() if k.endswith("/t;1"))
+        for key in keys:
+            assert np.array_equal(
+                original[key].values(), mapped[key].values()
+            ), f"{key} differs"
+
+    # the json converter does not know the mapped material
+    with pytest.raises(ValueError):
+        acts.examples.JsonMaterialWriter(
+            acts.examples.JsonMaterialWriter.Config(
+                converterCfg=acts.MaterialMapJsonConverter.Config(),
+                fileName=str(tmp_path / "material"),
+            ),
+            acts.logging.INFO,
+        ).write(trackingGeometry)
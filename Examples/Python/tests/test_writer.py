@@ -156,6 +156,72 @@ def test_root_particle_writer(tmp_path, conf_const, ptcl_gun, assert_root_hash):
     assert_root_hash(file.name, file)
 
 
+@pytest.mark.root
+def test_root_file_merger(tmp_path, ptcl_gun):
+    import uproot
+    import numpy as np
+
+    def write(file, **kwargs):
+        s = Sequencer(numThreads=1, **kwargs)
+        evGen = ptcl_gun(s)
+        s.addWriter(
+            RootParticleWriter(
+                level=acts.logging.INFO,
+                inputParticles=evGen.config.outputParticles,
+                filePath=str(file),
+            )
+        )
+        s.run()
+
+    write(tmp_path / "full.root", events=10)
+    write(tmp_path / "first.root", events=5)
+    write(tmp_path / "second.root", skip=5, events=5)
+
+    merged = tmp_path / "merged.root"
+    acts.examples.RootFileMerger.run(
+        acts.examples.RootFileMerger.Config(
+            # inputs out of order, which the merger has to undo
+            inputFiles=[str(tmp_path / "second.root"), str(tmp_path / "first.root")],
+            outputFile=str(merged),
+        ),
+        acts.logging.INFO,
+    )
+
+    exp = uproot.open(tmp_path / "full.root")["particles"].arrays(library="np")
+    act = uproot.open(merged)["particles"].arrays(library="np")
+    assert exp.keys() == act.keys()
+    for key in exp:
+        assert len(exp[key]) == len(act[key])
+        for e, a in zip(exp[key], act[key]):
+            assert np.array_equal(e, a)
+
+    # overlapping event ranges are sorted entry by entry
+    write(tmp_path / "overlap.root", skip=3, events=5)
+    # objects missing in some of the inputs are kept
+    with uproot.update(tmp_path / "overlap.root") as f:
+        f["extra"] = {"x": np.arange(3)}
+
+    inputs = [tmp_path / "first.root", tmp_path / "overlap.root"]
+    acts.examples.RootFileMerger.run(
+        acts.examples.RootFileMerger.Config(
+            inputFiles=[str(f) for f in inputs], outputFile=str(merged)
+        ),
+        acts.logging.INFO,
+    )
+
+    parts = [uproot.open(f)["particles"].arrays(library="np") for f in inputs]
+    events = np.concatenate([p["event_id"] for p in parts])
+    order = np.argsort(events, kind="stable")
+    with uproot.open(merged) as f:
+        act = f["particles"].arrays(library="np")
+        assert np.array_equal(f["extra"]["x"].array(library="np"), np.arange(3))
+    for key in act:
+        exp = np.concatenate([p[key] for p in parts])[order]
+        assert len(exp) == len(act[key])
+        for e, a in zip(exp, act[key]):
+            assert np.array_equal(e, a)
+
+
 @pytest.mark.root
 def test_root_meas_writer(tmp_path, fatras, trk_geo, assert_root_hash):
     s = Sequencer(numThreads=1, events=10)
@@ -462,6 +528,56 @@ def test_json_material_writer(tmp_path, fmt):
     assert out.stat().st_size > 1000
 
 
+@pytest.mark.root
+@pytest.mark.csv
+def test_bfield_writer_chunked(tmp_path):
+    from helpers.hash_root import hash_root_file
+
+    solenoid = acts.SolenoidBField(
+        radius=1200 * u.mm, length=6000 * u.mm, bMagCenter=2 * u.T, nCoils=1194
+    )
+    field = acts.solenoidFieldMap(
+        rlim=(0, 1200 * u.mm),
+        zlim=(-5000 * u.mm, 5000 * u.mm),
+        nbins=(10, 10),
+        field=solenoid,
+    )
+
+    # chunked and parallel writing gives the same output
+    for name, chunkSize, numThreads in [("serial", 100000, 1), ("chunked", 7, 2)]:
+        cfg = acts.examples.CsvBFieldWriter.ConfigXyzGrid()
+        cfg.bField = field
+        cfg.fileName = str(tmp_path / f"{name}.csv")
+        cfg.chunkSize = chunkSize
+        cfg.numThreads = numThreads
+        acts.examples.CsvBFieldWriter.runXyzGrid(cfg, acts.logging.INFO)
+
+        cfg = acts.examples.RootBFieldWriter.Config()
+        cfg.bField = field
+        cfg.gridType = acts.examples.RootBFieldWriter.GridType.rz
+        cfg.fileName = str(tmp_path / f"{name}.root")
+        cfg.treeName = "solenoid"
+        cfg.chunkSize = chunkSize
+        cfg.numThreads = numThreads
+        if name == "chunked":
+            cfg.compression = 505
+        acts.examples.RootBFieldWriter.run(cfg, acts.logging.INFO)
+
+    serial = (tmp_path / "serial.csv").read_text()
+    assert len(serial.splitlines()) == 1 + 10 * 10 * 10
+    assert (tmp_path / "chunked.csv").read_text() == serial
+    assert hash_root_file(tmp_path / "chunked.root") == hash_root_file(
+        tmp_path / "serial.root"
+    )
+
+    cfg = acts.examples.CsvBFieldWriter.ConfigXyzGrid()
+    cfg.bField = field
+    cfg.fileName = str(tmp_path / "invalid.csv")
+    cfg.numThreads = 0
+    with pytest.raises(ValueError):
+        acts.examples.CsvBFieldWriter.runXyzGrid(cfg, acts.logging.INFO)
+
+
 @pytest.mark.csv
 def test_csv_multitrajectory_writer(tmp_path):
     detector, trackingGeometry, decorators = GenericDetector.create()
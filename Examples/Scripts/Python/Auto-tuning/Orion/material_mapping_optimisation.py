@@ -48,6 +48,8 @@ def runMaterialMappingNoTrack(
     mapVolume=True,
     format=JsonFormat.Json,
     readCachedSurfaceInformation=False,
+    numThreads=1,
+    associationDir=None,
     s=None,
 ):
     """
@@ -63,9 +65,11 @@ def runMaterialMappingNoTrack(
     mapVolume : Is material being mapped onto volumes ?
     format : Json format used to write the material map (json, cbor, ...)
     readCachedSurfaceInformation : If set to true it will be assumed that the surface has already been associated with each material interaction in the input file.
+    numThreads : Number of threads used for the mapping if no sequencer is given, -1 for all cores
+    associationDir : Directory of the material association indices, they are reused by trials with the same surfaces and a different binning
     """
 
-    s = s or Sequencer(numThreads=1)
+    s = s or Sequencer(numThreads=numThreads)
     for decorator in decorators:
         s.addContextDecorator(decorator)
     wb = WhiteBoard(acts.logging.INFO)
@@ -73,19 +77,19 @@ def runMaterialMappingNoTrack(
     for decorator in decorators:
         assert decorator.decorate(context) == ProcessCode.SUCCESS
 
+    trackFile = os.path.join(
+        inputDir,
+        "optimised-material-map_tracks.root"
+        if readCachedSurfaceInformation
+        else "geant4_material_tracks.root",
+    )
+
     # Read material step information from a ROOT TTRee
     s.addReader(
         RootMaterialTrackReader(
             level=acts.logging.INFO,
             collection="material-tracks",
-            fileList=[
-                os.path.join(
-                    inputDir,
-                    "optimised-material-map_tracks.root"
-                    if readCachedSurfaceInformation
-                    else "geant4_material_tracks.root",
-                )
-            ],
+            fileList=[trackFile],
             readCachedSurfaceInformation=readCachedSurfaceInformation,
         )
     )
@@ -134,6 +138,13 @@ def runMaterialMappingNoTrack(
 
     mmAlgCfg.materialWriters = [jmw]
 
+    if associationDir is not None:
+        from material_mapping import addMaterialAssociation
+
+        addMaterialAssociation(
+            s, mmAlgCfg, trackingGeometry, context, associationDir, trackFile
+        )
+
     s.addAlgorithm(MaterialMapping(level=acts.logging.INFO, config=mmAlgCfg))
 
     return s
@@ -147,6 +158,7 @@ def runMaterialMappingVariance(
     pathExp,
     pipeResult,
     readCachedSurfaceInformation=False,
+    associationDir=None,
 ):
     """
     Run the material mapping and compute the variance for each bin of each surfaces
@@ -160,6 +172,7 @@ def runMaterialMappingVariance(
     pathExp : Material mapping optimisation path
     pipeResult : Pipe to send back the score to the main python instance
     readCachedSurfaceInformation : Are surface information stored in the material track. Switch to true if the mapping was already performed to improve the speed.
+    associationDir : Directory of the material association indices shared by the trials
     """
     print(
         datetime.now().strftime("%H:%M:%S") + "    Start mapping for job " + str(job),
@@ -206,6 +219,7 @@ def runMaterialMappingVariance(
         format=JsonFormat.Cbor,
         mapVolume=mapVolume,
         readCachedSurfaceInformation=readCachedSurfaceInformation,
+        associationDir=associationDir,
         s=sMap,
     )
     sMap.run()
@@ -236,18 +250,18 @@ def runMaterialMappingVariance(
     for decorator in decoratorsVar:
         assert decorator.decorate(context) == ProcessCode.SUCCESS
 
+    trackFile = os.path.join(
+        inputPath,
+        "optimised-material-map_tracks.root"
+        if readCachedSurfaceInformation
+        else "geant4_material_tracks.root",
+    )
+
     # Read material step information from a ROOT TTRee
     reader = RootMaterialTrackReader(
         level=acts.logging.ERROR,
         collection="material-tracks",
-        fileList=[
-            os.path.join(
-                inputPath,
-                "optimised-material-map_tracks.root"
-                if readCachedSurfaceInformation
-                else "geant4_material_tracks.root",
-            )
-        ],
+        fileList=[trackFile],
         readCachedSurfaceInformation=readCachedSurfaceInformation,
     )
     s.addReader(reader)
@@ -282,6 +296,13 @@ def runMaterialMappingVariance(
         )
         mmAlgCfg.materialVolumeMapper = mapper
 
+    if associationDir is not None:
+        from material_mapping import addMaterialAssociation
+
+        addMaterialAssociation(
+            s, mmAlgCfg, trackingGeometryVar, context, associationDir, trackFile
+        )
+
     mapping = MaterialMapping(level=acts.logging.ERROR, config=mmAlgCfg)
     s.addAlgorithm(mapping)
     s.run()
@@ -446,7 +467,6 @@ def surfaceExperiment(key, nbJobs, pathDB, pathResult, pipeBin, pipeResult, doPl
 
 
 if "__main__" == __name__:
-
     print(datetime.now().strftime("%H:%M:%S") + "    Starting")
     # Optimiser arguments
     parser = argparse.ArgumentParser()
@@ -468,6 +488,9 @@ if "__main__" == __name__:
     parser.add_argument(
         "--readCachedSurfaceInformation", action="store_true"
     )  # Use surface information from the material track
+    parser.add_argument(
+        "--associationDir", nargs="?", default=None, type=str
+    )  # reuse the association of the material tracks with the surfaces
     parser.set_defaults(doPloting=False)
     parser.set_defaults(readCachedSurfaceInformation=False)
     args = parser.parse_args()
@@ -557,6 +580,7 @@ if "__main__" == __name__:
                 pathExp,
                 resultPipes_child[job],
                 args.readCachedSurfaceInformation,
+                args.associationDir,
             ),
         )
         OptiJob[job].start()
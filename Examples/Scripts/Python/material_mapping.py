@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import hashlib
 import os
 
 from acts.examples import (
@@ -9,6 +10,8 @@ from acts.examples import (
     RootMaterialTrackReader,
     RootMaterialTrackWriter,
     MaterialMapping,
+    MaterialAssociationIndex,
+    MaterialAssociationWriter,
     JsonMaterialWriter,
     JsonFormat,
 )
@@ -28,47 +31,15 @@ from common import getOpenDataDetectorDirectory
 from acts.examples.odd import getOpenDataDetector
 
 
-def runMaterialMapping(
+def materialMappingConfig(
     trackingGeometry,
-    decorators,
+    context,
     outputDir,
-    inputDir,
     mapName="material-map",
     mapSurface=True,
     mapVolume=True,
-    readCachedSurfaceInformation=False,
     mappingStep=1,
-    s=None,
 ):
-    s = s or Sequencer(numThreads=1)
-
-    for decorator in decorators:
-        s.addContextDecorator(decorator)
-
-    wb = WhiteBoard(acts.logging.INFO)
-
-    context = AlgorithmContext(0, 0, wb)
-
-    for decorator in decorators:
-        assert decorator.decorate(context) == ProcessCode.SUCCESS
-
-    # Read material step information from a ROOT TTRee
-    s.addReader(
-        RootMaterialTrackReader(
-            level=acts.logging.INFO,
-            collection="material-tracks",
-            fileList=[
-                os.path.join(
-                    inputDir,
-                    mapName + "_tracks.root"
-                    if readCachedSurfaceInformation
-                    else "geant4_material_tracks.root",
-                )
-            ],
-            readCachedSurfaceInformation=readCachedSurfaceInformation,
-        )
-    )
-
     stepper = StraightLineStepper()
 
     mmAlgCfg = MaterialMapping.Config(context.geoContext, context.magFieldContext)
@@ -114,6 +85,124 @@ def runMaterialMapping(
 
     mmAlgCfg.materialWriters = [jmw]
 
+    return mmAlgCfg
+
+
+def addMaterialAssociation(
+    s, mmAlgCfg, trackingGeometry, context, associationDir, trackFile
+):
+    """
+    Reuse the association of the material steps with the mapping surfaces.
+
+    The association index is identified by the content of the material track
+    file and the hash of the mapping surfaces, which does not depend on their
+    binning. If it exists in `associationDir` the surface material mapper skips
+    the navigation, otherwise the index is written by this mapping.
+    Only surface material mapping is supported.
+    """
+    if mmAlgCfg.materialVolumeMapper is not None:
+        raise ValueError(
+            "The material association is not supported for volume material mapping"
+        )
+
+    geometryHash = MaterialAssociationIndex.hashGeometry(
+        trackingGeometry, context.geoContext
+    )
+    h = hashlib.sha256()
+    with open(trackFile, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+    inputHash = int.from_bytes(h.digest()[:8], "little")
+    stem = os.path.splitext(os.path.basename(trackFile))[0]
+    indexFile = os.path.join(
+        associationDir,
+        f"material-association-{stem}-{inputHash:016x}-{geometryHash:016x}.idx",
+    )
+    if os.path.exists(indexFile):
+        index = MaterialAssociationIndex(indexFile)
+        if index.inputHash != inputHash or index.geometryHash != geometryHash:
+            raise RuntimeError(
+                f"Material association index {indexFile} was not written for "
+                f"{trackFile} and the mapping surfaces"
+            )
+        mmAlgCfg.associationIndex = index
+    else:
+        os.makedirs(associationDir, exist_ok=True)
+        s.addWriter(
+            MaterialAssociationWriter(
+                level=acts.logging.INFO,
+                inputMaterialTracks=mmAlgCfg.collection,
+                collection=mmAlgCfg.mappingMaterialCollection,
+                fileName=indexFile,
+                geometryHash=geometryHash,
+                inputHash=inputHash,
+            )
+        )
+    return indexFile
+
+
+def runMaterialMapping(
+    trackingGeometry,
+    decorators,
+    outputDir,
+    inputDir,
+    mapName="material-map",
+    mapSurface=True,
+    mapVolume=True,
+    readCachedSurfaceInformation=False,
+    mappingStep=1,
+    inputCheckpoints=[],
+    outputCheckpoint=None,
+    numThreads=1,
+    associationDir=None,
+    s=None,
+):
+    s = s or Sequencer(numThreads=numThreads)
+
+    for decorator in decorators:
+        s.addContextDecorator(decorator)
+
+    wb = WhiteBoard(acts.logging.INFO)
+
+    context = AlgorithmContext(0, 0, wb)
+
+    for decorator in decorators:
+        assert decorator.decorate(context) == ProcessCode.SUCCESS
+
+    trackFile = os.path.join(
+        inputDir,
+        mapName + "_tracks.root"
+        if readCachedSurfaceInformation
+        else "geant4_material_tracks.root",
+    )
+
+    # Read material step information from a ROOT TTRee
+    s.addReader(
+        RootMaterialTrackReader(
+            level=acts.logging.INFO,
+            collection="material-tracks",
+            fileList=[trackFile],
+            readCachedSurfaceInformation=readCachedSurfaceInformation,
+        )
+    )
+
+    mmAlgCfg = materialMappingConfig(
+        trackingGeometry,
+        context,
+        outputDir,
+        mapName=mapName,
+        mapSurface=mapSurface,
+        mapVolume=mapVolume,
+        mappingStep=mappingStep,
+    )
+    mmAlgCfg.inputCheckpoints = inputCheckpoints
+    if outputCheckpoint is not None:
+        mmAlgCfg.outputCheckpoint = outputCheckpoint
+    if associationDir is not None:
+        addMaterialAssociation(
+            s, mmAlgCfg, trackingGeometry, context, associationDir, trackFile
+        )
+
     s.addAlgorithm(MaterialMapping(level=acts.logging.INFO, config=mmAlgCfg))
 
     s.addWriter(
@@ -132,6 +221,44 @@ def runMaterialMapping(
     return s
 
 
+def mergeMaterialMaps(
+    trackingGeometry,
+    decorators,
+    outputDir,
+    inputCheckpoints,
+    mapName="material-map",
+    mapSurface=True,
+    mapVolume=True,
+    mappingStep=1,
+):
+    """
+    Finalise the material maps from the checkpoints of partial mappings.
+
+    Each partial mapping runs `runMaterialMapping` over a subset of the material
+    tracks with an `outputCheckpoint`. The mapping options have to be the same
+    for all of them.
+    """
+    wb = WhiteBoard(acts.logging.INFO)
+    context = AlgorithmContext(0, 0, wb)
+    for decorator in decorators:
+        assert decorator.decorate(context) == ProcessCode.SUCCESS
+
+    mmAlgCfg = materialMappingConfig(
+        trackingGeometry,
+        context,
+        outputDir,
+        mapName=mapName,
+        mapSurface=mapSurface,
+        mapVolume=mapVolume,
+        mappingStep=mappingStep,
+    )
+    mmAlgCfg.inputCheckpoints = inputCheckpoints
+
+    # the maps are finalised and written once the algorithm is destroyed
+    alg = MaterialMapping(level=acts.logging.INFO, config=mmAlgCfg)
+    del alg
+
+
 if "__main__" == __name__:
     matDeco = acts.IMaterialDecorator.fromFile("geometry-map.json")
     detector, trackingGeometry, decorators = getOpenDataDetector(
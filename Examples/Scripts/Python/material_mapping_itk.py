@@ -41,9 +41,10 @@ def runMaterialMapping(
     mapSurface=True,
     readCachedSurfaceInformation=False,
     dumpMaterialTracks=False,
+    numThreads=1,
     s=None,
 ):
-    s = s or Sequencer(numThreads=1)
+    s = s or Sequencer(numThreads=numThreads)
 
     for decorator in decorators:
         s.addContextDecorator(decorator)
@@ -27,7 +27,20 @@ class PyAlg1(acts.examples.IAlgorithm):
         return acts.examples.ProcessCode.SUCCESS
 
 
+class PyBatchAlg(acts.examples.IBatchAlgorithm):
+    def __init__(self, name, level):
+        # collect up to 10 events in flight, waiting at most 10ms for them
+        acts.examples.IBatchAlgorithm.__init__(
+            self, name, level, batchSize=10, timeout=0.01
+        )
+
+    def execute_batch(self, contexts):
+        print([c.eventNumber for c in contexts])
+        return acts.examples.ProcessCode.SUCCESS
+
+
 s.addAlgorithm(PyAlg(name="blubb", level=acts.logging.INFO))
+s.addAlgorithm(PyBatchAlg(name="batch", level=acts.logging.INFO))
 
 print("alg go")
 s.run()
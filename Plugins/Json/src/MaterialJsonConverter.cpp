@@ -31,6 +31,7 @@
 #include <stdexcept>
 #include <string>
 #include <tuple>
+#include <typeinfo>
 #include <utility>
 #include <vector>
 
@@ -158,6 +159,13 @@ void Acts::to_json(nlohmann::json& j, const surfaceMaterialPointer& material) {
     j[Acts::jsonKey().materialkey] = jMaterial;
     return;
   }
+  // Other material types can not be read back, they are rejected instead of
+  // silently losing the material
+  if (material != nullptr) {
+    throw std::invalid_argument("Surface material of type " +
+                                std::string(typeid(*material).name()) +
+                                " can not be converted to json");
+  }
   // No material the json object is left empty.
   return;
 }
@@ -20,6 +20,7 @@
 
 #include <cstddef>
 #include <fstream>
+#include <vector>
 
 namespace bdata = boost::unit_test::data;
 namespace tt = boost::test_tools;
@@ -113,5 +114,37 @@ BOOST_AUTO_TEST_CASE(TestSolenoidBField) {
   // outf.close();
 }
 
+BOOST_AUTO_TEST_CASE(TestSolenoidBFieldBatched) {
+  SolenoidBField::Config cfg{};
+  cfg.length = 5.8_m;
+  cfg.radius = (2.56 + 2.46) * 0.5 * 0.5_m;
+  cfg.nCoils = 1154;
+  cfg.bMagCenter = 2_T;
+  SolenoidBField bField(cfg);
+
+  std::vector<Vector2> positions;
+  size_t steps = 20;
+  for (size_t i = 0; i < steps; i++) {
+    double r = 1.5 * cfg.radius / steps * i;
+    for (size_t j = 0; j <= steps; j++) {
+      double z = (1.5 * cfg.length / 2.) / steps * j;
+      positions.emplace_back(r, z);
+      positions.emplace_back(-r, -z);
+    }
+  }
+
+  std::vector<Vector2> fields;
+  bField.getField(positions, fields);
+  BOOST_CHECK_EQUAL(fields.size(), positions.size());
+  for (size_t i = 0; i < positions.size(); i++) {
+    BOOST_TEST_CONTEXT("r=" << positions[i][0] << " z=" << positions[i][1]) {
+      // the batched evaluation is identical to the single position one
+      Vector2 B = bField.getField(positions[i]);
+      BOOST_CHECK_EQUAL(fields[i][0], B[0]);
+      BOOST_CHECK_EQUAL(fields[i][1], B[1]);
+    }
+  }
+}
+
 }  // namespace Test
 }  // namespace Acts
@@ -198,4 +198,48 @@ BOOST_AUTO_TEST_CASE(MultipleDifferentTracks) {
   }
 }
 
+// merging partial accumulations is the same as accumulating all tracks
+BOOST_AUTO_TEST_CASE(MergeDifferentTracks) {
+  MaterialSlab unit = makeUnitSlab();
+  MaterialSlab three = unit;
+  three.scaleThickness(3);
+  MaterialSlab vac(2 * unit.thickness());
+
+  AccumulatedMaterialSlab all;
+  AccumulatedMaterialSlab first;
+  AccumulatedMaterialSlab second;
+  for (const auto& slab : {unit, three}) {
+    all.accumulate(slab);
+    all.trackAverage();
+    first.accumulate(slab);
+    first.trackAverage();
+  }
+  for (const auto& slab : {vac, vac}) {
+    all.accumulate(slab);
+    all.trackAverage();
+    second.accumulate(slab);
+    second.trackAverage();
+  }
+
+  AccumulatedMaterialSlab merged;
+  merged.merge(first);
+  merged.merge(AccumulatedMaterialSlab());
+  merged.merge(second);
+  auto [expected, expectedCount] = all.totalAverage();
+  auto [average, trackCount] = merged.totalAverage();
+  BOOST_CHECK_EQUAL(trackCount, expectedCount);
+  BOOST_CHECK_EQUAL(trackCount, 4u);
+  CHECK_CLOSE_REL(average.thickness(), expected.thickness(), eps);
+  CHECK_CLOSE_REL(average.thicknessInX0(), expected.thicknessInX0(), eps);
+  CHECK_CLOSE_REL(average.thicknessInL0(), expected.thicknessInL0(), eps);
+  CHECK_CLOSE_REL(average.material().molarDensity(),
+                  expected.material().molarDensity(), eps);
+
+  // restoring the total store keeps the accumulation going
+  AccumulatedMaterialSlab restored(average, trackCount);
+  restored.accumulate(unit);
+  restored.trackAverage();
+  BOOST_CHECK_EQUAL(restored.totalAverage().second, 5u);
+}
+
 BOOST_AUTO_TEST_SUITE_END()
@@ -19,6 +19,7 @@
 #include <array>
 #include <cstddef>
 #include <memory>
+#include <stdexcept>
 #include <vector>
 
 namespace Acts {
@@ -186,5 +187,43 @@ BOOST_AUTO_TEST_CASE(AccumulatedSurfaceMaterial_variance_0D) {
   BOOST_CHECK_EQUAL(trackCount, 2u);
 }
 
+/// Test the merging of partial accumulations
+BOOST_AUTO_TEST_CASE(AccumulatedSurfaceMaterial_merge) {
+  Material mat = Material::fromMolarDensity(1., 1., 1., 1., 1.);
+  MaterialSlab one(mat, 1.);
+  MaterialSlab three(mat, 3.);
+
+  BinUtility binUtility(2, -1., 1., open, binX);
+  AccumulatedSurfaceMaterial first(binUtility);
+  AccumulatedSurfaceMaterial second(binUtility);
+  first.accumulate(Vector3(-0.5, 0., 0.), one);
+  first.trackAverage();
+  second.accumulate(Vector3(-0.5, 0., 0.), three);
+  second.trackAverage();
+  second.accumulate(Vector3(0.5, 0., 0.), three);
+  second.trackAverage();
+
+  first.merge(second);
+  const auto& accMat = first.accumulatedMaterial();
+  auto [average0, count0] = accMat[0][0].totalAverage();
+  BOOST_CHECK_EQUAL(count0, 2u);
+  BOOST_CHECK_EQUAL(average0.thickness(), 2.);
+  auto [average1, count1] = accMat[0][1].totalAverage();
+  BOOST_CHECK_EQUAL(count1, 1u);
+  BOOST_CHECK_EQUAL(average1.thickness(), 3.);
+
+  // the binning has to match
+  AccumulatedSurfaceMaterial other(BinUtility(3, -1., 1., open, binX));
+  BOOST_CHECK_THROW(first.merge(other), std::invalid_argument);
+
+  // restore from the accumulated material
+  AccumulatedSurfaceMaterial restored(binUtility, accMat);
+  BOOST_CHECK_EQUAL(restored.accumulatedMaterial()[0][0].totalAverage().second,
+                    2u);
+  BOOST_CHECK_THROW(
+      AccumulatedSurfaceMaterial(BinUtility(3, -1., 1., open, binX), accMat),
+      std::invalid_argument);
+}
+
 }  // namespace Test
 }  // namespace Acts
@@ -104,6 +104,27 @@ BOOST_AUTO_TEST_CASE(two_materials_different_lengh) {
                   1e-4);
 }
 
+BOOST_AUTO_TEST_CASE(merge) {
+  Material mat1 = Material::fromMolarDensity(1., 2., 3., 4., 5.);
+  Material mat2 = Material::fromMolarDensity(6., 7., 8., 9., 10.);
+
+  AccumulatedVolumeMaterial all;
+  all.accumulate(MaterialSlab(mat1, 0.5));
+  all.accumulate(MaterialSlab(mat2, 2));
+
+  AccumulatedVolumeMaterial first;
+  first.accumulate(MaterialSlab(mat1, 0.5));
+  AccumulatedVolumeMaterial second;
+  second.accumulate(MaterialSlab(mat2, 2));
+  first.merge(second);
+  // merging nothing changes nothing
+  first.merge(AccumulatedVolumeMaterial());
+
+  CHECK_CLOSE_REL(first.accumulated().thickness(), 2.5, 1e-4);
+  CHECK_CLOSE_REL(first.average().parameters(), all.average().parameters(),
+                  1e-4);
+}
+
 BOOST_AUTO_TEST_SUITE_END()
 
 }  // namespace Test